@@ -0,0 +1,187 @@
+"""
+Adversary Strategy Interface
+
+Byzantine adversaries sit between a corrupted node and the network. Every message the
+node sends passes through its strategy, which may drop it, delay it, withhold it, or
+replace it with different (e.g. equivocating) messages.
+
+Strategies work at two levels:
+
+- Message level: ``intercept_send()`` and ``should_drop()`` operate on ``Message`` objects.
+- Frame level: ``intercept_frame()`` operates on encoded frames through a lazy
+  ``FrameView``. Drop, delay and withholding decisions usually need only the routing
+  header, so strategies override ``should_drop_frame()`` to avoid decoding the body.
+  Unchanged messages are forwarded as the original frame bytes; new frames are built only
+  for messages a strategy actually creates or modifies (``rewrites_content = True``).
+
+Every adversarial action is appended to ``actions`` for audit. Randomness comes from
+counter-based ``SeedService`` streams keyed by the corrupted node (and round), so behavior
+is reproducible however the run is sharded.
+
+Strategies whose behavior for a whole ``(round, phase)`` is fixed describe it through
+``compile_route()`` so ``AdversaryComposition`` can compile it into a routing table. A
+strategy that changes that behavior mid-round calls ``mark_changed()`` to invalidate
+compiled tables.
+"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, List, Optional, Sequence
+
+import numpy as np
+
+from ba_simulator.scheduling.determinism import SeedService
+from ba_simulator.transport.framing import FrameHeader, FrameView, encode_frame
+from ba_simulator.transport.message import Message
+from ba_simulator.transport.serialization import MessageSerializer
+
+if TYPE_CHECKING:
+    from ba_simulator.adversaries.composition import RouteEntry
+
+
+@dataclass(frozen=True)
+class AdversaryAction:
+    """
+    Audit record of one adversarial action.
+
+    Fields:
+        node_id: Corrupted node performing the action
+        action: Action type (e.g. "drop", "equivocate", "delay")
+        header: Routing header of the affected message
+        detail: Action-specific details
+    """
+
+    node_id: int
+    action: str
+    header: FrameHeader
+    detail: Optional[Dict[str, Any]] = None
+
+
+class AdversaryStrategy(ABC):
+    """
+    Abstract base class for Byzantine adversary strategies.
+
+    Attributes:
+        node_id: Corrupted node controlled by this strategy
+        fault_type: Short name of the behavior (e.g. "equivocator")
+        params: Intensity parameters of the behavior
+        seeds: Seed service of the strategy
+        rng: Node-level generator for randomized decisions
+        actions: Audit log of adversarial actions
+        rewrites_content: True if ``intercept_send()`` may return new or modified messages;
+            False lets ``intercept_frame()`` forward frames without decoding them
+    """
+
+    rewrites_content: bool = False
+
+    def __init__(
+        self,
+        node_id: int,
+        fault_type: str,
+        params: Optional[Dict[str, Any]] = None,
+        seed: int = 0,
+    ) -> None:
+        self.node_id = node_id
+        self.fault_type = fault_type
+        self.params: Dict[str, Any] = dict(params or {})
+        self.seeds = SeedService(seed)
+        self.rng = self.seeds.stream("adversary", node_id)
+        self.actions: List[AdversaryAction] = []
+        self.state_version = 0
+        self._listeners: List[Callable[[], None]] = []
+
+    @abstractmethod
+    def intercept_send(self, message: Message) -> List[Message]:
+        """
+        Return the messages actually sent in place of ``message``.
+
+        Return ``[message]`` (the same object) to send it unchanged.
+        """
+        pass
+
+    @abstractmethod
+    def should_drop(self, message: Message) -> bool:
+        """Return True if ``message`` must not be sent at all."""
+        pass
+
+    def should_drop_frame(self, view: FrameView) -> bool:
+        """
+        Frame-level drop decision.
+
+        The default decodes the frame and calls ``should_drop()``; strategies deciding on
+        the header alone should override this and read ``view.header`` only.
+        """
+        return self.should_drop(view.message)
+
+    def intercept_frame(
+        self, view: FrameView, serializer: Optional[MessageSerializer] = None
+    ) -> List[bytes]:
+        """
+        Frame-level interception.
+
+        Args:
+            view: Lazy view of the frame being sent
+            serializer: Serializer for newly built frames (defaults to the view's)
+
+        Returns:
+            Frames to send; the original bytes are reused for unchanged messages
+        """
+        if self.should_drop_frame(view):
+            self.log("drop", view.header)
+            return []
+        if not self.rewrites_content:
+            return [view.frame]
+
+        original = view.message
+        serializer = serializer or view.serializer
+        return [
+            view.frame if msg is original else encode_frame(msg, serializer)
+            for msg in self.intercept_send(original)
+        ]
+
+    def round_rng(self, round: int, purpose: str = "decisions") -> np.random.Generator:
+        """Return the independent stream of ``(node, round, purpose)``."""
+        return self.seeds.stream("adversary", self.node_id, round, purpose)
+
+    def controlled_senders(self) -> FrozenSet[int]:
+        """Return the senders whose messages this strategy intercepts (default: its node)."""
+        return frozenset((self.node_id,))
+
+    def compile_route(self, round: int, phase: str, sender: int) -> Optional["RouteEntry"]:
+        """
+        Return the fixed action for ``sender``'s messages of ``(round, phase)``.
+
+        ``sender`` is one of ``controlled_senders()``. The default returns None: the
+        behavior depends on message content and every message goes through
+        ``intercept_send()``.
+        """
+        return None
+
+    def intercept_batch(self, messages: Sequence[Message]) -> List[List[Message]]:
+        """
+        Intercept several messages at once; returns ``intercept_send()`` of each.
+
+        Strategies that sign what they send override this to sign the whole batch at once.
+        """
+        return [self.intercept_send(message) for message in messages]
+
+    def subscribe(self, listener: Callable[[], None]) -> None:
+        """Register a callback invoked by ``mark_changed()``."""
+        self._listeners.append(listener)
+
+    def mark_changed(self) -> None:
+        """Signal that ``compile_route()`` results changed; invalidates compiled tables."""
+        self.state_version += 1
+        for listener in self._listeners:
+            listener()
+
+    def log(self, action: str, header: FrameHeader, **detail: Any) -> None:
+        """Append an action to the audit log."""
+        self.actions.append(AdversaryAction(self.node_id, action, header, detail or None))
+
+    def action_counts(self) -> Dict[str, int]:
+        """Return the number of logged actions per action type."""
+        counts: Dict[str, int] = {}
+        for entry in self.actions:
+            counts[entry.action] = counts.get(entry.action, 0) + 1
+        return counts
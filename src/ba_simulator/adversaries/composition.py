@@ -0,0 +1,236 @@
+"""
+Compiled Adversary Composition
+
+A fault level ``f`` is reached by composing several strategies, one per corrupted node.
+Chaining per-message Python hooks across ``f`` strategies adds overhead to every send, so
+the composition compiles the active strategies once per round into a routing table that
+maps each ``(corrupted sender, phase)`` to a fixed action:
+
+- PASS: deliver unchanged
+- DROP: deliver to nobody (``dropped`` lists the dropped links for the audit log)
+- DELAY: deliver to every receiver not in ``dropped``, after ``link_delays[r]`` (or the
+  uniform ``delay``)
+- VARIANT: receiver ``r`` gets variant ``r % variants`` of the strategy's rewrites
+- CALL: not compilable; fall back to the strategy's ``intercept_send()``
+
+The send path is one dictionary lookup. The table is rebuilt when the round changes or
+when a strategy signals a state change through ``mark_changed()``. A strategy may control
+several senders (``controlled_senders()``); each of them counts towards the fault level.
+
+VARIANT and CALL messages of one ``deliver()`` call are handed to each strategy as one
+``intercept_batch()``, so signing strategies sign all their variants in a single batch.
+Dropped links are logged by the owning strategy exactly as its uncompiled send path would.
+"""
+
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+from ba_simulator.adversaries.adversary import AdversaryStrategy
+from ba_simulator.transport.framing import FrameHeader
+from ba_simulator.transport.message import Message
+
+Delivery = Tuple[float, int, Message]
+
+
+class RouteAction(Enum):
+    """Compiled action for a (corrupted sender, phase)."""
+
+    PASS = "pass"
+    DROP = "drop"
+    DELAY = "delay"
+    VARIANT = "variant"
+    CALL = "call"
+
+
+@dataclass(frozen=True)
+class RouteEntry:
+    """
+    One routing table entry.
+
+    Fields:
+        action: Compiled action
+        delay: Delivery delay of every link (DELAY only)
+        variants: Number of variants; receiver r gets variant r % variants (VARIANT only)
+        dropped: Receivers whose links are dropped (DELAY, and DROP for the audit log)
+        link_delays: Per-receiver delays overriding ``delay`` when non-empty (DELAY only)
+    """
+
+    action: RouteAction
+    delay: float = 0.0
+    variants: int = 0
+    dropped: FrozenSet[int] = frozenset()
+    link_delays: Tuple[float, ...] = ()
+
+    def delay_to(self, receiver: int) -> float:
+        """Return the delay of the link to ``receiver``."""
+        return self.link_delays[receiver] if self.link_delays else self.delay
+
+
+PASS = RouteEntry(RouteAction.PASS)
+CALL = RouteEntry(RouteAction.CALL)
+
+
+@dataclass
+class RoutingTable:
+    """
+    Routing table of one round.
+
+    Fields:
+        round: Round the table was compiled for
+        version: Compilation counter of the owning composition
+        entries: ``(sender, phase)`` -> entry; missing keys are PASS
+    """
+
+    round: int
+    version: int
+    entries: Dict[Tuple[int, str], RouteEntry] = field(default_factory=dict)
+
+
+class AdversaryComposition:
+    """
+    Compiles the strategies of up to ``t`` corrupted nodes into per-round routing tables.
+
+    Example:
+        >>> composition = AdversaryComposition(7, 2, [drop_node_5, equivocate_node_6], phases)
+        >>> for delay, receiver, msg in composition.deliver(outgoing):
+        ...     network.send(receiver, msg, at=delay)
+    """
+
+    def __init__(
+        self, n: int, t: int, strategies: Iterable[AdversaryStrategy], phases: Sequence[str]
+    ) -> None:
+        """
+        Initialize the composition.
+
+        Args:
+            n: Number of nodes
+            t: Byzantine fault bound
+            strategies: Strategies of the corrupted nodes (one per corrupted sender)
+            phases: Phases to compile
+
+        Raises:
+            ValueError: If more than t nodes are corrupted, a node has two strategies, or
+                a node ID is out of range
+        """
+        strategies = list(strategies)
+        corrupted = [
+            sender for strategy in strategies for sender in sorted(strategy.controlled_senders())
+        ]
+        if len(corrupted) > t:
+            raise ValueError(f"fault level {len(corrupted)} exceeds t={t}")
+        if len(set(corrupted)) != len(corrupted):
+            raise ValueError(f"each corrupted node needs exactly one strategy: {corrupted}")
+        if any(not 0 <= node_id < n for node_id in corrupted):
+            raise ValueError(f"corrupted nodes must be in [0, {n}), got {corrupted}")
+
+        self.n = n
+        self.t = t
+        self.phases = tuple(phases)
+        self.strategies: Dict[int, AdversaryStrategy] = {
+            sender: strategy for strategy in strategies for sender in strategy.controlled_senders()
+        }
+        self.compilations = 0
+        self._table: Optional[RoutingTable] = None
+        for strategy in strategies:
+            strategy.subscribe(self.invalidate)
+
+    @property
+    def fault_level(self) -> int:
+        """Number of corrupted nodes f."""
+        return len(self.strategies)
+
+    def invalidate(self) -> None:
+        """Discard the compiled table; the next lookup recompiles it."""
+        self._table = None
+
+    def table(self, round: int) -> RoutingTable:
+        """Return the routing table of ``round``, compiling it if needed."""
+        table = self._table
+        if table is None or table.round != round:
+            table = self._table = self._compile(round)
+        return table
+
+    def route(self, message: Message) -> RouteEntry:
+        """Return the compiled entry for ``message`` (PASS for honest senders)."""
+        entries = self.table(message.round).entries
+        return entries.get((message.sender_id, message.phase), PASS)
+
+    def deliver(
+        self, messages: Iterable[Message], receivers: Optional[Sequence[int]] = None
+    ) -> List[Delivery]:
+        """
+        Route outgoing messages through the compiled table.
+
+        Args:
+            messages: Outgoing messages of honest and corrupted senders
+            receivers: Receivers of each broadcast (defaults to all nodes)
+
+        Returns:
+            ``(delay, receiver, message)`` deliveries
+        """
+        targets = range(self.n) if receivers is None else receivers
+        routed = [(message, self.route(message)) for message in messages]
+        intercepted = self._intercept(routed)
+        deliveries: List[Delivery] = []
+        for message, entry in routed:
+            if entry is PASS:
+                deliveries.extend((0.0, receiver, message) for receiver in targets)
+            else:
+                deliveries.extend(self._apply(entry, message, targets, intercepted))
+        return deliveries
+
+    def _compile(self, round: int) -> RoutingTable:
+        """
+        Compile every strategy's entries for ``round``.
+
+        Phases are the outer loop, so strategies that sample per ``(round, phase)`` (e.g.
+        ``DelayDropAdversary.phase_links``) sample each phase once for all their senders.
+        """
+        self.compilations += 1
+        table = RoutingTable(round, self.compilations)
+        for phase in self.phases:
+            for sender, strategy in self.strategies.items():
+                entry = strategy.compile_route(round, phase, sender)
+                if entry is None:
+                    entry = CALL
+                if entry.action is not RouteAction.PASS:
+                    table.entries[(sender, phase)] = entry
+        return table
+
+    def _intercept(self, routed: Sequence[Tuple[Message, RouteEntry]]) -> Dict[int, List[Message]]:
+        """Intercept VARIANT and CALL messages with one batch per strategy, by message id."""
+        batches: Dict[int, Tuple[AdversaryStrategy, List[Message]]] = {}
+        for message, entry in routed:
+            if entry.action in (RouteAction.VARIANT, RouteAction.CALL):
+                strategy = self.strategies[message.sender_id]
+                batches.setdefault(id(strategy), (strategy, []))[1].append(message)
+        intercepted: Dict[int, List[Message]] = {}
+        for strategy, batch in batches.values():
+            for message, sent in zip(batch, strategy.intercept_batch(batch)):
+                intercepted[id(message)] = sent
+        return intercepted
+
+    def _apply(
+        self,
+        entry: RouteEntry,
+        message: Message,
+        targets: Sequence[int],
+        intercepted: Dict[int, List[Message]],
+    ) -> List[Delivery]:
+        """Expand a non-PASS entry into deliveries."""
+        action = entry.action
+        if action in (RouteAction.DROP, RouteAction.DELAY) and entry.dropped:
+            self.strategies[message.sender_id].log(
+                "drop", FrameHeader.of(message), receivers=sorted(entry.dropped)
+            )
+        if action is RouteAction.DROP:
+            if not entry.dropped:
+                self.strategies[message.sender_id].log("drop", FrameHeader.of(message))
+            return []
+        if action is RouteAction.DELAY:
+            return [(entry.delay_to(r), r, message) for r in targets if r not in entry.dropped]
+        sent = intercepted[id(message)]
+        if action is RouteAction.VARIANT:
+            return [(0.0, r, sent[r % entry.variants]) for r in targets]
+        return [(0.0, r, msg) for msg in sent for r in targets]
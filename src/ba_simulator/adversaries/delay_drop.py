@@ -0,0 +1,198 @@
+"""
+Delay/Drop Adversary
+
+Corrupted senders whose messages are delayed (up to Δ), reordered and dropped on a per-link
+basis. Instead of sampling a delay and a drop decision per message in Python, the adversary
+draws the whole ``(sender, receiver)`` delay matrix and drop mask of a phase at once from a
+seeded ``LinkDelayModel`` stream keyed by ``(seed, round, phase)``. Rows of senders the
+adversary does not control are zeroed (no delay, no drop).
+
+``schedule_broadcast()`` applies the matrices to a whole phase broadcast in one pass and
+returns the deliveries in arrival order. Replays with the same seed are identical.
+"""
+
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ba_simulator.adversaries.adversary import AdversaryStrategy
+from ba_simulator.adversaries.composition import PASS, RouteAction, RouteEntry
+from ba_simulator.scheduling.delays import (
+    DelayDistribution,
+    LinkDelayModel,
+    PhaseDelays,
+    arrival_order,
+)
+from ba_simulator.transport.framing import FrameHeader, FrameView
+from ba_simulator.transport.message import Message
+
+Delivery = Tuple[float, int, Message]
+
+
+class DelayDropAdversary(AdversaryStrategy):
+    """
+    Per-link delay and drop adversary for a set of corrupted senders.
+
+    Example:
+        >>> adversary = DelayDropAdversary(2, n=7, delta=1.0, drop_probability=0.3, seed=5)
+        >>> links = adversary.phase_links(round=0, phase="ECHO")
+        >>> for delay, receiver, msg in adversary.schedule_broadcast(0, "ECHO", outgoing):
+        ...     deliver(receiver, msg, at=delay)
+    """
+
+    def __init__(
+        self,
+        node_id: int,
+        n: int,
+        delta: float,
+        distribution: str = DelayDistribution.UNIFORM.value,
+        params: Optional[Dict[str, float]] = None,
+        drop_probability: float = 0.0,
+        seed: int = 0,
+        senders: Optional[Iterable[int]] = None,
+    ) -> None:
+        """
+        Initialize the adversary.
+
+        Args:
+            node_id: Primary corrupted node
+            n: Number of nodes
+            delta: Synchrony bound Δ; every delay is capped at Δ
+            distribution: "uniform", "normal" or "pareto"
+            params: Distribution parameters (see ``LinkDelayModel``)
+            drop_probability: Per-link drop probability in [0, 1]
+            seed: Seed of the per-(round, phase) streams
+            senders: Corrupted senders whose links are affected (defaults to ``node_id``)
+
+        Raises:
+            ValueError: If parameters are out of range or a sender is not in [0, n)
+        """
+        super().__init__(
+            node_id,
+            "delay_drop",
+            {"distribution": distribution, "drop_probability": drop_probability, "delta": delta},
+            seed,
+        )
+        self.n = n
+        self.model = LinkDelayModel(n, delta, distribution, params, drop_probability, seed)
+        controlled = sorted(set(senders) if senders is not None else {node_id})
+        if any(not 0 <= sender < n for sender in controlled):
+            raise ValueError(f"senders must be in [0, {n}), got {controlled}")
+        self.senders = np.zeros(n, dtype=bool)
+        self.senders[controlled] = True
+        self._cached: Optional[PhaseDelays] = None
+
+    def phase_links(self, round: int, phase: str) -> PhaseDelays:
+        """
+        Return the delay matrix and drop mask of ``(round, phase)``.
+
+        Rows of uncontrolled senders have zero delay and no drops. The last phase is
+        cached, so per-message queries within a phase do not resample.
+        """
+        cached = self._cached
+        if cached is not None and cached.round == round and cached.phase == phase:
+            return cached
+
+        sampled = self.model.sample_phase(round, phase)
+        delays = np.where(self.senders[:, None], sampled.delays, 0.0)
+        dropped = sampled.dropped & self.senders[:, None]
+        order = arrival_order(delays, dropped)
+        self._cached = PhaseDelays(round, phase, delays, dropped, order)
+        return self._cached
+
+    def should_drop(self, message: Message) -> bool:
+        """Return True if every link of the sender drops ``message`` this phase."""
+        return self._row_dropped(message.round, message.phase, message.sender_id)
+
+    def should_drop_frame(self, view: FrameView) -> bool:
+        """Header-only variant of ``should_drop()``."""
+        header = view.header
+        return self._row_dropped(header.round, header.phase, header.sender_id)
+
+    def get_delay(self, message: Message, receiver: Optional[int] = None) -> float:
+        """
+        Return the delay of ``message`` towards ``receiver`` (or its slowest link).
+
+        Always in [0, Δ].
+        """
+        row = self.phase_links(message.round, message.phase).delays[message.sender_id]
+        return float(row.max() if receiver is None else row[receiver])
+
+    def intercept_send(self, message: Message) -> List[Message]:
+        return [] if self.should_drop(message) else [message]
+
+    def controlled_senders(self) -> FrozenSet[int]:
+        """The corrupted senders whose links this adversary delays and drops."""
+        return frozenset(np.flatnonzero(self.senders).tolist())
+
+    def compile_route(self, round: int, phase: str, sender: int) -> RouteEntry:
+        """
+        Compile ``sender``'s links of ``(round, phase)`` into one routing entry.
+
+        The entry carries the dropped receivers and the exact per-link delays, so routing
+        through it matches ``schedule_broadcast()`` (deliveries and drop log). Uncontrolled
+        senders compile to PASS.
+        """
+        if not self.senders[sender]:
+            return PASS
+        links = self.phase_links(round, phase)
+        dropped = frozenset(np.flatnonzero(links.dropped[sender]).tolist())
+        if self._row_dropped(round, phase, sender):
+            return RouteEntry(RouteAction.DROP, dropped=dropped)
+        return RouteEntry(
+            RouteAction.DELAY,
+            dropped=dropped,
+            link_delays=tuple(links.delays[sender].tolist()),
+        )
+
+    def schedule_broadcast(
+        self, round: int, phase: str, messages: Sequence[Message]
+    ) -> List[Delivery]:
+        """
+        Apply the phase matrices to a whole broadcast at once.
+
+        Every message is sent to every receiver over its sender's links; dropped links are
+        omitted and logged.
+
+        Args:
+            round: Round number
+            phase: Protocol phase
+            messages: Messages broadcast in the phase (one or more per sender)
+
+        Returns:
+            ``(delay, receiver, message)`` triples in arrival order (ties by sender, then
+            receiver, then emission order)
+        """
+        links = self.phase_links(round, phase)
+        by_sender: Dict[int, List[Message]] = {}
+        for message in messages:
+            by_sender.setdefault(message.sender_id, []).append(message)
+
+        active = np.zeros(self.n, dtype=bool)
+        active[list(by_sender)] = True
+        order = links.order[active[links.order // self.n]]
+        senders, receivers = np.divmod(order, self.n)
+        delays = links.delays.ravel()[order]
+
+        self._log_drops(links, by_sender)
+        return [
+            (delay, receiver, message)
+            for delay, sender, receiver in zip(
+                delays.tolist(), senders.tolist(), receivers.tolist()
+            )
+            for message in by_sender[sender]
+        ]
+
+    def _row_dropped(self, round: int, phase: str, sender: int) -> bool:
+        """Return True if all links of ``sender`` except the self-link are dropped."""
+        dropped = self.phase_links(round, phase).dropped[sender]
+        return bool(self.senders[sender] and dropped.sum() == self.n - 1 and self.n > 1)
+
+    def _log_drops(self, links: PhaseDelays, by_sender: Dict[int, List[Message]]) -> None:
+        """Log one audit entry per message with its dropped receivers."""
+        for sender, messages in by_sender.items():
+            receivers: List[Any] = np.flatnonzero(links.dropped[sender]).tolist()
+            if not receivers:
+                continue
+            for message in messages:
+                self.log("drop", FrameHeader.of(message), receivers=receivers)
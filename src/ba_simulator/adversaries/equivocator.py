@@ -0,0 +1,151 @@
+"""
+Equivocator Adversary
+
+A corrupted node that signs conflicting values for the same
+``(round, protocol_id, phase, sender_id)`` and sends different versions to different
+recipients (targeted equivocation). Equivocation is limited to the configured phases;
+messages of other phases are forwarded unchanged.
+
+Signing dominates the cost of equivocation-heavy runs. Instead of signing one message per
+recipient at send time, the equivocator plans a whole round up front: it builds every
+distinct variant, signs each one exactly once in a single ``ParallelSigner`` batch, and
+hands the same signed ``Message`` object to every recipient of that variant.
+"""
+
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from ba_simulator.adversaries.adversary import AdversaryStrategy
+from ba_simulator.adversaries.composition import PASS, RouteAction, RouteEntry
+from ba_simulator.transport.crypto import NodeKeys, ParallelSigner
+from ba_simulator.transport.framing import FrameHeader
+from ba_simulator.transport.message import Message
+
+
+@dataclass
+class EquivocationPlan:
+    """
+    Signed messages of one round, per recipient.
+
+    Fields:
+        deliveries: Messages to send to each recipient, in send order
+        variants: Every distinct signed message of the round
+    """
+
+    deliveries: Dict[int, List[Message]] = field(default_factory=dict)
+    variants: List[Message] = field(default_factory=list)
+
+    def messages_for(self, receiver: int) -> List[Message]:
+        """Return the messages planned for ``receiver``."""
+        return self.deliveries.get(receiver, [])
+
+
+class EquivocatorAdversary(AdversaryStrategy):
+    """
+    Sends different signed values to different recipients in selected phases.
+
+    Recipient ``r`` receives variant ``values[r % len(values)]``.
+
+    Example:
+        >>> adversary = EquivocatorAdversary(3, keys, n=7, values=["A", "B"])
+        >>> plan = adversary.plan_round(outgoing)
+        >>> plan.messages_for(0)[0].value, plan.messages_for(1)[0].value
+        ('A', 'B')
+    """
+
+    rewrites_content = True
+
+    def __init__(
+        self,
+        node_id: int,
+        keys: NodeKeys,
+        n: int,
+        values: Sequence[Any],
+        phases: Iterable[str] = ("SEND",),
+        signer: Optional[ParallelSigner] = None,
+        seed: int = 0,
+    ) -> None:
+        """
+        Initialize the equivocator.
+
+        Args:
+            node_id: Corrupted node ID
+            keys: The corrupted node's keys (the adversary signs validly)
+            n: Number of nodes (recipients are 0..n-1)
+            values: Conflicting values to send (at least two)
+            phases: Phases in which to equivocate
+            signer: Batch signer (a private inline signer if omitted)
+            seed: Seed for the strategy RNG
+
+        Raises:
+            ValueError: If fewer than two values are given
+        """
+        if len(values) < 2:
+            raise ValueError("equivocation requires at least two values")
+        phases = tuple(phases)
+        super().__init__(node_id, "equivocator", {"values": list(values), "phases": phases}, seed)
+        self.keys = keys
+        self.n = n
+        self.values = list(values)
+        self.phases = frozenset(phases)
+        self.signer = signer or ParallelSigner()
+
+    def should_drop(self, message: Message) -> bool:
+        return False
+
+    def plan_round(self, messages: Sequence[Message]) -> EquivocationPlan:
+        """
+        Build and batch-sign every message of a round.
+
+        Messages outside the equivocation phases are delivered to all recipients as they
+        are (already signed by the node).
+
+        Returns:
+            Per-recipient deliveries sharing one signed object per variant
+        """
+        plan = EquivocationPlan(deliveries={receiver: [] for receiver in range(self.n)})
+        unsigned: List[Message] = []
+        for message in messages:
+            if message.phase not in self.phases:
+                for receiver in range(self.n):
+                    plan.deliveries[receiver].append(message)
+                continue
+            start = len(unsigned)
+            unsigned.extend(replace(message, value=value) for value in self.values)
+            for receiver in range(self.n):
+                plan.deliveries[receiver].append(unsigned[start + receiver % len(self.values)])
+            self.log("equivocate", FrameHeader.of(message), variants=len(self.values))
+
+        signatures = self.signer.sign_batch(self.keys, [m.signing_payload() for m in unsigned])
+        signed = {
+            id(message): replace(message, signature=signature)
+            for message, signature in zip(unsigned, signatures)
+        }
+        for receiver, queue in plan.deliveries.items():
+            plan.deliveries[receiver] = [signed.get(id(message), message) for message in queue]
+        plan.variants = list(signed.values())
+        return plan
+
+    def intercept_send(self, message: Message) -> List[Message]:
+        """Return every signed variant of ``message`` (or ``[message]`` outside the phases)."""
+        return self.intercept_batch([message])[0]
+
+    def intercept_batch(self, messages: Sequence[Message]) -> List[List[Message]]:
+        """Return the signed variants of every message, signed in one batch."""
+        variants = self.plan_round(messages).variants
+        k = len(self.values)
+        sent: List[List[Message]] = []
+        position = 0
+        for message in messages:
+            if message.phase not in self.phases:
+                sent.append([message])
+            else:
+                sent.append(variants[position : position + k])
+                position += k
+        return sent
+
+    def compile_route(self, round: int, phase: str, sender: int) -> RouteEntry:
+        """Equivocation phases compile to VARIANT (receiver r gets ``values[r % k]``)."""
+        if phase not in self.phases:
+            return PASS
+        return RouteEntry(RouteAction.VARIANT, variants=len(self.values))
@@ -0,0 +1,307 @@
+"""
+Withholder Adversary
+
+A corrupted node that holds back its terminal-phase messages (e.g. READY) and releases
+them only in a configurable late round, to stretch honest nodes' waiting time.
+
+Withheld messages are kept as ``DeferredMessage`` descriptors: a recipient set and a
+release round pointing at a shared ``MessageTemplate``. One template exists per distinct
+message (routing header - hence round and phase - value, aux and signature), so a message
+withheld towards several recipient sets is stored once. Ed25519 signatures are
+deterministic, so signing again on release would reproduce the same bytes: a template keeps
+the node's original signature, and a frame intercepted at frame level is kept as its
+original bytes (never decoded) and forwarded unchanged. Signing and serialization are
+deferred to ``release()`` / ``release_frames()``: templates withheld before signing
+(placeholder signature) are signed there once each, all due in a round in one
+``ParallelSigner`` batch. Messages that are never released cost no signature, no decoding
+and no serialization.
+"""
+
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, List, Optional, Tuple
+
+from ba_simulator.adversaries.adversary import AdversaryStrategy
+from ba_simulator.protocols.protocol_fsm import canonical_value_key
+from ba_simulator.transport.crypto import NodeKeys, ParallelSigner
+from ba_simulator.transport.framing import FrameHeader, FrameView, encode_frame
+from ba_simulator.transport.message import Message
+from ba_simulator.transport.serialization import MessageSerializer
+
+Release = Tuple[Message, FrozenSet[int]]
+
+_UNSIGNED = b"\x00" * 64
+
+
+@dataclass(frozen=True)
+class MessageTemplate:
+    """
+    Content of a withheld message, shared by every descriptor withholding it.
+
+    Fields:
+        header: Routing header (ssid, round, protocol_id, phase, sender_id)
+        value: Message value (None for frame templates)
+        digest: Optional value digest
+        aux: Auxiliary data (a copy owned by the template)
+        signature: The node's original signature (placeholder if withheld before signing)
+        frame: Original frame bytes if withheld at frame level
+    """
+
+    header: FrameHeader
+    value: Any = None
+    digest: Optional[bytes] = None
+    aux: Dict[str, Any] = field(default_factory=dict)
+    signature: bytes = _UNSIGNED
+    frame: Optional[bytes] = None
+
+    def message(self) -> Message:
+        """Build the message with the stored signature (decoding the frame if any)."""
+        if self.frame is not None:
+            return FrameView(self.frame).message
+        header = self.header
+        return Message(
+            ssid=header.ssid,
+            round=header.round,
+            protocol_id=header.protocol_id,
+            phase=header.phase,
+            sender_id=header.sender_id,
+            value=self.value,
+            digest=self.digest,
+            aux=dict(self.aux),
+            signature=self.signature,
+        )
+
+
+@dataclass(frozen=True)
+class DeferredMessage:
+    """
+    Descriptor of a withheld message.
+
+    Fields:
+        template: Shared content of the message
+        recipients: Nodes the message is released to
+        release_round: First round in which the message may be released
+    """
+
+    template: MessageTemplate
+    recipients: FrozenSet[int]
+    release_round: int
+
+    @property
+    def header(self) -> FrameHeader:
+        """Routing header of the withheld message."""
+        return self.template.header
+
+    def message(self) -> Message:
+        """Build the withheld message (see ``MessageTemplate.message()``)."""
+        return self.template.message()
+
+
+def _value_token(value: Any) -> Hashable:
+    """Hashable identity of a value: itself (by type) if hashable, else its canonical key."""
+    try:
+        hash(value)
+    except TypeError:
+        return canonical_value_key(value)
+    return (type(value), value)
+
+
+class WithholderAdversary(AdversaryStrategy):
+    """
+    Withholds terminal-phase messages until ``release_round``.
+
+    Example:
+        >>> adversary = WithholderAdversary(4, keys, n=7, phases=["READY"], release_round=9)
+        >>> adversary.intercept_send(ready)         # withheld: []
+        >>> for message, recipients in adversary.release(round=9):
+        ...     network.multicast(recipients, message)
+    """
+
+    def __init__(
+        self,
+        node_id: int,
+        keys: NodeKeys,
+        n: int,
+        release_round: int,
+        phases: Iterable[str] = ("READY",),
+        signer: Optional[ParallelSigner] = None,
+        seed: int = 0,
+    ) -> None:
+        """
+        Initialize the withholder.
+
+        Args:
+            node_id: Corrupted node ID
+            keys: The corrupted node's keys (released messages are signed validly)
+            n: Number of nodes (default recipients are 0..n-1)
+            release_round: Round in which withheld messages are released
+            phases: Phases to withhold
+            signer: Batch signer (a private inline signer if omitted)
+            seed: Seed for the strategy RNG
+        """
+        phases = tuple(phases)
+        super().__init__(
+            node_id, "withholder", {"release_round": release_round, "phases": phases}, seed
+        )
+        self.keys = keys
+        self.n = n
+        self.release_round = release_round
+        self.phases = frozenset(phases)
+        self.signer = signer or ParallelSigner()
+        self.deferred: List[DeferredMessage] = []
+        self._templates: Dict[Hashable, MessageTemplate] = {}
+
+    def should_drop(self, message: Message) -> bool:
+        return False
+
+    def intercept_send(self, message: Message) -> List[Message]:
+        """Withhold messages of the configured phases; pass the rest unchanged."""
+        if message.phase not in self.phases:
+            return [message]
+        self.withhold(message)
+        return []
+
+    def intercept_frame(
+        self, view: FrameView, serializer: Optional[MessageSerializer] = None
+    ) -> List[bytes]:
+        """Forward other phases and withhold the configured ones, by header alone."""
+        if view.header.phase not in self.phases:
+            return [view.frame]
+        self.withhold_frame(view)
+        return []
+
+    def withhold(
+        self, message: Message, recipients: Optional[Iterable[int]] = None
+    ) -> DeferredMessage:
+        """
+        Record ``message`` as deferred, sharing the template of an identical message.
+
+        Args:
+            message: Message to withhold
+            recipients: Release recipients (all nodes if omitted)
+
+        Returns:
+            The stored descriptor
+        """
+        header = FrameHeader.of(message)
+        key = (
+            header,
+            _value_token(message.value),
+            message.digest,
+            canonical_value_key(message.aux) if message.aux else None,
+            message.signature,
+        )
+        template = self._templates.get(key)
+        if template is None:
+            template = self._templates[key] = MessageTemplate(
+                header=header,
+                value=message.value,
+                digest=message.digest,
+                aux=dict(message.aux),
+                signature=message.signature,
+            )
+        return self._defer(template, recipients)
+
+    def withhold_frame(
+        self, view: FrameView, recipients: Optional[Iterable[int]] = None
+    ) -> DeferredMessage:
+        """Record an encoded frame as deferred without decoding its body."""
+        frame = bytes(view.frame)
+        template = self._templates.get(frame)
+        if template is None:
+            template = self._templates[frame] = MessageTemplate(header=view.header, frame=frame)
+        return self._defer(template, recipients)
+
+    def release(self, round: int) -> List[Release]:
+        """
+        Materialize every descriptor due by ``round``.
+
+        Released descriptors are removed. Each template is built once; messages keep the
+        node's original signature and only templates withheld before signing are signed,
+        in one batch.
+
+        Returns:
+            ``(message, recipients)`` pairs in withholding order
+        """
+        due = self._take_due(round)
+        built = self._build(due)
+        for descriptor in due:
+            self.log("release", descriptor.header, round=round)
+        return [(built[id(d.template)], d.recipients) for d in due]
+
+    def release_frames(
+        self, round: int, serializer: Optional[MessageSerializer] = None
+    ) -> List[Tuple[bytes, FrozenSet[int]]]:
+        """
+        Frame-level ``release()``: withheld frames are re-emitted as their original bytes.
+
+        Returns:
+            ``(frame, recipients)`` pairs in withholding order
+        """
+        due = self._take_due(round)
+        built = self._build([d for d in due if d.template.frame is None])
+        frames = {key: encode_frame(message, serializer) for key, message in built.items()}
+        released: List[Tuple[bytes, FrozenSet[int]]] = []
+        for descriptor in due:
+            frame = descriptor.template.frame
+            if frame is None:
+                frame = frames[id(descriptor.template)]
+            released.append((frame, descriptor.recipients))
+            self.log("release", descriptor.header, round=round)
+        return released
+
+    def discard(self) -> int:
+        """Drop every unreleased descriptor; returns how many were discarded."""
+        count = len(self.deferred)
+        self.deferred = []
+        self._templates = {}
+        return count
+
+    @property
+    def pending(self) -> int:
+        """Number of withheld, unreleased messages."""
+        return len(self.deferred)
+
+    @property
+    def templates(self) -> int:
+        """Number of distinct templates shared by the pending descriptors."""
+        return len(self._templates)
+
+    def _defer(
+        self, template: MessageTemplate, recipients: Optional[Iterable[int]]
+    ) -> DeferredMessage:
+        deferred = DeferredMessage(
+            template=template,
+            recipients=frozenset(range(self.n) if recipients is None else recipients),
+            release_round=self.release_round,
+        )
+        self.deferred.append(deferred)
+        self.log("withhold", deferred.header)
+        return deferred
+
+    def _take_due(self, round: int) -> List[DeferredMessage]:
+        """Remove and return the descriptors due by ``round``, dropping unused templates."""
+        due = [d for d in self.deferred if d.release_round <= round]
+        if due:
+            self.deferred = [d for d in self.deferred if d.release_round > round]
+            live = {id(d.template) for d in self.deferred}
+            self._templates = {
+                key: template for key, template in self._templates.items() if id(template) in live
+            }
+        return due
+
+    def _build(self, due: List[DeferredMessage]) -> Dict[int, Message]:
+        """
+        Build each distinct template of ``due`` once, keyed by template id.
+
+        Templates still carrying the placeholder signature are signed in one batch.
+        """
+        built: Dict[int, Message] = {}
+        for descriptor in due:
+            if id(descriptor.template) not in built:
+                built[id(descriptor.template)] = descriptor.message()
+        unsigned = [key for key, message in built.items() if message.signature == _UNSIGNED]
+        if unsigned:
+            payloads = [built[key].signing_payload() for key in unsigned]
+            for key, signature in zip(unsigned, self.signer.sign_batch(self.keys, payloads)):
+                built[key] = replace(built[key], signature=signature)
+        return built
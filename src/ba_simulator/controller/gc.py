@@ -0,0 +1,211 @@
+"""
+Round-Watermark Garbage Collection
+
+Termination stress tests run far past t+1 rounds, and every per-round structure - protocol
+inboxes, dedup entries, partial certificates, participation sets, carryover snapshots,
+late-arrival records, resident evidence - grows with the number of rounds.
+``WatermarkCollector`` bounds that growth with a retention model based on honest progress:
+
+    once every honest node has completed round r + k, data of rounds <= r is released
+
+where ``k`` is the lag configured per data kind. Each structure exposes
+``release_through(round) -> int`` and decides itself whether data is dropped or compacted
+into a summary (e.g. participation sets into digests, non-exported evidence into
+per-kind summaries; exported evidence is never touched). ``metrics`` reports per kind the
+items released and the estimated bytes reclaimed, measured with ``estimate_size()`` on the
+structure before and after each release.
+
+Messages referenced by certificates are pinned in their ``MessageStore``; the pins expire
+through ``release_pins_through()``, registered with a larger lag than the messages.
+
+Example wiring for a lock-step run:
+
+    collector = WatermarkCollector(honest=range(n), lag=2)
+    collector.register("inbox", cod.release_through)
+    collector.register("dedup", equivocations.release_through)
+    collector.register("partial_certificates", message_store.release_through)
+    collector.register("certificates", message_store.release_pins_through, lag=8)
+    collector.register("evidence", evidence_store.release_through, lag=4)
+    runner.run(max_rounds, on_round_end=collector.round_completed)
+"""
+
+import sys
+from dataclasses import dataclass
+from types import FunctionType, MethodType, ModuleType
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+Release = Callable[[int], int]
+Size = Callable[[], int]
+
+_OPAQUE = (type, ModuleType, FunctionType, MethodType)
+
+
+def estimate_size(obj: Any) -> int:
+    """
+    Estimate the bytes held by ``obj`` and everything it references.
+
+    Follows containers, instance dicts and slots; every object is counted once. Classes,
+    modules and functions are not followed.
+    """
+    seen = set()
+    total = 0
+    stack: List[Any] = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen or isinstance(item, _OPAQUE):
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        if hasattr(item, "__dict__"):
+            stack.append(vars(item))
+        slots = getattr(type(item), "__slots__", ())
+        for slot in (slots,) if isinstance(slots, str) else slots:
+            if hasattr(item, slot):
+                stack.append(getattr(item, slot))
+    return total
+
+
+@dataclass
+class GCMetrics:
+    """
+    Collection statistics of one data kind.
+
+    Fields:
+        lag: Rounds of honest progress retained beyond the watermark
+        collections: Number of collections that released data
+        items_released: Total items released (as counted by the structure)
+        bytes_reclaimed: Estimated bytes reclaimed by those releases
+        released_through: Highest round released so far (-1 if none)
+    """
+
+    lag: int
+    collections: int = 0
+    items_released: int = 0
+    bytes_reclaimed: int = 0
+    released_through: int = -1
+
+
+class WatermarkCollector:
+    """
+    Releases per-round data once every honest node is far enough past it.
+
+    Attributes:
+        honest: IDs of the honest nodes whose progress defines the watermark
+        lag: Default retention lag k
+        metrics: Collection statistics per data kind
+    """
+
+    def __init__(self, honest: Iterable[int], lag: int = 1) -> None:
+        """
+        Initialize the collector.
+
+        Args:
+            honest: Honest node IDs
+            lag: Default number of completed rounds retained behind the slowest honest node
+
+        Raises:
+            ValueError: If lag is negative or no honest node is given
+        """
+        if lag < 0:
+            raise ValueError(f"lag must be non-negative, got {lag}")
+        self.honest = frozenset(honest)
+        if not self.honest:
+            raise ValueError("at least one honest node is required")
+        self.lag = lag
+        self.metrics: Dict[str, GCMetrics] = {}
+        self._release: Dict[str, Release] = {}
+        self._size: Dict[str, Optional[Size]] = {}
+        self._completed: Dict[int, int] = {}
+
+    def register(
+        self,
+        kind: str,
+        release: Release,
+        lag: Optional[int] = None,
+        size: Optional[Size] = None,
+    ) -> None:
+        """
+        Register a data kind.
+
+        Args:
+            kind: Name of the data kind (used in metrics)
+            release: ``release_through(round)`` of the structure; returns items released
+            lag: Per-kind lag overriding the default
+            size: Returns the structure's current size in bytes; defaults to
+                ``estimate_size()`` of the object ``release`` is bound to (bytes are not
+                measured for unbound callables without ``size``)
+
+        Raises:
+            ValueError: If the kind is already registered or lag is negative
+        """
+        if kind in self._release:
+            raise ValueError(f"data kind {kind!r} already registered")
+        lag = self.lag if lag is None else lag
+        if lag < 0:
+            raise ValueError(f"lag must be non-negative, got {lag}")
+        if size is None and isinstance(release, MethodType):
+            owner = release.__self__
+
+            def size() -> int:
+                return estimate_size(owner)
+
+        self._release[kind] = release
+        self._size[kind] = size
+        self.metrics[kind] = GCMetrics(lag=lag)
+
+    def advance(self, node_id: int, round: int) -> None:
+        """Record that honest node ``node_id`` completed ``round`` (others are ignored)."""
+        if node_id in self.honest and round > self._completed.get(node_id, -1):
+            self._completed[node_id] = round
+
+    def progress(self) -> Optional[int]:
+        """Return the round completed by every honest node (None until all reported)."""
+        if len(self._completed) < len(self.honest):
+            return None
+        return min(self._completed.values())
+
+    def collect(self) -> Dict[str, int]:
+        """
+        Release every kind up to its watermark ``progress() - lag``.
+
+        Returns:
+            Items released per kind by this call
+        """
+        progress = self.progress()
+        released: Dict[str, int] = {}
+        if progress is None:
+            return released
+        for kind, release in self._release.items():
+            metrics = self.metrics[kind]
+            watermark = progress - metrics.lag
+            if watermark <= metrics.released_through:
+                continue
+            size = self._size[kind]
+            before = size() if size is not None else 0
+            count = release(watermark)
+            if size is not None:
+                metrics.bytes_reclaimed += max(0, before - size())
+            metrics.released_through = watermark
+            metrics.items_released += count
+            metrics.collections += 1
+            released[kind] = count
+        return released
+
+    def round_completed(self, round: int) -> None:
+        """Lock-step hook: every honest node completed ``round``; collect."""
+        for node_id in self.honest:
+            self.advance(node_id, round)
+        self.collect()
+
+    def total_items_released(self) -> int:
+        """Items released across all kinds."""
+        return sum(metrics.items_released for metrics in self.metrics.values())
+
+    def total_bytes_reclaimed(self) -> int:
+        """Estimated bytes reclaimed across all kinds."""
+        return sum(metrics.bytes_reclaimed for metrics in self.metrics.values())
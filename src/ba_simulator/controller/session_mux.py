@@ -0,0 +1,309 @@
+"""
+Multiplexed Concurrent BA Sessions
+
+Every ``Message`` carries an ``ssid`` identifying the BA instance it belongs to. This module
+runs many such instances concurrently inside one asyncio event loop instead of launching
+one process per instance.
+
+Sessions share:
+- the transport (one ``SessionMultiplexer`` routes every message by ``ssid``)
+- key material (opaque object handed to every session)
+- a verification cache (a signature checked once is never checked again)
+- a timer service (all Δ timeouts are scheduled on the same loop)
+
+Experiment replications thus become concurrent sessions, and throughput can be reported
+directly as agreements per second.
+"""
+
+import asyncio
+import hashlib
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ba_simulator.transport.message import Message
+
+
+class VerificationCache:
+    """
+    Bounded LRU cache of signature verification results.
+
+    Entries are keyed by ``(sha256(signing_payload), signature)`` so identical signed
+    messages seen by several sessions (or several times) are verified only once.
+    """
+
+    def __init__(self, max_entries: int = 65536) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached results
+
+        Raises:
+            ValueError: If max_entries is not positive
+        """
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+        self.max_entries = max_entries
+        self._results: "OrderedDict[Tuple[bytes, bytes], bool]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def verify(self, message: Message, verifier: Callable[[Message], bool]) -> bool:
+        """
+        Return the verification result for ``message``, calling ``verifier`` on a miss.
+
+        Args:
+            message: Signed message
+            verifier: Function performing the actual signature check
+
+        Returns:
+            True if the signature is valid
+        """
+        key = (hashlib.sha256(message.signing_payload()).digest(), message.signature)
+        cached = self._results.get(key)
+        if cached is not None:
+            self._results.move_to_end(key)
+            self.hits += 1
+            return cached
+
+        self.misses += 1
+        result = bool(verifier(message))
+        self._results[key] = result
+        if len(self._results) > self.max_entries:
+            self._results.popitem(last=False)
+        return result
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+
+class TimerService:
+    """
+    Shared timer service for all sessions on one event loop.
+
+    Sessions use ``sleep()`` for Δ timeouts and ``call_later()`` for callbacks; the service
+    keeps a count of pending timers for diagnostics.
+    """
+
+    def __init__(self) -> None:
+        self.pending = 0
+
+    async def sleep(self, delay: float) -> None:
+        """Suspend the calling session for ``delay`` seconds."""
+        self.pending += 1
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self.pending -= 1
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> asyncio.TimerHandle:
+        """Schedule ``callback`` after ``delay`` seconds on the running loop."""
+        self.pending += 1
+
+        def fire() -> None:
+            self.pending -= 1
+            callback()
+
+        return asyncio.get_running_loop().call_later(delay, fire)
+
+
+@dataclass
+class SharedServices:
+    """
+    Services shared by every session of a multiplexer.
+
+    Fields:
+        transport: The multiplexer itself, used to broadcast messages
+        keys: Key material shared by all sessions (opaque to the multiplexer)
+        verification_cache: Shared signature verification cache
+        timers: Shared timer service
+    """
+
+    transport: "SessionMultiplexer"
+    keys: Any
+    verification_cache: VerificationCache
+    timers: TimerService
+
+
+class BASession(ABC):
+    """
+    One BA instance run by a ``SessionMultiplexer``.
+
+    Incoming messages for the session's ``ssid`` are placed in ``self.inbox``; ``run()``
+    consumes them and returns the session's decision.
+    """
+
+    def __init__(self, ssid: str) -> None:
+        if not ssid:
+            raise ValueError("ssid must be a non-empty string")
+        self.ssid = ssid
+        self.inbox: "asyncio.Queue[Message]" = asyncio.Queue()
+
+    def deliver(self, message: Message) -> None:
+        """Accept a routed message (called by the multiplexer)."""
+        self.inbox.put_nowait(message)
+
+    @abstractmethod
+    async def run(self, services: SharedServices) -> Any:
+        """
+        Execute the BA instance to completion.
+
+        Args:
+            services: Shared transport, keys, verification cache and timers
+
+        Returns:
+            The decided value
+        """
+        pass
+
+
+@dataclass
+class MultiplexResult:
+    """
+    Outcome of running sessions through a multiplexer.
+
+    Fields:
+        decisions: Decided value per ssid
+        wall_time: Wall-clock duration of the run in seconds
+        routed: Messages delivered to a session
+        unroutable: Messages dropped because no active session matched their ssid
+    """
+
+    decisions: Dict[str, Any] = field(default_factory=dict)
+    wall_time: float = 0.0
+    routed: int = 0
+    unroutable: int = 0
+
+    @property
+    def agreements_per_second(self) -> float:
+        """Completed agreements per wall-clock second."""
+        if self.wall_time <= 0:
+            return 0.0
+        return len(self.decisions) / self.wall_time
+
+
+class SessionMultiplexer:
+    """
+    Run many BA sessions concurrently on one event loop over one shared transport.
+
+    Example:
+        >>> mux = SessionMultiplexer(keys=node_keys)
+        >>> result = await mux.run_all(MySession(f"rep-{i}") for i in range(100))
+        >>> result.agreements_per_second
+    """
+
+    def __init__(
+        self,
+        keys: Any = None,
+        verification_cache: Optional[VerificationCache] = None,
+        timers: Optional[TimerService] = None,
+        max_concurrent: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize the multiplexer.
+
+        Args:
+            keys: Key material shared by all sessions
+            verification_cache: Shared cache (a new one is created if omitted)
+            timers: Shared timer service (a new one is created if omitted)
+            max_concurrent: Maximum number of sessions running at once (None = unlimited)
+        """
+        self.services = SharedServices(
+            transport=self,
+            keys=keys,
+            verification_cache=verification_cache or VerificationCache(),
+            timers=timers or TimerService(),
+        )
+        self.max_concurrent = max_concurrent
+        self._sessions: Dict[str, BASession] = {}
+        self.routed = 0
+        self.unroutable = 0
+
+    def register(self, session: BASession) -> None:
+        """
+        Make ``session`` reachable by its ssid.
+
+        Raises:
+            ValueError: If another active session already uses the ssid
+        """
+        if session.ssid in self._sessions:
+            raise ValueError(f"session {session.ssid!r} already registered")
+        self._sessions[session.ssid] = session
+
+    def unregister(self, ssid: str) -> None:
+        """Stop routing messages to ``ssid``."""
+        self._sessions.pop(ssid, None)
+
+    def route(self, message: Message) -> bool:
+        """
+        Deliver ``message`` to the session matching its ssid.
+
+        Messages for unknown or finished sessions are expected (late or Byzantine
+        traffic) and are counted and dropped.
+
+        Returns:
+            True if the message was delivered
+        """
+        session = self._sessions.get(message.ssid)
+        if session is None:
+            self.unroutable += 1
+            return False
+        self.routed += 1
+        session.deliver(message)
+        return True
+
+    async def broadcast(self, message: Message) -> None:
+        """Send ``message`` over the shared transport."""
+        self.route(message)
+
+    async def run_all(self, sessions: Iterable[BASession]) -> MultiplexResult:
+        """
+        Run every session concurrently and collect their decisions.
+
+        Args:
+            sessions: Sessions to execute; ssids must be unique
+
+        Returns:
+            MultiplexResult with decisions, routing counters and wall time
+
+        Raises:
+            ValueError: If two sessions, or a session and an active one, share an ssid;
+                raised before any session starts, so no session is left running
+        """
+        sessions = list(sessions)
+        ssids = [session.ssid for session in sessions]
+        duplicates = sorted(
+            {ssid for ssid in ssids if ssids.count(ssid) > 1 or ssid in self._sessions}
+        )
+        if duplicates:
+            raise ValueError(f"duplicate session ssids: {duplicates}")
+        limiter = asyncio.Semaphore(self.max_concurrent) if self.max_concurrent else None
+        routed_before, unroutable_before = self.routed, self.unroutable
+
+        async def run_one(session: BASession) -> Tuple[str, Any]:
+            if limiter is not None:
+                async with limiter:
+                    return await self._run_session(session)
+            return await self._run_session(session)
+
+        start = time.perf_counter()
+        outcomes: List[Tuple[str, Any]] = await asyncio.gather(*(run_one(s) for s in sessions))
+        wall_time = time.perf_counter() - start
+
+        return MultiplexResult(
+            decisions=dict(outcomes),
+            wall_time=wall_time,
+            routed=self.routed - routed_before,
+            unroutable=self.unroutable - unroutable_before,
+        )
+
+    async def _run_session(self, session: BASession) -> Tuple[str, Any]:
+        """Register, run and unregister one session."""
+        self.register(session)
+        try:
+            return session.ssid, await session.run(self.services)
+        finally:
+            self.unregister(session.ssid)
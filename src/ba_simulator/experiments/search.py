@@ -0,0 +1,423 @@
+"""
+Adversary Schedule Search
+
+Random adversaries rarely hit the worst case for a given ``(n, t, f)``. This module
+searches adversary schedules - one adversarial choice per round - for the ones that
+maximize rounds-to-decision.
+
+Three things keep the search cheap:
+
+- Process pool: candidates are evaluated in worker processes, in batches.
+- Prefix caching: candidates are sorted so that batches share execution prefixes. After
+  every round a worker snapshots the run (``CheckpointedRun.checkpoint()``) under the
+  schedule prefix executed so far; a later candidate with the same prefix restores the
+  longest cached snapshot instead of re-simulating those rounds.
+- Result cache: every evaluated schedule is appended to a JSON-lines file per problem,
+  so an interrupted search resumes without re-running finished candidates.
+
+Prefix caching relies on one contract: the behavior of round ``r`` may depend on
+``schedule[: r + 1]`` and the problem configuration only. Both caches are therefore keyed
+by ``SearchProblem.key()``, which covers the full configuration (``config()``: sizes,
+seed and adversary parameters), and a prefix cache is bound to one problem.
+"""
+
+import hashlib
+import itertools
+import json
+import multiprocessing
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from ba_simulator.controller.checkpoint import (
+    CheckpointCodec,
+    CheckpointedRun,
+    decode_value,
+    encode_value,
+)
+from ba_simulator.scheduling.determinism import SeedService
+from ba_simulator.scheduling.lockstep import LockstepResult
+
+Schedule = Tuple[Hashable, ...]
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    """
+    Outcome of one candidate schedule.
+
+    Fields:
+        schedule: Adversarial choice per round
+        score: Problem score (higher is worse for the protocol)
+        rounds: Rounds executed
+        decided: True if every node decided within ``max_rounds``
+        resumed_from: Length of the cached prefix the run resumed from (0 if none)
+    """
+
+    schedule: Schedule
+    score: float
+    rounds: int
+    decided: bool
+    resumed_from: int = 0
+
+    def rank_key(self) -> Tuple[bool, float]:
+        """Sort key: undecided runs first, then by descending score."""
+        return (self.decided, -self.score)
+
+
+class SearchProblem(ABC):
+    """
+    A ``(n, t, f)`` configuration whose adversary schedules are searched.
+
+    Subclasses must be picklable (module-level) so workers can rebuild runs.
+
+    Attributes:
+        n: Number of nodes
+        t: Byzantine fault bound
+        f: Number of corrupted nodes
+        max_rounds: Round limit of each run
+        seed: Seed of the run's randomness
+        adversary: Adversary parameters (anything besides the schedule that shapes a run)
+    """
+
+    def __init__(
+        self,
+        n: int,
+        t: int,
+        f: int,
+        max_rounds: int,
+        seed: int = 0,
+        adversary: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        """
+        Raises:
+            ValueError: If f is not in [0, t] or max_rounds is not positive
+        """
+        if not 0 <= f <= t:
+            raise ValueError(f"f must be in [0, t={t}], got {f}")
+        if max_rounds <= 0:
+            raise ValueError(f"max_rounds must be positive, got {max_rounds}")
+        self.n = n
+        self.t = t
+        self.f = f
+        self.max_rounds = max_rounds
+        self.seed = seed
+        self.adversary = dict(adversary or {})
+
+    @abstractmethod
+    def build(self, schedule: Schedule) -> CheckpointedRun:
+        """Build a fresh run driven by ``schedule`` (round r uses ``schedule[: r + 1]``)."""
+        pass
+
+    def score(self, result: LockstepResult) -> float:
+        """Score a finished run; rounds-to-decision by default."""
+        return float(result.rounds)
+
+    def config(self) -> Dict[str, Any]:
+        """
+        Return the full configuration a run depends on besides its schedule.
+
+        Subclasses with further parameters extend the returned dict; values must be
+        encodable with ``encode_value``.
+        """
+        return {
+            "n": self.n,
+            "t": self.t,
+            "f": self.f,
+            "max_rounds": self.max_rounds,
+            "seed": self.seed,
+            "adversary": self.adversary,
+        }
+
+    def key(self) -> str:
+        """Identifier of the problem in the caches, covering the full ``config()``."""
+        encoded = json.dumps(encode_value(self.config()), sort_keys=True, separators=(",", ":"))
+        digest = hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+        return f"{type(self).__name__}-n{self.n}-t{self.t}-f{self.f}-r{self.max_rounds}-{digest}"
+
+
+class PrefixCache:
+    """
+    LRU cache of encoded round-boundary checkpoints keyed by schedule prefix.
+
+    Snapshots are only valid for one problem configuration: a cache is bound to the key of
+    the first problem ``evaluate()`` uses it with (or to ``scope``).
+
+    Example:
+        >>> cache = PrefixCache(max_entries=256, scope=problem.key())
+        >>> cache.store(("drop", "pass"), run.checkpoint())
+        >>> length, checkpoint = cache.longest(("drop", "pass", "delay"))
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        codec: Optional[CheckpointCodec] = None,
+        scope: Optional[str] = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.codec = codec or CheckpointCodec()
+        self.scope = scope
+        self._entries: "OrderedDict[Schedule, bytes]" = OrderedDict()
+
+    def bind(self, scope: str) -> None:
+        """
+        Bind the cache to the problem key ``scope``.
+
+        Raises:
+            ValueError: If the cache is already bound to another problem
+        """
+        if self.scope is None:
+            self.scope = scope
+        elif self.scope != scope:
+            raise ValueError(f"prefix cache of {self.scope!r} cannot serve {scope!r}")
+
+    def store(self, prefix: Schedule, checkpoint: Any) -> None:
+        """Cache ``checkpoint`` as the state after executing ``prefix``."""
+        self._entries[prefix] = self.codec.encode(checkpoint)
+        self._entries.move_to_end(prefix)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def longest(self, schedule: Schedule) -> Tuple[int, Any]:
+        """
+        Return the longest cached proper prefix of ``schedule``.
+
+        Returns:
+            ``(length, checkpoint)``, or ``(0, None)`` if no prefix is cached
+        """
+        for length in range(len(schedule) - 1, 0, -1):
+            data = self._entries.get(schedule[:length])
+            if data is not None:
+                self._entries.move_to_end(schedule[:length])
+                return length, self.codec.decode(data)
+        return 0, None
+
+    def __contains__(self, prefix: Schedule) -> bool:
+        return prefix in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def evaluate(problem: SearchProblem, schedule: Schedule, cache: PrefixCache) -> SearchResult:
+    """
+    Run one schedule, resuming from and extending the prefix cache.
+
+    Returns:
+        The candidate's SearchResult
+
+    Raises:
+        ValueError: If ``cache`` holds snapshots of another problem configuration
+    """
+    cache.bind(problem.key())
+    run = problem.build(schedule)
+    resumed_from, checkpoint = cache.longest(schedule)
+    if checkpoint is not None:
+        run.restore(checkpoint)
+
+    def on_round_end(round: int) -> None:
+        prefix = schedule[: round + 1]
+        if round + 1 < len(schedule) and prefix not in cache:
+            cache.store(prefix, run.checkpoint())
+
+    result = run.runner.run(problem.max_rounds, on_round_end=on_round_end)
+    return SearchResult(
+        schedule=schedule,
+        score=problem.score(result),
+        rounds=result.rounds,
+        decided=result.all_decided(problem.n),
+        resumed_from=resumed_from,
+    )
+
+
+def _evaluate_batch(
+    problem: SearchProblem, schedules: List[Schedule], max_entries: int
+) -> List[SearchResult]:
+    """Worker entry point: evaluate a prefix-sorted batch with a private cache."""
+    cache = PrefixCache(max_entries, scope=problem.key())
+    return [evaluate(problem, schedule, cache) for schedule in schedules]
+
+
+def _schedule_key(schedule: Schedule) -> str:
+    """Canonical JSON key of a schedule."""
+    return json.dumps(encode_value(tuple(schedule)), sort_keys=True, separators=(",", ":"))
+
+
+class ResultCache:
+    """
+    Append-only on-disk store of evaluated schedules for one problem.
+
+    Results live in ``<directory>/<problem key>.jsonl``; existing results are loaded on
+    construction.
+    """
+
+    def __init__(self, directory: Union[str, Path], problem_key: str) -> None:
+        self.path = Path(directory) / f"{problem_key}.jsonl"
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._results: Dict[str, SearchResult] = {}
+        if self.path.exists():
+            for line in self.path.read_text(encoding="utf-8").splitlines():
+                if line.strip():
+                    self._remember(self._decode(json.loads(line)))
+
+    def get(self, schedule: Schedule) -> Optional[SearchResult]:
+        """Return the cached result of ``schedule``, if any."""
+        return self._results.get(_schedule_key(schedule))
+
+    def add(self, result: SearchResult) -> None:
+        """Persist ``result`` (one JSON line, flushed immediately)."""
+        record = {
+            "schedule": encode_value(tuple(result.schedule)),
+            "score": result.score,
+            "rounds": result.rounds,
+            "decided": result.decided,
+        }
+        with open(self.path, "a", encoding="utf-8") as handle:
+            handle.write(json.dumps(record, sort_keys=True) + "\n")
+        self._remember(result)
+
+    def best(self, k: int = 1) -> List[SearchResult]:
+        """Return the ``k`` worst-case schedules found so far."""
+        return sorted(self._results.values(), key=SearchResult.rank_key)[:k]
+
+    def _remember(self, result: SearchResult) -> None:
+        self._results[_schedule_key(result.schedule)] = result
+
+    @staticmethod
+    def _decode(record: Dict[str, Any]) -> SearchResult:
+        return SearchResult(
+            schedule=tuple(decode_value(record["schedule"])),
+            score=record["score"],
+            rounds=record["rounds"],
+            decided=record["decided"],
+        )
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+
+def exhaustive_schedules(choices: Sequence[Hashable], horizon: int) -> Iterator[Schedule]:
+    """Yield every schedule of ``horizon`` rounds over ``choices``."""
+    return itertools.product(choices, repeat=horizon)
+
+
+def random_schedules(
+    choices: Sequence[Hashable], horizon: int, count: int, seeds: SeedService
+) -> List[Schedule]:
+    """Draw ``count`` schedules from the ``("schedule-search", i)`` streams of ``seeds``."""
+    return [
+        tuple(
+            choices[j]
+            for j in seeds.stream("schedule-search", i).integers(len(choices), size=horizon)
+        )
+        for i in range(count)
+    ]
+
+
+class AdversarySearch:
+    """
+    Parallel worst-case search over adversary schedules.
+
+    Example:
+        >>> search = AdversarySearch(MyProblem(n=7, t=2, f=2, max_rounds=12),
+        ...                          cache_dir=".search-cache", workers=8)
+        >>> search.search(exhaustive_schedules(["pass", "drop", "split"], horizon=5))
+        >>> search.best(3)
+    """
+
+    def __init__(
+        self,
+        problem: SearchProblem,
+        cache_dir: Optional[Union[str, Path]] = None,
+        workers: int = 1,
+        batch_size: int = 64,
+        prefix_entries: int = 1024,
+        mp_context: Optional[Any] = None,
+    ) -> None:
+        """
+        Initialize the search.
+
+        Args:
+            problem: Configuration to search
+            cache_dir: Directory of the on-disk result cache (in-memory only if omitted)
+            workers: Worker processes; 1 evaluates in the current process
+            batch_size: Candidates per worker task (consecutive in prefix order)
+            prefix_entries: Prefix snapshots kept per worker
+            mp_context: multiprocessing context (defaults to the platform default)
+
+        Raises:
+            ValueError: If workers or batch_size is not positive
+        """
+        if workers <= 0 or batch_size <= 0:
+            raise ValueError("workers and batch_size must be positive")
+        self.problem = problem
+        self.workers = workers
+        self.batch_size = batch_size
+        self.prefix_entries = prefix_entries
+        self.mp_context = mp_context or multiprocessing.get_context()
+        self.results: Dict[str, SearchResult] = {}
+        self.cache = ResultCache(cache_dir, problem.key()) if cache_dir is not None else None
+
+    def search(self, candidates: Iterable[Sequence[Hashable]]) -> List[SearchResult]:
+        """
+        Evaluate every candidate not already cached.
+
+        Returns:
+            Results of all candidates (cached and new), worst case first
+        """
+        schedules = list(dict.fromkeys(tuple(candidate) for candidate in candidates))
+        pending: List[Schedule] = []
+        for schedule in schedules:
+            cached = self.cache.get(schedule) if self.cache is not None else None
+            if cached is None:
+                pending.append(schedule)
+            else:
+                self.results[_schedule_key(schedule)] = cached
+
+        for result in self._run(sorted(pending, key=lambda s: [_schedule_key((c,)) for c in s])):
+            self.results[_schedule_key(result.schedule)] = result
+            if self.cache is not None:
+                self.cache.add(result)
+
+        found = [self.results[_schedule_key(schedule)] for schedule in schedules]
+        return sorted(found, key=SearchResult.rank_key)
+
+    def best(self, k: int = 1) -> List[SearchResult]:
+        """Return the ``k`` worst-case schedules evaluated or cached so far."""
+        pool = dict(self.results)
+        if self.cache is not None:
+            pool.update({_schedule_key(r.schedule): r for r in self.cache.best(k)})
+        return sorted(pool.values(), key=SearchResult.rank_key)[:k]
+
+    def _run(self, pending: List[Schedule]) -> Iterator[SearchResult]:
+        """Evaluate prefix-sorted candidates in batches."""
+        batches = [
+            pending[i : i + self.batch_size] for i in range(0, len(pending), self.batch_size)
+        ]
+        if self.workers == 1:
+            for batch in batches:
+                yield from _evaluate_batch(self.problem, batch, self.prefix_entries)
+            return
+        with ProcessPoolExecutor(max_workers=self.workers, mp_context=self.mp_context) as pool:
+            futures = [
+                pool.submit(_evaluate_batch, self.problem, batch, self.prefix_entries)
+                for batch in batches
+            ]
+            for future in futures:
+                yield from future.result()
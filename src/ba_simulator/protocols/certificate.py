@@ -0,0 +1,256 @@
+"""
+Signer-Bitmap Certificates
+
+A certificate is n-t signed messages for the same ``(round, phase, value)``. Storing it as
+``List[Message]`` makes every node keep its own list per certificate per round, i.e.
+O(n^2) message references per round across the network.
+
+``CompactCertificate`` stores only a header (ssid, round, protocol, phase, value digest)
+and an integer bitmap of signer IDs. The messages themselves live once in a shared,
+deduplicated ``MessageStore``; the certificate materializes them on demand (export,
+verification, or plain iteration) and otherwise costs O(n) bits.
+
+``CompactCertificate`` is a read-only ``Sequence[Message]`` ordered by sender ID, so code
+that iterates ``ProtocolOutput.certificate`` works unchanged.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from ba_simulator.protocols.equivocation import value_digest
+from ba_simulator.transport.message import Message
+
+CertificateKey = Tuple[str, int, str, str, bytes]
+
+
+def certificate_key(message: Message) -> CertificateKey:
+    """
+    Return the ``(ssid, round, protocol_id, phase, value digest)`` key of ``message``.
+
+    The digest is computed locally from the canonical value (``value_digest``), never taken
+    from the sender: the store is shared across nodes, so a sender-chosen key would let one
+    node be handed another node's message carrying a different value.
+    """
+    return (
+        message.ssid,
+        message.round,
+        message.protocol_id,
+        message.phase,
+        value_digest(message),
+    )
+
+
+class MessageStore:
+    """
+    Shared deduplicated store of signed messages, grouped by certificate key.
+
+    One store can back the certificates of every node in a simulation: a message delivered
+    to n nodes is stored once.
+
+    Pins are bounded by the store: only stored messages can be pinned, and
+    ``release_pins_through()`` expires the pins of old rounds together with the GC watermark.
+
+    Example:
+        >>> store = MessageStore(n=7)
+        >>> msg = store.add(incoming)          # canonical instance
+        >>> cert = CompactCertificate.from_messages(quorum, store)
+        >>> list(cert)                         # materialized from the store
+    """
+
+    def __init__(self, n: Optional[int] = None) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            n: Number of participants; sender IDs must lie in [0, n) (only non-negative
+                IDs are enforced if omitted)
+
+        Raises:
+            ValueError: If n is not positive
+        """
+        if n is not None and n <= 0:
+            raise ValueError(f"n must be positive, got {n}")
+        self.n = n
+        self._messages: Dict[CertificateKey, Dict[int, Message]] = {}
+        self._pinned: Dict[CertificateKey, int] = {}
+
+    def check_sender(self, sender_id: int) -> None:
+        """
+        Validate a signer ID.
+
+        Raises:
+            ValueError: If ``sender_id`` is negative or not below ``n``
+        """
+        if sender_id < 0 or (self.n is not None and sender_id >= self.n):
+            raise ValueError(f"sender {sender_id} out of range for n={self.n}")
+
+    def add(self, message: Message) -> Message:
+        """
+        Store ``message`` unless an equivalent one is already present.
+
+        Returns:
+            The stored (canonical) instance for the message's key and sender
+
+        Raises:
+            ValueError: If the sender ID is out of range
+        """
+        self.check_sender(message.sender_id)
+        senders = self._messages.setdefault(certificate_key(message), {})
+        return senders.setdefault(message.sender_id, message)
+
+    def get(self, key: CertificateKey, sender_id: int) -> Message:
+        """
+        Return the stored message of ``sender_id`` under ``key``.
+
+        Raises:
+            KeyError: If no such message was stored
+        """
+        return self._messages[key][sender_id]
+
+    def pin(self, key: CertificateKey, signers: int) -> None:
+        """
+        Keep the messages of ``signers`` (bitmap) under ``key`` across ``release_through()``.
+
+        Raises:
+            ValueError: If the bitmap is negative or names a signer without stored message
+        """
+        stored = sum(1 << sender for sender in self._messages.get(key, ()))
+        if signers < 0 or signers & ~stored:
+            raise ValueError(f"cannot pin signers {signers:#x}: messages not stored")
+        self._pinned[key] = self._pinned.get(key, 0) | signers
+
+    def release_through(self, round: int) -> int:
+        """
+        Drop messages of rounds <= ``round``, except those pinned by certificates.
+
+        Every ``CompactCertificate`` pins its signers' messages, so certificates that were
+        already built stay materializable.
+
+        Returns:
+            Number of messages released
+        """
+        released = 0
+        for key in [key for key in self._messages if key[1] <= round]:
+            pinned = self._pinned.get(key, 0)
+            senders = self._messages[key]
+            stale = [sender for sender in senders if not pinned >> sender & 1]
+            for sender in stale:
+                del senders[sender]
+            if not senders:
+                del self._messages[key]
+            released += len(stale)
+        return released
+
+    def release_pins_through(self, round: int) -> int:
+        """
+        Expire the pins of rounds <= ``round`` and drop the messages they still held.
+
+        Certificates of those rounds can no longer be materialized afterwards, so this is
+        registered with a larger GC lag than ``release_through()``.
+
+        Returns:
+            Number of messages released
+        """
+        released = 0
+        for key in [key for key in self._pinned if key[1] <= round]:
+            del self._pinned[key]
+            senders = self._messages.pop(key, {})
+            released += len(senders)
+        return released
+
+    def pinned(self) -> int:
+        """Number of certificate keys with pinned messages."""
+        return len(self._pinned)
+
+    def __len__(self) -> int:
+        """Number of stored messages."""
+        return sum(len(senders) for senders in self._messages.values())
+
+
+@dataclass(frozen=True)
+class CompactCertificate(Sequence):
+    """
+    Certificate header plus signer bitmap, backed by a ``MessageStore``.
+
+    Fields:
+        ssid: Session identifier
+        round: Round number
+        protocol_id: Subprotocol identifier
+        phase: Phase of the certified messages
+        value_digest: Digest of the certified value
+        signers: Bitmap with bit i set if node i signed
+        store: Store holding the signed messages (not part of equality)
+    """
+
+    ssid: str
+    round: int
+    protocol_id: str
+    phase: str
+    value_digest: bytes
+    signers: int
+    store: MessageStore = field(compare=False, repr=False)
+
+    @classmethod
+    def from_messages(
+        cls, messages: Iterable[Message], store: MessageStore
+    ) -> "CompactCertificate":
+        """
+        Build a certificate from messages sharing one certificate key.
+
+        Messages are added to ``store`` if missing and pinned there, so round garbage
+        collection of the store never strands the certificate before its pins expire.
+
+        Raises:
+            ValueError: If ``messages`` is empty, mixes certificate keys or has a sender ID
+                outside [0, n)
+        """
+        key = None
+        signers = 0
+        for message in messages:
+            message_key = certificate_key(message)
+            if key is None:
+                key = message_key
+            elif message_key != key:
+                raise ValueError("certificate messages must share round, phase and value")
+            store.add(message)
+            signers |= 1 << message.sender_id
+        if key is None:
+            raise ValueError("certificate requires at least one message")
+        store.pin(key, signers)
+        return cls(*key, signers=signers, store=store)
+
+    @property
+    def key(self) -> CertificateKey:
+        """The certificate key of the signed messages."""
+        return (self.ssid, self.round, self.protocol_id, self.phase, self.value_digest)
+
+    def signer_ids(self) -> List[int]:
+        """Return the signer IDs in ascending order."""
+        ids = []
+        bits = self.signers
+        while bits:
+            low = bits & -bits
+            ids.append(low.bit_length() - 1)
+            bits ^= low
+        return ids
+
+    def has_signer(self, sender_id: int) -> bool:
+        """Return True if ``sender_id`` is a signer (False for negative IDs)."""
+        return sender_id >= 0 and bool(self.signers >> sender_id & 1)
+
+    def materialize(self) -> List[Message]:
+        """Return the full signed messages, ordered by sender ID."""
+        key = self.key
+        return [self.store.get(key, sender) for sender in self.signer_ids()]
+
+    def __len__(self) -> int:
+        return bin(self.signers).count("1")
+
+    def __iter__(self) -> Iterator[Message]:
+        key = self.key
+        for sender in self.signer_ids():
+            yield self.store.get(key, sender)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Message, List[Message]]:
+        return self.materialize()[index]
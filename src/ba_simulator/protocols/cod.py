@@ -0,0 +1,188 @@
+"""
+Consistent Dissemination (CoD)
+
+Per-node CoD state machine with three phases:
+
+    SEND  -> ECHO   on n-t SEND messages carrying the same value
+    ECHO  -> READY  on n-t ECHO messages for a value, or t+1 READY messages (amplification)
+    READY -> output on n-t READY messages for a value (certificate)
+
+Only the first message of each sender in each phase is counted, so a sender contributes at
+most one value per phase. Incoming messages pass through an ``EquivocationIndex``: a sender
+signing a second, different value for the same phase is recorded with both messages as
+proof, and the conflicting message is not processed.
+
+When several values cross a threshold in the same check, the value with the smallest
+canonical key is chosen, which keeps execution deterministic.
+
+Accepted messages are interned in a ``MessageStore`` and the output certificate is a
+``CompactCertificate`` (signer bitmap) that materializes the READY messages on demand.
+
+Each transition is a ``@transition`` entry of the dispatch table compiled by
+``ProtocolFSM``; ``check_transition()`` runs them in SEND, ECHO, READY order and returns
+the messages the node must broadcast as ``(phase, value)`` pairs; building, signing and
+sending them is the caller's responsibility.
+"""
+
+from enum import Enum
+from typing import Any, List, Optional, Tuple
+
+from ba_simulator.protocols.certificate import CompactCertificate, MessageStore
+from ba_simulator.protocols.equivocation import (
+    EquivocationIndex,
+    EquivocationProof,
+    EquivocationStatus,
+)
+from ba_simulator.protocols.protocol_fsm import (
+    Action,
+    ProtocolFSM,
+    ProtocolOutput,
+    on_message,
+    transition,
+)
+from ba_simulator.transport.message import Message
+
+
+class CoDPhase(str, Enum):
+    """CoD protocol phases."""
+
+    SEND = "SEND"
+    ECHO = "ECHO"
+    READY = "READY"
+
+
+COD_PHASES = tuple(phase.value for phase in CoDPhase)
+
+
+class CoD(ProtocolFSM):
+    """
+    Scalar CoD state machine for a single node.
+
+    Example:
+        >>> cod = CoD(n=4, t=1, node_id=0)
+        >>> for msg in inbox:
+        ...     cod.process_message(msg)
+        >>> for phase, value in cod.check_transition():
+        ...     broadcast(phase, value)
+        >>> cod.get_output()
+    """
+
+    protocol_id = "CoD"
+
+    def __init__(
+        self,
+        n: int,
+        t: int,
+        node_id: int,
+        equivocation_index: Optional[EquivocationIndex] = None,
+        message_store: Optional[MessageStore] = None,
+    ) -> None:
+        """
+        Initialize the CoD FSM.
+
+        Args:
+            n: Number of participants
+            t: Byzantine fault bound
+            node_id: Local node identifier
+            equivocation_index: Index to share across protocol instances of this node
+                (a private one is created if omitted)
+            message_store: Deduplicated store backing the certificate, usually shared by
+                all nodes of a simulation (a private one is created if omitted)
+        """
+        super().__init__(n, t, node_id)
+        if equivocation_index is None:
+            equivocation_index = EquivocationIndex()
+        self.equivocations = equivocation_index
+        if message_store is None:
+            message_store = MessageStore(n)
+        self.message_store = message_store
+        self.has_echoed = False
+        self.has_readied = False
+        self.echo_value: Any = None
+        self.ready_value: Any = None
+        self._output: Optional[ProtocolOutput] = None
+
+    def initial_phase(self) -> str:
+        return CoDPhase.SEND.value
+
+    @on_message(*COD_PHASES)
+    def _accept(self, msg: Message) -> bool:
+        """
+        Accept the first CoD message of each sender per phase.
+
+        Duplicates are ignored; conflicting values are recorded as equivocation proofs and
+        never processed. The index is keyed by round, so a sender's message from another
+        round is FIRST there but still not stored over the sender's accepted message.
+
+        Returns:
+            True if the message was stored
+        """
+        if self.equivocations.observe(msg) is not EquivocationStatus.FIRST:
+            return False
+        if msg.sender_id in self.messages[msg.phase]:
+            return False
+        self.messages[msg.phase][msg.sender_id] = self.message_store.add(msg)
+        return True
+
+    def equivocation_proofs(self) -> List[EquivocationProof]:
+        """Return the equivocation proofs collected so far."""
+        return list(self.equivocations.proofs)
+
+    @transition(CoDPhase.SEND.value)
+    def _echo_on_send(self) -> List[Action]:
+        """SEND -> ECHO on n-t SEND messages for a value."""
+        if self.has_echoed:
+            return []
+        found = self._first_at_threshold(CoDPhase.SEND.value, self.strong_threshold)
+        if found is None:
+            return []
+        echo = CoDPhase.ECHO.value
+        self.has_echoed = True
+        self.echo_value = found[0]
+        self._transition(echo, f"{len(found[1])} SEND for value")
+        return [(echo, found[0])]
+
+    @transition(CoDPhase.ECHO.value)
+    def _ready_on_echo(self) -> List[Action]:
+        """ECHO -> READY on n-t ECHO messages, or t+1 READY messages (amplification)."""
+        if self.has_readied:
+            return []
+        ready = CoDPhase.READY.value
+        found = self._first_at_threshold(CoDPhase.ECHO.value, self.strong_threshold)
+        reason = "ECHO"
+        if found is None:
+            found = self._first_at_threshold(ready, self.weak_threshold)
+            reason = "READY (amplification)"
+        if found is None:
+            return []
+        self.has_readied = True
+        self.ready_value = found[0]
+        self._transition(ready, f"{len(found[1])} {reason} for value")
+        return [(ready, found[0])]
+
+    @transition(CoDPhase.READY.value)
+    def _output_on_ready(self) -> List[Action]:
+        """READY -> output on n-t READY messages (certificate)."""
+        if self._output is None:
+            found = self._first_at_threshold(CoDPhase.READY.value, self.strong_threshold)
+            if found is not None:
+                value, messages = found
+                certificate = CompactCertificate.from_messages(messages, self.message_store)
+                self._output = ProtocolOutput(
+                    value=value, certificate=certificate, metadata={"type": "certificate"}
+                )
+        return []
+
+    def get_output(self) -> Optional[ProtocolOutput]:
+        return self._output
+
+    def _first_at_threshold(
+        self, phase: str, threshold: int
+    ) -> Optional[Tuple[Any, List[Message]]]:
+        """Return the smallest-key value of ``phase`` with at least ``threshold`` senders."""
+        groups = self._messages_by_value(phase)
+        for key in sorted(groups):
+            value, messages = groups[key]
+            if len(messages) >= threshold:
+                return value, messages
+        return None
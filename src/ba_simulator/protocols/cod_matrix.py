@@ -0,0 +1,207 @@
+"""
+Bit-Matrix CoD Engine
+
+Vectorized CoD backend that simulates the CoD state machine of all n nodes at once.
+
+For every phase, which node has received which sender's message for which value is kept
+in a NumPy boolean tensor indexed ``[value_id, receiver, sender]``. A second matrix per
+phase records the first value accepted from each sender at each receiver, enforcing the
+same "first message per sender and phase" rule as the scalar ``CoD`` FSM.
+
+``step()`` evaluates the SEND/ECHO/READY thresholds for every node in one pass of array
+operations and returns the same broadcasts and outputs the per-node FSMs would produce for
+identical deliveries, including the smallest-canonical-key tie-break between values.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Optional
+
+import numpy as np
+
+from ba_simulator.protocols.cod import COD_PHASES, CoDPhase
+from ba_simulator.protocols.value_domain import ValueInterner
+from ba_simulator.transport.message import Message
+
+_NO_VALUE = -1
+
+
+@dataclass
+class CoDStep:
+    """
+    Threshold crossings found by one ``BitMatrixCoD.step()``.
+
+    Fields:
+        echo: Value each newly echoing node broadcasts in ECHO
+        ready: Value each newly ready node broadcasts in READY
+        outputs: Value each newly certified node outputs
+    """
+
+    echo: Dict[int, Any] = field(default_factory=dict)
+    ready: Dict[int, Any] = field(default_factory=dict)
+    outputs: Dict[int, Any] = field(default_factory=dict)
+
+
+class BitMatrixCoD:
+    """
+    CoD execution backend for all nodes based on boolean receive matrices.
+
+    Example:
+        >>> engine = BitMatrixCoD(n=7, t=2)
+        >>> for sender in range(7):
+        ...     engine.deliver("SEND", sender, "A")
+        >>> engine.step().echo
+        {0: 'A', 1: 'A', 2: 'A', 3: 'A', 4: 'A', 5: 'A', 6: 'A'}
+    """
+
+    def __init__(self, n: int, t: int) -> None:
+        """
+        Initialize empty receive matrices.
+
+        Args:
+            n: Number of nodes
+            t: Byzantine fault bound (n > 3t required)
+
+        Raises:
+            ValueError: If n <= 3t
+        """
+        if t < 0 or n <= 3 * t:
+            raise ValueError(f"n must exceed 3t (got n={n}, t={t})")
+        self.n = n
+        self.t = t
+
+        self.values = ValueInterner()
+        self._rank = np.zeros(0, dtype=np.int64)
+
+        self.received: Dict[str, np.ndarray] = {
+            phase: np.zeros((0, n, n), dtype=bool) for phase in COD_PHASES
+        }
+        self.first_value: Dict[str, np.ndarray] = {
+            phase: np.full((n, n), _NO_VALUE, dtype=np.int64) for phase in COD_PHASES
+        }
+
+        self.echo_value = np.full(n, _NO_VALUE, dtype=np.int64)
+        self.ready_value = np.full(n, _NO_VALUE, dtype=np.int64)
+        self.output_value = np.full(n, _NO_VALUE, dtype=np.int64)
+        self._certificates: Dict[int, np.ndarray] = {}
+
+    def intern(self, value: Any) -> int:
+        """Return the value ID of ``value``, allocating matrix planes for new values."""
+        known = len(self.values)
+        value_id = self.values.intern(value)
+        if value_id < known:
+            return value_id
+
+        for phase in COD_PHASES:
+            plane = np.zeros((1, self.n, self.n), dtype=bool)
+            self.received[phase] = np.concatenate([self.received[phase], plane])
+
+        self._rank = np.argsort(np.argsort(self.values.keys, kind="stable"), kind="stable")
+        return value_id
+
+    def value_of(self, value_id: int) -> Any:
+        """Return the value for ``value_id``."""
+        return self.values.value_of(value_id)
+
+    def deliver(
+        self, phase: str, sender: int, value: Any, receivers: Optional[Iterable[int]] = None
+    ) -> np.ndarray:
+        """
+        Deliver one sender's ``phase`` message for ``value`` to a set of receivers.
+
+        Receivers that already accepted a ``phase`` message from ``sender`` ignore it.
+
+        Args:
+            phase: CoD phase of the message
+            sender: Sender node ID
+            value: Message value
+            receivers: Receiving node IDs (all nodes if omitted)
+
+        Returns:
+            Boolean mask of receivers that accepted the message
+
+        Raises:
+            ValueError: If phase is not a CoD phase
+        """
+        if phase not in COD_PHASES:
+            raise ValueError(f"unknown CoD phase {phase!r}")
+        value_id = self.intern(value)
+
+        target = np.zeros(self.n, dtype=bool)
+        if receivers is None:
+            target[:] = True
+        else:
+            target[list(receivers)] = True
+
+        first = self.first_value[phase]
+        accepted = target & (first[:, sender] == _NO_VALUE)
+        first[accepted, sender] = value_id
+        self.received[phase][value_id, accepted, sender] = True
+        return accepted
+
+    def deliver_message(
+        self, msg: Message, receivers: Optional[Iterable[int]] = None
+    ) -> np.ndarray:
+        """Deliver a CoD ``Message`` (see ``deliver()``)."""
+        return self.deliver(msg.phase, msg.sender_id, msg.value, receivers)
+
+    def step(self) -> CoDStep:
+        """
+        Find every node crossing a threshold on the current receive state.
+
+        Returns:
+            CoDStep with the newly triggered ECHO and READY broadcasts and outputs
+        """
+        strong = self.n - self.t
+        weak = self.t + 1
+        counts = {phase: self.received[phase].sum(axis=2) for phase in COD_PHASES}
+
+        echo_ready = counts[CoDPhase.SEND.value] >= strong
+        echo_quorum = counts[CoDPhase.ECHO.value] >= strong
+        amplified = counts[CoDPhase.READY.value] >= weak
+        # ECHO quorums take precedence over READY amplification, as in the scalar FSM
+        ready_ready = np.where(echo_quorum.any(axis=0)[None, :], echo_quorum, amplified)
+        certified = counts[CoDPhase.READY.value] >= strong
+
+        result = CoDStep()
+        result.echo = self._apply(echo_ready, self.echo_value)
+        result.ready = self._apply(ready_ready, self.ready_value)
+        result.outputs = self._apply(certified, self.output_value)
+        ready_received = self.received[CoDPhase.READY.value]
+        for node in result.outputs:
+            # Snapshot the signers at certification time, like the scalar certificate
+            self._certificates[node] = ready_received[self.output_value[node], node].copy()
+        return result
+
+    def certificate_senders(self, node: int) -> np.ndarray:
+        """
+        Return the READY senders backing ``node``'s output, as of certification.
+
+        Raises:
+            ValueError: If the node has no output yet
+        """
+        if node not in self._certificates:
+            raise ValueError(f"node {node} has no CoD output")
+        return np.flatnonzero(self._certificates[node])
+
+    def _apply(self, crossing: np.ndarray, chosen: np.ndarray) -> Dict[int, Any]:
+        """
+        Record the smallest-key crossing value for nodes without a value yet.
+
+        Args:
+            crossing: (values, nodes) mask of threshold crossings
+            chosen: Per-node value IDs, updated in place
+
+        Returns:
+            Newly chosen value per node
+        """
+        if crossing.shape[0] == 0:
+            return {}
+        crossing = crossing & (chosen == _NO_VALUE)[None, :]
+        nodes = np.flatnonzero(crossing.any(axis=0))
+        if nodes.size == 0:
+            return {}
+
+        ranks = np.where(crossing[:, nodes], self._rank[:, None], np.iinfo(np.int64).max)
+        winners = np.argmin(ranks, axis=0)
+        chosen[nodes] = winners
+        return {int(node): self.values.value_of(int(v)) for node, v in zip(nodes, winners)}
@@ -0,0 +1,149 @@
+"""
+Equivocation Detection Index
+
+A sender equivocates when it signs two different values for the same
+``(round, protocol_id, phase)``. Comparing every incoming message against all previously
+received ones is quadratic under an equivocator that floods conflicting messages.
+
+``EquivocationIndex`` keeps a first-seen entry per ``(sender_id, round, protocol_id,
+phase)`` holding the digest of the first value seen and the message itself. Each new
+message is classified with one dictionary lookup and one digest comparison:
+
+    FIRST      - first message for the key; process it
+    DUPLICATE  - same value as the first message; ignore it
+    CONFLICT   - different value; an EquivocationProof is recorded (both signed messages)
+                 and the message must not be processed
+    SUPPRESSED - key already proven to equivocate; ignore every further message
+"""
+
+import hashlib
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, List, Optional, Tuple
+
+from ba_simulator.protocols.protocol_fsm import canonical_value_key
+from ba_simulator.transport.message import Message
+
+EquivocationKey = Tuple[int, int, str, str]
+
+
+class EquivocationStatus(str, Enum):
+    """Classification of a message by the equivocation index."""
+
+    FIRST = "first"
+    DUPLICATE = "duplicate"
+    CONFLICT = "conflict"
+    SUPPRESSED = "suppressed"
+
+
+@dataclass(frozen=True)
+class EquivocationProof:
+    """
+    Transferable proof that a sender equivocated.
+
+    Both messages are signed by the same sender for the same
+    ``(round, protocol_id, phase)`` but carry different values.
+
+    Fields:
+        first: The first message seen for the key
+        conflicting: The message that contradicted it
+    """
+
+    first: Message
+    conflicting: Message
+
+    @property
+    def sender_id(self) -> int:
+        """The equivocating sender."""
+        return self.first.sender_id
+
+
+def value_digest(message: Message) -> bytes:
+    """
+    Return the digest identifying a message's value.
+
+    The digest is SHA-256 of the canonical value encoding, computed locally: a
+    sender-supplied ``digest`` could claim the same digest for different values. Only a
+    digest-only message (no value) is identified by its signed ``digest`` field.
+    """
+    if message.value is None and message.digest is not None:
+        return message.digest
+    return hashlib.sha256(canonical_value_key(message.value).encode("utf-8")).digest()
+
+
+class EquivocationIndex:
+    """
+    O(1) first-seen index for detecting equivocation.
+
+    Example:
+        >>> index = EquivocationIndex()
+        >>> index.observe(msg_a)
+        <EquivocationStatus.FIRST: 'first'>
+        >>> index.observe(msg_b_same_key_other_value)
+        <EquivocationStatus.CONFLICT: 'conflict'>
+        >>> index.proofs[0].sender_id
+    """
+
+    def __init__(self) -> None:
+        self._first_seen: Dict[EquivocationKey, Tuple[bytes, Message]] = {}
+        self._equivocating: Dict[EquivocationKey, EquivocationProof] = {}
+        self.proofs: List[EquivocationProof] = []
+
+    @staticmethod
+    def key_of(message: Message) -> EquivocationKey:
+        """Return the ``(sender_id, round, protocol_id, phase)`` key of ``message``."""
+        return (message.sender_id, message.round, message.protocol_id, message.phase)
+
+    def observe(self, message: Message) -> EquivocationStatus:
+        """
+        Classify ``message`` and update the index.
+
+        Only messages classified FIRST should be processed further.
+        """
+        key = self.key_of(message)
+        if key in self._equivocating:
+            return EquivocationStatus.SUPPRESSED
+
+        digest = value_digest(message)
+        seen = self._first_seen.get(key)
+        if seen is None:
+            self._first_seen[key] = (digest, message)
+            return EquivocationStatus.FIRST
+        if seen[0] == digest:
+            return EquivocationStatus.DUPLICATE
+
+        proof = EquivocationProof(first=seen[1], conflicting=message)
+        self._equivocating[key] = proof
+        self.proofs.append(proof)
+        return EquivocationStatus.CONFLICT
+
+    def is_equivocating(self, sender_id: int, round: int, protocol_id: str, phase: str) -> bool:
+        """Return True if the sender was caught equivocating for the given key."""
+        return (sender_id, round, protocol_id, phase) in self._equivocating
+
+    def proof_for(
+        self, sender_id: int, round: int, protocol_id: str, phase: str
+    ) -> Optional[EquivocationProof]:
+        """Return the proof for the given key, if any."""
+        return self._equivocating.get((sender_id, round, protocol_id, phase))
+
+    def equivocators(self) -> List[int]:
+        """Return the sorted IDs of all senders caught equivocating."""
+        return sorted({proof.sender_id for proof in self.proofs})
+
+    def release_through(self, round: int) -> int:
+        """
+        Drop first-seen entries of rounds <= ``round`` (recorded proofs are kept).
+
+        Returns:
+            Number of entries released
+        """
+        stale = [key for key in self._first_seen if key[1] <= round]
+        for key in stale:
+            del self._first_seen[key]
+            self._equivocating.pop(key, None)
+        return len(stale)
+
+    def __len__(self) -> int:
+        """Number of keys tracked."""
+        return len(self._first_seen)
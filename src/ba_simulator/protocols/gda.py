@@ -0,0 +1,148 @@
+"""
+Graded Disseminate and Agree (GDA) - Grade Computation
+
+GDA grades the most common value in a node's PROPOSE inbox:
+
+    Grade 2: count >= n-t        (strong consensus - enables early decision)
+    Grade 1: t+1 <= count < n-t  (weak consensus)
+    Grade 0: count < t+1         (no consensus)
+
+The most common value is the one proposed by the most distinct senders; ties are broken
+toward the smallest canonical value key so every node grades deterministically.
+
+The ``GDA`` state machine runs two phases:
+
+    PROPOSE    -> GRADE_VOTE  on n-t PROPOSE messages: grade them, broadcast (value, grade)
+    GRADE_VOTE -> output      on n-t GRADE_VOTE messages
+"""
+
+from enum import Enum
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from ba_simulator.protocols.protocol_fsm import (
+    Action,
+    ProtocolFSM,
+    ProtocolOutput,
+    canonical_value_key,
+    on_message,
+    transition,
+)
+from ba_simulator.transport.message import Message
+
+
+class GDAPhase(str, Enum):
+    """GDA protocol phases."""
+
+    PROPOSE = "PROPOSE"
+    GRADE_VOTE = "GRADE_VOTE"
+
+
+def compute_grade(count: int, n: int, t: int) -> int:
+    """
+    Return the grade for a value proposed by ``count`` distinct senders.
+
+    Args:
+        count: Number of distinct senders proposing the value
+        n: Number of participants
+        t: Byzantine fault bound
+
+    Returns:
+        2, 1 or 0
+    """
+    if count >= n - t:
+        return 2
+    if count >= t + 1:
+        return 1
+    return 0
+
+
+def grade_proposals(proposals: Mapping[int, Any], n: int, t: int) -> Tuple[Optional[Any], int]:
+    """
+    Grade one node's PROPOSE inbox.
+
+    Args:
+        proposals: Proposed value per sender ID (one proposal per sender)
+        n: Number of participants
+        t: Byzantine fault bound
+
+    Returns:
+        ``(value, grade)`` for the most common value, or ``(None, 0)`` for an empty inbox
+    """
+    counts: Dict[str, int] = {}
+    values: Dict[str, Any] = {}
+    for value in proposals.values():
+        key = canonical_value_key(value)
+        counts[key] = counts.get(key, 0) + 1
+        values.setdefault(key, value)
+
+    if not counts:
+        return None, 0
+    best = min(counts, key=lambda key: (-counts[key], key))
+    return values[best], compute_grade(counts[best], n, t)
+
+
+class GDA(ProtocolFSM):
+    """
+    Scalar GDA state machine for a single node.
+
+    Attributes:
+        graded: Own ``(value, grade)`` once PROPOSE closed, else None
+
+    Example:
+        >>> gda = GDA(n=4, t=1, node_id=0)
+        >>> for msg in inbox:
+        ...     gda.process_message(msg)
+        >>> gda.check_transition()
+        [('GRADE_VOTE', {'value': 'A', 'grade': 2})]
+        >>> gda.get_output().metadata["grade"]
+    """
+
+    protocol_id = "GDA"
+
+    def __init__(self, n: int, t: int, node_id: int) -> None:
+        super().__init__(n, t, node_id)
+        self.graded: Optional[Tuple[Any, int]] = None
+        self._output: Optional[ProtocolOutput] = None
+
+    def initial_phase(self) -> str:
+        return GDAPhase.PROPOSE.value
+
+    @on_message(GDAPhase.PROPOSE.value, GDAPhase.GRADE_VOTE.value)
+    def _accept(self, msg: Message) -> bool:
+        """Accept the first message of each sender per phase."""
+        if msg.sender_id in self.messages[msg.phase]:
+            return False
+        self.messages[msg.phase][msg.sender_id] = msg
+        return True
+
+    @transition(GDAPhase.PROPOSE.value)
+    def _grade_on_propose(self) -> List[Action]:
+        """PROPOSE -> GRADE_VOTE on n-t PROPOSE messages."""
+        propose = GDAPhase.PROPOSE.value
+        if self.graded is not None or not self.has_threshold(propose, self.strong_threshold):
+            return []
+        proposals = {sender: msg.value for sender, msg in self.messages[propose].items()}
+        value, grade = grade_proposals(proposals, self.n, self.t)
+        self.graded = (value, grade)
+        vote = GDAPhase.GRADE_VOTE.value
+        self._transition(vote, f"{len(proposals)} PROPOSE, grade {grade}")
+        return [(vote, {"value": value, "grade": grade})]
+
+    @transition(GDAPhase.GRADE_VOTE.value)
+    def _output_on_grade_vote(self) -> List[Action]:
+        """GRADE_VOTE -> output on n-t GRADE_VOTE messages."""
+        vote = GDAPhase.GRADE_VOTE.value
+        if (
+            self._output is None
+            and self.graded is not None
+            and self.has_threshold(vote, self.strong_threshold)
+        ):
+            value, grade = self.graded
+            certificate = sorted(self.messages[vote].values(), key=lambda m: m.sender_id)
+            self._output = ProtocolOutput(
+                value=value, certificate=certificate, metadata={"grade": grade}
+            )
+        return []
+
+    def get_output(self) -> Optional[ProtocolOutput]:
+        return self._output
@@ -0,0 +1,145 @@
+"""
+Batched GDA Grade Computation
+
+Grades the PROPOSE inboxes of all honest nodes in one vectorized pass instead of calling
+``grade_proposals()`` once per node.
+
+Every regular view is encoded as one row of a ``(nodes, n)`` value-id matrix: column j holds
+the id of the value proposed by sender j, or -1 if nothing was received from j. Per-node
+value counts come from a single ``np.bincount`` over the flattened matrix, after which the
+argmax and the grade thresholds are evaluated for all rows at once. The matrix is filled in
+a single interning pass that canonicalizes each distinct hashable value once; canonical
+keys are only computed per entry for unhashable values. The value returned for a view is
+that view's own first proposal of the winning value, as in the scalar path, so views that
+spell a value differently (e.g. a tuple and a list) keep their own representation.
+
+A view is irregular when it cannot be expressed as such a row (a sender ID that is not an
+integer in [0, n)); irregular views are graded by the scalar ``grade_proposals()``.
+"""
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ba_simulator.protocols.gda import grade_proposals
+from ba_simulator.protocols.protocol_fsm import canonical_value_key
+
+MISSING = -1
+
+
+def grade_matrix(value_ids: np.ndarray, n: int, t: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Grade every row of a value-id matrix.
+
+    Value ids must be assigned in ascending canonical-key order: ties between equally
+    common values resolve to the lower id, matching the scalar tie-break.
+
+    Args:
+        value_ids: int matrix of shape (nodes, n); MISSING (-1) marks absent proposals
+        n: Number of participants
+        t: Byzantine fault bound
+
+    Returns:
+        Tuple ``(best_ids, grades)``: the most common value id per row (MISSING for empty
+        rows) and its grade
+    """
+    nodes = value_ids.shape[0]
+    present = value_ids != MISSING
+    num_values = int(value_ids.max()) + 1 if present.any() else 0
+    if nodes == 0 or num_values == 0:
+        return np.full(nodes, MISSING, dtype=np.int64), np.zeros(nodes, dtype=np.int64)
+
+    rows = np.broadcast_to(np.arange(nodes)[:, None], value_ids.shape)
+    flat = rows[present] * num_values + value_ids[present]
+    counts = np.bincount(flat, minlength=nodes * num_values).reshape(nodes, num_values)
+
+    best = counts.argmax(axis=1)
+    best_count = counts[np.arange(nodes), best]
+    grades = np.where(best_count >= n - t, 2, np.where(best_count >= t + 1, 1, 0))
+    best = np.where(best_count > 0, best, MISSING)
+    return best.astype(np.int64), grades.astype(np.int64)
+
+
+def _is_regular(view: Mapping[int, Any], n: int) -> bool:
+    """Return True if ``view`` fits in one row of the value-id matrix."""
+    return all(isinstance(sender, int) and 0 <= sender < n for sender in view)
+
+
+def _intern(
+    views: Sequence[Mapping[int, Any]], regular: Sequence[int], n: int
+) -> Tuple[np.ndarray, List[str], List[Any]]:
+    """
+    Fill the value-id matrix of the regular views in one pass.
+
+    Ids are assigned in first-seen order; each distinct hashable value is canonicalized
+    once (keyed by type as well, so that e.g. True and 1 stay apart).
+
+    Returns:
+        Tuple ``(matrix, keys)``: the first-seen id matrix and the canonical key per id
+    """
+    interned: Dict[Any, int] = {}
+    by_key: Dict[str, int] = {}
+    keys: List[str] = []
+    matrix = np.full((len(regular), n), MISSING, dtype=np.int64)
+    for row, i in enumerate(regular):
+        matrix_row = matrix[row]
+        for sender, value in views[i].items():
+            try:
+                token: Optional[Tuple[type, Any]] = (type(value), value)
+                value_id = interned.get(token)
+            except TypeError:
+                token = None
+                value_id = None
+            if value_id is None:
+                key = canonical_value_key(value)
+                value_id = by_key.get(key)
+                if value_id is None:
+                    value_id = by_key[key] = len(keys)
+                    keys.append(key)
+                if token is not None:
+                    interned[token] = value_id
+            matrix_row[sender] = value_id
+    return matrix, keys
+
+
+def _first_with_id(view: Mapping[int, Any], ids: List[int], value_id: int) -> Any:
+    """Return the first value of ``view`` (in iteration order) interned as ``value_id``."""
+    return next(value for sender, value in view.items() if ids[sender] == value_id)
+
+
+def grade_batch(
+    views: Sequence[Mapping[int, Any]], n: int, t: int
+) -> List[Tuple[Optional[Any], int]]:
+    """
+    Grade the PROPOSE inboxes of many nodes at once.
+
+    Args:
+        views: Per node, the proposed value per sender ID
+        n: Number of participants
+        t: Byzantine fault bound
+
+    Returns:
+        ``(value, grade)`` per view, identical to ``grade_proposals()`` on each view
+    """
+    results: List[Tuple[Optional[Any], int]] = [(None, 0)] * len(views)
+    regular = []
+    for i, view in enumerate(views):
+        if _is_regular(view, n):
+            regular.append(i)
+        else:
+            results[i] = grade_proposals(view, n, t)
+    if not regular:
+        return results
+
+    matrix, keys = _intern(views, regular, n)
+    # Remap first-seen ids to ascending key order for the tie-break (MISSING stays -1).
+    order = sorted(range(len(keys)), key=keys.__getitem__)
+    rank = np.empty(len(keys) + 1, dtype=np.int64)
+    rank[np.array(order, dtype=np.int64)] = np.arange(len(keys), dtype=np.int64)
+    rank[-1] = MISSING
+    best, grades = grade_matrix(rank[matrix], n, t)
+    for row, i in enumerate(regular):
+        if best[row] != MISSING:
+            value = _first_with_id(views[i], matrix[row].tolist(), order[best[row]])
+            results[i] = (value, int(grades[row]))
+    return results
@@ -0,0 +1,214 @@
+"""
+Lite PoP - Participation Digest Embedding
+
+Every message of round r carries a digest of the participation the sender observed in
+round r-1, under ``aux['participation_digest']``. Receivers compare it with their own
+digest of round r-1 (local chain verification).
+
+Recomputing the digest from the full participation set for every outgoing message costs
+O(n) per message. Instead, each round keeps an additive set hash that is updated in O(1)
+per participation event:
+
+    acc(r) = sum over distinct senders s of H(r, s)  mod 2^256
+    digest(r) = SHA-256("ba-sim/pop" || r || acc(r))
+
+where H(r, s) is SHA-256 of the round and sender ID read as a 256-bit integer. Addition is
+commutative, so the digest is independent of arrival order and equals the digest computed
+from scratch by ``compute_participation_digest()``. Digests are cached per round and only
+invalidated when a new sender is added to that round.
+"""
+
+import hashlib
+import hmac
+import struct
+from dataclasses import replace
+from typing import Dict, Iterable, Optional, Set
+
+from ba_simulator.transport.message import Message
+
+DIGEST_KEY = "participation_digest"
+
+_DOMAIN = b"ba-sim/pop"
+_MODULUS = 1 << 256
+_ROUND_SENDER = struct.Struct(">qq")
+_ROUND = struct.Struct(">q")
+
+
+def _sender_term(round: int, sender_id: int) -> int:
+    """Return H(round, sender_id) as an integer in [0, 2^256)."""
+    data = hashlib.sha256(_DOMAIN + _ROUND_SENDER.pack(round, sender_id)).digest()
+    return int.from_bytes(data, "big")
+
+
+def _finalize(round: int, accumulator: int) -> bytes:
+    """Bind the accumulator value to its round."""
+    payload = _DOMAIN + _ROUND.pack(round) + accumulator.to_bytes(32, "big")
+    return hashlib.sha256(payload).digest()
+
+
+class ParticipationAccumulator:
+    """
+    Order-independent O(1) participation hash for a single round.
+
+    Attributes:
+        round: Round whose participation is accumulated
+        senders: Distinct sender IDs observed so far
+    """
+
+    def __init__(self, round: int) -> None:
+        self.round = round
+        self.senders: Set[int] = set()
+        self._sum = 0
+        self._digest: Optional[bytes] = None
+
+    def add(self, sender_id: int) -> bool:
+        """
+        Record participation of ``sender_id``.
+
+        Returns:
+            True if the sender was not recorded before
+        """
+        if sender_id in self.senders:
+            return False
+        self.senders.add(sender_id)
+        self._sum = (self._sum + _sender_term(self.round, sender_id)) % _MODULUS
+        self._digest = None
+        return True
+
+    def digest(self) -> bytes:
+        """Return the (cached) participation digest of the round."""
+        if self._digest is None:
+            self._digest = _finalize(self.round, self._sum)
+        return self._digest
+
+    def __len__(self) -> int:
+        return len(self.senders)
+
+
+def compute_participation_digest(round: int, messages: Iterable[Message]) -> bytes:
+    """
+    Compute the participation digest of ``round`` from scratch.
+
+    Reference implementation of the incremental accumulator; O(n) in the number of messages.
+
+    Args:
+        round: Round the messages belong to
+        messages: Messages received in that round
+
+    Returns:
+        32-byte digest over the distinct sender IDs
+    """
+    senders = {msg.sender_id for msg in messages}
+    total = sum(_sender_term(round, sender) for sender in senders) % _MODULUS
+    return _finalize(round, total)
+
+
+class LitePoP:
+    """
+    Per-node Lite PoP state: participation accumulators and digest embedding.
+
+    Example:
+        >>> pop = LitePoP()
+        >>> for msg in inbox_of_round_3:
+        ...     pop.observe(msg)
+        >>> outgoing = pop.embed(message_for_round_4)
+        >>> pop.verify_chain(received_round_4_message)
+        True
+    """
+
+    protocol_id = "PoP"
+
+    def __init__(self) -> None:
+        self._rounds: Dict[int, ParticipationAccumulator] = {}
+        self._released: Dict[int, bytes] = {}
+        self._released_through = -1
+
+    def observe(self, message: Message) -> bool:
+        """
+        Record the sender of ``message`` as a participant of ``message.round``.
+
+        Returns:
+            True if this is the first participation of the sender in that round
+        """
+        return self.observe_sender(message.round, message.sender_id)
+
+    def observe_sender(self, round: int, sender_id: int) -> bool:
+        """
+        Record that ``sender_id`` participated in ``round`` (O(1)).
+
+        Late observations of released rounds are ignored: their digests are final.
+
+        Returns:
+            True if the participation was recorded for the first time
+        """
+        if round <= self._released_through:
+            return False
+        accumulator = self._rounds.get(round)
+        if accumulator is None:
+            accumulator = self._rounds[round] = ParticipationAccumulator(round)
+        return accumulator.add(sender_id)
+
+    def participants(self, round: int) -> Set[int]:
+        """Return the sender IDs observed in ``round``."""
+        accumulator = self._rounds.get(round)
+        return set(accumulator.senders) if accumulator is not None else set()
+
+    def participation_digest(self, round: int) -> bytes:
+        """Return the cached participation digest of ``round`` (empty set if unseen)."""
+        released = self._released.get(round)
+        if released is not None:
+            return released
+        accumulator = self._rounds.get(round)
+        if accumulator is None:
+            return _finalize(round, 0)
+        return accumulator.digest()
+
+    def release_through(self, round: int) -> int:
+        """
+        Compact rounds <= ``round`` to their 32-byte digests.
+
+        Participant sets of compacted rounds are dropped; their digests stay available and
+        later observations of those rounds are ignored.
+
+        Returns:
+            Number of participations released
+        """
+        stale = [observed for observed in self._rounds if observed <= round]
+        released = 0
+        for observed in stale:
+            accumulator = self._rounds.pop(observed)
+            self._released[observed] = accumulator.digest()
+            released += len(accumulator)
+        self._released_through = max(self._released_through, round)
+        return released
+
+    def embed(self, message: Message) -> Message:
+        """
+        Return a copy of ``message`` carrying the digest of the previous round in ``aux``.
+
+        Embedding must happen before signing, since ``aux`` is part of the signing payload.
+        """
+        aux = dict(message.aux)
+        aux[DIGEST_KEY] = self.participation_digest(message.round - 1).hex()
+        return replace(message, aux=aux)
+
+    @staticmethod
+    def verify_participation(message: Message, expected_digest: bytes) -> bool:
+        """
+        Check the digest embedded in ``message`` against ``expected_digest``.
+
+        Returns:
+            False if the digest is missing, malformed or different
+        """
+        embedded = message.aux.get(DIGEST_KEY)
+        if not isinstance(embedded, str):
+            return False
+        try:
+            digest = bytes.fromhex(embedded)
+        except ValueError:
+            return False
+        return hmac.compare_digest(digest, expected_digest)
+
+    def verify_chain(self, message: Message) -> bool:
+        """Check ``message`` against the local digest of the round preceding it."""
+        return self.verify_participation(message, self.participation_digest(message.round - 1))
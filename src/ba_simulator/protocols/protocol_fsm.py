@@ -0,0 +1,371 @@
+"""
+Protocol FSM Base Class
+
+CoD, GDA and Lite PoP all follow the same multi-phase pattern: accumulate signed messages
+per phase, move to the next phase once a threshold of distinct senders is reached, and
+finally produce an output backed by a certificate of signed messages.
+
+``ProtocolFSM`` captures that pattern:
+- per-phase message storage keyed by sender (one message per sender and phase)
+- threshold helpers computed from n and t (never hardcoded)
+- a transition log recording every phase change with its justification
+- dispatch tables compiled at class creation from decorated methods
+
+Message handlers (``@on_message(phase)``) and transition checks (``@transition(phase)``)
+are collected by ``__init_subclass__`` into per-class tables, so ``process_message()`` is
+one dictionary lookup and ``check_transition()`` a loop over a tuple - no if/elif chains
+on the hot path. Attaching a ``TransitionProfiler`` swaps in wrapped copies of the tables
+for that instance only; unprofiled instances run the plain tables at no extra cost.
+
+Byzantine Agreement thresholds:
+    Strong: n - t distinct senders (any two strong quorums intersect in an honest node)
+    Weak:   t + 1 distinct senders (at least one honest sender)
+"""
+
+import json
+import time
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from ba_simulator.transport.message import Message
+
+
+@dataclass
+class ProtocolOutput:
+    """
+    Output of a completed subprotocol instance.
+
+    Fields:
+        value: Output value
+        certificate: Signed messages justifying the output (a list, or a
+            ``CompactCertificate`` materializing them from a shared store)
+        metadata: Protocol-specific details (e.g. grade, output type)
+    """
+
+    value: Any
+    certificate: Sequence[Message]
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class PhaseTransition:
+    """
+    Record of one phase change.
+
+    Fields:
+        from_phase: Phase before the transition
+        to_phase: Phase after the transition
+        justification: Human-readable reason (threshold reached, value, counts)
+    """
+
+    from_phase: str
+    to_phase: str
+    justification: str
+
+
+Action = Tuple[str, Any]
+MessageHandler = Callable[[Any, Message], bool]
+TransitionCheck = Callable[[Any], List[Action]]
+ProfileKey = Tuple[str, str, str]
+
+_HANDLER_ATTR = "_fsm_message_phases"
+_TRANSITION_ATTR = "_fsm_transition_phase"
+
+
+def on_message(*phases: str) -> Callable[[MessageHandler], MessageHandler]:
+    """
+    Register a method as the handler for messages of the given phases.
+
+    The handler receives the message and returns True if it was accepted.
+    """
+
+    def decorate(func: MessageHandler) -> MessageHandler:
+        setattr(func, _HANDLER_ATTR, tuple(phases))
+        return func
+
+    return decorate
+
+
+def transition(phase: str) -> Callable[[TransitionCheck], TransitionCheck]:
+    """
+    Register a method as a transition check for ``phase``.
+
+    Checks run in definition order on every ``check_transition()`` call and return the
+    ``(phase, value)`` messages to broadcast.
+    """
+
+    def decorate(func: TransitionCheck) -> TransitionCheck:
+        setattr(func, _TRANSITION_ATTR, phase)
+        return func
+
+    return decorate
+
+
+@dataclass
+class TransitionStats:
+    """
+    Profiling counters for one (protocol, phase, transition) entry.
+
+    Fields:
+        calls: Number of invocations
+        total_time: Cumulative wall time in seconds
+    """
+
+    calls: int = 0
+    total_time: float = 0.0
+
+
+class TransitionProfiler:
+    """
+    Collects call counts and cumulative time per (protocol, phase, transition).
+
+    One profiler may be attached to many FSM instances to aggregate a whole run.
+
+    Example:
+        >>> profiler = TransitionProfiler()
+        >>> cod.attach_profiler(profiler)
+        >>> ...
+        >>> profiler.report()[:3]
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self.clock = clock
+        self.stats: Dict[ProfileKey, TransitionStats] = defaultdict(TransitionStats)
+
+    def wrap(self, key: ProfileKey, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Return ``func`` instrumented to record into ``key``."""
+        clock = self.clock
+        stats = self.stats[key]
+
+        def profiled(*args: Any) -> Any:
+            start = clock()
+            try:
+                return func(*args)
+            finally:
+                stats.calls += 1
+                stats.total_time += clock() - start
+
+        return profiled
+
+    def report(self) -> List[Tuple[ProfileKey, TransitionStats]]:
+        """Return entries sorted by cumulative time, slowest first."""
+        return sorted(self.stats.items(), key=lambda item: item[1].total_time, reverse=True)
+
+    def reset(self) -> None:
+        """Clear all counters."""
+        for stats in self.stats.values():
+            stats.calls = 0
+            stats.total_time = 0.0
+
+
+class ProtocolFSM(ABC):
+    """
+    Abstract base class for threshold-driven protocol state machines.
+
+    Subclasses define their phases, decorate message handlers with ``@on_message`` and
+    transition checks with ``@transition``, and implement output extraction.
+
+    Attributes:
+        n: Number of participants
+        t: Maximum number of Byzantine participants tolerated
+        node_id: Identifier of the local node
+        current_phase: Current protocol phase
+        messages: Accepted messages per phase, keyed by sender ID
+        transitions: Ordered log of phase transitions
+        released_through: Highest round whose inbox messages were released (-1 if none)
+    """
+
+    protocol_id: str = ""
+    _message_table: Dict[str, Tuple[str, MessageHandler]] = {}
+    _transition_table: Tuple[Tuple[str, str, TransitionCheck], ...] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Compile the message dispatch and transition tables of ``cls``."""
+        super().__init_subclass__(**kwargs)
+        cls._message_table, cls._transition_table = _compile_tables(cls)
+
+    def __init__(self, n: int, t: int, node_id: int) -> None:
+        """
+        Initialize the FSM.
+
+        Args:
+            n: Number of participants
+            t: Byzantine fault bound (n > 3t required)
+            node_id: Local node identifier
+
+        Raises:
+            ValueError: If n <= 3t or node_id is out of range
+        """
+        if t < 0 or n <= 3 * t:
+            raise ValueError(f"n must exceed 3t (got n={n}, t={t})")
+        if not 0 <= node_id < n:
+            raise ValueError(f"node_id must be in [0, {n}), got {node_id}")
+
+        self.n = n
+        self.t = t
+        self.node_id = node_id
+        self.current_phase = self.initial_phase()
+        self.messages: Dict[str, Dict[int, Message]] = defaultdict(dict)
+        self.transitions: List[PhaseTransition] = []
+        self.released_through = -1
+
+    @property
+    def strong_threshold(self) -> int:
+        """n - t distinct senders."""
+        return self.n - self.t
+
+    @property
+    def weak_threshold(self) -> int:
+        """t + 1 distinct senders."""
+        return self.t + 1
+
+    @abstractmethod
+    def initial_phase(self) -> str:
+        """Return the phase the FSM starts in."""
+        pass
+
+    def process_message(self, msg: Message) -> bool:
+        """
+        Dispatch a message to the handler registered for its phase.
+
+        Messages of released rounds are ignored.
+
+        Returns:
+            True if the message was accepted and may affect state
+        """
+        if msg.protocol_id != self.protocol_id or msg.round <= self.released_through:
+            return False
+        entry = self._message_table.get(msg.phase)
+        if entry is None:
+            return False
+        return entry[1](self, msg)
+
+    def check_transition(self) -> List[Action]:
+        """
+        Run every transition check in definition order.
+
+        Returns:
+            Messages to broadcast as ``(phase, value)`` pairs
+        """
+        actions: List[Action] = []
+        for _, _, check in self._transition_table:
+            actions.extend(check(self))
+        return actions
+
+    def release_through(self, round: int) -> int:
+        """
+        Drop inbox messages of rounds <= ``round``; later messages of those rounds are ignored.
+
+        The output (and its certificate), the phase and the transition log are kept.
+
+        Returns:
+            Number of messages released
+        """
+        released = 0
+        for senders in self.messages.values():
+            stale = [sender for sender, msg in senders.items() if msg.round <= round]
+            for sender in stale:
+                del senders[sender]
+            released += len(stale)
+        self.released_through = max(self.released_through, round)
+        return released
+
+    def attach_profiler(self, profiler: TransitionProfiler) -> None:
+        """
+        Record call counts and time of this instance's handlers and transitions.
+
+        Only this instance is affected; the class tables stay unwrapped.
+        """
+        protocol = self.protocol_id
+        self._message_table = {
+            phase: (name, profiler.wrap((protocol, phase, name), handler))
+            for phase, (name, handler) in type(self)._message_table.items()
+        }
+        self._transition_table = tuple(
+            (phase, name, profiler.wrap((protocol, phase, name), check))
+            for phase, name, check in type(self)._transition_table
+        )
+
+    def detach_profiler(self) -> None:
+        """Restore the unprofiled class tables."""
+        self.__dict__.pop("_message_table", None)
+        self.__dict__.pop("_transition_table", None)
+
+    @abstractmethod
+    def get_output(self) -> Optional[ProtocolOutput]:
+        """Return the protocol output once terminal, else None."""
+        pass
+
+    def get_current_phase(self) -> str:
+        """Return the current protocol phase."""
+        return self.current_phase
+
+    def is_terminal(self) -> bool:
+        """Return True once an output is available."""
+        return self.get_output() is not None
+
+    def count_messages_from_distinct_senders(self, phase: str) -> int:
+        """Return the number of distinct senders with an accepted message in ``phase``."""
+        return len(self.messages[phase])
+
+    def has_threshold(self, phase: str, threshold: int) -> bool:
+        """Return True if ``phase`` has messages from at least ``threshold`` senders."""
+        return self.count_messages_from_distinct_senders(phase) >= threshold
+
+    def _transition(self, to_phase: str, justification: str) -> None:
+        """Move to ``to_phase`` and log the transition."""
+        self.transitions.append(PhaseTransition(self.current_phase, to_phase, justification))
+        self.current_phase = to_phase
+
+    def _messages_by_value(self, phase: str) -> Dict[str, Tuple[Any, List[Message]]]:
+        """Group accepted messages of ``phase`` by canonical value key."""
+        groups: Dict[str, Tuple[Any, List[Message]]] = {}
+        for msg in self.messages[phase].values():
+            key = canonical_value_key(msg.value)
+            if key not in groups:
+                groups[key] = (msg.value, [])
+            groups[key][1].append(msg)
+        return groups
+
+
+def _compile_tables(
+    cls: type,
+) -> Tuple[Dict[str, Tuple[str, MessageHandler]], Tuple[Tuple[str, str, TransitionCheck], ...]]:
+    """
+    Collect decorated handlers and transition checks along the MRO of ``cls``.
+
+    Overriding a decorated method keeps its position in the table if the override is
+    decorated too, and removes it otherwise.
+    """
+    handlers: Dict[str, Tuple[Tuple[str, ...], MessageHandler]] = {}
+    transitions: Dict[str, Tuple[str, str, TransitionCheck]] = {}
+    for klass in reversed(cls.__mro__):
+        for name, attr in vars(klass).items():
+            phases = getattr(attr, _HANDLER_ATTR, None)
+            if phases is not None:
+                handlers[name] = (phases, attr)
+            else:
+                handlers.pop(name, None)
+            phase = getattr(attr, _TRANSITION_ATTR, None)
+            if phase is not None:
+                transitions[name] = (phase, name, attr)
+            else:
+                transitions.pop(name, None)
+
+    message_table = {
+        phase: (name, handler) for name, (phases, handler) in handlers.items() for phase in phases
+    }
+    return message_table, tuple(transitions.values())
+
+
+def canonical_value_key(value: Any) -> str:
+    """
+    Return the canonical string key of a protocol value.
+
+    Values are compared by their canonical JSON form (sorted keys, no whitespace), the
+    same representation used for signing. Keys also define the deterministic tie-break
+    order between values.
+    """
+    return json.dumps(value, sort_keys=True, separators=(",", ":"))
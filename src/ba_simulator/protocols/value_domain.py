@@ -0,0 +1,212 @@
+"""
+Candidate-Value Domain
+
+Value pruning repeatedly intersects and filters each node's set of still-possible decision
+values. Comparing arbitrary ``value`` payloads for equality means re-encoding them every
+time, which is slow for large structured values.
+
+``ValueInterner`` maps each distinct value (by canonical key) to a small integer ID once;
+repeat lookups of a hashable value hit a ``(type, value)`` token cache and never re-encode.
+``CandidateSet`` is an immutable integer bitset over those IDs: intersection, union,
+pruning and membership checks are single bitwise operations.
+
+Deterministic choice among candidates follows the protocol-wide rule: the value with the
+smallest canonical key wins.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from ba_simulator.protocols.protocol_fsm import canonical_value_key
+
+
+class ValueInterner:
+    """
+    Table assigning dense integer IDs to distinct values.
+
+    IDs are assigned in first-seen order and never change. Hashable values are cached by
+    ``(type, value)`` (so e.g. True and 1 stay apart), making repeat lookups O(1); only
+    unhashable values are canonicalized on every lookup.
+
+    Example:
+        >>> interner = ValueInterner()
+        >>> interner.intern({"block": 1})
+        0
+        >>> interner.intern({"block": 1})
+        0
+        >>> interner.value_of(0)
+        {'block': 1}
+    """
+
+    def __init__(self) -> None:
+        self._ids: Dict[str, int] = {}
+        self._tokens: Dict[Tuple[type, Any], int] = {}
+        self._values: List[Any] = []
+        self.keys: List[str] = []
+
+    def intern(self, value: Any) -> int:
+        """Return the ID of ``value``, assigning the next free ID to new values."""
+        token = _token(value)
+        if token is not None:
+            value_id = self._tokens.get(token)
+            if value_id is not None:
+                return value_id
+        key = canonical_value_key(value)
+        value_id = self._ids.get(key)
+        if value_id is None:
+            value_id = len(self._values)
+            self._ids[key] = value_id
+            self._values.append(value)
+            self.keys.append(key)
+        if token is not None:
+            self._tokens[token] = value_id
+        return value_id
+
+    def id_of(self, value: Any) -> Optional[int]:
+        """Return the ID of ``value``, or None if it was never interned."""
+        token = _token(value)
+        if token is not None:
+            value_id = self._tokens.get(token)
+            if value_id is not None:
+                return value_id
+        value_id = self._ids.get(canonical_value_key(value))
+        if value_id is not None and token is not None:
+            self._tokens[token] = value_id
+        return value_id
+
+    def value_of(self, value_id: int) -> Any:
+        """Return the value with ID ``value_id``."""
+        return self._values[value_id]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, value: Any) -> bool:
+        return self.id_of(value) is not None
+
+
+def _token(value: Any) -> Optional[Tuple[type, Any]]:
+    """Return the ``(type, value)`` cache token of a hashable value, else None."""
+    try:
+        hash(value)
+    except TypeError:
+        return None
+    return (type(value), value)
+
+
+@dataclass(frozen=True)
+class CandidateSet:
+    """
+    Immutable bitset of candidate value IDs.
+
+    Fields:
+        interner: Table the IDs refer to (not part of equality)
+        bits: Bit i is set if value ID i is still a candidate
+
+    Example:
+        >>> domain = ValueInterner()
+        >>> viable = CandidateSet.of(domain, ["A", "B", "C"])
+        >>> viable = viable.prune(["B"]) & CandidateSet.of(domain, ["A", "B"])
+        >>> viable.values()
+        ['A']
+    """
+
+    interner: ValueInterner = field(compare=False, repr=False)
+    bits: int = 0
+
+    @classmethod
+    def of(cls, interner: ValueInterner, values: Iterable[Any]) -> "CandidateSet":
+        """Build the set of ``values``, interning them as needed."""
+        bits = 0
+        for value in values:
+            bits |= 1 << interner.intern(value)
+        return cls(interner, bits)
+
+    @classmethod
+    def everything(cls, interner: ValueInterner) -> "CandidateSet":
+        """Return the set of all values interned so far."""
+        return cls(interner, (1 << len(interner)) - 1)
+
+    def _check(self, other: "CandidateSet") -> None:
+        """
+        Require ``other`` to share this set's interner.
+
+        Raises:
+            ValueError: If the two sets use different interners (their IDs are unrelated)
+        """
+        if other.interner is not self.interner:
+            raise ValueError("cannot combine candidate sets of different interners")
+
+    def _mask(self, values: Union["CandidateSet", Iterable[Any]]) -> int:
+        """Bitmask of a candidate set or of the already interned ``values`` (unknown skipped)."""
+        if isinstance(values, CandidateSet):
+            self._check(values)
+            return values.bits
+        mask = 0
+        for value in values:
+            value_id = self.interner.id_of(value)
+            if value_id is not None:
+                mask |= 1 << value_id
+        return mask
+
+    def __and__(self, other: "CandidateSet") -> "CandidateSet":
+        self._check(other)
+        return CandidateSet(self.interner, self.bits & other.bits)
+
+    def __or__(self, other: "CandidateSet") -> "CandidateSet":
+        self._check(other)
+        return CandidateSet(self.interner, self.bits | other.bits)
+
+    def __sub__(self, other: "CandidateSet") -> "CandidateSet":
+        self._check(other)
+        return CandidateSet(self.interner, self.bits & ~other.bits)
+
+    def prune(self, values: Union["CandidateSet", Iterable[Any]]) -> "CandidateSet":
+        """
+        Return the set without ``values`` (a candidate set or plain values).
+
+        Raises:
+            ValueError: If ``values`` is a candidate set of another interner
+        """
+        return CandidateSet(self.interner, self.bits & ~self._mask(values))
+
+    def restrict(self, values: Union["CandidateSet", Iterable[Any]]) -> "CandidateSet":
+        """
+        Return the set restricted to ``values`` (a candidate set or plain values).
+
+        Raises:
+            ValueError: If ``values`` is a candidate set of another interner
+        """
+        return CandidateSet(self.interner, self.bits & self._mask(values))
+
+    def contains_id(self, value_id: int) -> bool:
+        """Return True if ``value_id`` is a candidate."""
+        return bool(self.bits >> value_id & 1)
+
+    def __contains__(self, value: Any) -> bool:
+        value_id = self.interner.id_of(value)
+        return value_id is not None and self.contains_id(value_id)
+
+    def ids(self) -> Iterator[int]:
+        """Yield candidate IDs in ascending order."""
+        bits = self.bits
+        while bits:
+            low = bits & -bits
+            yield low.bit_length() - 1
+            bits ^= low
+
+    def values(self) -> List[Any]:
+        """Return the candidate values in ID order."""
+        return [self.interner.value_of(value_id) for value_id in self.ids()]
+
+    def choose(self) -> Optional[Any]:
+        """Return the candidate with the smallest canonical key, or None if empty."""
+        keys = self.interner.keys
+        best = min(self.ids(), key=lambda value_id: keys[value_id], default=None)
+        return None if best is None else self.interner.value_of(best)
+
+    def __len__(self) -> int:
+        return bin(self.bits).count("1")
+
+    def __bool__(self) -> bool:
+        return self.bits != 0
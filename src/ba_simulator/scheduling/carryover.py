@@ -0,0 +1,384 @@
+"""
+Persistent Carryover State
+
+Carryover state (participation digests, partial certificates, candidate values, prune
+sets) is the only data allowed to cross a round boundary. The round firewall requires
+that state sealed for round r can never be mutated afterwards. Deep-copying the state at
+every boundary enforces this but costs O(state) per node per round.
+
+This module provides:
+- ``PersistentMap``: an immutable hash array mapped trie (HAMT). Updates return a new map
+  that shares all untouched structure with the old one, so snapshots are O(1) and an
+  update costs O(log32 n) node copies.
+- ``CarryoverState``: round-scoped carryover storage built on ``PersistentMap``. Sealing a
+  round stores the current map as that round's snapshot; later writes create new maps
+  and can never reach a sealed snapshot.
+- ``freeze()``: converts plain containers into immutable equivalents so values stored in
+  carryover cannot be mutated in place either.
+"""
+
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+_BITS = 5
+_MASK = (1 << _BITS) - 1
+_HASH_MASK = (1 << 64) - 1
+
+
+class _Leaf:
+    """Single key/value entry stored in a trie slot."""
+
+    __slots__ = ("hash", "key", "value")
+
+    def __init__(self, hash: int, key: Any, value: Any) -> None:
+        self.hash = hash
+        self.key = key
+        self.value = value
+
+
+class _Collision:
+    """Entries whose keys share the full 64-bit hash."""
+
+    __slots__ = ("hash", "leaves")
+
+    def __init__(self, hash: int, leaves: Tuple[_Leaf, ...]) -> None:
+        self.hash = hash
+        self.leaves = leaves
+
+
+class _Node:
+    """Bitmap-compressed interior node: one entry per occupied slot."""
+
+    __slots__ = ("bitmap", "entries")
+
+    def __init__(self, bitmap: int, entries: Tuple[Any, ...]) -> None:
+        self.bitmap = bitmap
+        self.entries = entries
+
+
+_EMPTY_NODE = _Node(0, ())
+
+
+def _hash(key: Any) -> int:
+    return hash(key) & _HASH_MASK
+
+
+def _slot(node: _Node, shift: int, h: int) -> Tuple[int, int]:
+    """Return (bit, index) of the slot for hash ``h`` at ``shift``."""
+    bit = 1 << ((h >> shift) & _MASK)
+    return bit, bin(node.bitmap & (bit - 1)).count("1")
+
+
+def _replace(entries: Tuple[Any, ...], index: int, item: Any) -> Tuple[Any, ...]:
+    return entries[:index] + (item,) + entries[index + 1 :]
+
+
+def _merge(shift: int, a: Any, b: _Leaf) -> _Node:
+    """Build the smallest subtree holding two entries with different hashes."""
+    bit_a = 1 << ((a.hash >> shift) & _MASK)
+    bit_b = 1 << ((b.hash >> shift) & _MASK)
+    if bit_a == bit_b:
+        return _Node(bit_a, (_merge(shift + _BITS, a, b),))
+    entries = (a, b) if bit_a < bit_b else (b, a)
+    return _Node(bit_a | bit_b, entries)
+
+
+def _assoc(node: _Node, shift: int, h: int, key: Any, value: Any) -> Tuple[_Node, bool]:
+    """Return (new node, whether a key was added) after setting ``key``."""
+    bit, index = _slot(node, shift, h)
+    if not node.bitmap & bit:
+        entries = node.entries[:index] + (_Leaf(h, key, value),) + node.entries[index:]
+        return _Node(node.bitmap | bit, entries), True
+
+    item = node.entries[index]
+    if isinstance(item, _Node):
+        child, added = _assoc(item, shift + _BITS, h, key, value)
+        return _Node(node.bitmap, _replace(node.entries, index, child)), added
+
+    if isinstance(item, _Leaf):
+        if item.hash == h and item.key == key:
+            if item.value is value:
+                return node, False
+            return _Node(node.bitmap, _replace(node.entries, index, _Leaf(h, key, value))), False
+        if item.hash == h:
+            collision = _Collision(h, (item, _Leaf(h, key, value)))
+            return _Node(node.bitmap, _replace(node.entries, index, collision)), True
+        child = _merge(shift + _BITS, item, _Leaf(h, key, value))
+        return _Node(node.bitmap, _replace(node.entries, index, child)), True
+
+    # _Collision
+    if item.hash != h:
+        child = _merge(shift + _BITS, item, _Leaf(h, key, value))
+        return _Node(node.bitmap, _replace(node.entries, index, child)), True
+    leaves = tuple(leaf for leaf in item.leaves if leaf.key != key)
+    added = len(leaves) == len(item.leaves)
+    collision = _Collision(h, leaves + (_Leaf(h, key, value),))
+    return _Node(node.bitmap, _replace(node.entries, index, collision)), added
+
+
+def _dissoc_item(item: Any, shift: int, h: int, key: Any) -> Tuple[Optional[Any], bool]:
+    """Return (replacement, removed) for a single slot entry after deleting ``key``."""
+    if isinstance(item, _Node):
+        return _dissoc(item, shift + _BITS, h, key)
+    if isinstance(item, _Leaf):
+        if item.hash != h or item.key != key:
+            return item, False
+        return None, True
+    leaves = tuple(leaf for leaf in item.leaves if leaf.key != key)
+    if len(leaves) == len(item.leaves):
+        return item, False
+    return (leaves[0] if len(leaves) == 1 else _Collision(h, leaves)), True
+
+
+def _dissoc(node: _Node, shift: int, h: int, key: Any) -> Tuple[Optional[Any], bool]:
+    """
+    Return (replacement, removed) after deleting ``key``.
+
+    The replacement is a node, a single leaf that can be pulled up into the parent, or
+    None when the node became empty.
+    """
+    bit, index = _slot(node, shift, h)
+    if not node.bitmap & bit:
+        return node, False
+
+    child, removed = _dissoc_item(node.entries[index], shift, h, key)
+    if not removed:
+        return node, False
+    if child is None:
+        entries = node.entries[:index] + node.entries[index + 1 :]
+        if not entries:
+            return None, True
+        if len(entries) == 1 and not isinstance(entries[0], _Node) and shift > 0:
+            return entries[0], True
+        return _Node(node.bitmap & ~bit, entries), True
+    if len(node.entries) == 1 and not isinstance(child, _Node) and shift > 0:
+        return child, True
+    return _Node(node.bitmap, _replace(node.entries, index, child)), True
+
+
+def _iter_leaves(node: _Node) -> Iterator[_Leaf]:
+    for item in node.entries:
+        if isinstance(item, _Node):
+            yield from _iter_leaves(item)
+        elif isinstance(item, _Leaf):
+            yield item
+        else:
+            yield from item.leaves
+
+
+class PersistentMap(Mapping):
+    """
+    Immutable mapping with structural sharing.
+
+    ``set()`` and ``delete()`` return new maps; the original is never modified. Because
+    maps are immutable, taking a snapshot is simply keeping a reference.
+
+    Example:
+        >>> m1 = PersistentMap({"digest": b"..."})
+        >>> m2 = m1.set("candidates", frozenset({0, 1}))
+        >>> "candidates" in m1
+        False
+    """
+
+    __slots__ = ("_root", "_size")
+
+    def __init__(self, items: Optional[Mapping[Any, Any]] = None) -> None:
+        self._root = _EMPTY_NODE
+        self._size = 0
+        if items:
+            built = self.update(items)
+            self._root, self._size = built._root, built._size
+
+    @classmethod
+    def _from_root(cls, root: _Node, size: int) -> "PersistentMap":
+        new = cls.__new__(cls)
+        new._root = root
+        new._size = size
+        return new
+
+    def __getitem__(self, key: Any) -> Any:
+        h = _hash(key)
+        node = self._root
+        shift = 0
+        while True:
+            bit, index = _slot(node, shift, h)
+            if not node.bitmap & bit:
+                raise KeyError(key)
+            item = node.entries[index]
+            if isinstance(item, _Node):
+                node = item
+                shift += _BITS
+                continue
+            if isinstance(item, _Leaf):
+                if item.hash == h and item.key == key:
+                    return item.value
+                raise KeyError(key)
+            for leaf in item.leaves:
+                if leaf.key == key:
+                    return leaf.value
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[Any]:
+        return (leaf.key for leaf in _iter_leaves(self._root))
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return f"PersistentMap({dict(self.items())!r})"
+
+    def __hash__(self) -> int:
+        return hash(frozenset(self.items()))
+
+    def set(self, key: Any, value: Any) -> "PersistentMap":
+        """Return a new map with ``key`` bound to ``value``."""
+        root, added = _assoc(self._root, 0, _hash(key), key, value)
+        if root is self._root:
+            return self
+        return PersistentMap._from_root(root, self._size + (1 if added else 0))
+
+    def delete(self, key: Any) -> "PersistentMap":
+        """
+        Return a new map without ``key``.
+
+        Raises:
+            KeyError: If ``key`` is not present
+        """
+        root, removed = _dissoc(self._root, 0, _hash(key), key)
+        if not removed:
+            raise KeyError(key)
+        return PersistentMap._from_root(root or _EMPTY_NODE, self._size - 1)
+
+    def update(self, items: Mapping[Any, Any]) -> "PersistentMap":
+        """Return a new map with every entry of ``items`` set."""
+        result = self
+        for key, value in items.items():
+            result = result.set(key, value)
+        return result
+
+
+def freeze(value: Any) -> Any:
+    """
+    Convert a value into a deeply immutable equivalent.
+
+    Conversions: dict -> PersistentMap, list/tuple -> tuple, set/frozenset -> frozenset,
+    bytearray -> bytes. Scalars and already-persistent maps are returned unchanged.
+
+    Raises:
+        TypeError: If the value is of a mutable type that cannot be converted
+    """
+    if value is None or isinstance(value, (str, bytes, int, float, bool, PersistentMap)):
+        return value
+    if isinstance(value, dict):
+        return PersistentMap({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(item) for item in value)
+    if isinstance(value, bytearray):
+        return bytes(value)
+    try:
+        hash(value)
+    except TypeError:
+        raise TypeError(f"carryover values must be immutable, got {type(value).__name__}")
+    return value
+
+
+class CarryoverState:
+    """
+    Round-scoped carryover storage with O(1) sealed snapshots.
+
+    Values are written for the current round with ``set()``. ``seal(round)`` freezes the
+    current contents as that round's snapshot before advancement; the next round starts
+    from the sealed contents and any later write produces a new map, leaving the sealed
+    snapshot untouched.
+
+    Example:
+        >>> carry = CarryoverState()
+        >>> carry.set("viable_values", {"A", "B"})
+        >>> snapshot = carry.seal(0)
+        >>> carry.set("viable_values", {"A"})
+        >>> snapshot["viable_values"]
+        frozenset({'A', 'B'})
+    """
+
+    def __init__(self) -> None:
+        self._current = PersistentMap()
+        self._sealed: Dict[int, PersistentMap] = {}
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store ``value`` (frozen) under ``key`` for the current round.
+
+        Raises:
+            TypeError: If the value cannot be made immutable
+        """
+        self._current = self._current.set(key, freeze(value))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the current value for ``key`` or ``default``."""
+        return self._current.get(key, default)
+
+    def delete(self, key: str) -> None:
+        """Remove ``key`` from the current carryover if present."""
+        if key in self._current:
+            self._current = self._current.delete(key)
+
+    def clear(self) -> None:
+        """Reset the current carryover to empty (sealed snapshots are kept)."""
+        self._current = PersistentMap()
+
+    def current(self) -> PersistentMap:
+        """Return an O(1) snapshot of the current, unsealed contents."""
+        return self._current
+
+    def seal(self, round: int) -> PersistentMap:
+        """
+        Seal the current contents as the snapshot for ``round``.
+
+        Args:
+            round: Round being closed
+
+        Returns:
+            The immutable snapshot
+
+        Raises:
+            ValueError: If ``round`` was already sealed (round firewall violation)
+        """
+        if round in self._sealed:
+            raise ValueError(f"round {round} carryover already sealed")
+        self._sealed[round] = self._current
+        return self._current
+
+    def snapshot(self, round: int) -> PersistentMap:
+        """
+        Return the sealed snapshot for ``round``.
+
+        Raises:
+            KeyError: If ``round`` has not been sealed
+        """
+        return self._sealed[round]
+
+    def sealed_rounds(self) -> List[int]:
+        """Return the sealed round numbers in ascending order."""
+        return sorted(self._sealed)
+
+    def release_through(self, round: int) -> int:
+        """
+        Drop sealed snapshots of rounds <= ``round``.
+
+        Returns:
+            Number of snapshots released
+        """
+        stale = [sealed for sealed in self._sealed if sealed <= round]
+        for sealed in stale:
+            del self._sealed[sealed]
+        return len(stale)
+
+    def restore(self, snapshot: PersistentMap) -> None:
+        """Replace the current contents with a previously taken snapshot."""
+        self._current = snapshot
+
+    def load(self, current: PersistentMap, sealed: Mapping[int, PersistentMap]) -> None:
+        """Replace current contents and sealed snapshots (e.g. when resuming a run)."""
+        self._current = current
+        self._sealed = dict(sealed)
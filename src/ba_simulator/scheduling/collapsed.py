@@ -0,0 +1,201 @@
+"""
+Equivalence-Class Collapsing Executor
+
+Optional lock-step execution mode for large benign or uniform-adversary sweeps.
+
+Honest nodes that start in the same state (same ``RoundNode.class_key()``) and are treated
+identically by the adversary receive identical inboxes, so they make identical state
+transitions and send the same messages up to ``sender_id``. This executor simulates one
+representative per equivalence class and clones its messages for every other member,
+reducing the per-round work from n inbox traversals to k (one per class).
+
+Classes are split lazily: before each round the ``DeliveryPolicy`` partitions every class
+into groups it treats identically. Each extra group is represented by a node built by the
+factory for its smallest member, which keeps its own ``identity_fields`` (keys, node-indexed
+caches) and takes a copy of the rest of the representative's state. Results (decisions, message counts, inbox order) are identical to
+``LockstepRunner`` with the same policy, so Agreement and Validity checks apply unchanged.
+
+A clone differs from the representative's message in ``sender_id``, which is covered by
+the signature. Clones are therefore re-signed with the member's key when ``keys`` are
+given; without keys only unsigned messages (all-zero signature) can be collapsed.
+"""
+
+import copy
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, FrozenSet, List, Mapping, Optional
+
+from ba_simulator.scheduling.lockstep import LockstepResult
+from ba_simulator.scheduling.round_node import DeliveryPolicy, RoundNode
+from ba_simulator.transport.crypto import NodeKeys
+from ba_simulator.transport.message import Message
+
+_UNSIGNED = b"\x00" * 64
+
+
+@dataclass
+class NodeClass:
+    """
+    Honest nodes simulated by a single representative.
+
+    Fields:
+        representative: Node instance whose ``node_id`` is the smallest member
+        members: IDs of all nodes in the class
+    """
+
+    representative: RoundNode
+    members: FrozenSet[int]
+
+    @property
+    def multiplicity(self) -> int:
+        """Number of nodes in the class."""
+        return len(self.members)
+
+
+def detect_classes(nodes: List[RoundNode]) -> List[NodeClass]:
+    """
+    Group nodes by ``class_key()``; nodes returning None form singleton classes.
+
+    Returns:
+        Classes ordered by smallest member ID
+    """
+    grouped: Dict[object, List[RoundNode]] = {}
+    classes: List[NodeClass] = []
+    for node in nodes:
+        key = node.class_key()
+        if key is None:
+            classes.append(NodeClass(node, frozenset([node.node_id])))
+        else:
+            grouped.setdefault(key, []).append(node)
+
+    for group in grouped.values():
+        representative = min(group, key=lambda node: node.node_id)
+        classes.append(NodeClass(representative, frozenset(node.node_id for node in group)))
+    classes.sort(key=lambda cls: cls.representative.node_id)
+    return classes
+
+
+class CollapsedLockstepRunner:
+    """
+    Lock-step executor simulating one representative per equivalence class.
+
+    Attributes:
+        classes: Current equivalence classes
+        node_steps: Number of ``step()`` calls executed (k per round instead of n)
+
+    Example:
+        >>> runner = CollapsedLockstepRunner(node_factory=MyNode, n=1000)
+        >>> result = runner.run(max_rounds=10)
+        >>> len(runner.classes), runner.node_steps
+    """
+
+    def __init__(
+        self,
+        node_factory: Callable[[int], RoundNode],
+        n: int,
+        policy: Optional[DeliveryPolicy] = None,
+        keys: Optional[Mapping[int, NodeKeys]] = None,
+    ) -> None:
+        """
+        Build all nodes and detect the initial classes.
+
+        Args:
+            node_factory: Callable building the node for a given node ID
+            n: Number of nodes
+            policy: Delivery policy (benign if omitted)
+            keys: Keys per node ID used to re-sign cloned messages (required when nodes
+                send signed messages)
+
+        Raises:
+            ValueError: If n is not positive
+        """
+        if n <= 0:
+            raise ValueError(f"n must be positive, got {n}")
+        self.n = n
+        self.policy = policy if policy is not None else DeliveryPolicy()
+        self.keys = keys
+        self.node_factory = node_factory
+        self.classes = detect_classes([node_factory(node_id) for node_id in range(n)])
+        self.node_steps = 0
+
+    def run(self, max_rounds: int) -> LockstepResult:
+        """
+        Execute rounds until every node decided or ``max_rounds`` rounds ran.
+
+        Returns:
+            LockstepResult identical to the one ``LockstepRunner`` produces
+
+        Raises:
+            ValueError: If a signed message must be cloned and no keys were given
+        """
+        result = LockstepResult(rounds=0)
+        inbox: List[Message] = []
+
+        for round in range(max_rounds):
+            self._split(round)
+            by_sender: Dict[int, List[Message]] = {}
+            for cls in self.classes:
+                node = cls.representative
+                out = node.step(round, self.policy.filter_inbox(round, node.node_id, inbox))
+                self.node_steps += 1
+                for member in cls.members:
+                    by_sender[member] = out if member == node.node_id else self._clone(out, member)
+
+            inbox = [msg for sender in sorted(by_sender) for msg in by_sender[sender]]
+            result.rounds = round + 1
+            result.messages += len(inbox)
+            if all(cls.representative.is_decided() for cls in self.classes):
+                break
+
+        for cls in self.classes:
+            if cls.representative.is_decided():
+                for member in cls.members:
+                    result.decisions[member] = cls.representative.decision
+        result.decisions = dict(sorted(result.decisions.items()))
+        return result
+
+    def _split(self, round: int) -> None:
+        """Split every class the policy no longer treats uniformly in ``round``."""
+        split: List[NodeClass] = []
+        for cls in self.classes:
+            groups = [group for group in self.policy.partition(round, cls.members) if group]
+            if len(groups) == 1 and groups[0] == cls.members:
+                split.append(cls)
+                continue
+            if (
+                sum(len(group) for group in groups) != len(cls.members)
+                or frozenset().union(*groups) != cls.members
+            ):
+                raise ValueError(f"policy partition of class {sorted(cls.members)} is invalid")
+
+            for group in groups:
+                node = cls.representative
+                if node.node_id not in group:
+                    node = self._rebuild(node, min(group))
+                split.append(NodeClass(node, frozenset(group)))
+        split.sort(key=lambda cls: cls.representative.node_id)
+        self.classes = split
+
+    def _rebuild(self, representative: RoundNode, node_id: int) -> RoundNode:
+        """Build node ``node_id`` in the representative's state, keeping its own identity."""
+        node = self.node_factory(node_id)
+        shared = {
+            name: value
+            for name, value in vars(representative).items()
+            if name not in node.identity_fields
+        }
+        vars(node).update(copy.deepcopy(shared))
+        return node
+
+    def _clone(self, messages: List[Message], sender_id: int) -> List[Message]:
+        """Return copies of a representative's messages sent (and signed) by ``sender_id``."""
+        clones = [replace(msg, sender_id=sender_id) for msg in messages]
+        if self.keys is None:
+            if any(msg.signature != _UNSIGNED for msg in messages):
+                raise ValueError(
+                    "collapsed execution of signed messages requires keys to re-sign clones"
+                )
+            return clones
+        member_keys = self.keys[sender_id]
+        return [
+            replace(clone, signature=member_keys.sign(clone.signing_payload())) for clone in clones
+        ]
@@ -0,0 +1,225 @@
+"""
+Vectorized Link-Delay Sampling
+
+This module models per-message network delays for the lock-step synchrony model.
+Every message delivered in a phase traverses one (sender, receiver) link; the delay of
+that link is drawn from a Uniform, Normal or Pareto distribution and bounded by Δ.
+
+Instead of drawing one delay per message from Python's ``random`` module, the whole
+n×n link matrix of a phase is drawn in a single seeded NumPy call. Bounding by Δ,
+drop masks and the resulting delivery order are computed with array operations as well.
+
+Determinism:
+    The generator for a phase is the ``SeedService`` stream ``("link-delay", round,
+    phase)`` of the model's seed, so the draws for a given phase are identical regardless
+    of how many other phases were sampled before it, in which order, or in which process.
+"""
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ba_simulator.scheduling.determinism import SeedService
+
+
+class DelayDistribution(str, Enum):
+    """Supported link-delay distributions."""
+
+    UNIFORM = "uniform"
+    NORMAL = "normal"
+    PARETO = "pareto"
+
+
+@dataclass(frozen=True)
+class PhaseDelays:
+    """
+    Sampled link delays for one (round, phase).
+
+    Matrices are indexed ``[sender, receiver]``.
+
+    Fields:
+        round: Round the delays were sampled for
+        phase: Protocol phase the delays were sampled for
+        delays: float64 matrix of delays in simulated seconds, each in [0, Δ]
+        dropped: bool matrix, True where the link drops the message
+        order: Flat link indices (``sender * n + receiver``) of all delivered links,
+            sorted by arrival time with ties broken by sender then receiver
+    """
+
+    round: int
+    phase: str
+    delays: np.ndarray
+    dropped: np.ndarray
+    order: np.ndarray
+
+    @property
+    def n(self) -> int:
+        """Number of nodes covered by the link matrix."""
+        return int(self.delays.shape[0])
+
+    def receivers_of(self, sender: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return the receivers reached by a broadcast from ``sender`` and their delays.
+
+        Args:
+            sender: Sending node ID
+
+        Returns:
+            Tuple ``(receivers, delays)`` of the non-dropped links, sorted by
+            arrival time (ties broken by receiver ID)
+        """
+        row_delays = self.delays[sender]
+        receivers = np.flatnonzero(~self.dropped[sender])
+        arrival = np.lexsort((receivers, row_delays[receivers]))
+        receivers = receivers[arrival]
+        return receivers, row_delays[receivers]
+
+    def delivery_schedule(self) -> List[Tuple[int, int, float]]:
+        """
+        Return the delivered links of the phase in arrival order.
+
+        Returns:
+            List of ``(sender, receiver, delay)`` tuples
+        """
+        senders, receivers = np.divmod(self.order, self.n)
+        delays = self.delays.ravel()[self.order]
+        return list(zip(senders.tolist(), receivers.tolist(), delays.tolist()))
+
+
+class LinkDelayModel:
+    """
+    Seeded delay model drawing a whole phase's link matrix at once.
+
+    Distribution parameters (all in simulated seconds, defaults relative to Δ):
+        uniform: ``low`` (0.0), ``high`` (Δ)
+        normal: ``mean`` (Δ/2), ``std`` (Δ/4)
+        pareto: ``shape`` (2.0), ``scale`` (Δ/10) - classical Pareto with minimum ``scale``
+
+    Draws below zero are clipped to zero and draws above Δ are capped at Δ, so the
+    synchrony bound always holds. Self-links (a node delivering to itself) have zero
+    delay and are never dropped.
+
+    Example:
+        >>> model = LinkDelayModel(n=4, delta=1.0, distribution="pareto", seed=7)
+        >>> phase = model.sample_phase(round=3, phase="ECHO")
+        >>> receivers, delays = phase.receivers_of(sender=0)
+    """
+
+    def __init__(
+        self,
+        n: int,
+        delta: float,
+        distribution: str = DelayDistribution.UNIFORM.value,
+        params: Optional[Dict[str, float]] = None,
+        drop_probability: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        """
+        Initialize the delay model.
+
+        Args:
+            n: Number of nodes
+            delta: Synchrony bound Δ (maximum delay)
+            distribution: One of "uniform", "normal", "pareto"
+            params: Optional distribution parameters overriding the defaults
+            drop_probability: Independent per-link drop probability in [0, 1]
+            seed: Seed for the per-(round, phase) generators
+
+        Raises:
+            ValueError: If any parameter is out of range or the distribution is unknown
+        """
+        if n <= 0:
+            raise ValueError(f"n must be positive, got {n}")
+        if delta <= 0:
+            raise ValueError(f"delta must be positive, got {delta}")
+        if not 0.0 <= drop_probability <= 1.0:
+            raise ValueError(f"drop_probability must be in [0, 1], got {drop_probability}")
+
+        self.n = n
+        self.delta = float(delta)
+        self.distribution = DelayDistribution(distribution)
+        self.params = self._resolve_params(params or {})
+        self.drop_probability = float(drop_probability)
+        self.seed = seed
+        self.seeds = SeedService(seed)
+
+    def sample_phase(self, round: int, phase: str) -> PhaseDelays:
+        """
+        Draw delays and drops for every link of one phase.
+
+        Args:
+            round: Round number
+            phase: Protocol phase
+
+        Returns:
+            PhaseDelays for the phase; identical for identical (seed, round, phase)
+        """
+        rng = self._generator(round, phase)
+        shape = (self.n, self.n)
+
+        delays = np.clip(self._draw(rng, shape), 0.0, self.delta)
+        dropped = rng.random(shape) < self.drop_probability
+
+        np.fill_diagonal(delays, 0.0)
+        np.fill_diagonal(dropped, False)
+
+        order = arrival_order(delays, dropped)
+        return PhaseDelays(round=round, phase=phase, delays=delays, dropped=dropped, order=order)
+
+    def _generator(self, round: int, phase: str) -> np.random.Generator:
+        """Derive the generator for ``(seed, round, phase)``."""
+        return self.seeds.stream("link-delay", round, phase)
+
+    def _draw(self, rng: np.random.Generator, shape: Tuple[int, int]) -> np.ndarray:
+        """Draw an unbounded delay matrix from the configured distribution."""
+        p = self.params
+        if self.distribution is DelayDistribution.UNIFORM:
+            return rng.uniform(p["low"], p["high"], size=shape)
+        if self.distribution is DelayDistribution.NORMAL:
+            return rng.normal(p["mean"], p["std"], size=shape)
+        # NumPy's pareto() is the Lomax form; shift by one for the classical Pareto
+        return (rng.pareto(p["shape"], size=shape) + 1.0) * p["scale"]
+
+    def _resolve_params(self, params: Dict[str, Any]) -> Dict[str, float]:
+        """Merge user parameters with Δ-relative defaults and validate them."""
+        defaults = {
+            DelayDistribution.UNIFORM: {"low": 0.0, "high": self.delta},
+            DelayDistribution.NORMAL: {"mean": self.delta / 2, "std": self.delta / 4},
+            DelayDistribution.PARETO: {"shape": 2.0, "scale": self.delta / 10},
+        }[self.distribution]
+
+        unknown = set(params) - set(defaults)
+        if unknown:
+            raise ValueError(
+                f"Unknown parameters for {self.distribution.value} distribution: {sorted(unknown)}"
+            )
+        resolved = {key: float(params.get(key, value)) for key, value in defaults.items()}
+
+        if self.distribution is DelayDistribution.UNIFORM and resolved["low"] > resolved["high"]:
+            raise ValueError("uniform distribution requires low <= high")
+        if self.distribution is DelayDistribution.NORMAL and resolved["std"] < 0:
+            raise ValueError("normal distribution requires std >= 0")
+        if self.distribution is DelayDistribution.PARETO and (
+            resolved["shape"] <= 0 or resolved["scale"] <= 0
+        ):
+            raise ValueError("pareto distribution requires shape > 0 and scale > 0")
+        return resolved
+
+
+def arrival_order(delays: np.ndarray, dropped: np.ndarray) -> np.ndarray:
+    """
+    Sort delivered links by (delay, sender, receiver).
+
+    Args:
+        delays: n×n delay matrix indexed ``[sender, receiver]``
+        dropped: n×n drop mask
+
+    Returns:
+        Flat link indices (``sender * n + receiver``) of the non-dropped links
+    """
+    flat_delays = delays.ravel()
+    links = np.flatnonzero(~dropped.ravel())
+    # Flat index is sender-major, so it breaks ties by sender then receiver
+    return links[np.lexsort((links, flat_delays[links]))]
@@ -0,0 +1,208 @@
+"""
+Bounded Late-Message Audit Log
+
+Messages arriving after their round has closed are recorded with ``post_round=1`` for
+audit and are never processed for state mutation (round firewall). Under withholding
+adversaries the number of late messages grows without bound, so keeping them all in a
+Python list eventually exhausts memory on long runs.
+
+``LateMessageLog`` keeps the most recent late messages in a fixed-size in-memory ring and
+spills older ones to an append-only file. Only a compact index (message round and file
+offset per spilled record) stays resident; round-range queries read spilled records back
+lazily, one record at a time.
+
+Spill record layout (little-endian):
+    message_round: i64 | arrival_round: i64 | arrival_time: f64 | frame_length: u32 | frame
+where ``frame`` is the message encoded with the configured MessageSerializer.
+"""
+
+import struct
+from array import array
+from collections import Counter, deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Deque, Iterator, Optional, Union
+
+from ba_simulator.transport.message import Message
+from ba_simulator.transport.serialization import JSONMessageSerializer, MessageSerializer
+
+_RECORD_HEADER = struct.Struct("<qqdI")
+
+
+@dataclass(frozen=True)
+class LateMessageRecord:
+    """
+    Audit entry for a message that arrived after its round closed.
+
+    Fields:
+        message: The late message, with full headers and signature
+        arrival_round: Local round in which the message arrived
+        arrival_time: Simulated arrival timestamp
+        post_round: Always 1 - marks the message as audit-only
+    """
+
+    message: Message
+    arrival_round: int
+    arrival_time: float
+    post_round: int = 1
+
+    @property
+    def round_delta(self) -> int:
+        """Number of rounds between the message's round and its arrival."""
+        return self.arrival_round - self.message.round
+
+
+class LateMessageLog:
+    """
+    Late-message log with a bounded in-memory ring and an append-only spill file.
+
+    Example:
+        >>> log = LateMessageLog(spill_path="late.bin", capacity=1024)
+        >>> log.record(message, arrival_round=7, arrival_time=3.2)
+        >>> for entry in log.query(round_start=0, round_end=5):
+        ...     print(entry.message.sender_id, entry.round_delta)
+        >>> log.close()
+    """
+
+    def __init__(
+        self,
+        spill_path: Union[str, Path],
+        capacity: int = 1024,
+        serializer: Optional[MessageSerializer] = None,
+    ) -> None:
+        """
+        Initialize the log.
+
+        Args:
+            spill_path: File receiving spilled records (truncated on open)
+            capacity: Maximum number of records kept in memory
+            serializer: Serializer for spilled messages (defaults to JSON)
+
+        Raises:
+            ValueError: If capacity is not positive
+        """
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+
+        self.capacity = capacity
+        self.spill_path = Path(spill_path)
+        self.serializer = serializer or JSONMessageSerializer()
+
+        self._recent: Deque[LateMessageRecord] = deque()
+        self._spill_file = open(self.spill_path, "wb")
+        self._spilled_rounds = array("q")
+        self._spilled_offsets = array("q")
+
+        self.count_by_round: Counter = Counter()
+        self.count_by_sender: Counter = Counter()
+
+    def record(
+        self, message: Message, arrival_round: int, arrival_time: float
+    ) -> LateMessageRecord:
+        """
+        Append a late message to the audit log.
+
+        Args:
+            message: Message that arrived after its round closed
+            arrival_round: Local round at arrival
+            arrival_time: Simulated arrival timestamp
+
+        Returns:
+            The stored LateMessageRecord
+        """
+        entry = LateMessageRecord(
+            message=message, arrival_round=arrival_round, arrival_time=arrival_time
+        )
+        if len(self._recent) == self.capacity:
+            self._spill(self._recent.popleft())
+        self._recent.append(entry)
+
+        self.count_by_round[message.round] += 1
+        self.count_by_sender[message.sender_id] += 1
+        return entry
+
+    def query(self, round_start: int, round_end: int) -> Iterator[LateMessageRecord]:
+        """
+        Iterate over late messages whose message round lies in [round_start, round_end].
+
+        Spilled records are yielded first (read from disk on demand), followed by the
+        in-memory records, so results are in arrival order.
+
+        Args:
+            round_start: First message round (inclusive)
+            round_end: Last message round (inclusive)
+
+        Yields:
+            Matching LateMessageRecord entries
+        """
+        if self._spilled_offsets:
+            self._spill_file.flush()
+            with open(self.spill_path, "rb") as spill:
+                for msg_round, offset in zip(self._spilled_rounds, self._spilled_offsets):
+                    if round_start <= msg_round <= round_end:
+                        yield self._read_spilled(spill, offset)
+
+        for entry in list(self._recent):
+            if round_start <= entry.message.round <= round_end:
+                yield entry
+
+    def release_through(self, round: int) -> int:
+        """
+        Forget records whose message round is <= ``round``.
+
+        Spilled bytes stay in the append-only file but leave the index. The per-round and
+        per-sender counters are kept as a summary.
+
+        Returns:
+            Number of records released
+        """
+        keep = [i for i, msg_round in enumerate(self._spilled_rounds) if msg_round > round]
+        released = len(self._spilled_rounds) - len(keep)
+        self._spilled_rounds = array("q", (self._spilled_rounds[i] for i in keep))
+        self._spilled_offsets = array("q", (self._spilled_offsets[i] for i in keep))
+
+        recent = len(self._recent)
+        self._recent = deque(entry for entry in self._recent if entry.message.round > round)
+        return released + recent - len(self._recent)
+
+    @property
+    def spilled_count(self) -> int:
+        """Number of records moved to the spill file."""
+        return len(self._spilled_offsets)
+
+    @property
+    def in_memory_count(self) -> int:
+        """Number of records currently held in memory."""
+        return len(self._recent)
+
+    def __len__(self) -> int:
+        """Total number of late messages recorded."""
+        return self.spilled_count + self.in_memory_count
+
+    def close(self) -> None:
+        """Flush and close the spill file. The log must not be used afterwards."""
+        self._spill_file.close()
+
+    def _spill(self, entry: LateMessageRecord) -> None:
+        """Append one record to the spill file and index it."""
+        frame = self.serializer.encode(entry.message)
+        offset = self._spill_file.tell()
+        self._spill_file.write(
+            _RECORD_HEADER.pack(
+                entry.message.round, entry.arrival_round, entry.arrival_time, len(frame)
+            )
+        )
+        self._spill_file.write(frame)
+        self._spilled_rounds.append(entry.message.round)
+        self._spilled_offsets.append(offset)
+
+    def _read_spilled(self, spill: BinaryIO, offset: int) -> LateMessageRecord:
+        """Read back the spilled record starting at ``offset``."""
+        spill.seek(offset)
+        _, arrival_round, arrival_time, length = _RECORD_HEADER.unpack(
+            spill.read(_RECORD_HEADER.size)
+        )
+        message = self.serializer.decode(spill.read(length))
+        return LateMessageRecord(
+            message=message, arrival_round=arrival_round, arrival_time=arrival_time
+        )
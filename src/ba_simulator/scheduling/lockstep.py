@@ -0,0 +1,117 @@
+"""
+In-Process Lock-Step Executor
+
+Reference executor for ``RoundNode`` instances: every node runs in the current process,
+and every message broadcast in round r is delivered to every node at round r+1.
+
+Delivery order is fully deterministic: messages are ordered by sender ID and, within a
+sender, by emission order. The sharded multi-process executor reproduces exactly this
+order, so the two executors are interchangeable for a given set of nodes.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from ba_simulator.scheduling.round_node import DeliveryPolicy, RoundNode
+from ba_simulator.transport.message import Message
+
+
+@dataclass
+class LockstepResult:
+    """
+    Outcome of a lock-step run.
+
+    Fields:
+        rounds: Number of rounds executed
+        decisions: Decided value per node ID (undecided nodes are absent)
+        messages: Total number of messages broadcast
+    """
+
+    rounds: int
+    decisions: Dict[int, Any] = field(default_factory=dict)
+    messages: int = 0
+
+    def all_decided(self, n: int) -> bool:
+        """Return True if every one of the ``n`` nodes decided."""
+        return len(self.decisions) == n
+
+
+class LockstepRunner:
+    """
+    Run ``RoundNode`` instances in lock-step inside the current process.
+
+    Example:
+        >>> runner = LockstepRunner(node_factory=MyNode, n=7)
+        >>> result = runner.run(max_rounds=10)
+        >>> result.decisions
+    """
+
+    def __init__(
+        self,
+        node_factory: Callable[[int], RoundNode],
+        n: int,
+        policy: Optional[DeliveryPolicy] = None,
+    ) -> None:
+        """
+        Initialize the runner.
+
+        Args:
+            node_factory: Callable building the node for a given node ID
+            n: Number of nodes
+            policy: Delivery policy applied to every inbox (benign if omitted)
+
+        Raises:
+            ValueError: If n is not positive
+        """
+        if n <= 0:
+            raise ValueError(f"n must be positive, got {n}")
+        self.n = n
+        self.policy = policy
+        self.nodes: List[RoundNode] = [node_factory(node_id) for node_id in range(n)]
+        self.next_round = 0
+        self.pending: List[Message] = []
+        self.messages_sent = 0
+
+    def run(
+        self,
+        max_rounds: int,
+        on_round_end: Optional[Callable[[int], None]] = None,
+        guard: Optional[Callable[[int, int], None]] = None,
+    ) -> LockstepResult:
+        """
+        Execute rounds until every node decided or ``max_rounds`` rounds ran.
+
+        Execution continues from ``next_round`` with ``pending`` as the inbox, so a runner
+        whose nodes and fields were restored from a checkpoint resumes where it stopped.
+
+        Args:
+            max_rounds: Upper bound on the number of rounds
+            on_round_end: Called with the round number after each completed round
+            guard: Called with ``(node_id, round)`` before each node step, e.g.
+                ``PropertyMonitor.check_write`` to enforce the round firewall
+
+        Returns:
+            LockstepResult with decisions and message count
+        """
+        for round in range(self.next_round, max_rounds):
+            if round > 0 and all(node.is_decided() for node in self.nodes):
+                break
+            outgoing: List[Message] = []
+            for node in self.nodes:
+                node_inbox = self.pending
+                if self.policy is not None:
+                    node_inbox = self.policy.filter_inbox(round, node.node_id, self.pending)
+                if guard is not None:
+                    guard(node.node_id, round)
+                outgoing.extend(node.step(round, node_inbox))
+            self.pending = outgoing
+            self.next_round = round + 1
+            self.messages_sent += len(outgoing)
+            if on_round_end is not None:
+                on_round_end(round)
+
+        return LockstepResult(
+            rounds=self.next_round,
+            decisions={node.node_id: node.decision for node in self.nodes if node.is_decided()},
+            messages=self.messages_sent,
+        )
@@ -0,0 +1,122 @@
+"""
+Lock-Step Round Node Interface
+
+This module defines the minimal contract between a simulated node and the round-based
+executors (in-process and sharded). A node is a deterministic state machine that, once per
+round, consumes the messages broadcast in the previous round and emits the messages it
+broadcasts in the current round.
+
+Executors rely on two properties of every node:
+- Determinism: identical inboxes produce identical outputs and state transitions
+- Locality: a node only mutates its own state inside ``step()``
+
+These properties are what make it safe to run nodes in separate worker processes while
+keeping results bit-identical to a single-process run.
+
+``DeliveryPolicy`` lets an adversary shape what each receiver gets. A policy declares
+which nodes it treats identically, so the collapsed executor can keep simulating those
+nodes as a single equivalence class.
+"""
+
+import copy
+from abc import ABC, abstractmethod
+from typing import Any, Dict, FrozenSet, Hashable, List, Optional, Tuple
+
+from ba_simulator.transport.message import Message
+
+
+class RoundNode(ABC):
+    """
+    Abstract base class for nodes driven by a lock-step round executor.
+
+    Round semantics:
+        - ``step(0, [])`` is called first; the node broadcasts its round-0 messages
+        - ``step(r, inbox)`` receives every message broadcast in round r-1, ordered by
+          sender ID and, within a sender, by emission order
+        - A node signals its decision by setting ``self.decision``
+
+    Attributes:
+        node_id: Node identifier (0-indexed)
+        decision: Decided value, or None while undecided
+        identity_fields: Attributes derived from ``node_id`` (keys, node-indexed caches);
+            the collapsed executor never copies them from one node to another
+    """
+
+    identity_fields: Tuple[str, ...] = ("node_id",)
+
+    def __init__(self, node_id: int) -> None:
+        self.node_id = node_id
+        self.decision: Optional[Any] = None
+
+    @abstractmethod
+    def step(self, round: int, inbox: List[Message]) -> List[Message]:
+        """
+        Execute one round.
+
+        Args:
+            round: Current round number
+            inbox: Messages broadcast in the previous round (empty for round 0)
+
+        Returns:
+            Messages this node broadcasts in ``round``
+        """
+        pass
+
+    def is_decided(self) -> bool:
+        """Return True once the node has decided."""
+        return self.decision is not None
+
+    def class_key(self) -> Optional[Hashable]:
+        """
+        Return a key describing this node's state up to its identity.
+
+        Nodes with equal keys must behave identically on identical inboxes, and their
+        messages may differ only in ``sender_id``. The collapsed executor simulates such
+        nodes once. The default (None) opts out: the node is always simulated on its own.
+        """
+        return None
+
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Return the node's state as plain data for checkpointing.
+
+        The default is a deep copy of the instance attributes, so a checkpoint does not
+        alias state the node keeps mutating. Writing it to a checkpoint file requires every
+        attribute to be encodable (``encode_value``); nodes holding other objects override
+        this and ``set_state()``.
+        """
+        return copy.deepcopy(vars(self))
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        """Restore the state returned by ``get_state()`` (the default replaces attributes)."""
+        vars(self).update(copy.deepcopy(state))
+
+
+class DeliveryPolicy:
+    """
+    Adversarial control over message delivery in lock-step executors.
+
+    The default policy is benign: every receiver gets the full inbox and all nodes are
+    treated identically.
+    """
+
+    def partition(self, round: int, members: FrozenSet[int]) -> List[FrozenSet[int]]:
+        """
+        Split ``members`` into groups that ``filter_inbox`` treats identically in ``round``.
+
+        Args:
+            round: Current round number
+            members: Node IDs of one equivalence class
+
+        Returns:
+            Disjoint groups covering ``members``
+        """
+        return [members]
+
+    def filter_inbox(self, round: int, receiver: int, inbox: List[Message]) -> List[Message]:
+        """
+        Return the messages ``receiver`` gets in ``round``.
+
+        Must return the same inbox for all receivers of a group returned by ``partition``.
+        """
+        return inbox
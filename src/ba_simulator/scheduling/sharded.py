@@ -0,0 +1,249 @@
+"""
+Sharded Multi-Process Lock-Step Executor
+
+Runs ``RoundNode`` instances split across worker processes so a single large run can use
+every core of the machine. Node IDs are partitioned into contiguous shards; each shard is
+executed by one worker process.
+
+Data path:
+    worker --(outbound SharedMemoryRing)--> coordinator --(inbound SharedMemoryRing)--> workers
+
+Messages travel as serialized frames through shared-memory rings; only small control tuples
+(round start, round done, decisions) go through pipes.
+
+Round barrier and determinism:
+    1. The coordinator announces round r and the number of frames in the round-r inbox
+    2. It writes the inbox frames (everything broadcast in round r-1) to every shard's ring
+    3. Each worker decodes the inbox, steps its nodes in node-ID order and reports
+    4. The coordinator collects outbound frames shard by shard
+
+Because shards hold contiguous node ranges and are drained in shard order, the collected
+frames are ordered by sender ID and emission order - exactly the order produced by
+``LockstepRunner``. Results are therefore bit-identical to a single-process run.
+"""
+
+import multiprocessing
+import traceback
+from multiprocessing.connection import Connection
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from ba_simulator.scheduling.lockstep import LockstepResult
+from ba_simulator.scheduling.round_node import RoundNode
+from ba_simulator.scheduling.shm_ring import SharedMemoryRing
+from ba_simulator.transport.serialization import JSONMessageSerializer, MessageSerializer
+
+NodeFactory = Callable[[int], RoundNode]
+SerializerFactory = Callable[[], MessageSerializer]
+
+
+def partition_nodes(n: int, shards: int) -> List[range]:
+    """
+    Split node IDs 0..n-1 into ``shards`` contiguous, near-equal ranges.
+
+    Args:
+        n: Number of nodes
+        shards: Number of shards (capped at n)
+
+    Returns:
+        List of node-ID ranges in ascending order
+    """
+    shards = max(1, min(shards, n))
+    base, extra = divmod(n, shards)
+    ranges = []
+    start = 0
+    for shard in range(shards):
+        size = base + (1 if shard < extra else 0)
+        ranges.append(range(start, start + size))
+        start += size
+    return ranges
+
+
+def _shard_worker(
+    node_factory: NodeFactory,
+    node_ids: Sequence[int],
+    inbound_name: str,
+    outbound_name: str,
+    conn: Connection,
+    serializer_factory: SerializerFactory,
+) -> None:
+    """
+    Worker process main loop: step the shard's nodes once per announced round.
+
+    Control protocol (pipe):
+        recv ("round", r, inbox_count) -> send ("done", outbound_count, decisions)
+        recv ("stop",)                 -> exit
+        any exception                  -> send ("error", formatted traceback)
+    """
+    inbound = SharedMemoryRing.attach(inbound_name)
+    outbound = SharedMemoryRing.attach(outbound_name)
+    serializer = serializer_factory()
+
+    try:
+        nodes = [node_factory(node_id) for node_id in node_ids]
+        while True:
+            command = conn.recv()
+            if command[0] == "stop":
+                break
+            _, round, inbox_count = command
+
+            inbox = [serializer.decode(inbound.read_blocking()) for _ in range(inbox_count)]
+            frames = []
+            for node in nodes:
+                frames.extend(serializer.encode(msg) for msg in node.step(round, inbox))
+            decisions = {node.node_id: node.decision for node in nodes if node.is_decided()}
+
+            # Report before writing so the coordinator knows how many frames to drain
+            conn.send(("done", len(frames), decisions))
+            for frame in frames:
+                outbound.write(frame)
+    except Exception:
+        conn.send(("error", traceback.format_exc()))
+    finally:
+        inbound.close()
+        outbound.close()
+        conn.close()
+
+
+class ShardedExecutor:
+    """
+    Execute ``RoundNode`` instances across worker processes with shared-memory rings.
+
+    ``node_factory`` and ``serializer_factory`` must be picklable (module-level callables)
+    when the multiprocessing start method is not ``fork``.
+
+    Example:
+        >>> executor = ShardedExecutor(node_factory=MyNode, n=256, workers=32)
+        >>> result = executor.run(max_rounds=20)
+    """
+
+    def __init__(
+        self,
+        node_factory: NodeFactory,
+        n: int,
+        workers: int,
+        ring_capacity: int = 1 << 22,
+        serializer_factory: SerializerFactory = JSONMessageSerializer,
+        mp_context: Optional[Any] = None,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """
+        Initialize the executor.
+
+        Args:
+            node_factory: Callable building the node for a given node ID (runs in the worker)
+            n: Number of nodes
+            workers: Number of worker processes (capped at n)
+            ring_capacity: Data capacity of each shared-memory ring in bytes
+            serializer_factory: Callable returning the MessageSerializer used for frames
+            mp_context: multiprocessing context (defaults to the platform default)
+            timeout: Maximum seconds to wait for any single frame (None waits forever)
+
+        Raises:
+            ValueError: If n or workers is not positive
+        """
+        if n <= 0:
+            raise ValueError(f"n must be positive, got {n}")
+        if workers <= 0:
+            raise ValueError(f"workers must be positive, got {workers}")
+
+        self.node_factory = node_factory
+        self.n = n
+        self.shards = partition_nodes(n, workers)
+        self.ring_capacity = ring_capacity
+        self.serializer_factory = serializer_factory
+        self.mp_context = mp_context or multiprocessing.get_context()
+        self.timeout = timeout
+
+    def run(self, max_rounds: int) -> LockstepResult:
+        """
+        Execute rounds until every node decided or ``max_rounds`` rounds ran.
+
+        Args:
+            max_rounds: Upper bound on the number of rounds
+
+        Returns:
+            LockstepResult identical to the one ``LockstepRunner`` produces
+
+        Raises:
+            RuntimeError: If a worker process fails
+        """
+        rings: List[Tuple[SharedMemoryRing, SharedMemoryRing]] = []
+        conns: List[Connection] = []
+        processes = []
+
+        try:
+            for node_ids in self.shards:
+                inbound = SharedMemoryRing(self.ring_capacity)
+                outbound = SharedMemoryRing(self.ring_capacity)
+                rings.append((inbound, outbound))
+
+                parent_conn, child_conn = self.mp_context.Pipe()
+                process = self.mp_context.Process(
+                    target=_shard_worker,
+                    args=(
+                        self.node_factory,
+                        list(node_ids),
+                        inbound.name,
+                        outbound.name,
+                        child_conn,
+                        self.serializer_factory,
+                    ),
+                    daemon=True,
+                )
+                process.start()
+                child_conn.close()
+                conns.append(parent_conn)
+                processes.append(process)
+
+            return self._coordinate(rings, conns, max_rounds)
+        finally:
+            for conn in conns:
+                try:
+                    conn.send(("stop",))
+                except (BrokenPipeError, OSError):
+                    pass
+            for process in processes:
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+            for inbound, outbound in rings:
+                for ring in (inbound, outbound):
+                    ring.close()
+                    ring.unlink()
+
+    def _coordinate(
+        self,
+        rings: List[Tuple[SharedMemoryRing, SharedMemoryRing]],
+        conns: List[Connection],
+        max_rounds: int,
+    ) -> LockstepResult:
+        """Drive the round barrier and route frames between shards."""
+        result = LockstepResult(rounds=0)
+        decisions: Dict[int, Any] = {}
+        frames: List[bytes] = []
+
+        for round in range(max_rounds):
+            for conn in conns:
+                conn.send(("round", round, len(frames)))
+            for inbound, _ in rings:
+                for frame in frames:
+                    inbound.write(frame, timeout=self.timeout)
+
+            outgoing: List[bytes] = []
+            for conn, (_, outbound) in zip(conns, rings):
+                reply = conn.recv()
+                if reply[0] == "error":
+                    raise RuntimeError(f"shard worker failed:\n{reply[1]}")
+                _, count, shard_decisions = reply
+                decisions.update(shard_decisions)
+                outgoing.extend(outbound.read_blocking(self.timeout) for _ in range(count))
+
+            result.rounds = round + 1
+            result.messages += len(outgoing)
+            frames = outgoing
+
+            if len(decisions) == self.n:
+                break
+
+        result.decisions = dict(sorted(decisions.items()))
+        return result
@@ -0,0 +1,167 @@
+"""
+Shared-Memory Frame Ring Buffer
+
+Single-producer/single-consumer ring buffer of length-prefixed byte frames living in a
+``multiprocessing.shared_memory`` block. It carries serialized messages between the
+coordinator and shard worker processes without pickling or pipe copies.
+
+Layout of the shared block:
+    [0:8)    head - total bytes ever written (u64, only the producer writes it)
+    [8:16)   tail - total bytes ever read (u64, only the consumer writes it)
+    [16:24)  capacity - size of the data region (u64, written once by the creator)
+    [24:...) data region of ``capacity`` bytes
+
+Each frame is stored as a 4-byte little-endian length followed by the payload; both may
+wrap around the end of the data region. The producer publishes ``head`` only after the
+frame bytes are in place, so the consumer never observes a partially written frame.
+"""
+
+import struct
+import time
+from multiprocessing import shared_memory
+from typing import Optional
+
+_POSITIONS = struct.Struct("<QQ")
+_LENGTH = struct.Struct("<I")
+_HEADER_SIZE = 24
+_BACKOFF_SECONDS = 0.0001
+
+
+class SharedMemoryRing:
+    """
+    SPSC ring buffer of byte frames in shared memory.
+
+    The creating process owns the block and must call ``unlink()`` once all users are done.
+    Other processes attach with ``SharedMemoryRing.attach(name)``.
+
+    Example:
+        >>> ring = SharedMemoryRing(capacity=1 << 16)
+        >>> ring.write(b"frame")
+        >>> ring.read()
+        b'frame'
+    """
+
+    def __init__(self, capacity: int = 1 << 20, name: Optional[str] = None) -> None:
+        """
+        Create a new ring (``name`` is None) or attach to an existing one.
+
+        Args:
+            capacity: Size of the data region in bytes (ignored when attaching)
+            name: Name of an existing shared memory block to attach to
+
+        Raises:
+            ValueError: If capacity is too small to hold any frame
+        """
+        if name is None:
+            if capacity <= _LENGTH.size:
+                raise ValueError(f"capacity must exceed {_LENGTH.size} bytes, got {capacity}")
+            self._shm = shared_memory.SharedMemory(create=True, size=_HEADER_SIZE + capacity)
+            struct.pack_into("<QQQ", self._shm.buf, 0, 0, 0, capacity)
+            self.capacity = capacity
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+            # The OS may round the block size up, so read the capacity from the header
+            (self.capacity,) = struct.unpack_from("<Q", self._shm.buf, 16)
+        self._buf = self._shm.buf
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedMemoryRing":
+        """Attach to a ring created by another process."""
+        return cls(name=name)
+
+    @property
+    def name(self) -> str:
+        """Shared memory block name, used by other processes to attach."""
+        return self._shm.name
+
+    def write(self, frame: bytes, timeout: Optional[float] = None) -> None:
+        """
+        Append a frame, waiting for free space if the ring is full.
+
+        Args:
+            frame: Payload bytes
+            timeout: Maximum seconds to wait for space (None waits forever)
+
+        Raises:
+            ValueError: If the frame can never fit in the ring
+            TimeoutError: If space did not become available within ``timeout``
+        """
+        needed = _LENGTH.size + len(frame)
+        if needed > self.capacity:
+            raise ValueError(f"frame of {len(frame)} bytes exceeds ring capacity {self.capacity}")
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            head, tail = _POSITIONS.unpack_from(self._buf, 0)
+            if self.capacity - (head - tail) >= needed:
+                break
+            if deadline is not None and time.monotonic() > deadline:
+                raise TimeoutError("timed out waiting for ring space")
+            time.sleep(_BACKOFF_SECONDS)
+
+        self._copy_in(head, _LENGTH.pack(len(frame)))
+        self._copy_in(head + _LENGTH.size, frame)
+        struct.pack_into("<Q", self._buf, 0, head + needed)
+
+    def read(self) -> Optional[bytes]:
+        """
+        Pop the next frame without waiting.
+
+        Returns:
+            Frame payload, or None if the ring is empty
+        """
+        head, tail = _POSITIONS.unpack_from(self._buf, 0)
+        if head == tail:
+            return None
+        (length,) = _LENGTH.unpack(self._copy_out(tail, _LENGTH.size))
+        frame = self._copy_out(tail + _LENGTH.size, length)
+        struct.pack_into("<Q", self._buf, 8, tail + _LENGTH.size + length)
+        return frame
+
+    def read_blocking(self, timeout: Optional[float] = None) -> bytes:
+        """
+        Pop the next frame, waiting until one is available.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits forever)
+
+        Raises:
+            TimeoutError: If no frame arrived within ``timeout``
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            frame = self.read()
+            if frame is not None:
+                return frame
+            if deadline is not None and time.monotonic() > deadline:
+                raise TimeoutError("timed out waiting for a frame")
+            time.sleep(_BACKOFF_SECONDS)
+
+    def close(self) -> None:
+        """Detach this process from the shared memory block."""
+        self._buf = None  # type: ignore[assignment]
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Destroy the shared memory block (creator only)."""
+        self._shm.unlink()
+
+    def _copy_in(self, position: int, data: bytes) -> None:
+        """Copy ``data`` into the data region starting at logical ``position``."""
+        offset = position % self.capacity
+        first = min(len(data), self.capacity - offset)
+        start = _HEADER_SIZE + offset
+        self._buf[start : start + first] = data[:first]
+        if first < len(data):
+            rest = len(data) - first
+            self._buf[_HEADER_SIZE : _HEADER_SIZE + rest] = data[first:]
+
+    def _copy_out(self, position: int, length: int) -> bytes:
+        """Copy ``length`` bytes out of the data region starting at logical ``position``."""
+        offset = position % self.capacity
+        first = min(length, self.capacity - offset)
+        start = _HEADER_SIZE + offset
+        data = bytes(self._buf[start : start + first])
+        if first < length:
+            data += bytes(self._buf[_HEADER_SIZE : _HEADER_SIZE + length - first])
+        return data
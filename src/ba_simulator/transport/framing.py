@@ -0,0 +1,166 @@
+"""
+Binary Message Frames with Lazy Header Views
+
+Components that route or filter messages (adversaries, schedulers) mostly need the routing
+header - round, protocol, phase, sender - not the full message. Decoding every frame to a
+``Message`` and re-encoding it afterwards doubles the serialization cost of each message
+they touch.
+
+A frame is a fixed binary header followed by the serializer-encoded message body:
+
+    version   u8
+    round     i64
+    sender_id u32
+    len(ssid), len(protocol_id), len(phase)   u16, u8, u8
+    ssid | protocol_id | phase                UTF-8
+    body                                      MessageSerializer.encode(message)
+
+``FrameView`` parses the header from a memoryview on first access and decodes the body
+only when ``message`` is requested. Unmodified frames are forwarded as the original bytes.
+
+The header duplicates fields of the body, and only the body is covered by the signature.
+Decoding therefore checks the header against the decoded message and rejects the frame on
+any mismatch, so a forged header cannot be delivered with a body it does not describe.
+"""
+
+import struct
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Optional, Union
+
+from ba_simulator.transport.message import Message
+from ba_simulator.transport.serialization import JSONMessageSerializer, MessageSerializer
+
+FRAME_VERSION = 1
+
+_FIXED = struct.Struct("<BqIHBB")
+
+
+@dataclass(frozen=True)
+class FrameHeader:
+    """
+    Routing header of a message frame.
+
+    Fields:
+        ssid: Session identifier
+        round: Round number
+        protocol_id: Subprotocol identifier
+        phase: Protocol phase
+        sender_id: Sender node ID
+    """
+
+    ssid: str
+    round: int
+    protocol_id: str
+    phase: str
+    sender_id: int
+
+    @classmethod
+    def of(cls, message: Message) -> "FrameHeader":
+        """Return the header of ``message``."""
+        return cls(
+            message.ssid, message.round, message.protocol_id, message.phase, message.sender_id
+        )
+
+
+def encode_frame(message: Message, serializer: Optional[MessageSerializer] = None) -> bytes:
+    """
+    Encode ``message`` as a frame.
+
+    Raises:
+        ValueError: If a header field does not fit its length prefix
+    """
+    ssid = message.ssid.encode("utf-8")
+    protocol_id = message.protocol_id.encode("utf-8")
+    phase = message.phase.encode("utf-8")
+    if len(ssid) > 0xFFFF or len(protocol_id) > 0xFF or len(phase) > 0xFF:
+        raise ValueError("frame header field too long")
+
+    fixed = _FIXED.pack(
+        FRAME_VERSION, message.round, message.sender_id, len(ssid), len(protocol_id), len(phase)
+    )
+    body = (serializer or JSONMessageSerializer()).encode(message)
+    return b"".join((fixed, ssid, protocol_id, phase, body))
+
+
+class FrameView:
+    """
+    Lazy read-only view over an encoded frame.
+
+    Header fields are parsed on first access; the body is decoded only when ``message``
+    is read.
+
+    Example:
+        >>> view = FrameView(frame)
+        >>> view.header.phase            # no JSON decoding
+        'ECHO'
+        >>> view.message.value           # decodes the body once
+    """
+
+    def __init__(
+        self, frame: Union[bytes, memoryview], serializer: Optional[MessageSerializer] = None
+    ) -> None:
+        self.frame = frame
+        self.serializer = serializer or JSONMessageSerializer()
+        self.decoded = False
+
+    @cached_property
+    def _layout(self) -> tuple:
+        """Parse the fixed header: (round, sender_id, field lengths, body offset)."""
+        data = memoryview(self.frame)
+        if len(data) < _FIXED.size:
+            raise ValueError("frame shorter than its header")
+        version, round, sender_id, ssid_len, protocol_len, phase_len = _FIXED.unpack_from(data)
+        if version != FRAME_VERSION:
+            raise ValueError(f"unsupported frame version {version}")
+        body_offset = _FIXED.size + ssid_len + protocol_len + phase_len
+        if len(data) < body_offset:
+            raise ValueError("frame truncated inside its header")
+        return round, sender_id, ssid_len, protocol_len, phase_len, body_offset
+
+    @cached_property
+    def header(self) -> FrameHeader:
+        """The routing header, parsed without decoding the body."""
+        round, sender_id, ssid_len, protocol_len, phase_len, _ = self._layout
+        data = memoryview(self.frame)
+        start = _FIXED.size
+        ssid = bytes(data[start : start + ssid_len]).decode("utf-8")
+        start += ssid_len
+        protocol_id = bytes(data[start : start + protocol_len]).decode("utf-8")
+        start += protocol_len
+        phase = bytes(data[start : start + phase_len]).decode("utf-8")
+        return FrameHeader(ssid, round, protocol_id, phase, sender_id)
+
+    @property
+    def round(self) -> int:
+        """Round number (fixed header only)."""
+        return self._layout[0]
+
+    @property
+    def sender_id(self) -> int:
+        """Sender node ID (fixed header only)."""
+        return self._layout[1]
+
+    @property
+    def body(self) -> memoryview:
+        """The serializer-encoded message body."""
+        return memoryview(self.frame)[self._layout[5] :]
+
+    @cached_property
+    def message(self) -> Message:
+        """
+        The decoded message (decoded once, on first access).
+
+        Raises:
+            ValueError: If the frame header does not match the decoded body
+        """
+        self.decoded = True
+        message = self.serializer.decode(bytes(self.body))
+        if FrameHeader.of(message) != self.header:
+            raise ValueError(
+                f"frame header {self.header} does not match its body {FrameHeader.of(message)}"
+            )
+        return message
+
+    def __bytes__(self) -> bytes:
+        return bytes(self.frame)
@@ -0,0 +1,201 @@
+"""
+Incremental Property Assertions
+
+Agreement, Validity, Termination and the Round Firewall are checked on every run. Scanning
+every node's state at the end of a run gets expensive at scale and reports a violation
+long after it happened, so ``PropertyMonitor`` checks each property at the one event that
+can violate it, in O(1):
+
+- Agreement: at each honest decision, against the first honest decision (the reference).
+- Validity: at each honest decision, against the unanimous honest input, precomputed once
+  (no check when honest inputs differ).
+- Termination: at the end of the termination round, against a counter of decided honest
+  nodes.
+- Round Firewall: at each state write, against the highest closed round. The lock-step
+  runner reports every node step as a write through its ``guard`` hook.
+
+Values are compared by ``canonical_value_key``, as in the protocols, so canonically
+equal values (e.g. dicts with different key order) never count as a violation.
+
+A violation raises ``PropertyViolation`` immediately, carrying the offending event and
+the reference state needed to diagnose it.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Mapping, NoReturn, Optional
+
+from ba_simulator.protocols.protocol_fsm import canonical_value_key
+
+
+class PropertyViolation(AssertionError):
+    """
+    Raised when a BA property is violated.
+
+    Attributes:
+        property: Violated property ("agreement", "validity", "termination", "firewall",
+            "integrity")
+        round: Round of the offending event
+        node_id: Node of the offending event (None for run-level events)
+        diagnostics: Offending event and reference state
+    """
+
+    def __init__(
+        self, property: str, round: int, node_id: Optional[int], diagnostics: Dict[str, Any]
+    ) -> None:
+        self.property = property
+        self.round = round
+        self.node_id = node_id
+        self.diagnostics = diagnostics
+        details = ", ".join(f"{key}={value!r}" for key, value in diagnostics.items())
+        super().__init__(f"{property} violated at round {round} (node {node_id}): {details}")
+
+
+@dataclass(frozen=True)
+class Decision:
+    """
+    An honest decision event.
+
+    Fields:
+        node_id: Deciding node
+        round: Round of the decision
+        value: Decided value
+    """
+
+    node_id: int
+    round: int
+    value: Any
+
+
+class PropertyMonitor:
+    """
+    O(1)-per-event checker of Agreement, Validity, Termination and the Round Firewall.
+
+    Events of corrupted nodes are ignored.
+
+    Example:
+        >>> monitor = PropertyMonitor(honest=range(7), inputs=proposals, termination_round=4)
+        >>> monitor.on_decide(node_id=2, round=3, value="A")
+        >>> monitor.check_write(node_id=2, round=3)     # raises once round 3 is closed
+        >>> monitor.close_round(3)
+    """
+
+    def __init__(
+        self,
+        honest: Iterable[int],
+        inputs: Optional[Mapping[int, Any]] = None,
+        termination_round: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize the monitor.
+
+        Args:
+            honest: Honest node IDs
+            inputs: Input value per node (Validity is checked only if given)
+            termination_round: Round by whose end every honest node must have decided
+
+        Raises:
+            ValueError: If no honest node is given or an honest node has no input
+        """
+        self.honest = frozenset(honest)
+        if not self.honest:
+            raise ValueError("at least one honest node is required")
+        self.termination_round = termination_round
+        self.unanimous_input: Optional[Any] = None
+        self.has_unanimous_input = False
+        self._unanimous_key: Optional[str] = None
+        if inputs is not None:
+            missing = sorted(self.honest - set(inputs))
+            if missing:
+                raise ValueError(f"honest nodes without input: {missing}")
+            honest_inputs = [inputs[node_id] for node_id in sorted(self.honest)]
+            keys = {canonical_value_key(value) for value in honest_inputs}
+            if len(keys) == 1:
+                self.unanimous_input = honest_inputs[0]
+                self.has_unanimous_input = True
+                self._unanimous_key = keys.pop()
+
+        self.reference: Optional[Decision] = None
+        self.decisions: Dict[int, Decision] = {}
+        self._decision_keys: Dict[int, str] = {}
+        self.closed_through = -1
+        self.events = 0
+
+    def on_decide(self, node_id: int, round: int, value: Any) -> None:
+        """
+        Check a decision event.
+
+        Raises:
+            PropertyViolation: On disagreement with the reference decision, a decision
+                other than the unanimous input, or a node changing its decision
+        """
+        if node_id not in self.honest:
+            return
+        self.events += 1
+        decision = Decision(node_id, round, value)
+        key = canonical_value_key(value)
+        previous = self.decisions.get(node_id)
+        if previous is not None:
+            if self._decision_keys[node_id] != key:
+                self._violate("integrity", decision, previous=previous)
+            return
+
+        if self.has_unanimous_input and key != self._unanimous_key:
+            self._violate("validity", decision, unanimous_input=self.unanimous_input)
+        if self.reference is None:
+            self.reference = decision
+        elif key != self._decision_keys[self.reference.node_id]:
+            self._violate("agreement", decision, reference=self.reference)
+        self.decisions[node_id] = decision
+        self._decision_keys[node_id] = key
+
+    def on_round_end(self, round: int) -> None:
+        """
+        Check Termination at the end of ``round`` and close the round.
+
+        Raises:
+            PropertyViolation: If the termination round ended with undecided honest nodes
+        """
+        self.events += 1
+        self.close_round(round)
+        if self.termination_round is not None and round >= self.termination_round:
+            if len(self.decisions) < len(self.honest):
+                undecided = sorted(self.honest - set(self.decisions))
+                raise PropertyViolation(
+                    "termination",
+                    round,
+                    None,
+                    {
+                        "termination_round": self.termination_round,
+                        "undecided": undecided,
+                        "decided": len(self.decisions),
+                        "reference": self.reference,
+                    },
+                )
+
+    def close_round(self, round: int) -> None:
+        """Close every round <= ``round`` to further state writes."""
+        self.closed_through = max(self.closed_through, round)
+
+    def check_write(self, node_id: int, round: int, target: str = "state") -> None:
+        """
+        Guard a state write attributed to ``round``.
+
+        Pass as ``guard`` to ``LockstepRunner.run()`` to check every node step.
+
+        Raises:
+            PropertyViolation: If ``round`` is already closed
+        """
+        self.events += 1
+        if round <= self.closed_through and node_id in self.honest:
+            raise PropertyViolation(
+                "firewall",
+                round,
+                node_id,
+                {"target": target, "closed_through": self.closed_through},
+            )
+
+    def _violate(self, property: str, decision: Decision, **context: Any) -> NoReturn:
+        diagnostics: Dict[str, Any] = {"value": decision.value}
+        diagnostics.update(context)
+        diagnostics["decided"] = len(self.decisions)
+        raise PropertyViolation(property, decision.round, decision.node_id, diagnostics)
@@ -0,0 +1,221 @@
+"""
+Evidence Store Interface
+
+Validation keeps a record of the evidence behind every protocol outcome: barrier
+certificates, phase transition records, decision packages and late arrivals. Records are
+appended once and never modified; queries select them by round and kind.
+Records derived from a message also carry its phase and sender for post-hoc queries.
+
+Exported kinds (``EXPORTED_KINDS``: barrier certificates and decision packages) are
+immutable and kept for the whole run. Round garbage collection may compact the other kinds
+of old rounds: ``release_through`` folds them into one ``EvidenceSummary`` per
+(round, kind) - record count, payload bytes and a chained digest of the payloads.
+
+``EvidenceStore`` is the backend interface. ``MemoryEvidenceStore`` is the reference
+backend keeping everything in process memory; persistent backends (segment files, SQLite)
+implement the same interface so validators do not depend on where evidence lives.
+"""
+
+import hashlib
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, replace
+from enum import Enum
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+from ba_simulator.transport.message import Message
+from ba_simulator.transport.serialization import JSONMessageSerializer, MessageSerializer
+
+
+class EvidenceKind(str, Enum):
+    """Standard evidence kinds."""
+
+    BARRIER_CERTIFICATE = "barrier_certificate"
+    TRANSITION = "transition"
+    DECISION = "decision"
+    LATE_ARRIVAL = "late_arrival"
+
+
+EXPORTED_KINDS: FrozenSet[str] = frozenset(
+    {EvidenceKind.BARRIER_CERTIFICATE.value, EvidenceKind.DECISION.value}
+)
+
+
+@dataclass(frozen=True)
+class EvidenceRecord:
+    """
+    One immutable evidence record.
+
+    Fields:
+        round: Round the evidence belongs to
+        kind: Evidence kind (usually an ``EvidenceKind`` value)
+        payload: Encoded evidence (e.g. a serialized certificate)
+        phase: Protocol phase the evidence concerns, if any
+        sender_id: Sender the evidence concerns, if any
+    """
+
+    round: int
+    kind: str
+    payload: bytes
+    phase: Optional[str] = None
+    sender_id: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "kind", kind_name(self.kind))
+
+    @classmethod
+    def from_message(
+        cls, kind: str, message: Message, serializer: Optional[MessageSerializer] = None
+    ) -> "EvidenceRecord":
+        """Build a record whose payload is ``message`` encoded by ``serializer``."""
+        payload = (serializer or JSONMessageSerializer()).encode(message)
+        return cls(message.round, kind, payload, message.phase, message.sender_id)
+
+
+@dataclass(frozen=True)
+class EvidenceSummary:
+    """
+    Compacted evidence of one (round, kind).
+
+    Fields:
+        round: Round the compacted records belonged to
+        kind: Evidence kind of the compacted records
+        count: Number of records folded in
+        payload_bytes: Total payload size of the folded records
+        digest: SHA-256 hex digest chained over the payloads in fold order
+    """
+
+    round: int
+    kind: str
+    count: int = 0
+    payload_bytes: int = 0
+    digest: str = ""
+
+    def fold(self, payload: bytes) -> "EvidenceSummary":
+        """Return the summary with one more record of ``payload`` folded in."""
+        digest = hashlib.sha256(bytes.fromhex(self.digest) + payload).hexdigest()
+        return replace(
+            self,
+            count=self.count + 1,
+            payload_bytes=self.payload_bytes + len(payload),
+            digest=digest,
+        )
+
+
+class EvidenceStore(ABC):
+    """
+    Append-only evidence storage backend.
+
+    Example:
+        >>> store.append(EvidenceRecord(3, EvidenceKind.DECISION, package_bytes))
+        >>> for record in store.records(round=3, kind=EvidenceKind.DECISION):
+        ...     verify(record.payload)
+    """
+
+    @abstractmethod
+    def append(self, record: EvidenceRecord) -> None:
+        """Append ``record``; stored records are never modified."""
+        pass
+
+    @abstractmethod
+    def records(self, round: int, kind: Optional[str] = None) -> Iterator[EvidenceRecord]:
+        """Iterate over the records of ``round`` (of one ``kind`` if given), in append order."""
+        pass
+
+    @abstractmethod
+    def rounds(self) -> List[int]:
+        """Return the rounds holding at least one record, ascending."""
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    def release_through(self, round: int) -> int:
+        """
+        Compact the non-exported evidence of rounds <= ``round`` into summaries.
+
+        Exported kinds are never compacted. The default keeps every record.
+
+        Returns:
+            Number of records compacted
+        """
+        return 0
+
+    def summaries(self, round: int) -> List[EvidenceSummary]:
+        """Return the summaries of compacted evidence of ``round``."""
+        return []
+
+    def close(self) -> None:
+        """Release backend resources. The store must not be used afterwards."""
+
+
+class MemoryEvidenceStore(EvidenceStore):
+    """In-memory evidence store indexed by (round, kind)."""
+
+    def __init__(self, exported_kinds: Iterable[str] = EXPORTED_KINDS) -> None:
+        """
+        Create an empty store.
+
+        Args:
+            exported_kinds: Kinds kept in full by ``release_through``
+        """
+        self.exported_kinds = frozenset(kind_name(kind) for kind in exported_kinds)
+        self._index: Dict[Tuple[int, str], List[EvidenceRecord]] = {}
+        self._order: Dict[int, List[EvidenceRecord]] = {}
+        self._summaries: Dict[Tuple[int, str], EvidenceSummary] = {}
+        self._released_through = -1
+        self._count = 0
+
+    def append(self, record: EvidenceRecord) -> None:
+        """Append ``record``; late non-exported records of compacted rounds are folded."""
+        if record.round <= self._released_through and record.kind not in self.exported_kinds:
+            fold_summary(self._summaries, record.round, record.kind, record.payload)
+            return
+        self._index.setdefault((record.round, record.kind), []).append(record)
+        self._order.setdefault(record.round, []).append(record)
+        self._count += 1
+
+    def records(self, round: int, kind: Optional[str] = None) -> Iterator[EvidenceRecord]:
+        if kind is None:
+            return iter(list(self._order.get(round, ())))
+        return iter(list(self._index.get((round, kind_name(kind)), ())))
+
+    def rounds(self) -> List[int]:
+        return sorted(self._order)
+
+    def release_through(self, round: int) -> int:
+        self._released_through = max(self._released_through, round)
+        compacted = 0
+        for key in [
+            key for key in self._index if key[0] <= round and key[1] not in self.exported_kinds
+        ]:
+            for record in self._index.pop(key):
+                fold_summary(self._summaries, key[0], key[1], record.payload)
+                compacted += 1
+        for stale in [r for r in self._order if r <= round]:
+            kept = [record for record in self._order[stale] if record.kind in self.exported_kinds]
+            if kept:
+                self._order[stale] = kept
+            else:
+                del self._order[stale]
+        self._count -= compacted
+        return compacted
+
+    def summaries(self, round: int) -> List[EvidenceSummary]:
+        return [summary for key, summary in self._summaries.items() if key[0] == round]
+
+    def __len__(self) -> int:
+        return self._count
+
+
+def kind_name(kind: str) -> str:
+    """Normalize ``EvidenceKind`` members and plain strings to the kind name."""
+    return kind.value if isinstance(kind, EvidenceKind) else kind
+
+
+def fold_summary(
+    summaries: Dict[Tuple[int, str], EvidenceSummary], round: int, kind: str, payload: bytes
+) -> None:
+    """Fold one record of (``round``, ``kind``) into its summary in ``summaries``."""
+    key = (round, kind)
+    summaries[key] = summaries.get(key, EvidenceSummary(round, kind)).fold(payload)
@@ -0,0 +1,250 @@
+"""
+Memory-Mapped Segment Evidence Store
+
+Evidence records are appended to segment files in a directory and read back through
+``mmap``. Segments are append-only: a record is never rewritten once stored, which is what
+makes the evidence immutable. When the active segment reaches ``segment_bytes`` a new one
+is started.
+
+Only a compact index stays resident: per ``(round, kind)`` and per round, an
+``array("q")`` of record positions (segment number in the high bits, byte offset in the low
+40 bits) - 8 bytes per record and index. Payloads live in the page cache, so resident
+memory stays flat however long the run is.
+
+Record layout (little-endian):
+    round: i64 | sender_id: i32 | kind_length: u16 | phase_length: u8 | payload_length: u32
+    | kind (UTF-8) | phase (UTF-8) | payload
+where a missing sender is stored as -1 and a missing phase as an empty string.
+
+``release_through`` compacts non-exported kinds of old rounds by dropping their index
+entries and keeping an ``EvidenceSummary`` instead; segment files are never touched, so
+exported kinds stay immutable and compacted records are still on disk.
+
+Opening an existing directory rebuilds the index by scanning its segments; a truncated
+trailing record (interrupted write) is cut off. Record positions use the segment number
+persisted in each file name, so a missing segment does not renumber the ones after it.
+"""
+
+import mmap
+import os
+import struct
+from array import array
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from ba_simulator.validation.evidence_store import (
+    EXPORTED_KINDS,
+    EvidenceRecord,
+    EvidenceStore,
+    EvidenceSummary,
+    fold_summary,
+    kind_name,
+)
+
+_RECORD_HEADER = struct.Struct("<qiHBI")
+
+_OFFSET_BITS = 40
+_OFFSET_MASK = (1 << _OFFSET_BITS) - 1
+
+
+class SegmentEvidenceStore(EvidenceStore):
+    """
+    Append-only evidence store on memory-mapped segment files.
+
+    Example:
+        >>> store = SegmentEvidenceStore("evidence", segment_bytes=64 << 20)
+        >>> store.append(EvidenceRecord(4, EvidenceKind.TRANSITION, record_bytes))
+        >>> list(store.records(round=4, kind=EvidenceKind.TRANSITION))
+        >>> store.close()
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        segment_bytes: int = 64 << 20,
+        exported_kinds: Iterable[str] = EXPORTED_KINDS,
+    ) -> None:
+        """
+        Open (or create) a segment store.
+
+        Args:
+            directory: Directory holding ``segment-NNNNNN.log`` files
+            segment_bytes: Size at which the active segment is rotated
+            exported_kinds: Kinds kept in the index by ``release_through``
+
+        Raises:
+            ValueError: If segment_bytes is not positive
+        """
+        if segment_bytes <= 0:
+            raise ValueError(f"segment_bytes must be positive, got {segment_bytes}")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_bytes = segment_bytes
+        self.exported_kinds = frozenset(kind_name(kind) for kind in exported_kinds)
+
+        self._by_kind: Dict[Tuple[int, str], array] = {}
+        self._by_round: Dict[int, array] = {}
+        self._maps: Dict[int, mmap.mmap] = {}
+        self._summaries: Dict[Tuple[int, str], EvidenceSummary] = {}
+        self._released_through = -1
+        self._count = 0
+
+        existing = sorted(
+            int(path.stem[len("segment-") :])
+            for path in self.directory.glob("segment-*.log")
+            if path.stem[len("segment-") :].isdigit()
+        )
+        for number in existing:
+            self._scan(number)
+        self._active = existing[-1] if existing else 0
+        self._segments = len(existing) or 1
+        self._writer: BinaryIO = open(self._segment_path(self._active), "ab")
+
+    @property
+    def segment_count(self) -> int:
+        """Number of segment files."""
+        return self._segments
+
+    def append(self, record: EvidenceRecord) -> None:
+        """
+        Append ``record`` to the active segment.
+
+        Late non-exported records of compacted rounds are written but only folded into
+        their summary, not indexed.
+
+        Raises:
+            ValueError: If the kind is longer than 65535 bytes or the phase than 255 bytes
+        """
+        kind = record.kind.encode("utf-8")
+        phase = (record.phase or "").encode("utf-8")
+        if len(kind) > 0xFFFF or len(phase) > 0xFF:
+            raise ValueError("evidence kind or phase too long")
+        sender_id = -1 if record.sender_id is None else record.sender_id
+        size = _RECORD_HEADER.size + len(kind) + len(phase) + len(record.payload)
+        offset = self._writer.tell()
+        if offset and offset + size > self.segment_bytes:
+            self._rotate()
+            offset = 0
+
+        self._writer.write(
+            _RECORD_HEADER.pack(record.round, sender_id, len(kind), len(phase), len(record.payload))
+        )
+        self._writer.write(b"".join((kind, phase, record.payload)))
+        if record.round <= self._released_through and record.kind not in self.exported_kinds:
+            fold_summary(self._summaries, record.round, record.kind, record.payload)
+            return
+        self._index(record.round, record.kind, (self._active << _OFFSET_BITS) | offset)
+
+    def records(self, round: int, kind: Optional[str] = None) -> Iterator[EvidenceRecord]:
+        if kind is None:
+            positions = self._by_round.get(round, array("q"))
+        else:
+            positions = self._by_kind.get((round, kind_name(kind)), array("q"))
+        for position in list(positions):
+            yield self._read(position >> _OFFSET_BITS, position & _OFFSET_MASK)
+
+    def rounds(self) -> List[int]:
+        return sorted(self._by_round)
+
+    def release_through(self, round: int) -> int:
+        """Compact index entries of rounds <= ``round``; segment files are left untouched."""
+        self._released_through = max(self._released_through, round)
+        compacted = 0
+        for key in [
+            key for key in self._by_kind if key[0] <= round and key[1] not in self.exported_kinds
+        ]:
+            for position in self._by_kind.pop(key):
+                record = self._read(position >> _OFFSET_BITS, position & _OFFSET_MASK)
+                fold_summary(self._summaries, key[0], key[1], record.payload)
+                compacted += 1
+        for stale in [r for r in self._by_round if r <= round]:
+            kept = [self._by_kind.get((stale, kind), ()) for kind in self.exported_kinds]
+            positions = sorted(position for group in kept for position in group)
+            if positions:
+                self._by_round[stale] = array("q", positions)
+            else:
+                del self._by_round[stale]
+        self._count -= compacted
+        return compacted
+
+    def summaries(self, round: int) -> List[EvidenceSummary]:
+        return [summary for key, summary in self._summaries.items() if key[0] == round]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self) -> None:
+        """Close the writer and every mapping."""
+        for mapping in self._maps.values():
+            mapping.close()
+        self._maps.clear()
+        self._writer.close()
+
+    def _segment_path(self, number: int) -> Path:
+        return self.directory / f"segment-{number:06d}.log"
+
+    def _rotate(self) -> None:
+        """Seal the active segment and start the next one."""
+        self._writer.close()
+        self._active += 1
+        self._segments += 1
+        self._writer = open(self._segment_path(self._active), "ab")
+
+    def _index(self, round: int, kind: str, position: int) -> None:
+        self._by_kind.setdefault((round, kind), array("q")).append(position)
+        self._by_round.setdefault(round, array("q")).append(position)
+        self._count += 1
+
+    def _map(self, number: int, end: int) -> mmap.mmap:
+        """Return a mapping of segment ``number`` covering at least ``end`` bytes."""
+        mapping = self._maps.get(number)
+        if mapping is None or len(mapping) < end:
+            if number == self._active:
+                self._writer.flush()
+            if mapping is not None:
+                mapping.close()
+            with open(self._segment_path(number), "rb") as handle:
+                mapping = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps[number] = mapping
+        return mapping
+
+    def _read(self, number: int, offset: int) -> EvidenceRecord:
+        """Read the record at ``offset`` of segment ``number``."""
+        mapping = self._map(number, offset + _RECORD_HEADER.size)
+        round, sender_id, kind_length, phase_length, payload_length = _RECORD_HEADER.unpack_from(
+            mapping, offset
+        )
+        start = offset + _RECORD_HEADER.size
+        phase_start = start + kind_length
+        payload_start = phase_start + phase_length
+        mapping = self._map(number, payload_start + payload_length)
+        return EvidenceRecord(
+            round,
+            mapping[start:phase_start].decode("utf-8"),
+            mapping[payload_start : payload_start + payload_length],
+            mapping[phase_start:payload_start].decode("utf-8") or None,
+            None if sender_id < 0 else sender_id,
+        )
+
+    def _scan(self, number: int) -> None:
+        """Index every complete record of an existing segment; cut a torn tail."""
+        path = self._segment_path(number)
+        size = path.stat().st_size
+        offset = 0
+        if size:
+            with open(path, "rb") as handle:
+                mapping = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            while offset + _RECORD_HEADER.size <= size:
+                round, _, kind_length, phase_length, payload_length = _RECORD_HEADER.unpack_from(
+                    mapping, offset
+                )
+                end = offset + _RECORD_HEADER.size + kind_length + phase_length + payload_length
+                if end > size:
+                    break
+                start = offset + _RECORD_HEADER.size
+                kind = mapping[start : start + kind_length].decode("utf-8")
+                self._index(round, kind, (number << _OFFSET_BITS) | offset)
+                offset = end
+            mapping.close()
+        if offset < size:
+            os.truncate(path, offset)
@@ -0,0 +1,150 @@
+"""
+SQLite Evidence Store
+
+Local SQLite backend for post-hoc querying of evidence (by round, kind, phase or
+sender) with ordinary SQL tools.
+
+Write path:
+- The database runs in WAL mode with ``synchronous=NORMAL``: commits append to the
+  write-ahead log instead of rewriting pages, and fsync happens at checkpoints only.
+- Appended records are buffered and written with one ``executemany`` and one commit per
+  round - when the first record of a round above every round seen so far arrives, or on
+  ``commit()`` / ``close()``. Late arrivals carry older rounds and are buffered with the
+  current round instead of forcing a commit. Per-record commits would cost one
+  transaction (and potentially one fsync) each.
+- Payloads are stored as BLOBs exactly as produced by the serializer, without base64.
+
+Queries first write buffered records (without committing) so they are always visible to
+the store itself.
+"""
+
+import sqlite3
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Tuple, Union
+
+from ba_simulator.validation.evidence_store import EvidenceRecord, EvidenceStore, kind_name
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS evidence (
+    seq INTEGER PRIMARY KEY,
+    round INTEGER NOT NULL,
+    kind TEXT NOT NULL,
+    phase TEXT,
+    sender_id INTEGER,
+    payload BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS evidence_round_kind ON evidence (round, kind);
+CREATE INDEX IF NOT EXISTS evidence_phase ON evidence (phase);
+CREATE INDEX IF NOT EXISTS evidence_sender ON evidence (sender_id);
+"""
+
+_INSERT = "INSERT INTO evidence (round, kind, phase, sender_id, payload) VALUES (?, ?, ?, ?, ?)"
+
+Row = Tuple[int, str, Optional[str], Optional[int], bytes]
+
+
+class SQLiteEvidenceStore(EvidenceStore):
+    """
+    WAL-mode SQLite evidence store with round-level commit batching.
+
+    Example:
+        >>> store = SQLiteEvidenceStore("evidence.db")
+        >>> store.append(EvidenceRecord.from_message(EvidenceKind.LATE_ARRIVAL, message))
+        >>> list(store.query(phase="READY", sender_id=3))
+        >>> store.close()
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """
+        Open (or create) the database at ``path``.
+
+        Args:
+            path: Database file
+        """
+        self.path = Path(path)
+        self._connection = sqlite3.connect(str(self.path))
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+        self._connection.commit()
+        self._buffer: List[Row] = []
+        self._high_round: Optional[int] = None
+        self.commits = 0
+
+    def append(self, record: EvidenceRecord) -> None:
+        """Buffer ``record``; the buffer is committed when a new highest round begins."""
+        if self._high_round is None or record.round > self._high_round:
+            if self._high_round is not None:
+                self.commit()
+            self._high_round = record.round
+        self._buffer.append(
+            (record.round, record.kind, record.phase, record.sender_id, bytes(record.payload))
+        )
+
+    def commit(self) -> None:
+        """Write buffered records and commit them in one transaction."""
+        self._drain()
+        if self._connection.in_transaction:
+            self._connection.commit()
+            self.commits += 1
+
+    def records(self, round: int, kind: Optional[str] = None) -> Iterator[EvidenceRecord]:
+        return self.query(round=round, kind=kind)
+
+    def query(
+        self,
+        round: Optional[int] = None,
+        kind: Optional[str] = None,
+        phase: Optional[str] = None,
+        sender_id: Optional[int] = None,
+    ) -> Iterator[EvidenceRecord]:
+        """
+        Iterate over records matching every given filter, in append order.
+
+        Args:
+            round: Round filter
+            kind: Kind filter
+            phase: Phase filter
+            sender_id: Sender filter
+
+        Yields:
+            Matching EvidenceRecord entries
+        """
+        filters = (
+            ("round", round),
+            ("kind", None if kind is None else kind_name(kind)),
+            ("phase", phase),
+            ("sender_id", sender_id),
+        )
+        active = [(column, value) for column, value in filters if value is not None]
+        params: List[Any] = [value for _, value in active]
+        where = " AND ".join(f"{column} = ?" for column, _ in active)
+        where = f" WHERE {where}" if where else ""
+
+        self._drain()
+        cursor = self._connection.execute(
+            f"SELECT round, kind, payload, phase, sender_id FROM evidence{where} ORDER BY seq",
+            params,
+        )
+        for row in cursor.fetchall():
+            yield EvidenceRecord(*row)
+
+    def rounds(self) -> List[int]:
+        self._drain()
+        cursor = self._connection.execute("SELECT DISTINCT round FROM evidence ORDER BY round")
+        return [row[0] for row in cursor]
+
+    def __len__(self) -> int:
+        self._drain()
+        return self._connection.execute("SELECT COUNT(*) FROM evidence").fetchone()[0]
+
+    def close(self) -> None:
+        """Commit buffered records and close the connection."""
+        self.commit()
+        self._connection.close()
+
+    def _drain(self) -> None:
+        """Insert buffered records into the open transaction (no commit)."""
+        if self._buffer:
+            self._connection.executemany(_INSERT, self._buffer)
+            self._buffer = []
@@ -0,0 +1,53 @@
+"""
+Property-based tests for batched GDA grading
+
+Property: for any collection of PROPOSE inboxes, ``grade_batch()`` returns exactly what the
+scalar ``grade_proposals()`` returns for each inbox - including ties, empty inboxes and
+irregular views handled by the scalar fallback.
+"""
+
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from ba_simulator.protocols.gda import grade_proposals
+from ba_simulator.protocols.gda_batch import grade_batch
+
+VALUES = st.one_of(
+    st.sampled_from(["A", "B", "C"]),
+    st.integers(min_value=0, max_value=3),
+    st.fixed_dictionaries({"v": st.integers(min_value=0, max_value=2)}),
+)
+
+
+@st.composite
+def network_and_views(draw):
+    """Draw (n, t, views) with mostly regular and occasionally irregular views."""
+    t = draw(st.integers(min_value=0, max_value=4))
+    n = draw(st.integers(min_value=3 * t + 1, max_value=3 * t + 4))
+    regular_view = st.dictionaries(st.integers(min_value=0, max_value=n - 1), VALUES)
+    irregular_view = st.dictionaries(st.integers(min_value=-2, max_value=n + 3), VALUES)
+    views = draw(st.lists(st.one_of(regular_view, regular_view, irregular_view), max_size=12))
+    return n, t, views
+
+
+@settings(max_examples=300, deadline=None)
+@given(network_and_views())
+def test_grade_batch_equivalent_to_scalar(case):
+    """Property: grade_batch(views) == [grade_proposals(view) for view in views]"""
+    n, t, views = case
+
+    assert grade_batch(views, n, t) == [grade_proposals(view, n, t) for view in views]
+
+
+@settings(max_examples=200, deadline=None)
+@given(network_and_views())
+def test_grades_respect_thresholds(case):
+    """Property: Grade 2 implies n-t supporters; grade 1 implies at least t+1"""
+    n, t, views = case
+
+    for view, (value, grade) in zip(views, grade_batch(views, n, t)):
+        support = sum(1 for v in view.values() if v == value and type(v) is type(value))
+        if grade == 2:
+            assert support >= n - t
+        elif grade == 1:
+            assert t + 1 <= support < n - t
@@ -0,0 +1 @@
+# Adversary framework unit tests
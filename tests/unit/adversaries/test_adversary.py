@@ -0,0 +1,130 @@
+"""
+Unit tests for the adversary strategy interface
+
+Tests cover:
+- Frame-level pass-through without decoding
+- Header-only drop decisions
+- Rewriting strategies (original bytes reused, new frames built only when needed)
+- Audit logging and seeded RNGs
+"""
+
+from ba_simulator.adversaries.adversary import AdversaryStrategy
+from ba_simulator.transport.framing import FrameHeader, FrameView, encode_frame
+from ba_simulator.transport.message import Message
+
+
+def make_msg(phase="ECHO", value="A", sender_id=1):
+    """Build a message from the corrupted node."""
+    return Message(
+        ssid="adv-test",
+        round=2,
+        protocol_id="CoD",
+        phase=phase,
+        sender_id=sender_id,
+        value=value,
+        digest=None,
+        aux={},
+        signature=b"\x00" * 64,
+    )
+
+
+class PhaseDropper(AdversaryStrategy):
+    """Drop every message of one phase, deciding on the header only."""
+
+    def __init__(self, node_id, phase):
+        super().__init__(node_id, "phase_dropper", {"phase": phase})
+
+    def should_drop(self, message):
+        return message.phase == self.params["phase"]
+
+    def should_drop_frame(self, view):
+        return view.header.phase == self.params["phase"]
+
+    def intercept_send(self, message):
+        return [] if self.should_drop(message) else [message]
+
+
+class DoubleSender(AdversaryStrategy):
+    """Send the original message plus a conflicting copy."""
+
+    rewrites_content = True
+
+    def __init__(self, node_id):
+        super().__init__(node_id, "double_sender")
+
+    def should_drop(self, message):
+        return False
+
+    def intercept_send(self, message):
+        self.log("equivocate", FrameHeader.of(message))
+        conflicting = Message(**{**message.to_dict(), "value": "B"})
+        return [message, conflicting]
+
+
+# ============================================================================
+# Frame Interception
+# ============================================================================
+
+
+def test_header_only_strategy_never_decodes():
+    """Test: Pass-through and drop decisions leave the body undecoded"""
+    adversary = PhaseDropper(node_id=1, phase="READY")
+    kept = FrameView(encode_frame(make_msg("ECHO")))
+    dropped = FrameView(encode_frame(make_msg("READY")))
+
+    assert adversary.intercept_frame(kept) == [kept.frame]
+    assert adversary.intercept_frame(dropped) == []
+    assert not kept.decoded and not dropped.decoded
+    assert adversary.action_counts() == {"drop": 1}
+    assert adversary.actions[0].header.phase == "READY"
+
+
+def test_rewriting_strategy_reuses_original_bytes():
+    """Test: The unchanged message keeps its frame; only the new one is encoded"""
+    adversary = DoubleSender(node_id=1)
+    view = FrameView(encode_frame(make_msg()))
+
+    frames = adversary.intercept_frame(view)
+
+    assert frames[0] is view.frame
+    assert FrameView(frames[1]).message.value == "B"
+    assert adversary.action_counts() == {"equivocate": 1}
+
+
+def test_default_frame_drop_decodes_message():
+    """Test: Without an override, should_drop_frame() falls back to should_drop()"""
+
+    class DropAll(DoubleSender):
+        def should_drop(self, message):
+            return True
+
+    view = FrameView(encode_frame(make_msg()))
+    assert DropAll(node_id=1).intercept_frame(view) == []
+    assert view.decoded
+
+
+# ============================================================================
+# Configuration
+# ============================================================================
+
+
+def test_seeded_rng_reproducible():
+    """Test: Same seed and node give the same random stream"""
+    a = DoubleSender(node_id=4)
+    b = DoubleSender(node_id=4)
+    c = DoubleSender(node_id=5)
+
+    assert a.rng.random() == b.rng.random()
+    assert a.rng.random() != c.rng.random()
+    assert a.fault_type == "double_sender"
+
+
+def test_round_rng_independent_of_other_draws():
+    """Test: Per-round streams ignore draws from the node stream and other rounds"""
+    a = DoubleSender(node_id=4)
+    b = DoubleSender(node_id=4)
+    a.rng.random(10)
+    a.round_rng(0).random()
+
+    assert a.round_rng(3).random() == b.round_rng(3).random()
+    assert a.round_rng(3).random() != a.round_rng(3, "delay").random()
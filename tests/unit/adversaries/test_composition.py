@@ -0,0 +1,281 @@
+"""
+Unit tests for the compiled adversary composition
+
+Tests cover:
+- Fault level validation (f <= t, one strategy per node, multi-sender strategies)
+- Compiled PASS / DROP / DELAY / VARIANT / CALL entries
+- One compilation per round (one link sample per phase) and recompilation on strategy
+  state changes
+- Delivery expansion through the routing table, matching the uncompiled adversary's
+  deliveries and drop log
+- One signing batch per strategy for VARIANT messages
+"""
+
+from typing import List
+
+import pytest
+
+from ba_simulator.adversaries.adversary import AdversaryStrategy
+from ba_simulator.adversaries.composition import (
+    PASS,
+    AdversaryComposition,
+    RouteAction,
+    RouteEntry,
+)
+from ba_simulator.adversaries.delay_drop import DelayDropAdversary
+from ba_simulator.adversaries.equivocator import EquivocatorAdversary
+from ba_simulator.transport.crypto import NodeKeys, ParallelSigner
+from ba_simulator.transport.message import Message
+
+N, T = 7, 2
+PHASES = ("SEND", "ECHO")
+
+
+def msg(sender_id, phase="SEND", round=0, value="v"):
+    """Build an outgoing message."""
+    return Message(
+        ssid="compose",
+        round=round,
+        protocol_id="CoD",
+        phase=phase,
+        sender_id=sender_id,
+        value=value,
+        digest=None,
+        aux={},
+        signature=b"\x00" * 64,
+    )
+
+
+class Toggle(AdversaryStrategy):
+    """Drops everything while ``silent``; otherwise passes."""
+
+    def __init__(self, node_id: int) -> None:
+        super().__init__(node_id, "toggle")
+        self.silent = False
+
+    def intercept_send(self, message: Message) -> List[Message]:
+        return [] if self.silent else [message]
+
+    def should_drop(self, message: Message) -> bool:
+        return self.silent
+
+    def compile_route(self, round: int, phase: str, sender: int) -> RouteEntry:
+        return RouteEntry(RouteAction.DROP) if self.silent else PASS
+
+    def go_silent(self) -> None:
+        self.silent = True
+        self.mark_changed()
+
+
+class Duplicator(AdversaryStrategy):
+    """Sends every message twice; content-dependent, so not compilable."""
+
+    def __init__(self, node_id: int) -> None:
+        super().__init__(node_id, "duplicator")
+
+    def intercept_send(self, message: Message) -> List[Message]:
+        return [message, message]
+
+    def should_drop(self, message: Message) -> bool:
+        return False
+
+
+# ============================================================================
+# Validation
+# ============================================================================
+
+
+def test_fault_level_bounded_by_t():
+    """Test: More than t strategies raise ValueError"""
+    with pytest.raises(ValueError):
+        AdversaryComposition(N, T, [Toggle(0), Toggle(1), Toggle(2)], PHASES)
+
+
+def test_multi_sender_strategy_counts_every_sender():
+    """Test: Every sender a strategy controls counts towards the fault level"""
+    adversary = DelayDropAdversary(1, N, delta=1.0, senders=[1, 2, 3])
+    with pytest.raises(ValueError, match="exceeds"):
+        AdversaryComposition(N, T, [adversary], PHASES)
+    with pytest.raises(ValueError, match="exactly one"):
+        AdversaryComposition(
+            N, 3, [DelayDropAdversary(1, N, 1.0, senders=[1, 2]), Toggle(2)], PHASES
+        )
+
+
+def test_duplicate_and_out_of_range_nodes_rejected():
+    """Test: Two strategies for one node or an unknown node raise ValueError"""
+    with pytest.raises(ValueError):
+        AdversaryComposition(N, T, [Toggle(1), Toggle(1)], PHASES)
+    with pytest.raises(ValueError):
+        AdversaryComposition(N, T, [Toggle(N)], PHASES)
+
+
+# ============================================================================
+# Compilation
+# ============================================================================
+
+
+def test_compiled_entries():
+    """Test: Each strategy compiles to its fixed action; honest senders are PASS"""
+    keys = NodeKeys.from_seed(5, b"\x05" * 32)
+    composition = AdversaryComposition(
+        N,
+        T,
+        [
+            DelayDropAdversary(4, N, delta=1.0, drop_probability=1.0),
+            EquivocatorAdversary(5, keys, N, values=["A", "B"]),
+        ],
+        PHASES,
+    )
+
+    assert composition.fault_level == 2
+    assert composition.route(msg(0)) is PASS
+    assert composition.route(msg(4)).action is RouteAction.DROP
+    assert composition.route(msg(5)).action is RouteAction.VARIANT
+    assert composition.route(msg(5, phase="ECHO")) is PASS
+
+
+def test_uncompilable_strategy_falls_back_to_call():
+    """Test: Strategies without compile_route() are routed through intercept_send()"""
+    composition = AdversaryComposition(N, T, [Duplicator(3)], PHASES)
+
+    assert composition.route(msg(3)).action is RouteAction.CALL
+    assert len(composition.deliver([msg(3)])) == 2 * N
+
+
+def test_compiled_once_per_round():
+    """Test: Lookups within a round reuse the table; a new round recompiles"""
+    composition = AdversaryComposition(N, T, [Toggle(1)], PHASES)
+
+    for sender in range(N):
+        composition.route(msg(sender))
+    assert composition.compilations == 1
+
+    composition.route(msg(1, round=1))
+    assert composition.compilations == 2
+
+
+def test_compile_samples_each_phase_once():
+    """Test: A multi-sender delay/drop strategy samples each phase once per compilation"""
+    adversary = DelayDropAdversary(1, N, delta=1.0, drop_probability=0.3, senders=[1, 2])
+    sampled = []
+    sample_phase = adversary.model.sample_phase
+
+    def counting_sample(round, phase):
+        sampled.append((round, phase))
+        return sample_phase(round, phase)
+
+    adversary.model.sample_phase = counting_sample
+    composition = AdversaryComposition(N, T, [adversary], PHASES)
+    composition.table(0)
+
+    assert sampled == [(0, "SEND"), (0, "ECHO")]
+
+
+def test_state_change_recompiles():
+    """Test: mark_changed() invalidates the table mid-round"""
+    toggle = Toggle(1)
+    composition = AdversaryComposition(N, T, [toggle], PHASES)
+    assert composition.route(msg(1)) is PASS
+
+    toggle.go_silent()
+
+    assert composition.route(msg(1)).action is RouteAction.DROP
+    assert composition.compilations == 2
+    assert toggle.state_version == 1
+
+
+# ============================================================================
+# Delivery
+# ============================================================================
+
+
+def test_delay_entry_matches_uncompiled_adversary():
+    """Test: DELAY deliveries keep per-link delays and omit dropped receivers"""
+    adversary = DelayDropAdversary(2, N, delta=1.0, drop_probability=0.3, seed=4)
+    reference = DelayDropAdversary(2, N, delta=1.0, drop_probability=0.3, seed=4)
+    composition = AdversaryComposition(N, T, [adversary], PHASES)
+    entry = composition.route(msg(2))
+
+    deliveries = composition.deliver([msg(2)])
+
+    assert {r for _, r, _ in deliveries} == set(range(N)) - entry.dropped
+    assert len({delay for delay, _, _ in deliveries}) > 1
+    assert sorted((d, r) for d, r, _ in deliveries) == sorted(
+        (d, r) for d, r, _ in reference.schedule_broadcast(0, "SEND", [msg(2)])
+    )
+    assert entry.dropped
+    assert adversary.actions == reference.actions
+
+
+def test_delay_drop_sender_filter():
+    """Test: Only the adversary's controlled senders are compiled"""
+    adversary = DelayDropAdversary(1, N, delta=1.0, drop_probability=0.3, seed=4, senders=[3])
+    composition = AdversaryComposition(N, T, [adversary], PHASES)
+
+    assert adversary.compile_route(0, "SEND", 1) is PASS
+    assert composition.route(msg(1)) is PASS
+    assert composition.route(msg(3)).action is RouteAction.DELAY
+    assert composition.fault_level == 1
+
+
+def test_variant_entry_targets_receivers():
+    """Test: VARIANT deliveries give receiver r variant r % k"""
+    keys = NodeKeys.from_seed(5, b"\x05" * 32)
+    composition = AdversaryComposition(
+        N, T, [EquivocatorAdversary(5, keys, N, values=["A", "B"])], PHASES
+    )
+
+    deliveries = composition.deliver([msg(5), msg(0)])
+
+    assert [m.value for _, r, m in deliveries if m.sender_id == 5] == list("ABABABA")
+    assert [m.value for _, _, m in deliveries if m.sender_id == 0] == ["v"] * N
+
+
+def test_variants_signed_in_one_batch():
+    """Test: All VARIANT messages of a delivery are signed in one batch"""
+
+    class CountingSigner(ParallelSigner):
+        def __init__(self):
+            super().__init__()
+            self.batches = []
+
+        def sign_batch(self, keys, payloads):
+            self.batches.append(len(payloads))
+            return super().sign_batch(keys, payloads)
+
+    keys = NodeKeys.from_seed(5, b"\x05" * 32)
+    signer = CountingSigner()
+    equivocator = EquivocatorAdversary(5, keys, N, values=["A", "B"], signer=signer)
+    composition = AdversaryComposition(N, T, [equivocator], PHASES)
+
+    deliveries = composition.deliver([msg(5, value="x"), msg(5, value="y"), msg(0)])
+
+    assert signer.batches == [4]
+    assert len(deliveries) == 3 * N
+    assert all(
+        NodeKeys.verify(m.signing_payload(), m.signature, keys.verify_key)
+        for _, _, m in deliveries
+        if m.sender_id == 5
+    )
+
+
+def test_drop_entry_is_logged():
+    """Test: DROP entries deliver nothing and are audited by the strategy"""
+    toggle = Toggle(1)
+    toggle.go_silent()
+    composition = AdversaryComposition(N, T, [toggle], PHASES)
+
+    assert composition.deliver([msg(1)], receivers=[0, 2]) == []
+    assert toggle.action_counts() == {"drop": 1}
+
+
+def test_dropped_row_logged_like_uncompiled_adversary():
+    """Test: A fully dropped sender logs the same drop record as schedule_broadcast()"""
+    adversary = DelayDropAdversary(4, N, delta=1.0, drop_probability=1.0)
+    reference = DelayDropAdversary(4, N, delta=1.0, drop_probability=1.0)
+    composition = AdversaryComposition(N, T, [adversary], PHASES)
+
+    assert composition.deliver([msg(4)]) == []
+    reference.schedule_broadcast(0, "SEND", [msg(4)])
+    assert adversary.actions == reference.actions
@@ -0,0 +1,139 @@
+"""
+Unit tests for the vectorized delay/drop adversary
+
+Tests cover:
+- Phase matrices restricted to corrupted senders and capped at Δ
+- Drop probability extremes and drop logging
+- Whole-broadcast scheduling in arrival order
+- Replay determinism and per-phase caching
+- Header-only frame drop decisions
+"""
+
+import numpy as np
+import pytest
+
+from ba_simulator.adversaries.delay_drop import DelayDropAdversary
+from ba_simulator.transport.framing import FrameView, encode_frame
+from ba_simulator.transport.message import Message
+
+N = 6
+
+
+def msg(sender_id, round=0, phase="ECHO", value="v"):
+    """Build a broadcast message."""
+    return Message(
+        ssid="dd-test",
+        round=round,
+        protocol_id="CoD",
+        phase=phase,
+        sender_id=sender_id,
+        value=value,
+        digest=None,
+        aux={},
+        signature=b"\x00" * 64,
+    )
+
+
+# ============================================================================
+# Phase Matrices
+# ============================================================================
+
+
+def test_only_corrupted_rows_affected():
+    """Test: Honest rows have zero delay and no drops; corrupted rows stay within Δ"""
+    adversary = DelayDropAdversary(
+        1, N, delta=2.0, distribution="pareto", drop_probability=0.5, seed=3, senders=[1, 4]
+    )
+    links = adversary.phase_links(0, "ECHO")
+
+    honest = [0, 2, 3, 5]
+    assert not links.delays[honest].any()
+    assert not links.dropped[honest].any()
+    assert links.delays[[1, 4]].max() <= 2.0
+    assert links.delays[[1, 4]].any()
+
+
+def test_replay_identical_and_phase_cached():
+    """Test: Same seed replays identically; repeated queries reuse the cached phase"""
+    a = DelayDropAdversary(2, N, delta=1.0, drop_probability=0.3, seed=9)
+    b = DelayDropAdversary(2, N, delta=1.0, drop_probability=0.3, seed=9)
+
+    first = a.phase_links(4, "READY")
+    assert a.phase_links(4, "READY") is first
+    assert np.array_equal(first.delays, b.phase_links(4, "READY").delays)
+    assert np.array_equal(first.dropped, b.phase_links(4, "READY").dropped)
+    assert not np.array_equal(first.delays, a.phase_links(5, "READY").delays)
+
+
+def test_invalid_senders_rejected():
+    """Test: Senders outside [0, n) raise ValueError"""
+    with pytest.raises(ValueError):
+        DelayDropAdversary(0, N, delta=1.0, senders=[N])
+
+
+# ============================================================================
+# Drops and Delays
+# ============================================================================
+
+
+def test_drop_probability_extremes():
+    """Test: p=1 drops the whole broadcast, p=0 never drops"""
+    always = DelayDropAdversary(2, N, delta=1.0, drop_probability=1.0)
+    never = DelayDropAdversary(2, N, delta=1.0, drop_probability=0.0)
+
+    assert always.should_drop(msg(2)) and always.intercept_send(msg(2)) == []
+    assert not always.should_drop(msg(3))
+    assert not never.should_drop(msg(2))
+    assert never.intercept_send(msg(2)) == [msg(2)]
+
+
+def test_get_delay_capped():
+    """Test: Delays are in [0, Δ] and zero for honest senders"""
+    adversary = DelayDropAdversary(2, N, delta=0.5, distribution="normal", seed=1)
+
+    assert 0.0 <= adversary.get_delay(msg(2)) <= 0.5
+    assert adversary.get_delay(msg(2), receiver=2) == 0.0
+    assert adversary.get_delay(msg(0)) == 0.0
+
+
+def test_frame_drop_is_header_only():
+    """Test: Frame-level drop decisions do not decode the body"""
+    adversary = DelayDropAdversary(2, N, delta=1.0, drop_probability=1.0)
+    view = FrameView(encode_frame(msg(2)))
+
+    assert adversary.intercept_frame(view) == []
+    assert not view.decoded
+
+
+# ============================================================================
+# Broadcast Scheduling
+# ============================================================================
+
+
+def test_schedule_broadcast_arrival_order_and_drops():
+    """Test: Deliveries follow arrival order; dropped links are omitted and logged"""
+    adversary = DelayDropAdversary(1, N, delta=1.0, drop_probability=0.4, seed=11)
+    messages = [msg(s) for s in range(N)]
+    links = adversary.phase_links(0, "ECHO")
+
+    schedule = adversary.schedule_broadcast(0, "ECHO", messages)
+
+    expected_links = [(s, r) for s, r, _ in links.delivery_schedule()]
+    assert [(m.sender_id, r) for _, r, m in schedule] == expected_links
+    assert [d for d, _, _ in schedule] == sorted(d for d, _, _ in schedule)
+    dropped = int(links.dropped.sum())
+    assert len(schedule) == N * N - dropped
+    if dropped:
+        assert adversary.action_counts() == {"drop": 1}
+        assert adversary.actions[0].detail["receivers"] == np.flatnonzero(links.dropped[1]).tolist()
+
+
+def test_schedule_broadcast_keeps_emission_order_per_sender():
+    """Test: Several messages of one sender share its links in emission order"""
+    adversary = DelayDropAdversary(0, N, delta=1.0, seed=2)
+    first, second = msg(0, value="a"), msg(0, value="b")
+
+    schedule = adversary.schedule_broadcast(0, "ECHO", [first, second])
+
+    assert len(schedule) == 2 * N
+    assert [m.value for _, _, m in schedule[:2]] == ["a", "b"]
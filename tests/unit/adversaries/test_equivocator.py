@@ -0,0 +1,110 @@
+"""
+Unit tests for the equivocator adversary
+
+Tests cover:
+- Targeted per-recipient variants with valid signatures
+- One signature per distinct variant, reused across recipients
+- Pass-through outside the equivocation phases
+- Integration with CoD equivocation detection
+"""
+
+import pytest
+
+from ba_simulator.adversaries.equivocator import EquivocatorAdversary
+from ba_simulator.protocols.cod import CoD
+from ba_simulator.transport.crypto import NodeKeys, ParallelSigner
+from ba_simulator.transport.message import Message
+
+N = 7
+
+
+def outgoing(phase="SEND", value="X", round=0):
+    """Build the corrupted node's honest-looking message."""
+    return Message(
+        ssid="equiv-adv",
+        round=round,
+        protocol_id="CoD",
+        phase=phase,
+        sender_id=3,
+        value=value,
+        digest=None,
+        aux={},
+        signature=b"\x00" * 64,
+    )
+
+
+@pytest.fixture
+def keys():
+    return NodeKeys.from_seed(3, b"\x03" * 32)
+
+
+# ============================================================================
+# Planning and Signing
+# ============================================================================
+
+
+def test_recipients_get_conflicting_signed_variants(keys):
+    """Test: Recipients alternate between variants, each validly signed"""
+    adversary = EquivocatorAdversary(3, keys, N, values=["A", "B"])
+    plan = adversary.plan_round([outgoing()])
+
+    assert [plan.messages_for(r)[0].value for r in range(N)] == list("ABABABA")
+    for message in plan.variants:
+        assert NodeKeys.verify(message.signing_payload(), message.signature, keys.verify_key)
+    assert adversary.action_counts() == {"equivocate": 1}
+
+
+def test_each_variant_signed_once(keys):
+    """Test: A round signs one payload per distinct variant and shares the objects"""
+    signer = ParallelSigner()
+    adversary = EquivocatorAdversary(3, keys, N, values=["A", "B", "C"], signer=signer)
+    plan = adversary.plan_round([outgoing(round=r) for r in range(4)])
+
+    assert signer.signed == 4 * 3
+    assert len(plan.variants) == 12
+    assert plan.messages_for(0)[2] is plan.messages_for(3)[2]
+
+
+def test_other_phases_pass_through(keys):
+    """Test: Messages outside the equivocation phases are neither changed nor signed"""
+    signer = ParallelSigner()
+    adversary = EquivocatorAdversary(3, keys, N, values=["A", "B"], signer=signer)
+    echo = outgoing(phase="ECHO")
+
+    plan = adversary.plan_round([echo])
+
+    assert all(plan.messages_for(r) == [echo] for r in range(N))
+    assert plan.messages_for(0)[0] is echo
+    assert adversary.intercept_send(echo) == [echo]
+    assert signer.signed == 0
+
+
+def test_intercept_send_returns_all_variants(keys):
+    """Test: intercept_send() yields every signed variant"""
+    adversary = EquivocatorAdversary(3, keys, N, values=["A", "B"])
+    assert [m.value for m in adversary.intercept_send(outgoing())] == ["A", "B"]
+
+
+def test_requires_two_values(keys):
+    """Test: Fewer than two values raise ValueError"""
+    with pytest.raises(ValueError):
+        EquivocatorAdversary(3, keys, N, values=["A"])
+
+
+# ============================================================================
+# CoD Integration
+# ============================================================================
+
+
+def test_equivocation_detected_by_cod(keys):
+    """Test: A node seeing two variants records an equivocation proof"""
+    adversary = EquivocatorAdversary(3, keys, N, values=["A", "B"], phases=["ECHO"])
+    plan = adversary.plan_round([outgoing(phase="ECHO")])
+    cod = CoD(n=N, t=2, node_id=0)
+
+    cod.process_message(plan.messages_for(0)[0])
+    cod.process_message(plan.messages_for(1)[0])
+
+    proofs = cod.equivocation_proofs()
+    assert [p.sender_id for p in proofs] == [3]
+    assert {proofs[0].first.value, proofs[0].conflicting.value} == {"A", "B"}
@@ -0,0 +1,182 @@
+"""
+Unit tests for the withholder adversary
+
+Tests cover:
+- Withholding terminal phases as deferred descriptors sharing one template per message
+- Signed messages and frames re-emitted unchanged, without re-signing
+- Signing of messages withheld before signing, once per released message
+- Release timing, recipients and discarding
+- Header-only frame forwarding and withholding
+"""
+
+from dataclasses import replace
+
+import pytest
+
+from ba_simulator.adversaries.withholder import WithholderAdversary
+from ba_simulator.transport.crypto import NodeKeys, ParallelSigner
+from ba_simulator.transport.framing import FrameView, encode_frame
+from ba_simulator.transport.message import Message
+
+N = 7
+
+
+def outgoing(phase="READY", round=0, value="X"):
+    """Build the corrupted node's message."""
+    return Message(
+        ssid="withhold",
+        round=round,
+        protocol_id="CoD",
+        phase=phase,
+        sender_id=4,
+        value=value,
+        digest=None,
+        aux={"k": 1},
+        signature=b"\x00" * 64,
+    )
+
+
+@pytest.fixture
+def keys():
+    return NodeKeys.from_seed(4, b"\x04" * 32)
+
+
+# ============================================================================
+# Withholding
+# ============================================================================
+
+
+def test_terminal_phase_withheld_without_signing(keys):
+    """Test: Withheld messages become descriptors and cost no signature"""
+    signer = ParallelSigner()
+    adversary = WithholderAdversary(4, keys, N, release_round=5, signer=signer)
+
+    assert adversary.intercept_send(outgoing()) == []
+    assert adversary.intercept_send(outgoing(phase="ECHO")) == [outgoing(phase="ECHO")]
+    assert adversary.pending == 1
+    assert adversary.deferred[0].recipients == frozenset(range(N))
+    assert signer.signed == 0
+
+
+def test_frame_pass_through_is_header_only(keys):
+    """Test: Frames of other phases are forwarded without decoding"""
+    adversary = WithholderAdversary(4, keys, N, release_round=5)
+    echo = FrameView(encode_frame(outgoing(phase="ECHO")))
+    ready = FrameView(encode_frame(outgoing()))
+
+    assert adversary.intercept_frame(echo) == [echo.frame]
+    assert not echo.decoded
+    assert adversary.intercept_frame(ready) == []
+    assert not ready.decoded
+    assert adversary.pending == 1
+
+
+# ============================================================================
+# Release
+# ============================================================================
+
+
+def test_release_signs_due_messages_once(keys):
+    """Test: Release signs each due message once with a valid signature"""
+    signer = ParallelSigner()
+    adversary = WithholderAdversary(4, keys, N, release_round=5, signer=signer)
+    for round in range(3):
+        adversary.intercept_send(outgoing(round=round))
+
+    assert adversary.release(4) == []
+    released = adversary.release(5)
+
+    assert signer.signed == 3
+    assert [m.round for m, _ in released] == [0, 1, 2]
+    for message, recipients in released:
+        assert recipients == frozenset(range(N))
+        assert message.aux == {"k": 1}
+        assert NodeKeys.verify(message.signing_payload(), message.signature, keys.verify_key)
+    assert adversary.release(6) == []
+    assert adversary.action_counts() == {"withhold": 3, "release": 3}
+
+
+def test_signed_message_released_with_original_signature(keys):
+    """Test: A message the node already signed is re-emitted without signing again"""
+    signer = ParallelSigner()
+    adversary = WithholderAdversary(4, keys, N, release_round=1, signer=signer)
+    unsigned = outgoing()
+    signed = replace(unsigned, signature=keys.sign(unsigned.signing_payload()))
+    adversary.intercept_send(signed)
+
+    [(message, _)] = adversary.release(1)
+
+    assert message == signed
+    assert signer.signed == 0
+
+
+def test_withheld_frame_released_as_original_bytes(keys):
+    """Test: Frames are withheld and released byte-identical, never decoded or signed"""
+    signer = ParallelSigner()
+    adversary = WithholderAdversary(4, keys, N, release_round=1, signer=signer)
+    frame = encode_frame(outgoing())
+    adversary.intercept_frame(FrameView(frame))
+    adversary.intercept_send(outgoing(round=1))
+
+    released = adversary.release_frames(1)
+
+    assert released[0] == (frame, frozenset(range(N)))
+    message = FrameView(released[1][0]).message
+    assert NodeKeys.verify(message.signing_payload(), message.signature, keys.verify_key)
+    assert signer.signed == 1
+
+
+def test_descriptor_owns_aux(keys):
+    """Test: Mutating the caller's aux after withholding does not change the release"""
+    adversary = WithholderAdversary(4, keys, N, release_round=0)
+    message = outgoing()
+    adversary.intercept_send(message)
+    message.aux["k"] = 2
+
+    [(released, _)] = adversary.release(0)
+    assert released.aux == {"k": 1}
+
+
+def test_identical_messages_share_one_template(keys):
+    """Test: A message withheld towards several recipient sets is stored and signed once"""
+    signer = ParallelSigner()
+    adversary = WithholderAdversary(4, keys, N, release_round=0, signer=signer)
+    adversary.withhold(outgoing(), recipients=[1, 2])
+    adversary.withhold(outgoing(), recipients=[3])
+    adversary.withhold(outgoing(value="Y"), recipients=[5])
+
+    assert adversary.pending == 3
+    assert adversary.templates == 2
+    assert adversary.deferred[0].template is adversary.deferred[1].template
+
+    released = adversary.release(0)
+    assert signer.signed == 2
+    assert [recipients for _, recipients in released] == [
+        frozenset({1, 2}),
+        frozenset({3}),
+        frozenset({5}),
+    ]
+    assert released[0][0] is released[1][0]
+    assert adversary.templates == 0
+
+
+def test_custom_recipients(keys):
+    """Test: withhold() keeps an explicit recipient set"""
+    adversary = WithholderAdversary(4, keys, N, release_round=0)
+    adversary.withhold(outgoing(), recipients=[1, 2])
+
+    [(message, recipients)] = adversary.release(0)
+    assert recipients == frozenset({1, 2})
+    assert message.value == "X"
+
+
+def test_discarded_messages_never_signed(keys):
+    """Test: Never-released descriptors are discarded without any signing"""
+    signer = ParallelSigner()
+    adversary = WithholderAdversary(4, keys, N, release_round=100, signer=signer)
+    for round in range(50):
+        adversary.intercept_send(outgoing(round=round))
+
+    assert adversary.discard() == 50
+    assert adversary.release(100) == []
+    assert signer.signed == 0
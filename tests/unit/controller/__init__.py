@@ -0,0 +1 @@
+# Controller layer unit tests
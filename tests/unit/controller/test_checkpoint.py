@@ -0,0 +1,223 @@
+"""
+Unit tests for round-boundary checkpoints
+
+Tests cover:
+- Tagged value encoding round trips (carryover types, bytes, arrays)
+- Checkpoint codec round trip and version check
+- Atomic save/load
+- Bit-identical resume of a lock-step run (nodes, carryover, RNGs)
+- Forking variants from a shared prefix
+- Default attribute-based node state
+- Mismatch errors
+"""
+
+import numpy as np
+import pytest
+
+from ba_simulator.controller.checkpoint import (
+    Checkpoint,
+    CheckpointCodec,
+    CheckpointedRun,
+    decode_value,
+    encode_value,
+    load_checkpoint,
+    save_checkpoint,
+)
+from ba_simulator.scheduling.carryover import CarryoverState, PersistentMap
+from ba_simulator.scheduling.lockstep import LockstepRunner
+from ba_simulator.scheduling.round_node import DeliveryPolicy, RoundNode
+from ba_simulator.transport.message import Message
+
+
+class NoisyNode(RoundNode):
+    """Sum inbox values plus shared RNG noise; log the running total in carryover."""
+
+    def __init__(self, node_id, rng, carryover):
+        super().__init__(node_id)
+        self.rng = rng
+        self.carryover = carryover
+        self.total = node_id
+        self.history = ()
+
+    def step(self, round, inbox):
+        self.total = (self.total + sum(msg.value for msg in inbox)) % 1000
+        self.total = (self.total + int(self.rng.integers(0, 10))) % 1000
+        self.history = self.history + (self.total,)
+        if self.node_id == 0:
+            self.carryover.set("totals", {round: self.total})
+            self.carryover.seal(round)
+        if round == 8:
+            self.decision = self.total
+        return [
+            Message(
+                ssid="ckpt-test",
+                round=round,
+                protocol_id="BA",
+                phase="SUM",
+                sender_id=self.node_id,
+                value=self.total,
+                digest=None,
+                aux={},
+                signature=bytes([self.node_id]) * 64,
+            )
+        ]
+
+    def get_state(self):
+        return {"total": self.total, "history": self.history, "decision": self.decision}
+
+    def set_state(self, state):
+        self.total = state["total"]
+        self.history = state["history"]
+        self.decision = state["decision"]
+
+
+class DefaultStateNode(RoundNode):
+    """Node relying on the default attribute-based get_state() / set_state()."""
+
+    def __init__(self, node_id):
+        super().__init__(node_id)
+        self.seen = []
+
+    def step(self, round, inbox):
+        self.seen.append(len(inbox))
+        return []
+
+
+class MuteSenderPolicy(DeliveryPolicy):
+    """Drop every message from one sender."""
+
+    def __init__(self, sender):
+        self.sender = sender
+
+    def filter_inbox(self, round, receiver, inbox):
+        return [msg for msg in inbox if msg.sender_id != self.sender]
+
+
+def make_run(n=5, seed=3, policy=None):
+    """Build a checkpointed run with a shared RNG and carryover."""
+    rng = np.random.default_rng(seed)
+    carryover = CarryoverState()
+    runner = LockstepRunner(lambda i: NoisyNode(i, rng, carryover), n, policy=policy)
+    return CheckpointedRun(runner, carryover=carryover, rngs={"noise": rng})
+
+
+# ============================================================================
+# Value Encoding
+# ============================================================================
+
+
+def test_encode_value_round_trip():
+    """Test: Carryover types, bytes and arrays survive encoding"""
+    value = {
+        "map": PersistentMap({"a": (1, 2), 3: frozenset({"x", "y"})}),
+        "bytes": b"\x00\xff",
+        "array": np.arange(3, dtype=np.uint64),
+        "list": [None, True, 1.5],
+    }
+    decoded = decode_value(encode_value(value))
+
+    assert decoded["map"] == value["map"]
+    assert decoded["bytes"] == value["bytes"]
+    assert decoded["array"].dtype == np.uint64
+    assert decoded["array"].tolist() == [0, 1, 2]
+    assert decoded["list"] == value["list"]
+
+
+def test_encode_value_is_canonical():
+    """Test: Set and mapping order do not affect the encoding"""
+    assert encode_value(frozenset({"b", "a"})) == encode_value(frozenset({"a", "b"}))
+    assert encode_value({2: 0, 1: 0}) == encode_value({1: 0, 2: 0})
+
+
+def test_encode_value_rejects_unknown_types():
+    """Test: Unsupported values raise TypeError"""
+    with pytest.raises(TypeError):
+        encode_value(object())
+
+
+# ============================================================================
+# Codec and Files
+# ============================================================================
+
+
+def test_codec_round_trip_and_version(tmp_path):
+    """Test: Checkpoints round-trip through files; foreign versions are rejected"""
+    run = make_run()
+    run.run(max_rounds=3)
+    checkpoint = run.checkpoint()
+
+    path = save_checkpoint(tmp_path / "c.ckpt", checkpoint)
+    assert load_checkpoint(path) == checkpoint
+    assert not (tmp_path / "c.ckpt.tmp").exists()
+
+    with pytest.raises(ValueError, match="version"):
+        CheckpointCodec().decode(b'{"version": 99}')
+
+
+# ============================================================================
+# Resume and Fork
+# ============================================================================
+
+
+def test_resume_is_bit_identical(tmp_path):
+    """Test: Resuming from a round-boundary checkpoint reproduces the uninterrupted run"""
+    reference = make_run()
+    expected = reference.run(max_rounds=12, checkpoint_dir=tmp_path, every=2)
+
+    resumed = make_run(seed=999)
+    resumed.restore(load_checkpoint(tmp_path / "round-000003.ckpt"))
+    result = resumed.run(max_rounds=12)
+
+    assert result == expected
+    assert resumed.checkpoint() == reference.checkpoint()
+    assert sorted(p.name for p in tmp_path.iterdir())[:2] == [
+        "round-000001.ckpt",
+        "round-000003.ckpt",
+    ]
+
+
+def test_fork_variants_from_shared_prefix(tmp_path):
+    """Test: Variants restored from one prefix diverge only through their policies"""
+    make_run().run(max_rounds=4, checkpoint_dir=tmp_path)
+    prefix = load_checkpoint(tmp_path / "round-000003.ckpt")
+
+    benign = make_run()
+    benign.restore(prefix)
+    muted = make_run(policy=MuteSenderPolicy(sender=4))
+    muted.restore(prefix)
+
+    assert benign.run(max_rounds=12).decisions != muted.run(max_rounds=12).decisions
+    assert muted.runner.next_round == 9
+
+
+# ============================================================================
+# Errors
+# ============================================================================
+
+
+def test_restore_rejects_mismatched_runs():
+    """Test: Node IDs and RNG names must match the checkpoint"""
+    checkpoint = make_run(n=5).checkpoint()
+
+    with pytest.raises(ValueError, match="node IDs"):
+        make_run(n=4).restore(checkpoint)
+    with pytest.raises(ValueError, match="RNG"):
+        make_run().restore(Checkpoint(0, 0, [], checkpoint.node_states))
+
+
+def test_default_node_state_roundtrip():
+    """Test: The default get_state() snapshots attributes without aliasing them"""
+    run = CheckpointedRun(LockstepRunner(DefaultStateNode, 2))
+    run.run(max_rounds=2)
+    checkpoint = run.checkpoint()
+    run.run(max_rounds=4)
+
+    assert checkpoint.node_states[0] == {"node_id": 0, "decision": None, "seen": [0, 0]}
+    run.restore(CheckpointCodec().decode(CheckpointCodec().encode(checkpoint)))
+    assert run.runner.nodes[1].seen == [0, 0]
+
+
+def test_invalid_checkpoint_interval(tmp_path):
+    """Test: Non-positive intervals raise ValueError"""
+    with pytest.raises(ValueError):
+        make_run().run(max_rounds=2, checkpoint_dir=tmp_path, every=0)
@@ -0,0 +1,165 @@
+"""
+Unit tests for round-watermark garbage collection
+
+Tests cover:
+- Watermark from the slowest honest node, ignoring corrupted nodes
+- Per-kind lags and idempotent collection
+- Metrics of released items and estimated bytes reclaimed
+- Lock-step wiring keeping per-round state bounded
+"""
+
+import pytest
+
+from ba_simulator.controller.gc import WatermarkCollector
+from ba_simulator.protocols.lite_pop import LitePoP
+from ba_simulator.scheduling.lockstep import LockstepRunner
+from ba_simulator.scheduling.round_node import RoundNode
+from ba_simulator.transport.message import Message
+from ba_simulator.validation.evidence_store import (
+    EvidenceKind,
+    EvidenceRecord,
+    MemoryEvidenceStore,
+)
+
+
+class Recorder:
+    """Per-round structure counting one item per round."""
+
+    def __init__(self, rounds):
+        self.rounds = set(rounds)
+        self.calls = []
+
+    def release_through(self, round):
+        self.calls.append(round)
+        stale = {r for r in self.rounds if r <= round}
+        self.rounds -= stale
+        return len(stale)
+
+
+class PoPNode(RoundNode):
+    """Broadcasts every round and feeds a shared LitePoP."""
+
+    def __init__(self, node_id, pop):
+        super().__init__(node_id)
+        self.pop = pop
+
+    def step(self, round, inbox):
+        for message in inbox:
+            self.pop.observe(message)
+        return [
+            Message(
+                ssid="gc",
+                round=round,
+                protocol_id="PoP",
+                phase="PARTICIPATE",
+                sender_id=self.node_id,
+                value=None,
+                digest=None,
+                aux={},
+                signature=b"\x00" * 64,
+            )
+        ]
+
+
+# ============================================================================
+# Watermark
+# ============================================================================
+
+
+def test_watermark_follows_slowest_honest_node():
+    """Test: Nothing is released until every honest node passed round r + k"""
+    recorder = Recorder(range(10))
+    collector = WatermarkCollector(honest=[0, 1, 2], lag=2)
+    collector.register("inbox", recorder.release_through)
+
+    collector.advance(0, 5)
+    collector.advance(1, 5)
+    collector.advance(3, 9)
+    assert collector.collect() == {}
+
+    collector.advance(2, 3)
+    assert collector.collect() == {"inbox": 2}
+    assert recorder.rounds == set(range(2, 10))
+
+
+def test_per_kind_lag_and_idempotence():
+    """Test: Each kind uses its own lag; repeated collection releases nothing new"""
+    fast, slow = Recorder(range(10)), Recorder(range(10))
+    collector = WatermarkCollector(honest=[0], lag=1)
+    collector.register("dedup", fast.release_through)
+    collector.register("certificates", slow.release_through, lag=4)
+
+    collector.advance(0, 6)
+    assert collector.collect() == {"dedup": 6, "certificates": 3}
+    assert collector.collect() == {}
+    assert fast.calls == [5] and slow.calls == [2]
+
+    metrics = collector.metrics["certificates"]
+    assert (metrics.lag, metrics.collections, metrics.items_released) == (4, 1, 3)
+    assert metrics.released_through == 2
+    assert collector.total_items_released() == 9
+
+
+def test_invalid_configuration_rejected():
+    """Test: Negative lags, no honest nodes and duplicate kinds raise ValueError"""
+    with pytest.raises(ValueError):
+        WatermarkCollector(honest=[0], lag=-1)
+    with pytest.raises(ValueError):
+        WatermarkCollector(honest=[])
+    collector = WatermarkCollector(honest=[0])
+    collector.register("x", Recorder([]).release_through)
+    with pytest.raises(ValueError):
+        collector.register("x", Recorder([]).release_through)
+    with pytest.raises(ValueError):
+        collector.register("y", Recorder([]).release_through, lag=-2)
+
+
+def test_bytes_reclaimed_estimated_from_bound_structure():
+    """Test: Releasing from a bound method's object reports the bytes it freed"""
+    store = MemoryEvidenceStore()
+    for round in range(20):
+        store.append(EvidenceRecord(round, EvidenceKind.TRANSITION, bytes(256)))
+    collector = WatermarkCollector(honest=[0], lag=0)
+    collector.register("evidence", store.release_through)
+
+    collector.advance(0, 9)
+    assert collector.collect() == {"evidence": 10}
+    assert collector.metrics["evidence"].bytes_reclaimed > 10 * 256
+    assert collector.total_bytes_reclaimed() == collector.metrics["evidence"].bytes_reclaimed
+    assert [s.count for s in store.summaries(3)] == [1]
+
+
+def test_explicit_size_callable_used():
+    """Test: A registered size callable replaces the estimate; plain callables report none"""
+    recorder = Recorder(range(10))
+    collector = WatermarkCollector(honest=[0], lag=0)
+    collector.register("sized", recorder.release_through, size=lambda: 100 * len(recorder.rounds))
+    unsized = Recorder(range(10))
+    collector.register("unsized", lambda round: unsized.release_through(round))
+
+    collector.advance(0, 3)
+    collector.collect()
+
+    assert collector.metrics["sized"].bytes_reclaimed == 400
+    assert collector.metrics["unsized"].bytes_reclaimed == 0
+    assert collector.metrics["unsized"].items_released == 4
+
+
+# ============================================================================
+# Lock-Step Wiring
+# ============================================================================
+
+
+def test_lockstep_run_keeps_state_bounded():
+    """Test: A long run retains only participation sets above the watermark"""
+    pop = LitePoP()
+    collector = WatermarkCollector(honest=range(4), lag=2)
+    collector.register("participation", pop.release_through)
+    runner = LockstepRunner(lambda i: PoPNode(i, pop), n=4)
+
+    runner.run(max_rounds=50, on_round_end=collector.round_completed)
+
+    # Round 48 messages are observed in round 49; the watermark after it is 47
+    assert [r for r in range(50) if pop.participants(r)] == [48]
+    assert collector.metrics["participation"].items_released == 4 * 48
+    assert pop.participation_digest(10) != pop.participation_digest(11)
@@ -0,0 +1,258 @@
+"""
+Unit tests for the multiplexed BA session runner
+
+Tests cover:
+- Routing by ssid, unroutable message accounting and duplicate ssid rejection
+- Concurrent execution of many sessions with shared services
+- Verification cache hits, misses and eviction
+- Timer service bookkeeping
+- Throughput reporting (agreements per second)
+"""
+
+import asyncio
+
+import pytest
+
+from ba_simulator.controller.session_mux import (
+    BASession,
+    MultiplexResult,
+    SessionMultiplexer,
+    TimerService,
+    VerificationCache,
+)
+from ba_simulator.transport.message import Message
+
+
+def make_message(ssid, sender_id, value):
+    """Build a BA VOTE message for a session."""
+    return Message(
+        ssid=ssid,
+        round=0,
+        protocol_id="BA",
+        phase="VOTE",
+        sender_id=sender_id,
+        value=value,
+        digest=None,
+        aux={},
+        signature=bytes([sender_id]) * 64,
+    )
+
+
+class MinVoteSession(BASession):
+    """n virtual voters broadcast a value; decide the minimum once all votes arrived."""
+
+    def __init__(self, ssid, n, values):
+        super().__init__(ssid)
+        self.n = n
+        self.values = values
+
+    async def run(self, services):
+        for sender_id, value in enumerate(self.values):
+            await services.transport.broadcast(make_message(self.ssid, sender_id, value))
+            await services.timers.sleep(0)
+
+        votes = []
+        while len(votes) < self.n:
+            msg = await self.inbox.get()
+            if services.verification_cache.verify(msg, lambda m: True):
+                votes.append(msg.value)
+        return min(votes)
+
+
+# ============================================================================
+# Routing
+# ============================================================================
+
+
+def test_route_delivers_by_ssid():
+    """Test: route() delivers only to the session matching the ssid"""
+    mux = SessionMultiplexer()
+    a = MinVoteSession("a", 1, [1])
+    b = MinVoteSession("b", 1, [1])
+    mux.register(a)
+    mux.register(b)
+
+    assert mux.route(make_message("b", 0, 5))
+    assert a.inbox.empty()
+    assert b.inbox.get_nowait().value == 5
+
+
+def test_route_unknown_ssid_is_dropped():
+    """Test: Messages for unknown sessions are counted and dropped"""
+    mux = SessionMultiplexer()
+
+    assert not mux.route(make_message("ghost", 0, 1))
+    assert mux.unroutable == 1
+
+
+def test_duplicate_ssid_rejected():
+    """Test: Registering two active sessions with the same ssid raises ValueError"""
+    mux = SessionMultiplexer()
+    mux.register(MinVoteSession("dup", 1, [0]))
+
+    with pytest.raises(ValueError):
+        mux.register(MinVoteSession("dup", 1, [0]))
+
+
+def test_run_all_rejects_duplicate_ssids_before_starting():
+    """Test: Duplicate ssids raise ValueError before any session is started"""
+    started = []
+
+    class StartSession(BASession):
+        async def run(self, services):
+            started.append(self.ssid)
+            return None
+
+    mux = SessionMultiplexer()
+    with pytest.raises(ValueError, match="dup"):
+        asyncio.run(mux.run_all([StartSession("dup"), StartSession("ok"), StartSession("dup")]))
+
+    mux.register(MinVoteSession("active", 1, [0]))
+    with pytest.raises(ValueError, match="active"):
+        asyncio.run(mux.run_all([StartSession("active")]))
+
+    assert started == []
+    assert mux.route(make_message("active", 0, 1))
+
+
+def test_empty_ssid_rejected():
+    """Test: Sessions require a non-empty ssid"""
+    with pytest.raises(ValueError):
+        MinVoteSession("", 1, [0])
+
+
+# ============================================================================
+# Concurrent Execution
+# ============================================================================
+
+
+def test_run_all_runs_sessions_concurrently():
+    """Test: Many sessions complete concurrently with correct, isolated decisions"""
+    sessions = [MinVoteSession(f"rep-{i}", 4, [i + 3, i + 1, i + 2, i + 4]) for i in range(50)]
+    mux = SessionMultiplexer()
+
+    result = asyncio.run(mux.run_all(sessions))
+
+    assert isinstance(result, MultiplexResult)
+    assert result.decisions == {f"rep-{i}": i + 1 for i in range(50)}
+    assert result.routed == 200
+    assert result.unroutable == 0
+    assert result.agreements_per_second > 0
+
+
+def test_run_all_respects_max_concurrent():
+    """Test: max_concurrent bounds the number of simultaneously active sessions"""
+    active = []
+    peak = []
+
+    class TrackingSession(BASession):
+        async def run(self, services):
+            active.append(self.ssid)
+            peak.append(len(active))
+            await services.timers.sleep(0.001)
+            active.remove(self.ssid)
+            return self.ssid
+
+    mux = SessionMultiplexer(max_concurrent=3)
+    result = asyncio.run(mux.run_all(TrackingSession(f"s{i}") for i in range(10)))
+
+    assert len(result.decisions) == 10
+    assert max(peak) <= 3
+
+
+def test_sessions_share_services():
+    """Test: Every session receives the same keys, cache and timer service"""
+    seen = []
+
+    class ServiceSession(BASession):
+        async def run(self, services):
+            seen.append(services)
+            return None
+
+    keys = object()
+    mux = SessionMultiplexer(keys=keys)
+    asyncio.run(mux.run_all(ServiceSession(f"s{i}") for i in range(3)))
+
+    assert all(services is mux.services for services in seen)
+    assert mux.services.keys is keys
+
+
+def test_finished_session_no_longer_routable():
+    """Test: Messages for a completed session are unroutable"""
+    mux = SessionMultiplexer()
+    asyncio.run(mux.run_all([MinVoteSession("done", 1, [7])]))
+
+    assert not mux.route(make_message("done", 0, 1))
+
+
+def test_agreements_per_second_zero_without_time():
+    """Test: Throughput is zero when no wall time elapsed"""
+    assert MultiplexResult(decisions={"a": 1}, wall_time=0.0).agreements_per_second == 0.0
+
+
+# ============================================================================
+# Verification Cache
+# ============================================================================
+
+
+def test_verification_cache_hits_on_repeat():
+    """Test: A repeated message is verified only once"""
+    cache = VerificationCache()
+    calls = []
+    msg = make_message("x", 1, "v")
+
+    def verifier(m):
+        calls.append(m)
+        return True
+
+    assert cache.verify(msg, verifier)
+    assert cache.verify(make_message("x", 1, "v"), verifier)
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_verification_cache_caches_failures():
+    """Test: Invalid signatures are cached as False"""
+    cache = VerificationCache()
+    msg = make_message("x", 2, "bad")
+
+    assert not cache.verify(msg, lambda m: False)
+    assert not cache.verify(msg, lambda m: True)
+
+
+def test_verification_cache_evicts_lru():
+    """Test: The least recently used entry is evicted beyond max_entries"""
+    cache = VerificationCache(max_entries=2)
+    for value in ("a", "b", "c"):
+        cache.verify(make_message("x", 0, value), lambda m: True)
+
+    assert len(cache) == 2
+    cache.verify(make_message("x", 0, "a"), lambda m: True)
+    assert cache.misses == 4
+
+
+def test_verification_cache_invalid_size():
+    """Test: Non-positive max_entries raises ValueError"""
+    with pytest.raises(ValueError):
+        VerificationCache(max_entries=0)
+
+
+# ============================================================================
+# Timer Service
+# ============================================================================
+
+
+def test_timer_service_tracks_pending_timers():
+    """Test: call_later() timers are counted until they fire"""
+    timers = TimerService()
+    fired = []
+
+    async def scenario():
+        timers.call_later(0.001, lambda: fired.append(True))
+        assert timers.pending == 1
+        await asyncio.sleep(0.01)
+
+    asyncio.run(scenario())
+
+    assert fired == [True]
+    assert timers.pending == 0
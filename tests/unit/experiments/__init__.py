@@ -0,0 +1 @@
+# Experiment harness unit tests
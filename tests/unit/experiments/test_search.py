@@ -0,0 +1,250 @@
+"""
+Unit tests for the adversary schedule search
+
+Tests cover:
+- Problem validation and schedule generators
+- Prefix-cache reuse with results identical to fresh runs
+- Cache keys covering seed and adversary configuration
+- Worst-case ranking
+- On-disk result cache and resumed searches
+- Process-pool evaluation
+"""
+
+import multiprocessing
+
+import pytest
+
+from ba_simulator.controller.checkpoint import CheckpointedRun
+from ba_simulator.experiments.search import (
+    AdversarySearch,
+    PrefixCache,
+    ResultCache,
+    SearchProblem,
+    SearchResult,
+    evaluate,
+    exhaustive_schedules,
+    random_schedules,
+)
+from ba_simulator.scheduling.determinism import SeedService
+from ba_simulator.scheduling.lockstep import LockstepRunner
+from ba_simulator.scheduling.round_node import DeliveryPolicy, RoundNode
+from ba_simulator.transport.message import Message
+
+
+class QuorumNode(RoundNode):
+    """Decides once a round delivers at least ``quorum`` messages."""
+
+    def __init__(self, node_id, quorum):
+        super().__init__(node_id)
+        self.quorum = quorum
+
+    def step(self, round, inbox):
+        if not self.is_decided() and len(inbox) >= self.quorum:
+            self.decision = round
+        return [
+            Message(
+                ssid="search",
+                round=round,
+                protocol_id="BA",
+                phase="VOTE",
+                sender_id=self.node_id,
+                value=1,
+                digest=None,
+                aux={},
+                signature=b"\x00" * 64,
+            )
+        ]
+
+    def get_state(self):
+        return {"decision": self.decision}
+
+    def set_state(self, state):
+        self.decision = state["decision"]
+
+
+class SchedulePolicy(DeliveryPolicy):
+    """Round r blocks every inbox when the schedule says "block"."""
+
+    def __init__(self, schedule):
+        self.schedule = schedule
+
+    def filter_inbox(self, round, receiver, inbox):
+        if round < len(self.schedule) and self.schedule[round] == "block":
+            return []
+        return inbox
+
+
+class BlockingProblem(SearchProblem):
+    """Nodes decide on the first round whose inbox is not blocked."""
+
+    def __init__(self, n=4, t=1, f=1, max_rounds=8, seed=0, adversary=None):
+        super().__init__(n, t, f, max_rounds, seed, adversary)
+        self.builds = 0
+
+    def build(self, schedule):
+        self.builds += 1
+        quorum = self.n - self.f
+        runner = LockstepRunner(
+            lambda i: QuorumNode(i, quorum), self.n, policy=SchedulePolicy(schedule)
+        )
+        return CheckpointedRun(runner)
+
+
+CHOICES = ("block", "pass")
+
+
+# ============================================================================
+# Problem and Schedules
+# ============================================================================
+
+
+def test_problem_rejects_f_above_t():
+    """Test: f > t or non-positive max_rounds raise ValueError"""
+    with pytest.raises(ValueError):
+        BlockingProblem(t=1, f=2)
+    with pytest.raises(ValueError):
+        BlockingProblem(max_rounds=0)
+
+
+def test_schedule_generators():
+    """Test: Exhaustive enumeration is complete; random draws are seed-reproducible"""
+    assert len(list(exhaustive_schedules(CHOICES, 3))) == 8
+    a = random_schedules(CHOICES, 5, 4, SeedService(1))
+    assert a == random_schedules(CHOICES, 5, 4, SeedService(1))
+    assert all(len(s) == 5 and set(s) <= set(CHOICES) for s in a)
+
+
+# ============================================================================
+# Prefix Caching
+# ============================================================================
+
+
+def test_prefix_cache_longest_proper_prefix():
+    """Test: longest() returns the longest cached proper prefix"""
+    problem = BlockingProblem()
+    cache = PrefixCache()
+    evaluate(problem, ("block", "block", "pass"), cache)
+
+    length, checkpoint = cache.longest(("block", "block", "block"))
+    assert length == 2 and checkpoint.next_round == 2
+    assert cache.longest(("pass", "block")) == (0, None)
+
+
+def test_prefix_cache_evicts_oldest():
+    """Test: The cache keeps at most max_entries snapshots"""
+    problem = BlockingProblem()
+    cache = PrefixCache(max_entries=2)
+    evaluate(problem, ("block",) * 5, cache)
+
+    assert len(cache) == 2
+    assert ("block",) * 4 in cache and ("block",) not in cache
+
+
+def test_prefix_cache_bound_to_one_configuration():
+    """Test: A prefix cache refuses problems with another seed or adversary configuration"""
+    cache = PrefixCache()
+    evaluate(BlockingProblem(seed=1), ("block", "pass"), cache)
+    evaluate(BlockingProblem(seed=1), ("block", "block"), cache)
+
+    for other in (BlockingProblem(seed=2), BlockingProblem(seed=1, adversary={"p": 0.5})):
+        with pytest.raises(ValueError, match="cannot serve"):
+            evaluate(other, ("block", "block"), cache)
+
+
+def test_problem_key_covers_configuration():
+    """Test: Problems differing only in seed or adversary parameters get distinct keys"""
+    keys = {
+        BlockingProblem().key(),
+        BlockingProblem(seed=3).key(),
+        BlockingProblem(adversary={"drop": 0.1}).key(),
+        BlockingProblem(adversary={"drop": 0.2}).key(),
+    }
+    assert len(keys) == 4
+    assert BlockingProblem(seed=3).key() == BlockingProblem(seed=3).key()
+
+
+def test_resumed_runs_match_fresh_runs():
+    """Test: Candidates resumed from cached prefixes score like fresh runs"""
+    problem = BlockingProblem()
+    results = AdversarySearch(problem).search(exhaustive_schedules(CHOICES, 4))
+
+    assert any(r.resumed_from > 0 for r in results)
+    for result in results:
+        fresh = evaluate(BlockingProblem(), result.schedule, PrefixCache())
+        assert (fresh.rounds, fresh.decided) == (result.rounds, result.decided)
+
+
+def test_worst_case_ranked_first():
+    """Test: Longest blocking schedule is the worst case"""
+    search = AdversarySearch(BlockingProblem(max_rounds=6))
+    search.search(exhaustive_schedules(CHOICES, 3))
+
+    worst = search.best(1)[0]
+    assert worst.schedule == ("block", "block", "block")
+    assert worst.rounds == 4
+
+
+def test_undecided_ranked_before_decided():
+    """Test: Runs that never decide outrank slow decisions"""
+    results = AdversarySearch(BlockingProblem(max_rounds=3)).search(
+        [("pass", "pass", "pass"), ("block", "block", "block")]
+    )
+    assert results[0].schedule == ("block", "block", "block")
+    assert not results[0].decided
+
+
+# ============================================================================
+# Result Cache
+# ============================================================================
+
+
+def test_result_cache_roundtrip(tmp_path):
+    """Test: Results persist as JSON lines and reload with tuple schedules"""
+    cache = ResultCache(tmp_path, "p")
+    cache.add(SearchResult(("block", 2), 4.0, 4, True))
+
+    reloaded = ResultCache(tmp_path, "p")
+    assert len(reloaded) == 1
+    assert reloaded.get(("block", 2)).rounds == 4
+    assert reloaded.get(("block", 3)) is None
+
+
+def test_search_resumes_from_disk_cache(tmp_path):
+    """Test: A second search over the same candidates evaluates nothing"""
+    schedules = list(exhaustive_schedules(CHOICES, 3))
+    first = AdversarySearch(BlockingProblem(), cache_dir=tmp_path).search(schedules)
+
+    problem = BlockingProblem()
+    second = AdversarySearch(problem, cache_dir=tmp_path).search(schedules)
+
+    assert problem.builds == 0
+    assert [(r.schedule, r.rounds) for r in second] == [(r.schedule, r.rounds) for r in first]
+
+    reseeded = BlockingProblem(seed=9)
+    AdversarySearch(reseeded, cache_dir=tmp_path).search(schedules)
+    assert reseeded.builds == len(schedules)
+
+
+# ============================================================================
+# Process Pool
+# ============================================================================
+
+
+def test_process_pool_matches_in_process():
+    """Test: Worker processes produce the same results as in-process evaluation"""
+    schedules = list(exhaustive_schedules(CHOICES, 3))
+    local = AdversarySearch(BlockingProblem()).search(schedules)
+    remote = AdversarySearch(
+        BlockingProblem(),
+        workers=2,
+        batch_size=3,
+        mp_context=multiprocessing.get_context("spawn"),
+    ).search(schedules)
+
+    assert [(r.schedule, r.rounds) for r in remote] == [(r.schedule, r.rounds) for r in local]
+
+
+def test_invalid_workers_rejected():
+    """Test: Non-positive workers or batch_size raise ValueError"""
+    with pytest.raises(ValueError):
+        AdversarySearch(BlockingProblem(), workers=0)
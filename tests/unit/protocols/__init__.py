@@ -0,0 +1 @@
+# Protocol layer unit tests
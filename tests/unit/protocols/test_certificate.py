@@ -0,0 +1,202 @@
+"""
+Unit tests for signer-bitmap certificates and the shared message store
+
+Tests cover:
+- MessageStore deduplication and lookup, keyed by a locally computed value hash
+- CompactCertificate construction, signer bitmap and validation (sender range)
+- Pin validation and expiry with the GC watermark
+- Lazy materialization and Sequence behavior
+- CoD certificates backed by a store shared across nodes
+"""
+
+from dataclasses import replace
+
+import pytest
+
+from ba_simulator.protocols.certificate import (
+    CompactCertificate,
+    MessageStore,
+    certificate_key,
+)
+from ba_simulator.protocols.cod import CoD
+from ba_simulator.transport.message import Message
+
+
+def ready(sender_id, value="A", round=0, digest=None):
+    """Build a READY message."""
+    return Message(
+        ssid="cert-test",
+        round=round,
+        protocol_id="CoD",
+        phase="READY",
+        sender_id=sender_id,
+        value=value,
+        digest=digest,
+        aux={},
+        signature=bytes([sender_id]) * 64,
+    )
+
+
+# ============================================================================
+# MessageStore
+# ============================================================================
+
+
+def test_store_deduplicates_equivalent_messages():
+    """Test: Adding an equivalent message returns the first stored instance"""
+    store = MessageStore()
+    first = store.add(ready(1))
+
+    assert store.add(ready(1)) is first
+    assert len(store) == 1
+    assert store.get(certificate_key(first), 1) is first
+
+
+def test_store_keys_by_local_value_hash():
+    """Test: A forged digest field cannot make the store return another value's message"""
+    store = MessageStore()
+    forged = b"\x07" * 32
+    first = store.add(ready(1, value="A", digest=forged))
+    second = store.add(ready(1, value="B", digest=forged))
+
+    assert second is not first
+    assert (first.value, second.value) == ("A", "B")
+    assert certificate_key(first) != certificate_key(second)
+
+
+def test_store_get_missing_raises():
+    """Test: Looking up an unknown sender raises KeyError"""
+    with pytest.raises(KeyError):
+        MessageStore().get(certificate_key(ready(0)), 0)
+
+
+# ============================================================================
+# CompactCertificate
+# ============================================================================
+
+
+def test_certificate_bitmap_and_materialize():
+    """Test: Signers are kept as a bitmap and materialized in sender order"""
+    store = MessageStore()
+    cert = CompactCertificate.from_messages([ready(5), ready(0), ready(2)], store)
+
+    assert cert.signers == 0b100101
+    assert cert.signer_ids() == [0, 2, 5]
+    assert cert.has_signer(2) and not cert.has_signer(1)
+    assert [m.sender_id for m in cert.materialize()] == [0, 2, 5]
+
+
+def test_certificate_is_a_sequence():
+    """Test: len(), iteration and indexing behave like a sender-ordered list"""
+    cert = CompactCertificate.from_messages([ready(3), ready(1)], MessageStore())
+
+    assert len(cert) == 2
+    assert [m.sender_id for m in cert] == [1, 3]
+    assert cert[1].sender_id == 3
+    assert [m.sender_id for m in cert[:1]] == [1]
+
+
+def test_certificate_equality_ignores_store():
+    """Test: Certificates with equal header and signers compare equal"""
+    a = CompactCertificate.from_messages([ready(0), ready(1)], MessageStore())
+    b = CompactCertificate.from_messages([ready(1), ready(0)], MessageStore())
+    assert a == b
+
+
+def test_certificate_rejects_mixed_or_empty():
+    """Test: Mixed values or an empty message list raise ValueError"""
+    with pytest.raises(ValueError, match="share"):
+        CompactCertificate.from_messages([ready(0, "A"), ready(1, "B")], MessageStore())
+    with pytest.raises(ValueError, match="at least one"):
+        CompactCertificate.from_messages([], MessageStore())
+
+
+def test_certificate_rejects_out_of_range_senders():
+    """Test: Negative sender IDs and IDs >= n are rejected"""
+    with pytest.raises(ValueError, match="out of range"):
+        CompactCertificate.from_messages(
+            [ready(0), replace(ready(1), sender_id=-1)], MessageStore()
+        )
+    with pytest.raises(ValueError, match="out of range"):
+        CompactCertificate.from_messages([ready(0), ready(4)], MessageStore(n=4))
+    with pytest.raises(ValueError):
+        MessageStore(n=0)
+
+    cert = CompactCertificate.from_messages([ready(1)], MessageStore(n=4))
+    assert not cert.has_signer(-1)
+
+
+# ============================================================================
+# CoD Integration
+# ============================================================================
+
+
+def test_cod_nodes_share_store():
+    """Test: Nodes sharing a store keep one copy per message and compact certificates"""
+    store = MessageStore()
+    nodes = [CoD(n=4, t=1, node_id=i, message_store=store) for i in range(4)]
+    for node in nodes:
+        for sender in range(3):
+            node.process_message(ready(sender))
+        node.check_transition()
+
+    assert len(store) == 3
+    certificates = [node.get_output().certificate for node in nodes]
+    assert all(isinstance(cert, CompactCertificate) for cert in certificates)
+    assert all(cert == certificates[0] for cert in certificates)
+    assert certificates[0][0] is certificates[3][0]
+
+
+def test_store_release_through():
+    """Test: Messages of released rounds are dropped; later rounds stay"""
+    store = MessageStore()
+    for round in range(3):
+        for sender in range(4):
+            store.add(ready(sender, round=round))
+
+    assert store.release_through(1) == 8
+    assert len(store) == 4
+    assert store.get(certificate_key(ready(0, round=2)), 0).round == 2
+
+
+def test_store_release_keeps_certified_messages():
+    """Test: Messages referenced by a certificate survive release; the rest are dropped"""
+    store = MessageStore()
+    for sender in range(4):
+        store.add(ready(sender))
+    certificate = CompactCertificate.from_messages([ready(s) for s in range(3)], store)
+
+    assert store.release_through(0) == 1
+    assert [m.sender_id for m in certificate.materialize()] == [0, 1, 2]
+    with pytest.raises(KeyError):
+        store.get(certificate.key, 3)
+
+
+def test_pin_requires_stored_messages():
+    """Test: Pins are bounded by the store; unknown signers or negative bitmaps raise"""
+    store = MessageStore()
+    store.add(ready(0))
+    key = certificate_key(ready(0))
+
+    with pytest.raises(ValueError, match="not stored"):
+        store.pin(key, 0b10)
+    with pytest.raises(ValueError, match="not stored"):
+        store.pin(key, -1)
+    with pytest.raises(ValueError, match="not stored"):
+        store.pin(certificate_key(ready(0, round=5)), 0b1)
+    assert store.pinned() == 0
+
+
+def test_pins_expire_with_watermark():
+    """Test: release_pins_through() drops old pins and the messages they held"""
+    store = MessageStore()
+    old = CompactCertificate.from_messages([ready(s, round=0) for s in range(3)], store)
+    new = CompactCertificate.from_messages([ready(s, round=2) for s in range(3)], store)
+    store.release_through(2)
+
+    assert store.release_pins_through(1) == 3
+    assert store.pinned() == 1
+    assert len(store) == 3
+    assert [m.round for m in new.materialize()] == [2, 2, 2]
+    with pytest.raises(KeyError):
+        old.materialize()
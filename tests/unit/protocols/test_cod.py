@@ -0,0 +1,169 @@
+"""
+Unit tests for the scalar CoD state machine and ProtocolFSM base behavior
+
+Tests cover:
+- ProtocolFSM parameter validation and threshold helpers
+- First-message-per-sender acceptance
+- SEND -> ECHO, ECHO -> READY and READY amplification transitions
+- Certificate output and transition logging
+- Deterministic tie-breaking between values
+"""
+
+import pytest
+
+from ba_simulator.protocols.cod import CoD, CoDPhase
+from ba_simulator.protocols.protocol_fsm import ProtocolOutput, canonical_value_key
+from ba_simulator.transport.message import Message
+
+
+def cod_msg(phase, sender_id, value, protocol_id="CoD"):
+    """Build a CoD message."""
+    return Message(
+        ssid="cod-test",
+        round=0,
+        protocol_id=protocol_id,
+        phase=phase,
+        sender_id=sender_id,
+        value=value,
+        digest=None,
+        aux={},
+        signature=b"\x00" * 64,
+    )
+
+
+# ============================================================================
+# ProtocolFSM Base Behavior
+# ============================================================================
+
+
+def test_requires_n_greater_than_3t():
+    """Test: n <= 3t raises ValueError"""
+    with pytest.raises(ValueError):
+        CoD(n=3, t=1, node_id=0)
+
+
+def test_node_id_range_checked():
+    """Test: node_id outside [0, n) raises ValueError"""
+    with pytest.raises(ValueError):
+        CoD(n=4, t=1, node_id=4)
+
+
+def test_thresholds_computed_from_n_and_t():
+    """Test: Strong threshold is n-t and weak threshold is t+1"""
+    cod = CoD(n=7, t=2, node_id=0)
+
+    assert cod.strong_threshold == 5
+    assert cod.weak_threshold == 3
+
+
+def test_canonical_value_key_sorts_dict_keys():
+    """Test: Canonical keys ignore dict insertion order"""
+    assert canonical_value_key({"b": 1, "a": 2}) == canonical_value_key({"a": 2, "b": 1})
+
+
+# ============================================================================
+# Message Acceptance
+# ============================================================================
+
+
+def test_first_message_per_sender_and_phase_counts():
+    """Test: A second message from the same sender and phase is ignored"""
+    cod = CoD(n=4, t=1, node_id=0)
+
+    assert cod.process_message(cod_msg("SEND", 1, "A"))
+    assert not cod.process_message(cod_msg("SEND", 1, "B"))
+    assert cod.count_messages_from_distinct_senders("SEND") == 1
+
+
+def test_non_cod_messages_rejected():
+    """Test: Messages of other protocols or unknown phases are rejected"""
+    cod = CoD(n=4, t=1, node_id=0)
+
+    assert not cod.process_message(cod_msg("SEND", 1, "A", protocol_id="GDA"))
+    assert not cod.process_message(cod_msg("PROPOSE", 1, "A"))
+
+
+# ============================================================================
+# Transitions
+# ============================================================================
+
+
+def test_send_quorum_triggers_echo():
+    """Test: n-t matching SENDs produce an ECHO broadcast"""
+    cod = CoD(n=4, t=1, node_id=0)
+    for sender in range(3):
+        cod.process_message(cod_msg("SEND", sender, "A"))
+
+    assert cod.check_transition() == [("ECHO", "A")]
+    assert cod.get_current_phase() == CoDPhase.ECHO.value
+    assert cod.check_transition() == []
+
+
+def test_below_quorum_no_transition():
+    """Test: Fewer than n-t matching SENDs produce nothing"""
+    cod = CoD(n=4, t=1, node_id=0)
+    cod.process_message(cod_msg("SEND", 0, "A"))
+    cod.process_message(cod_msg("SEND", 1, "A"))
+    cod.process_message(cod_msg("SEND", 2, "B"))
+
+    assert cod.check_transition() == []
+
+
+def test_echo_quorum_triggers_ready():
+    """Test: n-t matching ECHOs produce a READY broadcast"""
+    cod = CoD(n=4, t=1, node_id=0)
+    for sender in range(3):
+        cod.process_message(cod_msg("ECHO", sender, "A"))
+
+    assert cod.check_transition() == [("READY", "A")]
+
+
+def test_ready_amplification():
+    """Test: t+1 READYs produce a READY broadcast without an ECHO quorum"""
+    cod = CoD(n=7, t=2, node_id=0)
+    for sender in range(3):
+        cod.process_message(cod_msg("READY", sender, "B"))
+
+    assert cod.check_transition() == [("READY", "B")]
+    assert "amplification" in cod.transitions[-1].justification
+
+
+def test_ready_quorum_produces_certificate():
+    """Test: n-t READYs produce an output with a sender-ordered certificate"""
+    cod = CoD(n=4, t=1, node_id=0)
+    for sender in (2, 0, 1):
+        cod.process_message(cod_msg("READY", sender, "A"))
+    cod.check_transition()
+
+    output = cod.get_output()
+    assert isinstance(output, ProtocolOutput)
+    assert output.value == "A"
+    assert [m.sender_id for m in output.certificate] == [0, 1, 2]
+    assert output.metadata["type"] == "certificate"
+    assert cod.is_terminal()
+
+
+def test_tie_break_prefers_smallest_canonical_key():
+    """Test: When two values cross together, the smallest canonical key wins"""
+    cod = CoD(n=7, t=2, node_id=0)
+    for sender in range(3):
+        cod.process_message(cod_msg("READY", sender, "Z"))
+    for sender in range(3, 6):
+        cod.process_message(cod_msg("READY", sender, "M"))
+
+    assert cod.check_transition() == [("READY", "M")]
+
+
+def test_transitions_logged():
+    """Test: Every phase change is recorded with a justification"""
+    cod = CoD(n=4, t=1, node_id=0)
+    for sender in range(3):
+        cod.process_message(cod_msg("SEND", sender, "A"))
+        cod.process_message(cod_msg("ECHO", sender, "A"))
+    cod.check_transition()
+
+    assert [(tr.from_phase, tr.to_phase) for tr in cod.transitions] == [
+        ("SEND", "ECHO"),
+        ("ECHO", "READY"),
+    ]
+    assert all(tr.justification for tr in cod.transitions)
@@ -0,0 +1,212 @@
+"""
+Unit tests for the bit-matrix CoD engine
+
+Tests cover:
+- Receive matrix bookkeeping and first-message-per-sender rule
+- Vectorized ECHO/READY/certificate threshold detection
+- Equivalence with the scalar per-node CoD FSM under randomized Byzantine deliveries
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from ba_simulator.protocols.cod import CoD
+from ba_simulator.protocols.cod_matrix import BitMatrixCoD
+from ba_simulator.transport.message import Message
+
+
+def cod_msg(phase, sender_id, value):
+    """Build a CoD message."""
+    return Message(
+        ssid="cod-matrix-test",
+        round=0,
+        protocol_id="CoD",
+        phase=phase,
+        sender_id=sender_id,
+        value=value,
+        digest=None,
+        aux={},
+        signature=b"\x00" * 64,
+    )
+
+
+# ============================================================================
+# Bookkeeping
+# ============================================================================
+
+
+def test_deliver_records_receivers():
+    """Test: deliver() marks exactly the targeted receivers"""
+    engine = BitMatrixCoD(n=4, t=1)
+    accepted = engine.deliver("SEND", sender=2, value="A", receivers=[0, 3])
+
+    assert accepted.tolist() == [True, False, False, True]
+    value_id = engine.intern("A")
+    assert engine.received["SEND"][value_id, :, 2].tolist() == [True, False, False, True]
+
+
+def test_second_value_from_sender_ignored():
+    """Test: Receivers keep only the first value per sender and phase"""
+    engine = BitMatrixCoD(n=4, t=1)
+    engine.deliver("SEND", sender=1, value="A", receivers=[0])
+    accepted = engine.deliver("SEND", sender=1, value="B", receivers=[0, 1])
+
+    assert accepted.tolist() == [False, True, False, False]
+
+
+def test_unknown_phase_rejected():
+    """Test: Non-CoD phases raise ValueError"""
+    engine = BitMatrixCoD(n=4, t=1)
+
+    with pytest.raises(ValueError):
+        engine.deliver("PROPOSE", sender=0, value="A")
+
+
+def test_requires_n_greater_than_3t():
+    """Test: n <= 3t raises ValueError"""
+    with pytest.raises(ValueError):
+        BitMatrixCoD(n=6, t=2)
+
+
+# ============================================================================
+# Threshold Detection
+# ============================================================================
+
+
+def test_step_finds_all_echoing_nodes():
+    """Test: A full SEND broadcast makes every node echo in one step"""
+    engine = BitMatrixCoD(n=7, t=2)
+    for sender in range(7):
+        engine.deliver_message(cod_msg("SEND", sender, "A"))
+
+    result = engine.step()
+
+    assert result.echo == {node: "A" for node in range(7)}
+    assert engine.step().echo == {}
+
+
+def test_step_partial_delivery():
+    """Test: Only nodes holding n-t SENDs echo"""
+    engine = BitMatrixCoD(n=4, t=1)
+    for sender in range(3):
+        engine.deliver("SEND", sender, "A", receivers=[0, 1])
+
+    assert engine.step().echo == {0: "A", 1: "A"}
+
+
+def test_full_run_certifies_all_nodes():
+    """Test: SEND, ECHO and READY broadcasts certify every node"""
+    n, t = 7, 2
+    engine = BitMatrixCoD(n, t)
+    for sender in range(n):
+        engine.deliver("SEND", sender, "V")
+    for phase in ("ECHO", "READY"):
+        step = engine.step()
+        broadcasts = step.echo if phase == "ECHO" else step.ready
+        for node, value in broadcasts.items():
+            engine.deliver(phase, node, value)
+
+    result = engine.step()
+
+    assert result.outputs == {node: "V" for node in range(n)}
+    assert engine.certificate_senders(0).tolist() == list(range(n))
+
+
+def test_certificate_senders_requires_output():
+    """Test: certificate_senders() raises for undecided nodes"""
+    with pytest.raises(ValueError):
+        BitMatrixCoD(n=4, t=1).certificate_senders(0)
+
+
+# ============================================================================
+# Equivalence with the Scalar FSM
+# ============================================================================
+
+
+class EquivalenceDriver:
+    """Drive scalar FSMs and the matrix engine with identical random deliveries."""
+
+    VALUES = ["A", "B", {"v": 1}]
+
+    def __init__(self, n, t, seed, unanimous):
+        self.n = n
+        self.rng = random.Random(seed)
+        self.byzantine = set(self.rng.sample(range(n), t))
+        self.fsms = [CoD(n, t, node) for node in range(n)]
+        self.engine = BitMatrixCoD(n, t)
+        self.pending = []
+        for sender in range(n):
+            if sender in self.byzantine:
+                for receiver in range(n):
+                    self.pending.append(["SEND", sender, self.rng.choice(self.VALUES), {receiver}])
+            else:
+                value = "A" if unanimous else self.VALUES[sender % 2]
+                self.pending.append(["SEND", sender, value, set(range(n))])
+
+    def deliver_batch(self):
+        """Deliver a random part of every pending broadcast to both backends."""
+        for item in self.pending:
+            now = {r for r in item[3] if self.rng.random() < 0.5}
+            item[3] -= now
+            if now:
+                phase, sender, value = item[:3]
+                self.engine.deliver(phase, sender, value, sorted(now))
+                for receiver in now:
+                    self.fsms[receiver].process_message(cod_msg(phase, sender, value))
+        self.pending = [item for item in self.pending if item[3]]
+
+    def scalar_step(self):
+        """Run check_transition() on every scalar FSM and collect the results."""
+        echo, ready, outputs = {}, {}, {}
+        for node, fsm in enumerate(self.fsms):
+            had_output = fsm.get_output() is not None
+            for phase, value in fsm.check_transition():
+                (echo if phase == "ECHO" else ready)[node] = value
+            if not had_output and fsm.get_output() is not None:
+                outputs[node] = fsm.get_output().value
+        return echo, ready, outputs
+
+    def broadcast(self, phase, broadcasts):
+        """Queue broadcasts; Byzantine nodes send random values to random halves."""
+        for node, value in broadcasts.items():
+            if node in self.byzantine:
+                receivers = set(self.rng.sample(range(self.n), self.n // 2))
+                self.pending.append([phase, node, self.rng.choice(self.VALUES), receivers])
+            else:
+                self.pending.append([phase, node, value, set(range(self.n))])
+
+    def run(self, max_steps=200):
+        """Run until no deliveries are pending, comparing every step."""
+        for _ in range(max_steps):
+            if not self.pending:
+                break
+            self.deliver_batch()
+            step = self.engine.step()
+            assert (step.echo, step.ready, step.outputs) == self.scalar_step()
+            self.broadcast("ECHO", step.echo)
+            self.broadcast("READY", step.ready)
+
+        for node, fsm in enumerate(self.fsms):
+            output = fsm.get_output()
+            if output is None:
+                assert self.engine.output_value[node] == -1
+            else:
+                senders = [m.sender_id for m in output.certificate]
+                assert np.array_equal(self.engine.certificate_senders(node), senders)
+        return self.fsms
+
+
+@pytest.mark.parametrize("seed", range(12))
+@pytest.mark.parametrize("unanimous", [True, False])
+def test_matrix_engine_matches_scalar_fsm(seed, unanimous):
+    """Test: Matrix engine reproduces scalar FSM broadcasts and outputs step by step"""
+    EquivalenceDriver(n=7, t=2, seed=seed, unanimous=unanimous).run()
+
+
+def test_honest_nodes_certify_in_equivalence_scenario():
+    """Test: The randomized driver actually reaches certification"""
+    fsms = EquivalenceDriver(n=10, t=3, seed=99, unanimous=True).run()
+
+    assert all(fsm.get_output() is not None for fsm in fsms)
@@ -0,0 +1,175 @@
+"""
+Unit tests for the equivocation detection index
+
+Tests cover:
+- FIRST / DUPLICATE / CONFLICT / SUPPRESSED classification
+- Key isolation across rounds, protocols, phases and senders
+- Proof contents (both signed messages)
+- Digest handling (canonical value hash; digest field only for digest-only messages)
+- Integration with the CoD FSM
+"""
+
+from ba_simulator.protocols.cod import CoD
+from ba_simulator.protocols.equivocation import (
+    EquivocationIndex,
+    EquivocationStatus,
+    value_digest,
+)
+from ba_simulator.transport.message import Message
+
+
+def make_msg(value, sender_id=1, round=0, protocol_id="CoD", phase="ECHO", digest=None, sig=0):
+    """Build a signed message (signature bytes vary with ``sig``)."""
+    return Message(
+        ssid="equiv-test",
+        round=round,
+        protocol_id=protocol_id,
+        phase=phase,
+        sender_id=sender_id,
+        value=value,
+        digest=digest,
+        aux={},
+        signature=bytes([sig]) * 64,
+    )
+
+
+# ============================================================================
+# Classification
+# ============================================================================
+
+
+def test_first_then_duplicate():
+    """Test: The first message is FIRST; the same value again is DUPLICATE"""
+    index = EquivocationIndex()
+
+    assert index.observe(make_msg("A")) is EquivocationStatus.FIRST
+    assert index.observe(make_msg("A", sig=2)) is EquivocationStatus.DUPLICATE
+    assert index.proofs == []
+
+
+def test_conflict_records_proof():
+    """Test: A different value for the same key is a CONFLICT with both messages kept"""
+    index = EquivocationIndex()
+    first = make_msg("A", sig=1)
+    second = make_msg("B", sig=2)
+    index.observe(first)
+
+    assert index.observe(second) is EquivocationStatus.CONFLICT
+    proof = index.proof_for(1, 0, "CoD", "ECHO")
+    assert proof.first is first
+    assert proof.conflicting is second
+    assert proof.sender_id == 1
+    assert index.equivocators() == [1]
+
+
+def test_suppressed_after_conflict():
+    """Test: Once a key equivocated, every further message for it is SUPPRESSED"""
+    index = EquivocationIndex()
+    index.observe(make_msg("A"))
+    index.observe(make_msg("B"))
+
+    assert index.observe(make_msg("A")) is EquivocationStatus.SUPPRESSED
+    assert index.observe(make_msg("C")) is EquivocationStatus.SUPPRESSED
+    assert len(index.proofs) == 1
+
+
+def test_keys_are_isolated():
+    """Test: Different round, protocol, phase or sender never conflict"""
+    index = EquivocationIndex()
+    index.observe(make_msg("A"))
+
+    assert index.observe(make_msg("B", round=1)) is EquivocationStatus.FIRST
+    assert index.observe(make_msg("B", protocol_id="GDA")) is EquivocationStatus.FIRST
+    assert index.observe(make_msg("B", phase="READY")) is EquivocationStatus.FIRST
+    assert index.observe(make_msg("B", sender_id=2)) is EquivocationStatus.FIRST
+    assert not index.is_equivocating(1, 0, "CoD", "ECHO")
+
+
+def test_flood_of_conflicts_stays_linear():
+    """Test: A flooding equivocator yields one proof and constant index size per key"""
+    index = EquivocationIndex()
+    for i in range(1000):
+        index.observe(make_msg(f"v{i}"))
+
+    assert len(index) == 1
+    assert len(index.proofs) == 1
+
+
+# ============================================================================
+# Digests
+# ============================================================================
+
+
+def test_value_digest_ignores_sender_digest_when_value_present():
+    """Test: The digest is computed locally from the value, not taken from the sender"""
+    assert value_digest(make_msg("A", digest=b"\x07" * 32)) == value_digest(make_msg("A"))
+
+
+def test_value_digest_uses_digest_field_for_digest_only_message():
+    """Test: A message carrying only a digest is identified by that digest"""
+    assert value_digest(make_msg(None, digest=b"\x07" * 32)) == b"\x07" * 32
+
+
+def test_forged_digest_does_not_hide_conflict():
+    """Test: Two values sent with the same digest field are still a CONFLICT"""
+    index = EquivocationIndex()
+    index.observe(make_msg("A", digest=b"\x07" * 32))
+
+    assert index.observe(make_msg("B", digest=b"\x07" * 32)) is EquivocationStatus.CONFLICT
+    assert len(index.proofs) == 1
+
+
+def test_value_digest_is_canonical():
+    """Test: Dict values with different key order have the same digest"""
+    assert value_digest(make_msg({"a": 1, "b": 2})) == value_digest(make_msg({"b": 2, "a": 1}))
+
+
+# ============================================================================
+# CoD Integration
+# ============================================================================
+
+
+def test_cod_ignores_conflicting_echo_and_keeps_proof():
+    """Test: CoD counts only the first ECHO of an equivocator and records the proof"""
+    cod = CoD(n=4, t=1, node_id=0)
+
+    assert cod.process_message(make_msg("A", sender_id=3))
+    assert not cod.process_message(make_msg("B", sender_id=3))
+    assert cod.messages["ECHO"][3].value == "A"
+    assert [p.sender_id for p in cod.equivocation_proofs()] == [3]
+
+
+def test_cod_keeps_first_value_of_sender_across_rounds():
+    """Test: A later-round message of the same sender and phase cannot replace the value"""
+    cod = CoD(n=4, t=1, node_id=0)
+
+    assert cod.process_message(make_msg("A", sender_id=3, round=0))
+    assert not cod.process_message(make_msg("B", sender_id=3, round=1))
+    assert cod.messages["ECHO"][3].value == "A"
+
+
+def test_cod_shares_index_across_instances():
+    """Test: A shared index exposes proofs from every CoD instance of a node"""
+    shared = EquivocationIndex()
+    first_round = CoD(n=4, t=1, node_id=0, equivocation_index=shared)
+    second_round = CoD(n=4, t=1, node_id=0, equivocation_index=shared)
+
+    first_round.process_message(make_msg("A", sender_id=2, round=0))
+    second_round.process_message(make_msg("A", sender_id=2, round=1))
+    second_round.process_message(make_msg("B", sender_id=2, round=1))
+
+    assert shared.equivocators() == [2]
+    assert shared.is_equivocating(2, 1, "CoD", "ECHO")
+
+
+def test_release_through_drops_old_keys_keeps_proofs():
+    """Test: Released rounds leave the index; recorded proofs survive"""
+    index = EquivocationIndex()
+    index.observe(make_msg("A", round=0))
+    index.observe(make_msg("B", round=0))
+    index.observe(make_msg("A", round=3))
+
+    assert index.release_through(2) == 1
+    assert len(index) == 1
+    assert len(index.proofs) == 1
+    assert index.observe(make_msg("A", round=3)) == EquivocationStatus.DUPLICATE
@@ -0,0 +1,221 @@
+"""
+Unit tests for GDA grade computation (scalar and batched)
+
+Tests cover:
+- compute_grade() thresholds, including the exact n-t and t+1 boundaries
+- grade_proposals() most-common-value selection and tie-breaking
+- grade_matrix() vectorized grading of a value-id matrix
+- grade_batch() regular rows and scalar fallback for irregular views
+- grade_batch() keeps per-view representations and canonicalizes each value once
+- GDA state machine PROPOSE -> GRADE_VOTE -> graded output
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from ba_simulator.protocols.gda import GDA, GDAPhase, compute_grade, grade_proposals
+from ba_simulator.protocols import gda_batch
+from ba_simulator.protocols.gda_batch import MISSING, grade_batch, grade_matrix
+from ba_simulator.protocols.protocol_fsm import canonical_value_key
+from ba_simulator.transport.message import Message
+
+
+def gda_msg(phase, sender_id, value):
+    """Build a GDA message."""
+    return Message(
+        ssid="gda-test",
+        round=0,
+        protocol_id="GDA",
+        phase=phase,
+        sender_id=sender_id,
+        value=value,
+        digest=None,
+        aux={},
+        signature=b"\x00" * 64,
+    )
+
+
+# ============================================================================
+# compute_grade()
+# ============================================================================
+
+
+@pytest.mark.parametrize(
+    "count,expected",
+    [(7, 2), (5, 2), (4, 1), (3, 1), (2, 0), (0, 0)],
+)
+def test_compute_grade_thresholds(count, expected):
+    """Test: n=7, t=2 -> grade 2 at >=5, grade 1 at 3..4, grade 0 below 3"""
+    assert compute_grade(count, n=7, t=2) == expected
+
+
+# ============================================================================
+# grade_proposals()
+# ============================================================================
+
+
+def test_grade_proposals_most_common_value():
+    """Test: The most common value is graded"""
+    proposals = {0: "A", 1: "A", 2: "A", 3: "B"}
+
+    assert grade_proposals(proposals, n=4, t=1) == ("A", 2)
+
+
+def test_grade_proposals_weak_support():
+    """Test: t+1 supporters give grade 1"""
+    proposals = {0: "A", 1: "A", 2: "B", 3: "C"}
+
+    assert grade_proposals(proposals, n=4, t=1) == ("A", 1)
+
+
+def test_grade_proposals_tie_breaks_on_canonical_key():
+    """Test: Equally common values resolve to the smallest canonical key"""
+    proposals = {0: "B", 1: "A", 2: "B", 3: "A"}
+
+    assert grade_proposals(proposals, n=4, t=1) == ("A", 1)
+
+
+def test_grade_proposals_empty_inbox():
+    """Test: An empty inbox grades (None, 0)"""
+    assert grade_proposals({}, n=4, t=1) == (None, 0)
+
+
+# ============================================================================
+# grade_matrix()
+# ============================================================================
+
+
+def test_grade_matrix_rows():
+    """Test: Each row is graded independently in one call"""
+    matrix = np.array(
+        [
+            [0, 0, 0, 1],
+            [0, 1, 1, MISSING],
+            [MISSING, MISSING, MISSING, MISSING],
+            [2, 1, 0, 2],
+        ]
+    )
+
+    best, grades = grade_matrix(matrix, n=4, t=1)
+
+    assert best.tolist() == [0, 1, MISSING, 2]
+    assert grades.tolist() == [2, 1, 0, 1]
+
+
+def test_grade_matrix_empty():
+    """Test: A matrix without proposals yields MISSING and grade 0"""
+    best, grades = grade_matrix(np.full((3, 4), MISSING), n=4, t=1)
+
+    assert best.tolist() == [MISSING] * 3
+    assert grades.tolist() == [0] * 3
+
+
+# ============================================================================
+# grade_batch()
+# ============================================================================
+
+
+def test_grade_batch_matches_scalar():
+    """Test: Batched grades equal per-node scalar grades"""
+    views = [
+        {0: "A", 1: "A", 2: "A", 3: "B"},
+        {0: {"x": 1}, 1: {"x": 1}, 3: "B"},
+        {},
+        {2: "C"},
+    ]
+
+    assert grade_batch(views, n=4, t=1) == [grade_proposals(v, 4, 1) for v in views]
+
+
+def test_grade_batch_irregular_view_falls_back():
+    """Test: Sender IDs outside [0, n) are graded by the scalar path"""
+    views = [{0: "A", 9: "A", 10: "A"}, {0: "B", 1: "B", 2: "B"}]
+
+    assert grade_batch(views, n=4, t=1) == [("A", 2), ("B", 2)]
+
+
+def test_grade_batch_tie_break_ignores_first_seen_order():
+    """Test: Ties resolve by canonical key even when the larger key is seen first"""
+    views = [{0: "B", 1: "A"}, {0: "B", 1: "B", 2: "A", 3: "A"}]
+
+    assert grade_batch(views, n=4, t=1) == [grade_proposals(v, 4, 1) for v in views]
+    assert grade_batch(views, n=4, t=1)[1][0] == "A"
+
+
+def test_grade_batch_distinguishes_equal_hashing_values():
+    """Test: True and 1 hash alike but have different canonical keys"""
+    views = [{0: True, 1: 1, 2: 1}]
+
+    assert grade_batch(views, n=4, t=1) == [(1, 1)]
+
+
+def test_grade_batch_keeps_each_views_representation():
+    """Test: Canonically equal tuple and list proposals grade to each view's own value"""
+    views = [{0: (1, 2), 1: (1, 2)}, {2: [1, 2], 3: [1, 2], 0: (1, 2)}, {1: [1, 2], 2: (1, 2)}]
+
+    batched = grade_batch(views, n=4, t=1)
+
+    assert batched == [grade_proposals(v, 4, 1) for v in views]
+    assert [type(value) for value, _ in batched] == [tuple, list, list]
+
+
+def test_grade_batch_canonicalizes_each_value_once(monkeypatch):
+    """Test: Batched grading of 128 views of n=128 serializes 3 distinct values 3 times"""
+    n, t = 128, 42
+    rng = random.Random(7)
+    views = [{j: rng.choice(["A", "B", "C"]) for j in range(n)} for _ in range(n)]
+    expected = [grade_proposals(view, n, t) for view in views]
+    calls = []
+
+    def counting_key(value):
+        calls.append(value)
+        return canonical_value_key(value)
+
+    monkeypatch.setattr(gda_batch, "canonical_value_key", counting_key)
+
+    assert grade_batch(views, n, t) == expected
+    assert len(calls) == 3
+
+
+# ============================================================================
+# GDA State Machine
+# ============================================================================
+
+
+def test_gda_grades_after_strong_propose_quorum():
+    """Test: n-t PROPOSE messages trigger one GRADE_VOTE broadcast"""
+    gda = GDA(n=4, t=1, node_id=0)
+    for sender, value in enumerate(["A", "A"]):
+        gda.process_message(gda_msg(GDAPhase.PROPOSE.value, sender, value))
+    assert gda.check_transition() == []
+
+    gda.process_message(gda_msg(GDAPhase.PROPOSE.value, 2, "B"))
+    assert gda.check_transition() == [("GRADE_VOTE", {"value": "A", "grade": 1})]
+    assert gda.get_current_phase() == GDAPhase.GRADE_VOTE.value
+    assert gda.check_transition() == []
+
+
+def test_gda_full_execution_outputs_grade():
+    """Test: PROPOSE -> GRADE_VOTE -> output with the grade in metadata"""
+    gda = GDA(n=4, t=1, node_id=0)
+    for sender in range(4):
+        gda.process_message(gda_msg(GDAPhase.PROPOSE.value, sender, "A"))
+    gda.check_transition()
+    for sender in (3, 1, 0):
+        gda.process_message(gda_msg(GDAPhase.GRADE_VOTE.value, sender, {"value": "A"}))
+    gda.check_transition()
+
+    output = gda.get_output()
+    assert output.value == "A"
+    assert output.metadata == {"grade": 2}
+    assert [m.sender_id for m in output.certificate] == [0, 1, 3]
+
+
+def test_gda_ignores_duplicate_senders():
+    """Test: Only the first PROPOSE per sender counts"""
+    gda = GDA(n=4, t=1, node_id=0)
+    assert gda.process_message(gda_msg(GDAPhase.PROPOSE.value, 1, "A"))
+    assert not gda.process_message(gda_msg(GDAPhase.PROPOSE.value, 1, "B"))
+    assert gda.count_messages_from_distinct_senders(GDAPhase.PROPOSE.value) == 1
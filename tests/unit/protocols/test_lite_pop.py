@@ -0,0 +1,172 @@
+"""
+Unit tests for Lite PoP participation digests
+
+Tests cover:
+- Incremental accumulator equals the from-scratch digest
+- Order independence and duplicate handling
+- Per-round digest caching and invalidation
+- Embedding in aux and verification (including local chain checks)
+- Round release: compaction to digests, late observations ignored
+"""
+
+import random
+
+from ba_simulator.protocols.lite_pop import (
+    DIGEST_KEY,
+    LitePoP,
+    ParticipationAccumulator,
+    compute_participation_digest,
+)
+from ba_simulator.transport.message import Message
+
+
+def make_msg(sender_id, round=1, aux=None):
+    """Build a PoP message."""
+    return Message(
+        ssid="pop-test",
+        round=round,
+        protocol_id="PoP",
+        phase="PARTICIPATE",
+        sender_id=sender_id,
+        value=None,
+        digest=None,
+        aux=aux if aux is not None else {},
+        signature=b"\x00" * 64,
+    )
+
+
+# ============================================================================
+# Accumulator
+# ============================================================================
+
+
+def test_incremental_matches_full_recompute():
+    """Test: The accumulator digest equals compute_participation_digest()"""
+    messages = [make_msg(s, round=5) for s in (4, 0, 9, 2)]
+    accumulator = ParticipationAccumulator(5)
+    for msg in messages:
+        accumulator.add(msg.sender_id)
+
+    assert accumulator.digest() == compute_participation_digest(5, messages)
+
+
+def test_order_independent_and_duplicate_safe():
+    """Test: Arrival order and repeated senders do not change the digest"""
+    senders = list(range(20))
+    shuffled = senders + senders[:5]
+    random.Random(7).shuffle(shuffled)
+    a, b = ParticipationAccumulator(2), ParticipationAccumulator(2)
+    for s in senders:
+        a.add(s)
+    added = [b.add(s) for s in shuffled]
+
+    assert a.digest() == b.digest()
+    assert added.count(True) == 20
+    assert len(b) == 20
+
+
+def test_digest_binds_round_and_set():
+    """Test: Different rounds or sender sets give different digests"""
+    assert compute_participation_digest(1, [make_msg(0)]) != compute_participation_digest(
+        2, [make_msg(0)]
+    )
+    assert compute_participation_digest(1, [make_msg(0)]) != compute_participation_digest(
+        1, [make_msg(1)]
+    )
+
+
+def test_cached_digest_invalidated_on_new_sender():
+    """Test: The cached digest is reused until a new sender arrives"""
+    accumulator = ParticipationAccumulator(0)
+    accumulator.add(1)
+    first = accumulator.digest()
+    assert accumulator.digest() is first
+
+    accumulator.add(1)
+    assert accumulator.digest() is first
+    accumulator.add(2)
+    assert accumulator.digest() != first
+
+
+# ============================================================================
+# Embedding and Verification
+# ============================================================================
+
+
+def test_embed_uses_previous_round_digest():
+    """Test: embed() stores the previous round digest as hex in aux"""
+    pop = LitePoP()
+    for s in range(4):
+        pop.observe(make_msg(s, round=3))
+
+    out = pop.embed(make_msg(0, round=4, aux={"other": 1}))
+
+    assert out.aux["other"] == 1
+    assert bytes.fromhex(out.aux[DIGEST_KEY]) == pop.participation_digest(3)
+    assert pop.participants(3) == {0, 1, 2, 3}
+
+
+def test_embed_does_not_mutate_original():
+    """Test: The original message aux is left untouched"""
+    original = make_msg(0, round=1)
+    LitePoP().embed(original)
+    assert DIGEST_KEY not in original.aux
+
+
+def test_verify_chain_matching_views():
+    """Test: Nodes with the same participation view verify each other's messages"""
+    sender, receiver = LitePoP(), LitePoP()
+    for s in (0, 1, 2):
+        sender.observe_sender(0, s)
+    for s in (2, 0, 1):
+        receiver.observe_sender(0, s)
+
+    assert receiver.verify_chain(sender.embed(make_msg(0, round=1)))
+
+
+def test_verify_chain_diverging_views():
+    """Test: A different participation view fails verification"""
+    sender, receiver = LitePoP(), LitePoP()
+    sender.observe_sender(0, 0)
+    receiver.observe_sender(0, 1)
+
+    assert not receiver.verify_chain(sender.embed(make_msg(0, round=1)))
+
+
+def test_verify_rejects_missing_or_malformed():
+    """Test: Missing, non-string or non-hex digests are rejected"""
+    expected = LitePoP().participation_digest(0)
+    assert not LitePoP.verify_participation(make_msg(0), expected)
+    assert not LitePoP.verify_participation(make_msg(0, aux={DIGEST_KEY: 5}), expected)
+    assert not LitePoP.verify_participation(make_msg(0, aux={DIGEST_KEY: "zz"}), expected)
+
+
+def test_release_through_keeps_digests():
+    """Test: Released rounds are compacted to their digests"""
+    pop = LitePoP()
+    for sender in range(5):
+        pop.observe(make_msg(sender, round=1))
+        pop.observe(make_msg(sender, round=2))
+    digest = pop.participation_digest(1)
+
+    assert pop.release_through(1) == 5
+    assert pop.participants(1) == set()
+    assert pop.participation_digest(1) == digest
+    assert pop.verify_chain(pop.embed(make_msg(0, round=2)))
+    assert pop.participants(2) == set(range(5))
+
+
+def test_late_observation_of_released_round_ignored():
+    """Test: A late sender of a released round does not replace the compacted digest"""
+    pop = LitePoP()
+    for round in range(5):
+        for sender in range(4):
+            pop.observe_sender(round, sender)
+    digest = pop.participation_digest(3)
+    pop.release_through(3)
+
+    assert not pop.observe_sender(3, 0)
+    assert not pop.observe(make_msg(9, round=2))
+    assert pop.participation_digest(3) == digest
+    assert pop.participants(3) == set()
+    assert pop.observe_sender(4, 9)
@@ -0,0 +1,204 @@
+"""
+Unit tests for ProtocolFSM dispatch tables and transition profiling
+
+Tests cover:
+- Table compilation from @on_message / @transition decorators
+- Dispatch by message phase and protocol ID
+- Override semantics in subclasses
+- Inbox release below the GC watermark
+- Per-instance profiling hooks (attach, report, detach)
+"""
+
+from ba_simulator.protocols.cod import CoD
+from ba_simulator.protocols.protocol_fsm import (
+    ProtocolFSM,
+    TransitionProfiler,
+    on_message,
+    transition,
+)
+from ba_simulator.transport.message import Message
+
+
+class PingFSM(ProtocolFSM):
+    """Two-phase FSM: PING messages trigger a PONG broadcast."""
+
+    protocol_id = "PING"
+
+    def __init__(self, n, t, node_id):
+        super().__init__(n, t, node_id)
+        self.ponged = False
+
+    def initial_phase(self):
+        return "PING"
+
+    @on_message("PING", "PONG")
+    def _store(self, msg):
+        self.messages[msg.phase][msg.sender_id] = msg
+        return True
+
+    @transition("PING")
+    def _pong(self):
+        if self.ponged or not self.has_threshold("PING", self.strong_threshold):
+            return []
+        self.ponged = True
+        return [("PONG", "pong")]
+
+    @transition("PONG")
+    def _done(self):
+        return []
+
+    def get_output(self):
+        return None
+
+
+class QuietPingFSM(PingFSM):
+    """Overrides one transition without registering it."""
+
+    def _done(self):
+        return [("NEVER", None)]
+
+
+def msg(phase, sender_id, protocol_id="PING", round=0):
+    """Build a message."""
+    return Message(
+        ssid="fsm-test",
+        round=round,
+        protocol_id=protocol_id,
+        phase=phase,
+        sender_id=sender_id,
+        value=None,
+        digest=None,
+        aux={},
+        signature=b"\x00" * 64,
+    )
+
+
+class FakeClock:
+    """Clock advancing one second per reading."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        self.now += 1.0
+        return self.now
+
+
+# ============================================================================
+# Dispatch Tables
+# ============================================================================
+
+
+def test_tables_compiled_at_class_creation():
+    """Test: Handlers are keyed by phase and transitions kept in definition order"""
+    assert set(PingFSM._message_table) == {"PING", "PONG"}
+    assert [(phase, name) for phase, name, _ in PingFSM._transition_table] == [
+        ("PING", "_pong"),
+        ("PONG", "_done"),
+    ]
+    assert [name for _, name, _ in CoD._transition_table] == [
+        "_echo_on_send",
+        "_ready_on_echo",
+        "_output_on_ready",
+    ]
+
+
+def test_dispatch_by_phase_and_protocol():
+    """Test: Unknown phases and foreign protocols are rejected without a handler call"""
+    fsm = PingFSM(n=4, t=1, node_id=0)
+
+    assert fsm.process_message(msg("PING", 1))
+    assert not fsm.process_message(msg("OTHER", 1))
+    assert not fsm.process_message(msg("PING", 2, protocol_id="CoD"))
+
+
+def test_check_transition_runs_table():
+    """Test: check_transition() concatenates actions of all registered checks"""
+    fsm = PingFSM(n=4, t=1, node_id=0)
+    for sender in range(3):
+        fsm.process_message(msg("PING", sender))
+
+    assert fsm.check_transition() == [("PONG", "pong")]
+    assert fsm.check_transition() == []
+
+
+def test_undecorated_override_unregisters_transition():
+    """Test: Overriding a transition without the decorator removes it from the table"""
+    assert [name for _, name, _ in QuietPingFSM._transition_table] == ["_pong"]
+    assert QuietPingFSM(n=4, t=1, node_id=0).check_transition() == []
+
+
+def test_release_through_drops_old_inbox():
+    """Test: Inbox messages of released rounds are dropped and late ones ignored"""
+    fsm = PingFSM(n=4, t=1, node_id=0)
+    for round in range(3):
+        fsm.process_message(msg("PING", round, round=round))
+    fsm.process_message(msg("PONG", 3, round=1))
+
+    assert fsm.release_through(1) == 3
+    assert list(fsm.messages["PING"]) == [2]
+    assert fsm.messages["PONG"] == {}
+    assert not fsm.process_message(msg("PING", 0, round=1))
+    assert fsm.process_message(msg("PING", 0, round=2))
+
+
+# ============================================================================
+# Profiling
+# ============================================================================
+
+
+def test_profiler_records_calls_and_time():
+    """Test: Profiled instances record calls and time per (protocol, phase, name)"""
+    profiler = TransitionProfiler(clock=FakeClock())
+    fsm = PingFSM(n=4, t=1, node_id=0)
+    fsm.attach_profiler(profiler)
+
+    fsm.process_message(msg("PING", 0))
+    fsm.process_message(msg("PONG", 1))
+    fsm.check_transition()
+
+    stats = profiler.stats
+    assert stats[("PING", "PING", "_store")].calls == 1
+    assert stats[("PING", "PONG", "_store")].calls == 1
+    assert stats[("PING", "PING", "_pong")].calls == 1
+    assert stats[("PING", "PONG", "_done")].total_time == 1.0
+
+
+def test_profiling_is_per_instance():
+    """Test: Attaching a profiler leaves class tables and other instances untouched"""
+    profiler = TransitionProfiler()
+    profiled = PingFSM(n=4, t=1, node_id=0)
+    plain = PingFSM(n=4, t=1, node_id=1)
+    profiled.attach_profiler(profiler)
+
+    plain.process_message(msg("PING", 0))
+    plain.check_transition()
+
+    assert plain._message_table is PingFSM._message_table
+    assert all(s.calls == 0 for s in profiler.stats.values())
+
+
+def test_detach_and_reset():
+    """Test: detach_profiler() restores class tables; reset() clears counters"""
+    profiler = TransitionProfiler()
+    fsm = PingFSM(n=4, t=1, node_id=0)
+    fsm.attach_profiler(profiler)
+    fsm.check_transition()
+    fsm.detach_profiler()
+    fsm.check_transition()
+
+    assert fsm._transition_table is PingFSM._transition_table
+    assert profiler.stats[("PING", "PING", "_pong")].calls == 1
+    profiler.reset()
+    assert profiler.stats[("PING", "PING", "_pong")].calls == 0
+
+
+def test_report_sorted_slowest_first():
+    """Test: report() orders entries by cumulative time"""
+    profiler = TransitionProfiler(clock=FakeClock())
+    fsm = CoD(n=4, t=1, node_id=0)
+    fsm.attach_profiler(profiler)
+    fsm.check_transition()
+    profiler.stats[("CoD", "READY", "_output_on_ready")].total_time += 5
+
+    assert profiler.report()[0][0] == ("CoD", "READY", "_output_on_ready")
@@ -0,0 +1,136 @@
+"""
+Unit tests for the candidate-value domain
+
+Tests cover:
+- ValueInterner ID assignment by canonical key and the (type, value) token cache
+- CandidateSet set algebra, pruning and membership
+- Rejection of sets from different interners
+- Deterministic smallest-key choice
+"""
+
+import pytest
+
+from ba_simulator.protocols import value_domain
+from ba_simulator.protocols.protocol_fsm import canonical_value_key
+from ba_simulator.protocols.value_domain import CandidateSet, ValueInterner
+
+# ============================================================================
+# ValueInterner
+# ============================================================================
+
+
+def test_interner_assigns_dense_stable_ids():
+    """Test: Equal values share an ID; new values get the next one"""
+    interner = ValueInterner()
+
+    assert interner.intern({"a": 1, "b": [1, 2]}) == 0
+    assert interner.intern("x") == 1
+    assert interner.intern({"b": [1, 2], "a": 1}) == 0
+    assert len(interner) == 2
+    assert interner.value_of(1) == "x"
+
+
+def test_interner_lookup_without_interning():
+    """Test: id_of() and membership do not allocate IDs"""
+    interner = ValueInterner()
+    interner.intern("A")
+
+    assert interner.id_of("B") is None
+    assert "A" in interner and "B" not in interner
+    assert len(interner) == 1
+
+
+def test_repeat_lookups_hit_token_cache(monkeypatch):
+    """Test: Hashable values are canonicalized once; True and 1 keep separate IDs"""
+    calls = []
+
+    def counting_key(value):
+        calls.append(value)
+        return canonical_value_key(value)
+
+    monkeypatch.setattr(value_domain, "canonical_value_key", counting_key)
+    interner = ValueInterner()
+    for _ in range(10):
+        interner.intern(("block", 1))
+        interner.id_of(("block", 1))
+    assert interner.id_of(True) is None
+
+    assert interner.intern(1) != interner.intern(True)
+    assert len(calls) == 4
+    assert interner.intern(["block", 1]) == interner.id_of(("block", 1)) == 0
+
+
+# ============================================================================
+# CandidateSet
+# ============================================================================
+
+
+def test_set_algebra():
+    """Test: &, | and - operate on the bitsets"""
+    domain = ValueInterner()
+    abc = CandidateSet.of(domain, ["A", "B", "C"])
+    bd = CandidateSet.of(domain, ["B", "D"])
+
+    assert (abc & bd).values() == ["B"]
+    assert (abc | bd).values() == ["A", "B", "C", "D"]
+    assert (abc - bd).values() == ["A", "C"]
+
+
+def test_prune_and_restrict():
+    """Test: prune() removes and restrict() keeps the given values; unknown values are ignored"""
+    domain = ValueInterner()
+    viable = CandidateSet.everything(domain)
+    assert not viable
+
+    CandidateSet.of(domain, ["A", "B", "C"])
+    viable = CandidateSet.everything(domain)
+
+    assert viable.prune(["B", "zzz"]).values() == ["A", "C"]
+    assert viable.restrict(["C", "zzz"]).values() == ["C"]
+    assert "zzz" not in domain
+
+
+def test_membership_and_len():
+    """Test: Membership checks by value and by ID"""
+    domain = ValueInterner()
+    viable = CandidateSet.of(domain, [{"v": 1}, {"v": 2}]).prune([{"v": 1}])
+
+    assert {"v": 2} in viable
+    assert {"v": 1} not in viable
+    assert {"v": 3} not in viable
+    assert viable.contains_id(1) and not viable.contains_id(0)
+    assert len(viable) == 1
+
+
+def test_choose_smallest_canonical_key():
+    """Test: choose() follows canonical key order, not ID order"""
+    domain = ValueInterner()
+    viable = CandidateSet.of(domain, ["Z", "M", "Q"])
+
+    assert viable.choose() == "M"
+    assert CandidateSet(domain).choose() is None
+
+
+def test_equality_by_bits():
+    """Test: Sets over the same interner compare by their bits"""
+    domain = ValueInterner()
+    assert CandidateSet.of(domain, ["A", "B"]) == CandidateSet.of(domain, ["B", "A"])
+
+
+def test_sets_of_different_interners_rejected():
+    """Test: Combining sets over different interners raises ValueError"""
+    a = CandidateSet.of(ValueInterner(), ["A", "B"])
+    b = CandidateSet.of(ValueInterner(), ["B"])
+
+    for combine in (
+        lambda: a & b,
+        lambda: a | b,
+        lambda: a - b,
+        lambda: a.prune(b),
+        lambda: a.restrict(b),
+    ):
+        with pytest.raises(ValueError, match="different interners"):
+            combine()
+    same = CandidateSet.of(a.interner, ["B"])
+    assert a.prune(same).values() == ["A"]
+    assert a.restrict(same).values() == ["B"]
@@ -0,0 +1 @@
+# Scheduling layer unit tests
@@ -0,0 +1,250 @@
+"""
+Unit tests for persistent carryover state
+
+Tests cover:
+- PersistentMap mapping semantics and immutability
+- Structural sharing: old versions are unaffected by updates
+- Hash collisions and randomized operations against a dict model
+- freeze() conversion of mutable containers
+- CarryoverState sealing and round firewall behavior
+"""
+
+import random
+
+import pytest
+
+from ba_simulator.scheduling.carryover import CarryoverState, PersistentMap, freeze
+
+
+class CollidingKey:
+    """Key type whose instances all share one hash value."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __hash__(self):
+        return 42
+
+    def __eq__(self, other):
+        return isinstance(other, CollidingKey) and other.name == self.name
+
+    def __repr__(self):
+        return f"CollidingKey({self.name!r})"
+
+
+# ============================================================================
+# PersistentMap Semantics
+# ============================================================================
+
+
+def test_empty_map():
+    """Test: An empty map has no entries"""
+    m = PersistentMap()
+
+    assert len(m) == 0
+    assert list(m) == []
+    assert "x" not in m
+
+
+def test_set_returns_new_map():
+    """Test: set() leaves the original map unchanged"""
+    m1 = PersistentMap({"a": 1})
+    m2 = m1.set("b", 2)
+
+    assert dict(m1) == {"a": 1}
+    assert dict(m2) == {"a": 1, "b": 2}
+
+
+def test_overwrite_keeps_size():
+    """Test: Overwriting a key does not change the size"""
+    m = PersistentMap({"a": 1}).set("a", 2)
+
+    assert len(m) == 1
+    assert m["a"] == 2
+
+
+def test_set_same_value_returns_same_map():
+    """Test: Setting an identical value is a no-op"""
+    value = ("x",)
+    m = PersistentMap({"a": value})
+
+    assert m.set("a", value) is m
+
+
+def test_delete_returns_new_map():
+    """Test: delete() removes a key in the new map only"""
+    m1 = PersistentMap({"a": 1, "b": 2})
+    m2 = m1.delete("a")
+
+    assert dict(m1) == {"a": 1, "b": 2}
+    assert dict(m2) == {"b": 2}
+    with pytest.raises(KeyError):
+        m2.delete("a")
+
+
+def test_map_has_no_item_assignment():
+    """Test: PersistentMap does not support in-place mutation"""
+    m = PersistentMap({"a": 1})
+
+    with pytest.raises(TypeError):
+        m["a"] = 2  # type: ignore[index]
+
+
+def test_equality_and_hash():
+    """Test: Maps with equal contents compare and hash equal"""
+    m1 = PersistentMap({"a": 1, "b": 2})
+    m2 = PersistentMap({"b": 2}).set("a", 1)
+
+    assert m1 == m2
+    assert m1 == {"a": 1, "b": 2}
+    assert hash(m1) == hash(m2)
+
+
+def test_hash_collisions():
+    """Test: Keys with identical hashes coexist and delete correctly"""
+    keys = [CollidingKey(str(i)) for i in range(5)]
+    m = PersistentMap()
+    for i, key in enumerate(keys):
+        m = m.set(key, i)
+
+    assert len(m) == 5
+    assert [m[key] for key in keys] == list(range(5))
+
+    m = m.delete(keys[2])
+    assert len(m) == 4
+    assert keys[2] not in m
+    assert m[keys[3]] == 3
+
+
+def test_randomized_operations_match_dict():
+    """Test: Random set/delete sequences agree with a dict model at every version"""
+    rng = random.Random(1234)
+    model = {}
+    m = PersistentMap()
+    versions = []
+
+    for _ in range(3000):
+        key = rng.randrange(400)
+        if key in model and rng.random() < 0.4:
+            del model[key]
+            m = m.delete(key)
+        else:
+            model[key] = rng.random()
+            m = m.set(key, model[key])
+        versions.append((m, dict(model)))
+
+    for version, expected in versions[::97]:
+        assert dict(version) == expected
+        assert len(version) == len(expected)
+
+
+def test_delete_everything_yields_empty_map():
+    """Test: Deleting all keys collapses back to an empty map"""
+    m = PersistentMap({i: i for i in range(100)})
+    for i in range(100):
+        m = m.delete(i)
+
+    assert len(m) == 0
+    assert dict(m) == {}
+
+
+# ============================================================================
+# freeze()
+# ============================================================================
+
+
+def test_freeze_converts_containers():
+    """Test: freeze() converts nested mutable containers to immutable ones"""
+    frozen = freeze({"a": [1, {2, 3}], "b": bytearray(b"x")})
+
+    assert isinstance(frozen, PersistentMap)
+    assert frozen["a"] == (1, frozenset({2, 3}))
+    assert frozen["b"] == b"x"
+
+
+def test_freeze_rejects_unhashable_objects():
+    """Test: Objects that cannot be made immutable raise TypeError"""
+
+    class Mutable:
+        __hash__ = None
+
+    with pytest.raises(TypeError):
+        freeze(Mutable())
+
+
+# ============================================================================
+# CarryoverState
+# ============================================================================
+
+
+def test_carryover_set_get_clear():
+    """Test: Basic set/get/delete/clear behavior"""
+    carry = CarryoverState()
+    carry.set("digest", b"\x00" * 32)
+    carry.set("count", 3)
+
+    assert carry.get("digest") == b"\x00" * 32
+    carry.delete("count")
+    assert carry.get("count") is None
+    carry.clear()
+    assert carry.get("digest", "missing") == "missing"
+
+
+def test_sealed_snapshot_never_changes():
+    """Test: Writes after seal() never reach the sealed snapshot"""
+    carry = CarryoverState()
+    carry.set("viable_values", ["A", "B"])
+    carry.set("partial", {"votes": [1, 2]})
+    snapshot = carry.seal(0)
+
+    carry.set("viable_values", ["A"])
+    carry.set("partial", {"votes": [1, 2, 3]})
+    carry.delete("partial")
+
+    assert snapshot["viable_values"] == ("A", "B")
+    assert snapshot["partial"]["votes"] == (1, 2)
+    assert carry.snapshot(0) is snapshot
+
+
+def test_stored_values_cannot_be_mutated_in_place():
+    """Test: Values read back from carryover are immutable"""
+    carry = CarryoverState()
+    carry.set("prune", {1, 2})
+
+    with pytest.raises(AttributeError):
+        carry.get("prune").add(3)
+
+
+def test_seal_twice_raises():
+    """Test: Re-sealing a round is a firewall violation"""
+    carry = CarryoverState()
+    carry.seal(3)
+
+    with pytest.raises(ValueError):
+        carry.seal(3)
+
+
+def test_sealed_rounds_and_restore():
+    """Test: sealed_rounds() lists sealed rounds; restore() rewinds current state"""
+    carry = CarryoverState()
+    carry.set("x", 1)
+    first = carry.seal(0)
+    carry.set("x", 2)
+    carry.seal(1)
+    carry.restore(first)
+
+    assert carry.sealed_rounds() == [0, 1]
+    assert carry.get("x") == 1
+
+
+def test_release_through_drops_sealed_snapshots():
+    """Test: Snapshots of released rounds are dropped; later ones stay"""
+    state = CarryoverState()
+    for round in range(4):
+        state.set("r", round)
+        state.seal(round)
+
+    assert state.release_through(1) == 2
+    assert state.sealed_rounds() == [2, 3]
+    with pytest.raises(KeyError):
+        state.snapshot(0)
@@ -0,0 +1,268 @@
+"""
+Unit tests for equivalence-class collapsing execution
+
+Tests cover:
+- Class detection from node class keys
+- Equivalence with LockstepRunner (benign and targeting policies)
+- Lazy class splitting and reduced step counts
+- Agreement and Validity on collapsed runs
+- Re-signing of cloned messages with member keys
+- Split nodes rebuilt with their own identity (keys)
+- Invalid policy partitions
+"""
+
+from dataclasses import replace
+
+import pytest
+
+from ba_simulator.scheduling.collapsed import CollapsedLockstepRunner, detect_classes
+from ba_simulator.scheduling.lockstep import LockstepRunner
+from ba_simulator.scheduling.round_node import DeliveryPolicy, RoundNode
+from ba_simulator.transport.crypto import NodeKeys
+from ba_simulator.transport.message import Message
+
+
+class MajorityNode(RoundNode):
+    """Adopt the majority value of each round (ties to the minimum); decide in round 3."""
+
+    DECIDE_ROUND = 3
+
+    def __init__(self, node_id: int) -> None:
+        super().__init__(node_id)
+        self.value = 0 if node_id % 3 == 0 else 1
+
+    def step(self, round, inbox):
+        if inbox:
+            ones = sum(msg.value for msg in inbox)
+            self.value = 1 if ones * 2 > len(inbox) else 0
+        if round == self.DECIDE_ROUND:
+            self.decision = self.value
+        return [
+            Message(
+                ssid="collapse-test",
+                round=round,
+                protocol_id="BA",
+                phase="VOTE",
+                sender_id=self.node_id,
+                value=self.value,
+                digest=None,
+                aux={},
+                signature=b"\x00" * 64,
+            )
+        ]
+
+    def class_key(self):
+        return (self.value, self.decision)
+
+
+class OpaqueNode(MajorityNode):
+    """Majority node that does not declare a class key."""
+
+    def class_key(self):
+        return None
+
+
+KEYS = {node_id: NodeKeys.from_seed(node_id, bytes([node_id]) * 32) for node_id in range(6)}
+
+
+class SignedNode(MajorityNode):
+    """Majority node signing its messages with its own key."""
+
+    def step(self, round, inbox):
+        keys = KEYS[self.node_id]
+        return [
+            replace(msg, signature=keys.sign(msg.signing_payload()))
+            for msg in super().step(round, inbox)
+        ]
+
+
+class KeyedNode(MajorityNode):
+    """Majority node holding a reference to its own keys."""
+
+    identity_fields = ("node_id", "keys")
+
+    def __init__(self, node_id: int) -> None:
+        super().__init__(node_id)
+        self.keys = KEYS[node_id]
+
+    def step(self, round, inbox):
+        return [
+            replace(msg, signature=self.keys.sign(msg.signing_payload()))
+            for msg in super().step(round, inbox)
+        ]
+
+
+class TargetingPolicy(DeliveryPolicy):
+    """Hide the 1-votes of round ``attack_round - 1`` from the targeted receivers."""
+
+    def __init__(self, targets, attack_round=1):
+        self.targets = frozenset(targets)
+        self.attack_round = attack_round
+
+    def partition(self, round, members):
+        if round != self.attack_round:
+            return [members]
+        return [members & self.targets, members - self.targets]
+
+    def filter_inbox(self, round, receiver, inbox):
+        if round == self.attack_round and receiver in self.targets:
+            return [msg for msg in inbox if msg.value == 0]
+        return inbox
+
+
+class BrokenPolicy(DeliveryPolicy):
+    """Partition that loses members."""
+
+    def partition(self, round, members):
+        return [frozenset([min(members)])]
+
+
+# ============================================================================
+# Class Detection
+# ============================================================================
+
+
+def test_detect_classes_groups_by_key():
+    """Test: Nodes with equal keys share a class represented by the smallest ID"""
+    classes = detect_classes([MajorityNode(i) for i in range(7)])
+
+    assert [sorted(cls.members) for cls in classes] == [[0, 3, 6], [1, 2, 4, 5]]
+    assert [cls.representative.node_id for cls in classes] == [0, 1]
+    assert [cls.multiplicity for cls in classes] == [3, 4]
+
+
+def test_detect_classes_without_keys_are_singletons():
+    """Test: Nodes without a class key are simulated individually"""
+    classes = detect_classes([OpaqueNode(i) for i in range(4)])
+    assert [cls.multiplicity for cls in classes] == [1, 1, 1, 1]
+
+
+# ============================================================================
+# Equivalence
+# ============================================================================
+
+
+@pytest.mark.parametrize("n", [4, 10, 31])
+def test_benign_matches_lockstep(n):
+    """Test: Collapsed execution equals full execution and steps only k nodes per round"""
+    expected = LockstepRunner(MajorityNode, n).run(max_rounds=10)
+    runner = CollapsedLockstepRunner(MajorityNode, n)
+    result = runner.run(max_rounds=10)
+
+    assert result == expected
+    assert runner.node_steps <= 2 * result.rounds
+
+
+def test_targeting_policy_splits_lazily():
+    """Test: Targeted nodes are split off in the attack round only"""
+    n = 12
+    policy = TargetingPolicy(targets={1, 2, 3})
+    expected = LockstepRunner(MajorityNode, n, policy=policy).run(max_rounds=10)
+    runner = CollapsedLockstepRunner(MajorityNode, n, policy=policy)
+    result = runner.run(max_rounds=10)
+
+    assert result == expected
+    assert sorted(sorted(cls.members) for cls in runner.classes) == [
+        [0, 6, 9],
+        [1, 2],
+        [3],
+        [4, 5, 7, 8, 10, 11],
+    ]
+
+
+def test_inbox_order_and_senders_preserved():
+    """Test: Cloned messages carry each member's sender ID in sender order"""
+    seen = []
+
+    class RecordingNode(MajorityNode):
+        def step(self, round, inbox):
+            if round == 1:
+                seen.append([msg.sender_id for msg in inbox])
+            return super().step(round, inbox)
+
+    CollapsedLockstepRunner(RecordingNode, 6).run(max_rounds=2)
+
+    assert seen == [list(range(6))] * 2
+
+
+def test_opaque_nodes_match_lockstep():
+    """Test: Without class keys the runner degrades to full simulation"""
+    expected = LockstepRunner(OpaqueNode, 7).run(max_rounds=10)
+    runner = CollapsedLockstepRunner(OpaqueNode, 7)
+
+    assert runner.run(max_rounds=10) == expected
+    assert runner.node_steps == 7 * expected.rounds
+
+
+def test_clones_are_resigned_for_their_member():
+    """Test: Every cloned message verifies under its own sender's key"""
+    seen = []
+
+    class RecordingNode(SignedNode):
+        def step(self, round, inbox):
+            seen.extend(inbox)
+            return super().step(round, inbox)
+
+    CollapsedLockstepRunner(RecordingNode, 6, keys=KEYS).run(max_rounds=2)
+
+    assert {msg.sender_id for msg in seen} == set(range(6))
+    assert all(
+        NodeKeys.verify(msg.signing_payload(), msg.signature, KEYS[msg.sender_id].verify_key)
+        for msg in seen
+    )
+
+
+def test_split_node_signs_with_its_own_key():
+    """Test: A node split off a class keeps its own keys and signs its own messages"""
+    seen = []
+
+    class RecordingNode(KeyedNode):
+        def step(self, round, inbox):
+            seen.extend(inbox)
+            return super().step(round, inbox)
+
+    policy = TargetingPolicy(targets={4})
+    runner = CollapsedLockstepRunner(RecordingNode, 6, policy=policy, keys=KEYS)
+    runner.run(max_rounds=3)
+
+    split = next(cls.representative for cls in runner.classes if cls.members == {4})
+    assert split.node_id == 4 and split.keys is KEYS[4]
+    assert {msg.sender_id for msg in seen} == set(range(6))
+    assert all(
+        NodeKeys.verify(msg.signing_payload(), msg.signature, KEYS[msg.sender_id].verify_key)
+        for msg in seen
+    )
+
+
+def test_signed_messages_without_keys_raise():
+    """Test: Cloning signed messages without member keys raises ValueError"""
+    with pytest.raises(ValueError, match="requires keys"):
+        CollapsedLockstepRunner(SignedNode, 6).run(max_rounds=2)
+
+
+# ============================================================================
+# Properties and Errors
+# ============================================================================
+
+
+def test_agreement_and_validity_hold():
+    """Test: All nodes decide one value that was some node's input"""
+    n = 40
+    inputs = {MajorityNode(i).value for i in range(n)}
+    result = CollapsedLockstepRunner(MajorityNode, n).run(max_rounds=10)
+
+    assert result.all_decided(n)
+    assert len(set(result.decisions.values())) == 1
+    assert set(result.decisions.values()) <= inputs
+
+
+def test_invalid_partition_raises():
+    """Test: A partition that does not cover the class raises ValueError"""
+    with pytest.raises(ValueError, match="invalid"):
+        CollapsedLockstepRunner(MajorityNode, 6, policy=BrokenPolicy()).run(max_rounds=3)
+
+
+def test_rejects_empty_network():
+    """Test: n <= 0 raises ValueError"""
+    with pytest.raises(ValueError):
+        CollapsedLockstepRunner(MajorityNode, 0)
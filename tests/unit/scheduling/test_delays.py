@@ -0,0 +1,224 @@
+"""
+Unit tests for vectorized link-delay sampling
+
+Tests cover:
+- Distribution sampling and Δ bounding
+- Drop masks and self-link handling
+- Arrival ordering of delivered links
+- Reproducibility per (seed, round, phase)
+- Parameter validation
+"""
+
+import numpy as np
+import pytest
+
+from ba_simulator.scheduling.delays import DelayDistribution, LinkDelayModel, PhaseDelays
+
+
+# ============================================================================
+# Sampling and Δ Bounding
+# ============================================================================
+
+
+@pytest.mark.parametrize("distribution", [d.value for d in DelayDistribution])
+def test_sample_phase_shapes(distribution):
+    """Test: sample_phase() returns n×n delay and drop matrices"""
+    model = LinkDelayModel(n=5, delta=1.0, distribution=distribution, seed=1)
+    phase = model.sample_phase(round=0, phase="SEND")
+
+    assert isinstance(phase, PhaseDelays)
+    assert phase.delays.shape == (5, 5)
+    assert phase.dropped.shape == (5, 5)
+    assert phase.dropped.dtype == bool
+
+
+@pytest.mark.parametrize("distribution", [d.value for d in DelayDistribution])
+def test_delays_bounded_by_delta(distribution):
+    """Test: All delays lie in [0, Δ] for every distribution"""
+    model = LinkDelayModel(n=40, delta=0.5, distribution=distribution, seed=3)
+    delays = model.sample_phase(round=2, phase="ECHO").delays
+
+    assert delays.min() >= 0.0
+    assert delays.max() <= 0.5
+
+
+def test_normal_delays_are_capped_at_delta():
+    """Test: A distribution centred above Δ is capped at exactly Δ"""
+    model = LinkDelayModel(
+        n=10, delta=1.0, distribution="normal", params={"mean": 5.0, "std": 0.1}, seed=0
+    )
+    delays = model.sample_phase(round=0, phase="SEND").delays
+    off_diagonal = delays[~np.eye(10, dtype=bool)]
+
+    assert np.all(off_diagonal == 1.0)
+
+
+def test_pareto_delays_respect_scale_minimum():
+    """Test: Pareto delays are never below the scale parameter (off-diagonal)"""
+    model = LinkDelayModel(
+        n=20, delta=10.0, distribution="pareto", params={"shape": 3.0, "scale": 0.2}, seed=5
+    )
+    delays = model.sample_phase(round=1, phase="READY").delays
+    off_diagonal = delays[~np.eye(20, dtype=bool)]
+
+    assert off_diagonal.min() >= 0.2
+
+
+def test_uniform_params_respected():
+    """Test: Uniform delays stay inside [low, high]"""
+    model = LinkDelayModel(
+        n=20, delta=1.0, distribution="uniform", params={"low": 0.25, "high": 0.75}, seed=9
+    )
+    delays = model.sample_phase(round=0, phase="SEND").delays
+    off_diagonal = delays[~np.eye(20, dtype=bool)]
+
+    assert off_diagonal.min() >= 0.25
+    assert off_diagonal.max() <= 0.75
+
+
+# ============================================================================
+# Drop Masks and Self Links
+# ============================================================================
+
+
+def test_self_links_have_zero_delay_and_never_drop():
+    """Test: Diagonal links are instantaneous and always delivered"""
+    model = LinkDelayModel(n=6, delta=1.0, drop_probability=1.0, seed=0)
+    phase = model.sample_phase(round=0, phase="SEND")
+
+    assert np.all(np.diag(phase.delays) == 0.0)
+    assert not np.any(np.diag(phase.dropped))
+
+
+def test_drop_probability_one_drops_all_other_links():
+    """Test: drop_probability=1 drops every non-self link"""
+    model = LinkDelayModel(n=6, delta=1.0, drop_probability=1.0, seed=0)
+    phase = model.sample_phase(round=0, phase="SEND")
+
+    assert phase.dropped.sum() == 6 * 5
+    assert len(phase.order) == 6
+
+
+def test_drop_probability_zero_drops_nothing():
+    """Test: drop_probability=0 delivers every link"""
+    model = LinkDelayModel(n=6, delta=1.0, seed=0)
+    phase = model.sample_phase(round=0, phase="SEND")
+
+    assert not phase.dropped.any()
+    assert len(phase.order) == 36
+
+
+def test_drop_rate_close_to_probability():
+    """Test: Empirical drop rate matches drop_probability on a large matrix"""
+    model = LinkDelayModel(n=200, delta=1.0, drop_probability=0.3, seed=11)
+    dropped = model.sample_phase(round=0, phase="SEND").dropped
+    off_diagonal = dropped[~np.eye(200, dtype=bool)]
+
+    assert abs(off_diagonal.mean() - 0.3) < 0.02
+
+
+# ============================================================================
+# Arrival Ordering
+# ============================================================================
+
+
+def test_delivery_schedule_sorted_by_arrival():
+    """Test: delivery_schedule() is ordered by delay, then sender, then receiver"""
+    model = LinkDelayModel(n=8, delta=1.0, drop_probability=0.2, seed=4)
+    schedule = model.sample_phase(round=1, phase="ECHO").delivery_schedule()
+
+    keys = [(delay, sender, receiver) for sender, receiver, delay in schedule]
+    assert keys == sorted(keys)
+
+
+def test_delivery_schedule_excludes_dropped_links():
+    """Test: Dropped links never appear in the delivery schedule"""
+    model = LinkDelayModel(n=8, delta=1.0, drop_probability=0.5, seed=4)
+    phase = model.sample_phase(round=1, phase="ECHO")
+
+    for sender, receiver, _ in phase.delivery_schedule():
+        assert not phase.dropped[sender, receiver]
+    assert len(phase.delivery_schedule()) == int((~phase.dropped).sum())
+
+
+def test_receivers_of_matches_matrix_row():
+    """Test: receivers_of() returns the non-dropped row sorted by delay"""
+    model = LinkDelayModel(n=10, delta=1.0, drop_probability=0.3, seed=2)
+    phase = model.sample_phase(round=0, phase="SEND")
+    receivers, delays = phase.receivers_of(3)
+
+    assert set(receivers.tolist()) == set(np.flatnonzero(~phase.dropped[3]).tolist())
+    assert np.all(np.diff(delays) >= 0)
+    assert np.array_equal(delays, phase.delays[3, receivers])
+
+
+# ============================================================================
+# Reproducibility
+# ============================================================================
+
+
+def test_same_seed_round_phase_reproducible():
+    """Test: Identical (seed, round, phase) produce identical draws"""
+    a = LinkDelayModel(n=12, delta=1.0, distribution="pareto", drop_probability=0.1, seed=42)
+    b = LinkDelayModel(n=12, delta=1.0, distribution="pareto", drop_probability=0.1, seed=42)
+
+    pa = a.sample_phase(round=3, phase="READY")
+    pb = b.sample_phase(round=3, phase="READY")
+
+    assert np.array_equal(pa.delays, pb.delays)
+    assert np.array_equal(pa.dropped, pb.dropped)
+    assert np.array_equal(pa.order, pb.order)
+
+
+def test_draws_independent_of_sampling_order():
+    """Test: Sampling other phases first does not change a phase's draws"""
+    model = LinkDelayModel(n=12, delta=1.0, seed=42)
+    first = model.sample_phase(round=1, phase="ECHO").delays
+
+    model.sample_phase(round=0, phase="SEND")
+    model.sample_phase(round=7, phase="READY")
+    again = model.sample_phase(round=1, phase="ECHO").delays
+
+    assert np.array_equal(first, again)
+
+
+def test_different_round_phase_or_seed_differ():
+    """Test: Changing seed, round or phase changes the draws"""
+    base = LinkDelayModel(n=12, delta=1.0, seed=1).sample_phase(round=0, phase="SEND").delays
+
+    assert not np.array_equal(
+        base, LinkDelayModel(n=12, delta=1.0, seed=2).sample_phase(0, "SEND").delays
+    )
+    assert not np.array_equal(
+        base, LinkDelayModel(n=12, delta=1.0, seed=1).sample_phase(1, "SEND").delays
+    )
+    assert not np.array_equal(
+        base, LinkDelayModel(n=12, delta=1.0, seed=1).sample_phase(0, "ECHO").delays
+    )
+
+
+# ============================================================================
+# Validation
+# ============================================================================
+
+
+def test_invalid_parameters_rejected():
+    """Test: Out-of-range constructor arguments raise ValueError"""
+    with pytest.raises(ValueError):
+        LinkDelayModel(n=0, delta=1.0)
+    with pytest.raises(ValueError):
+        LinkDelayModel(n=4, delta=0.0)
+    with pytest.raises(ValueError):
+        LinkDelayModel(n=4, delta=1.0, drop_probability=1.5)
+    with pytest.raises(ValueError):
+        LinkDelayModel(n=4, delta=1.0, distribution="exponential")
+
+
+def test_invalid_distribution_params_rejected():
+    """Test: Unknown or inconsistent distribution parameters raise ValueError"""
+    with pytest.raises(ValueError, match="Unknown parameters"):
+        LinkDelayModel(n=4, delta=1.0, distribution="uniform", params={"mean": 1.0})
+    with pytest.raises(ValueError):
+        LinkDelayModel(n=4, delta=1.0, distribution="uniform", params={"low": 2.0, "high": 1.0})
+    with pytest.raises(ValueError):
+        LinkDelayModel(n=4, delta=1.0, distribution="pareto", params={"shape": 0.0})
@@ -0,0 +1,92 @@
+"""
+Unit tests for counter-based random streams
+
+Tests cover:
+- Stream identity per key and independence across keys
+- Order- and process-independence of draws
+- Key encoding (type tags, invalid parts)
+- Runs of one experiment
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+from ba_simulator.scheduling.determinism import SeedService, stream_key
+
+
+def draw(master_seed, node, round):
+    """Draw a node's values for one round (module-level for worker processes)."""
+    return SeedService(master_seed).stream("adversary", node, round).random(4).tolist()
+
+
+# ============================================================================
+# Stream Identity
+# ============================================================================
+
+
+def test_same_key_same_stream():
+    """Test: Two requests for one key produce identical draws"""
+    seeds = SeedService(7, run=2)
+    assert np.array_equal(seeds.stream("delay", 3).random(8), seeds.stream("delay", 3).random(8))
+
+
+def test_distinct_keys_distinct_streams():
+    """Test: Changing any key component changes the draws"""
+    base = SeedService(7).stream("delay", 3, "ECHO").random(8)
+
+    assert not np.array_equal(base, SeedService(8).stream("delay", 3, "ECHO").random(8))
+    assert not np.array_equal(base, SeedService(7, run=1).stream("delay", 3, "ECHO").random(8))
+    assert not np.array_equal(base, SeedService(7).stream("delay", 4, "ECHO").random(8))
+    assert not np.array_equal(base, SeedService(7).stream("delay", 3, "READY").random(8))
+
+
+def test_request_order_irrelevant():
+    """Test: Draws do not depend on which streams were used before"""
+    seeds = SeedService(1)
+    forward = [seeds.stream("node", node).random() for node in range(6)]
+    backward = [seeds.stream("node", node).random() for node in reversed(range(6))]
+    assert forward == backward[::-1]
+
+
+def test_process_independent():
+    """Test: Worker processes reproduce the draws of the parent bit-for-bit"""
+    jobs = [(5, node, round) for node in range(4) for round in range(3)]
+    local = [draw(*job) for job in jobs]
+
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=2, mp_context=context) as pool:
+        remote = list(pool.map(draw, *zip(*jobs)))
+
+    assert remote == local
+
+
+# ============================================================================
+# Keys and Runs
+# ============================================================================
+
+
+def test_key_parts_are_type_tagged():
+    """Test: An int and its string form are different keys"""
+    assert stream_key(1, 2) != stream_key(1, "2")
+    assert stream_key("ab", "c") != stream_key("a", "bc")
+    assert stream_key(b"x") != stream_key("x")
+    assert 0 <= stream_key(-1) < 2**128
+
+
+def test_invalid_key_parts_rejected():
+    """Test: Unsupported key parts raise ValueError"""
+    with pytest.raises(ValueError):
+        stream_key(1.5)
+    with pytest.raises(ValueError):
+        stream_key(True)
+
+
+def test_for_run_keeps_master_seed():
+    """Test: for_run() derives the sibling run of one experiment"""
+    sibling = SeedService(9, run=0).for_run(4)
+
+    assert sibling.key("x") == (9, 4, "x")
+    assert np.array_equal(sibling.stream("x").random(3), SeedService(9, 4).stream("x").random(3))
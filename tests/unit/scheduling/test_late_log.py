@@ -0,0 +1,140 @@
+"""
+Unit tests for the bounded late-message audit log
+
+Tests cover:
+- Record metadata (post_round flag, round delta)
+- Bounded in-memory ring with spill to disk
+- Lazy round-range queries over spilled and in-memory records
+- Statistics by round and sender
+"""
+
+import pytest
+
+from ba_simulator.scheduling.late_log import LateMessageLog, LateMessageRecord
+from ba_simulator.transport.message import Message
+
+
+def make_message(round, sender_id, value="v"):
+    """Build a late CoD READY message."""
+    return Message(
+        ssid="late-test",
+        round=round,
+        protocol_id="CoD",
+        phase="READY",
+        sender_id=sender_id,
+        value=value,
+        digest=b"\x01" * 32,
+        aux={"k": round},
+        signature=bytes([sender_id % 256]) * 64,
+    )
+
+
+@pytest.fixture
+def log(tmp_path):
+    """Log with a tiny in-memory ring to force spilling."""
+    log = LateMessageLog(spill_path=tmp_path / "late.bin", capacity=3)
+    yield log
+    log.close()
+
+
+# ============================================================================
+# Record Metadata
+# ============================================================================
+
+
+def test_record_marks_post_round(log):
+    """Test: Recorded entries carry post_round=1 and the round delta"""
+    entry = log.record(make_message(round=2, sender_id=1), arrival_round=5, arrival_time=1.5)
+
+    assert isinstance(entry, LateMessageRecord)
+    assert entry.post_round == 1
+    assert entry.round_delta == 3
+    assert entry.arrival_time == 1.5
+
+
+# ============================================================================
+# Bounded Memory and Spilling
+# ============================================================================
+
+
+def test_in_memory_ring_is_bounded(log):
+    """Test: Only `capacity` records stay in memory; the rest spill"""
+    for i in range(10):
+        log.record(make_message(round=i, sender_id=i), arrival_round=i + 1, arrival_time=float(i))
+
+    assert log.in_memory_count == 3
+    assert log.spilled_count == 7
+    assert len(log) == 10
+
+
+def test_spilled_records_round_trip(log):
+    """Test: Spilled records are read back identical to what was recorded"""
+    recorded = [
+        log.record(make_message(round=i, sender_id=i, value={"i": i}), i + 2, i * 0.5)
+        for i in range(8)
+    ]
+
+    assert list(log.query(0, 100)) == recorded
+
+
+def test_query_filters_by_message_round(log):
+    """Test: query() returns only records whose message round is in range"""
+    for i in range(10):
+        log.record(make_message(round=i % 5, sender_id=i), arrival_round=9, arrival_time=0.0)
+
+    rounds = [entry.message.round for entry in log.query(1, 2)]
+
+    assert rounds == [1, 2, 1, 2]
+
+
+def test_query_is_lazy(log):
+    """Test: query() is a generator that reads spilled data on demand"""
+    for i in range(6):
+        log.record(make_message(round=i, sender_id=i), arrival_round=8, arrival_time=0.0)
+
+    results = log.query(0, 10)
+    first = next(results)
+
+    assert first.message.round == 0
+
+
+def test_query_after_more_spills(log):
+    """Test: Queries see records spilled after an earlier query"""
+    for i in range(5):
+        log.record(make_message(round=i, sender_id=i), arrival_round=6, arrival_time=0.0)
+    assert len(list(log.query(0, 10))) == 5
+
+    for i in range(5, 9):
+        log.record(make_message(round=i, sender_id=i), arrival_round=10, arrival_time=0.0)
+
+    assert [e.message.round for e in log.query(0, 10)] == list(range(9))
+
+
+def test_invalid_capacity_rejected(tmp_path):
+    """Test: Non-positive capacity raises ValueError"""
+    with pytest.raises(ValueError):
+        LateMessageLog(spill_path=tmp_path / "x.bin", capacity=0)
+
+
+# ============================================================================
+# Statistics
+# ============================================================================
+
+
+def test_statistics_cover_spilled_records(log):
+    """Test: Counts by round and sender include spilled records"""
+    for i in range(7):
+        log.record(make_message(round=i % 2, sender_id=i % 3), arrival_round=5, arrival_time=0.0)
+
+    assert log.count_by_round == {0: 4, 1: 3}
+    assert log.count_by_sender == {0: 3, 1: 2, 2: 2}
+
+
+def test_release_through_keeps_counters(log):
+    """Test: Released records leave the ring and spill index; counters remain"""
+    for round in range(6):
+        log.record(make_message(round, sender_id=round), arrival_round=round + 2, arrival_time=0.0)
+
+    assert log.release_through(3) == 4
+    assert [entry.message.round for entry in log.query(0, 10)] == [4, 5]
+    assert log.count_by_round[0] == 1
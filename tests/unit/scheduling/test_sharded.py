@@ -0,0 +1,145 @@
+"""
+Unit tests for lock-step execution (in-process and sharded)
+
+Tests cover:
+- Node partitioning into contiguous shards
+- LockstepRunner round semantics and decisions
+- ShardedExecutor equivalence with LockstepRunner
+- Worker failure reporting
+"""
+
+import pytest
+
+from ba_simulator.scheduling.lockstep import LockstepRunner
+from ba_simulator.scheduling.round_node import RoundNode
+from ba_simulator.scheduling.sharded import ShardedExecutor, partition_nodes
+from ba_simulator.transport.message import Message
+
+
+class FloodMinNode(RoundNode):
+    """Flood the minimum value seen; decide after a fixed number of rounds."""
+
+    DECIDE_ROUND = 3
+
+    def __init__(self, node_id: int) -> None:
+        super().__init__(node_id)
+        self.value = (node_id * 7919) % 101
+        self.seen = []
+
+    def step(self, round, inbox):
+        self.seen.append([(msg.sender_id, msg.value) for msg in inbox])
+        for msg in inbox:
+            self.value = min(self.value, msg.value)
+        if round == self.DECIDE_ROUND:
+            self.decision = self.value
+        return [
+            Message(
+                ssid="sharded-test",
+                round=round,
+                protocol_id="BA",
+                phase="FLOOD",
+                sender_id=self.node_id,
+                value=self.value,
+                digest=None,
+                aux={"round": round},
+                signature=b"\x00" * 64,
+            )
+        ]
+
+
+class FailingNode(FloodMinNode):
+    """Node that crashes in round 1."""
+
+    def step(self, round, inbox):
+        if round == 1 and self.node_id == 0:
+            raise RuntimeError("boom")
+        return super().step(round, inbox)
+
+
+# ============================================================================
+# Partitioning
+# ============================================================================
+
+
+def test_partition_nodes_contiguous_and_complete():
+    """Test: Shards cover 0..n-1 contiguously with near-equal sizes"""
+    shards = partition_nodes(10, 3)
+
+    assert [list(r) for r in shards] == [[0, 1, 2, 3], [4, 5, 6], [7, 8, 9]]
+
+
+def test_partition_nodes_caps_shards_at_n():
+    """Test: More shards than nodes yields one node per shard"""
+    assert len(partition_nodes(3, 8)) == 3
+
+
+# ============================================================================
+# LockstepRunner
+# ============================================================================
+
+
+def test_lockstep_runner_decides_global_minimum():
+    """Test: Every node decides the global minimum input"""
+    n = 9
+    result = LockstepRunner(FloodMinNode, n).run(max_rounds=10)
+    expected = min((i * 7919) % 101 for i in range(n))
+
+    assert result.rounds == FloodMinNode.DECIDE_ROUND + 1
+    assert result.all_decided(n)
+    assert set(result.decisions.values()) == {expected}
+    assert result.messages == n * result.rounds
+
+
+def test_lockstep_inbox_ordered_by_sender():
+    """Test: Inboxes list previous-round messages by ascending sender"""
+    runner = LockstepRunner(FloodMinNode, 5)
+    runner.run(max_rounds=2)
+
+    assert runner.nodes[0].seen[0] == []
+    assert [sender for sender, _ in runner.nodes[0].seen[1]] == [0, 1, 2, 3, 4]
+
+
+def test_lockstep_runner_rejects_empty_network():
+    """Test: n <= 0 raises ValueError"""
+    with pytest.raises(ValueError):
+        LockstepRunner(FloodMinNode, 0)
+
+
+# ============================================================================
+# ShardedExecutor
+# ============================================================================
+
+
+@pytest.mark.parametrize("workers", [1, 2, 3])
+def test_sharded_matches_lockstep(workers):
+    """Test: Sharded execution produces results identical to in-process execution"""
+    n = 11
+    expected = LockstepRunner(FloodMinNode, n).run(max_rounds=10)
+    result = ShardedExecutor(FloodMinNode, n, workers=workers, timeout=30).run(max_rounds=10)
+
+    assert result == expected
+
+
+def test_sharded_small_rings_apply_backpressure():
+    """Test: Rounds larger than the ring capacity still complete correctly"""
+    n = 8
+    expected = LockstepRunner(FloodMinNode, n).run(max_rounds=10)
+    result = ShardedExecutor(FloodMinNode, n, workers=2, ring_capacity=512, timeout=30).run(
+        max_rounds=10
+    )
+
+    assert result == expected
+
+
+def test_sharded_worker_failure_raises():
+    """Test: An exception inside a worker surfaces as RuntimeError"""
+    with pytest.raises(RuntimeError, match="boom"):
+        ShardedExecutor(FailingNode, 4, workers=2, timeout=30).run(max_rounds=5)
+
+
+def test_sharded_invalid_arguments():
+    """Test: Non-positive n or workers raise ValueError"""
+    with pytest.raises(ValueError):
+        ShardedExecutor(FloodMinNode, 0, workers=1)
+    with pytest.raises(ValueError):
+        ShardedExecutor(FloodMinNode, 4, workers=0)
@@ -0,0 +1,114 @@
+"""
+Unit tests for the shared-memory frame ring buffer
+
+Tests cover:
+- FIFO write/read of frames
+- Wrap-around of frames across the end of the data region
+- Capacity limits and timeouts
+- Cross-process transfer through an attached ring
+"""
+
+import multiprocessing
+
+import pytest
+
+from ba_simulator.scheduling.shm_ring import SharedMemoryRing
+
+
+@pytest.fixture
+def ring():
+    """Small ring owned by the test, unlinked afterwards."""
+    ring = SharedMemoryRing(capacity=64)
+    yield ring
+    ring.close()
+    ring.unlink()
+
+
+def _produce(name, count):
+    """Child process: write ``count`` numbered frames to an attached ring."""
+    ring = SharedMemoryRing.attach(name)
+    for i in range(count):
+        ring.write(f"frame-{i}".encode("ascii") * 3)
+    ring.close()
+
+
+# ============================================================================
+# FIFO Semantics
+# ============================================================================
+
+
+def test_read_empty_returns_none(ring):
+    """Test: read() on an empty ring returns None"""
+    assert ring.read() is None
+
+
+def test_frames_read_in_write_order(ring):
+    """Test: Frames come out in FIFO order"""
+    ring.write(b"a")
+    ring.write(b"bb")
+    ring.write(b"")
+
+    assert ring.read() == b"a"
+    assert ring.read() == b"bb"
+    assert ring.read() == b""
+    assert ring.read() is None
+
+
+def test_frames_wrap_around_data_region(ring):
+    """Test: Repeated writes wrap around the end of the region intact"""
+    for i in range(50):
+        frame = bytes([i]) * (i % 17 + 1)
+        ring.write(frame)
+        assert ring.read() == frame
+
+
+# ============================================================================
+# Capacity and Timeouts
+# ============================================================================
+
+
+def test_oversized_frame_rejected(ring):
+    """Test: A frame that can never fit raises ValueError"""
+    with pytest.raises(ValueError):
+        ring.write(b"x" * 61)
+
+
+def test_full_ring_write_times_out(ring):
+    """Test: Writing to a full ring raises TimeoutError after the timeout"""
+    ring.write(b"x" * 60)
+    with pytest.raises(TimeoutError):
+        ring.write(b"y", timeout=0.01)
+
+
+def test_read_blocking_times_out(ring):
+    """Test: read_blocking() on an empty ring raises TimeoutError"""
+    with pytest.raises(TimeoutError):
+        ring.read_blocking(timeout=0.01)
+
+
+def test_invalid_capacity_rejected():
+    """Test: Capacity too small for a length prefix raises ValueError"""
+    with pytest.raises(ValueError):
+        SharedMemoryRing(capacity=4)
+
+
+# ============================================================================
+# Cross-Process Transfer
+# ============================================================================
+
+
+def test_attached_ring_reports_creator_capacity(ring):
+    """Test: An attached ring reads capacity from the shared header"""
+    attached = SharedMemoryRing.attach(ring.name)
+    assert attached.capacity == 64
+    attached.close()
+
+
+def test_frames_cross_process_boundary(ring):
+    """Test: A child process streams more data than capacity through the ring"""
+    child = multiprocessing.get_context().Process(target=_produce, args=(ring.name, 40))
+    child.start()
+    received = [ring.read_blocking(timeout=10) for _ in range(40)]
+    child.join(timeout=10)
+
+    assert received == [f"frame-{i}".encode("ascii") * 3 for i in range(40)]
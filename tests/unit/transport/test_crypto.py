@@ -0,0 +1,70 @@
+"""
+Unit tests for Ed25519 node keys and batch signing
+
+Tests cover:
+- Key generation (random and seeded)
+- Signing, verification success and failure
+- Deterministic signatures
+- ParallelSigner inline and thread-pool batches
+"""
+
+from ba_simulator.transport.crypto import NodeKeys, ParallelSigner, generate_keypair
+
+SEED = bytes(range(32))
+
+
+# ============================================================================
+# NodeKeys
+# ============================================================================
+
+
+def test_generate_keypair_seeded_is_deterministic():
+    """Test: The same seed yields the same key pair"""
+    (_, vk1), (_, vk2) = generate_keypair(SEED), generate_keypair(SEED)
+    assert bytes(vk1) == bytes(vk2)
+    assert bytes(generate_keypair()[1]) != bytes(vk1)
+
+
+def test_sign_and_verify():
+    """Test: Valid signatures verify; wrong key, payload or garbage do not"""
+    keys = NodeKeys.from_seed(0, SEED)
+    other = NodeKeys(1)
+    signature = keys.sign(b"payload")
+
+    assert len(signature) == 64
+    assert NodeKeys.verify(b"payload", signature, keys.verify_key)
+    assert not NodeKeys.verify(b"payload", signature, other.verify_key)
+    assert not NodeKeys.verify(b"tampered", signature, keys.verify_key)
+    assert not NodeKeys.verify(b"payload", b"short", keys.verify_key)
+
+
+def test_signatures_are_deterministic():
+    """Test: Ed25519 signs the same payload identically"""
+    keys = NodeKeys.from_seed(0, SEED)
+    assert keys.sign(b"x") == keys.sign(b"x")
+
+
+# ============================================================================
+# ParallelSigner
+# ============================================================================
+
+
+def test_parallel_batch_matches_sequential():
+    """Test: Pool-signed batches equal inline signatures, in order"""
+    keys = NodeKeys.from_seed(0, SEED)
+    payloads = [f"payload-{i}".encode() for i in range(200)]
+
+    with ParallelSigner(max_workers=4, min_parallel=8) as signer:
+        signatures = signer.sign_batch(keys, payloads)
+
+    assert signatures == [keys.sign(p) for p in payloads]
+    assert signer.signed == 200
+
+
+def test_small_batches_signed_inline():
+    """Test: Batches below the threshold never start a pool"""
+    signer = ParallelSigner(min_parallel=64)
+    signer.sign_batch(NodeKeys(0), [b"a", b"b"])
+
+    assert signer._pool is None
+    assert signer.signed == 2
@@ -0,0 +1,118 @@
+"""
+Unit tests for binary message frames and lazy frame views
+
+Tests cover:
+- Frame round trip through FrameView
+- Header access without body decoding
+- Malformed frame rejection, including headers that do not match the body
+"""
+
+import pytest
+
+from ba_simulator.transport.framing import FrameHeader, FrameView, encode_frame
+from ba_simulator.transport.message import Message
+
+
+def make_msg(**overrides):
+    """Build a message with optional field overrides."""
+    fields = dict(
+        ssid="frame-test",
+        round=7,
+        protocol_id="CoD",
+        phase="ECHO",
+        sender_id=3,
+        value={"v": [1, 2]},
+        digest=b"\x01" * 32,
+        aux={"k": "v"},
+        signature=b"\x02" * 64,
+    )
+    fields.update(overrides)
+    return Message(**fields)
+
+
+# ============================================================================
+# Round Trip
+# ============================================================================
+
+
+def test_frame_round_trip():
+    """Test: The decoded message equals the encoded one"""
+    msg = make_msg()
+    assert FrameView(encode_frame(msg)).message == msg
+
+
+def test_header_without_decoding_body():
+    """Test: Header fields are available without decoding the body"""
+    view = FrameView(encode_frame(make_msg(ssid="sess-é")))
+
+    assert view.header == FrameHeader("sess-é", 7, "CoD", "ECHO", 3)
+    assert (view.round, view.sender_id) == (7, 3)
+    assert not view.decoded
+
+    view.message
+    assert view.decoded
+
+
+def test_header_of_message_matches_view():
+    """Test: FrameHeader.of() agrees with the parsed frame header"""
+    msg = make_msg(round=0, sender_id=0)
+    assert FrameHeader.of(msg) == FrameView(encode_frame(msg)).header
+
+
+def test_view_over_memoryview():
+    """Test: Views work over memoryview slices and expose the original bytes"""
+    frame = encode_frame(make_msg())
+    view = FrameView(memoryview(b"xx" + frame)[2:])
+
+    assert bytes(view) == frame
+    assert view.message == make_msg()
+
+
+# ============================================================================
+# Malformed Frames
+# ============================================================================
+
+
+def test_truncated_frame_rejected():
+    """Test: Frames shorter than their header raise ValueError"""
+    frame = encode_frame(make_msg())
+    with pytest.raises(ValueError):
+        FrameView(frame[:5]).header
+    with pytest.raises(ValueError, match="truncated"):
+        FrameView(frame[:18]).header
+
+
+def test_unknown_version_rejected():
+    """Test: Frames with an unknown version byte raise ValueError"""
+    frame = bytearray(encode_frame(make_msg()))
+    frame[0] = 99
+    with pytest.raises(ValueError, match="version"):
+        FrameView(bytes(frame)).round
+
+
+def test_oversized_header_field_rejected():
+    """Test: Header fields beyond their length prefix raise ValueError"""
+    with pytest.raises(ValueError, match="too long"):
+        encode_frame(make_msg(phase="P" * 300))
+
+
+@pytest.mark.parametrize(
+    "forged",
+    [
+        dict(round=8),
+        dict(sender_id=4),
+        dict(phase="READY"),
+        dict(ssid="other"),
+        dict(protocol_id="GDA"),
+    ],
+)
+def test_forged_header_rejected_on_decode(forged):
+    """Test: A header that disagrees with the body is rejected when the body is decoded"""
+    body = FrameView(encode_frame(make_msg())).body
+    header = FrameView(encode_frame(make_msg(**forged)))
+    frame = bytes(header.frame)[: len(header.frame) - len(header.body)] + bytes(body)
+    view = FrameView(frame)
+
+    assert view.header == FrameHeader.of(make_msg(**forged))
+    with pytest.raises(ValueError, match="does not match"):
+        view.message
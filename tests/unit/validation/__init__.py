@@ -0,0 +1 @@
+# Validation layer unit tests
@@ -0,0 +1,198 @@
+"""
+Unit tests for incremental property assertions
+
+Tests cover:
+- Agreement against the reference decision
+- Canonical value comparison (canonically equal values agree)
+- Validity against the precomputed unanimous input
+- Termination at the end of the termination round
+- Round Firewall write guards
+- Diagnostics, corrupted-node events and a guarded lock-step run
+"""
+
+import pytest
+
+from ba_simulator.scheduling.lockstep import LockstepRunner
+from ba_simulator.scheduling.round_node import RoundNode
+from ba_simulator.validation.assertions import PropertyMonitor, PropertyViolation
+
+HONEST = range(5)
+
+
+class DecideAtNode(RoundNode):
+    """Decides its input at a fixed round and reports it to the monitor."""
+
+    def __init__(self, node_id, monitor, value, round):
+        super().__init__(node_id)
+        self.monitor = monitor
+        self.value = value
+        self.decide_round = round
+
+    def step(self, round, inbox):
+        if round == self.decide_round:
+            self.decision = self.value
+            self.monitor.on_decide(self.node_id, round, self.value)
+        return []
+
+
+# ============================================================================
+# Agreement and Validity
+# ============================================================================
+
+
+def test_agreement_violation_reports_reference():
+    """Test: A decision differing from the first honest decision halts immediately"""
+    monitor = PropertyMonitor(HONEST)
+    monitor.on_decide(0, 2, "A")
+    monitor.on_decide(1, 2, "A")
+
+    with pytest.raises(PropertyViolation) as info:
+        monitor.on_decide(3, 3, "B")
+
+    violation = info.value
+    assert (violation.property, violation.round, violation.node_id) == ("agreement", 3, 3)
+    assert violation.diagnostics["reference"].node_id == 0
+    assert violation.diagnostics["decided"] == 2
+
+
+def test_validity_against_unanimous_input():
+    """Test: With unanimous honest inputs, any other decision violates Validity"""
+    inputs = {node: "A" for node in HONEST}
+    inputs[7] = "Z"
+    monitor = PropertyMonitor(HONEST, inputs=inputs)
+
+    assert monitor.unanimous_input == "A"
+    with pytest.raises(PropertyViolation) as info:
+        monitor.on_decide(0, 1, "Z")
+    assert info.value.property == "validity"
+
+
+def test_mixed_inputs_skip_validity():
+    """Test: Without unanimous honest inputs any common decision is valid"""
+    monitor = PropertyMonitor(HONEST, inputs={node: node % 2 for node in HONEST})
+
+    assert not monitor.has_unanimous_input
+    for node in HONEST:
+        monitor.on_decide(node, 2, 1)
+
+
+def test_canonically_equal_values_agree():
+    """Test: Values with the same canonical form satisfy every check"""
+    inputs = {node: {"a": 1, "b": 2} for node in HONEST}
+    inputs[0] = {"b": 2, "a": 1}
+    monitor = PropertyMonitor(HONEST, inputs=inputs)
+
+    assert monitor.has_unanimous_input
+    monitor.on_decide(0, 1, {"a": 1, "b": 2})
+    monitor.on_decide(1, 1, {"b": 2, "a": 1})
+    monitor.on_decide(0, 2, {"b": 2, "a": 1})
+    assert len(monitor.decisions) == 2
+
+
+def test_canonically_distinct_values_disagree():
+    """Test: Values equal under == but canonically distinct are a disagreement"""
+    monitor = PropertyMonitor(HONEST)
+    monitor.on_decide(0, 1, 1)
+
+    with pytest.raises(PropertyViolation) as info:
+        monitor.on_decide(1, 1, True)
+    assert info.value.property == "agreement"
+
+
+def test_changed_decision_violates_integrity():
+    """Test: A node deciding twice with different values is reported"""
+    monitor = PropertyMonitor(HONEST)
+    monitor.on_decide(0, 1, "A")
+    monitor.on_decide(0, 2, "A")
+
+    with pytest.raises(PropertyViolation) as info:
+        monitor.on_decide(0, 3, "B")
+    assert info.value.property == "integrity"
+
+
+def test_corrupted_events_ignored():
+    """Test: Decisions and writes of corrupted nodes are not checked"""
+    monitor = PropertyMonitor(HONEST)
+    monitor.on_decide(9, 1, "X")
+    monitor.on_decide(0, 1, "A")
+    monitor.close_round(1)
+    monitor.check_write(9, 0)
+
+    assert monitor.reference.value == "A"
+
+
+def test_missing_honest_input_rejected():
+    """Test: Inputs must cover every honest node"""
+    with pytest.raises(ValueError):
+        PropertyMonitor(HONEST, inputs={0: "A"})
+    with pytest.raises(ValueError):
+        PropertyMonitor([])
+
+
+# ============================================================================
+# Termination and Firewall
+# ============================================================================
+
+
+def test_termination_checked_at_bound():
+    """Test: Undecided honest nodes at the end of the termination round are reported"""
+    monitor = PropertyMonitor(HONEST, termination_round=3)
+    for node in range(4):
+        monitor.on_decide(node, 1, "A")
+    monitor.on_round_end(2)
+
+    with pytest.raises(PropertyViolation) as info:
+        monitor.on_round_end(3)
+    assert info.value.property == "termination"
+    assert info.value.diagnostics["undecided"] == [4]
+
+
+def test_firewall_guards_closed_rounds():
+    """Test: Writes to closed rounds raise; the open round is writable"""
+    monitor = PropertyMonitor(HONEST)
+    monitor.on_round_end(4)
+    monitor.check_write(1, 5)
+
+    with pytest.raises(PropertyViolation) as info:
+        monitor.check_write(1, 4, target="carryover")
+    assert info.value.diagnostics == {"target": "carryover", "closed_through": 4}
+    assert "firewall violated at round 4" in str(info.value)
+
+
+# ============================================================================
+# Lock-Step Run
+# ============================================================================
+
+
+def test_lockstep_run_checked_per_event():
+    """Test: A correct run passes with one check per decision, write and round end"""
+    monitor = PropertyMonitor(HONEST, inputs={n: "A" for n in HONEST}, termination_round=3)
+    runner = LockstepRunner(lambda i: DecideAtNode(i, monitor, "A", round=i % 3), n=5)
+
+    result = runner.run(max_rounds=10, on_round_end=monitor.on_round_end, guard=monitor.check_write)
+
+    assert result.all_decided(5)
+    assert len(monitor.decisions) == 5
+    assert monitor.events == 5 * result.rounds + 5 + result.rounds
+
+
+def test_lockstep_run_halts_on_disagreement():
+    """Test: The run stops at the first disagreeing decision"""
+    monitor = PropertyMonitor(HONEST)
+    runner = LockstepRunner(lambda i: DecideAtNode(i, monitor, "AB"[i == 3], round=1), n=5)
+
+    with pytest.raises(PropertyViolation) as info:
+        runner.run(max_rounds=5, on_round_end=monitor.on_round_end, guard=monitor.check_write)
+    assert (info.value.property, info.value.node_id) == ("agreement", 3)
+
+
+def test_lockstep_guard_rejects_replayed_round():
+    """Test: Rewinding the runner into a closed round violates the firewall"""
+    monitor = PropertyMonitor(HONEST)
+    runner = LockstepRunner(lambda i: DecideAtNode(i, monitor, "A", round=5), n=5)
+    runner.run(max_rounds=3, on_round_end=monitor.on_round_end, guard=monitor.check_write)
+
+    runner.next_round = 1
+    with pytest.raises(PropertyViolation) as info:
+        runner.run(max_rounds=3, on_round_end=monitor.on_round_end, guard=monitor.check_write)
+    assert (info.value.property, info.value.round, info.value.node_id) == ("firewall", 1, 0)
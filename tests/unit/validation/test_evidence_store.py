@@ -0,0 +1,71 @@
+"""
+Unit tests for the evidence store interface and in-memory backend
+
+Tests cover:
+- Kind normalization of records
+- Queries by round and by (round, kind) in append order
+- Round listing and record counts
+- Compaction of non-exported kinds into summaries; exported kinds kept in full
+"""
+
+from ba_simulator.validation.evidence_store import (
+    EvidenceKind,
+    EvidenceRecord,
+    EvidenceSummary,
+    MemoryEvidenceStore,
+)
+
+
+def test_record_kind_normalized():
+    """Test: EvidenceKind members are stored as plain kind names"""
+    record = EvidenceRecord(1, EvidenceKind.DECISION, b"d")
+    assert record.kind == "decision"
+    assert type(record.kind) is str
+    assert record == EvidenceRecord(1, "decision", b"d")
+
+
+def test_memory_store_queries():
+    """Test: Records are returned per round and per (round, kind) in append order"""
+    store = MemoryEvidenceStore()
+    store.append(EvidenceRecord(2, EvidenceKind.TRANSITION, b"t1"))
+    store.append(EvidenceRecord(2, EvidenceKind.DECISION, b"d"))
+    store.append(EvidenceRecord(2, EvidenceKind.TRANSITION, b"t2"))
+    store.append(EvidenceRecord(0, EvidenceKind.LATE_ARRIVAL, b"l"))
+
+    assert [r.payload for r in store.records(2)] == [b"t1", b"d", b"t2"]
+    assert [r.payload for r in store.records(2, EvidenceKind.TRANSITION)] == [b"t1", b"t2"]
+    assert [r.payload for r in store.records(2, "decision")] == [b"d"]
+    assert list(store.records(5)) == []
+    assert store.rounds() == [0, 2]
+    assert len(store) == 4
+
+
+def test_memory_store_release_through_compacts_non_exported_kinds():
+    """Test: Released rounds keep exported kinds and summarize the rest"""
+    store = MemoryEvidenceStore()
+    for round in range(3):
+        store.append(EvidenceRecord(round, EvidenceKind.TRANSITION, b"t1"))
+        store.append(EvidenceRecord(round, EvidenceKind.DECISION, b"d"))
+        store.append(EvidenceRecord(round, EvidenceKind.TRANSITION, b"t22"))
+
+    assert store.release_through(1) == 4
+    assert [r.kind for r in store.records(0)] == ["decision"]
+    assert len(list(store.records(2))) == 3
+    assert len(store) == 5
+    expected = EvidenceSummary(0, "transition").fold(b"t1").fold(b"t22")
+    assert store.summaries(0) == [expected]
+    assert (expected.count, expected.payload_bytes) == (2, 5)
+    assert store.summaries(2) == []
+
+
+def test_memory_store_folds_late_records_of_released_rounds():
+    """Test: Late non-exported records of a compacted round go to its summary"""
+    store = MemoryEvidenceStore()
+    store.release_through(4)
+
+    store.append(EvidenceRecord(3, EvidenceKind.LATE_ARRIVAL, b"late"))
+    store.append(EvidenceRecord(3, EvidenceKind.BARRIER_CERTIFICATE, b"cert"))
+
+    assert [r.kind for r in store.records(3)] == ["barrier_certificate"]
+    assert store.summaries(3) == [EvidenceSummary(3, "late_arrival").fold(b"late")]
+    assert len(store) == 1
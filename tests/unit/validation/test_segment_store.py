@@ -0,0 +1,196 @@
+"""
+Unit tests for the memory-mapped segment evidence store
+
+Tests cover:
+- Append and (round, kind) queries through mmap
+- Segment rotation
+- Reads interleaved with appends on the active segment
+- Reopening a directory, recovering from a torn tail and from a missing segment
+- Parity with the in-memory backend
+- Compaction of non-exported kinds without touching segment files
+"""
+
+import pytest
+
+from ba_simulator.validation.evidence_store import (
+    EvidenceKind,
+    EvidenceRecord,
+    MemoryEvidenceStore,
+)
+from ba_simulator.validation.segment_store import SegmentEvidenceStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SegmentEvidenceStore(tmp_path / "evidence", segment_bytes=256)
+    yield store
+    store.close()
+
+
+def sample_records(rounds=6):
+    """Records of every kind over several rounds."""
+    return [
+        EvidenceRecord(round, kind, f"{round}:{kind.value}".encode() * 3)
+        for round in range(rounds)
+        for kind in EvidenceKind
+    ]
+
+
+# ============================================================================
+# Append and Query
+# ============================================================================
+
+
+def test_records_round_trip(store):
+    """Test: Records are read back per (round, kind) with identical payloads"""
+    records = sample_records()
+    for record in records:
+        store.append(record)
+
+    assert len(store) == len(records)
+    assert store.rounds() == list(range(6))
+    assert list(store.records(3, EvidenceKind.DECISION)) == [
+        EvidenceRecord(3, EvidenceKind.DECISION, b"3:decision" * 3)
+    ]
+    assert list(store.records(4)) == [r for r in records if r.round == 4]
+
+
+def test_segments_rotate(store):
+    """Test: Segments are rotated at segment_bytes"""
+    for record in sample_records():
+        store.append(record)
+
+    assert store.segment_count > 1
+    assert all(p.stat().st_size <= 256 for p in store.directory.glob("segment-*.log"))
+
+
+def test_reads_interleaved_with_appends(store):
+    """Test: The active segment is remapped as it grows"""
+    store.append(EvidenceRecord(0, "k", b"a"))
+    assert [r.payload for r in store.records(0)] == [b"a"]
+
+    store.append(EvidenceRecord(0, "k", b"b"))
+    assert [r.payload for r in store.records(0, "k")] == [b"a", b"b"]
+
+
+def test_oversized_record_gets_own_segment(store):
+    """Test: A record larger than segment_bytes is still stored"""
+    store.append(EvidenceRecord(0, "small", b"x"))
+    store.append(EvidenceRecord(1, "big", b"y" * 1000))
+
+    assert [r.payload for r in store.records(1)] == [b"y" * 1000]
+    assert store.segment_count == 2
+
+
+def test_invalid_segment_bytes(tmp_path):
+    """Test: Non-positive segment_bytes raise ValueError"""
+    with pytest.raises(ValueError):
+        SegmentEvidenceStore(tmp_path, segment_bytes=0)
+
+
+# ============================================================================
+# Reopening
+# ============================================================================
+
+
+def test_reopen_rebuilds_index(tmp_path):
+    """Test: A reopened store sees every record and keeps appending"""
+    records = sample_records()
+    store = SegmentEvidenceStore(tmp_path, segment_bytes=256)
+    for record in records:
+        store.append(record)
+    segments = store.segment_count
+    store.close()
+
+    reopened = SegmentEvidenceStore(tmp_path, segment_bytes=256)
+    reopened.append(EvidenceRecord(9, "extra", b"e"))
+
+    assert reopened.segment_count >= segments
+    assert len(reopened) == len(records) + 1
+    assert list(reopened.records(2)) == [r for r in records if r.round == 2]
+    reopened.close()
+
+
+def test_reopen_cuts_torn_tail(tmp_path):
+    """Test: A truncated trailing record is discarded on reopen"""
+    store = SegmentEvidenceStore(tmp_path)
+    store.append(EvidenceRecord(0, "k", b"complete"))
+    store.append(EvidenceRecord(1, "k", b"torn-record"))
+    store.close()
+    path = tmp_path / "segment-000000.log"
+    path.write_bytes(path.read_bytes()[:-4])
+
+    reopened = SegmentEvidenceStore(tmp_path)
+    reopened.append(EvidenceRecord(1, "k", b"again"))
+
+    assert [r.payload for r in reopened.records(0)] == [b"complete"]
+    assert [r.payload for r in reopened.records(1)] == [b"again"]
+    reopened.close()
+
+
+def test_reopen_keeps_segment_numbers_after_gap(tmp_path):
+    """Test: Records are located by their persisted segment number, not scan order"""
+    store = SegmentEvidenceStore(tmp_path, segment_bytes=64)
+    for round in range(3):
+        store.append(EvidenceRecord(round, "k", bytes([round]) * 40))
+    store.close()
+    (tmp_path / "segment-000001.log").unlink()
+
+    reopened = SegmentEvidenceStore(tmp_path, segment_bytes=64)
+    reopened.append(EvidenceRecord(3, "k", b"next"))
+
+    assert reopened.rounds() == [0, 2, 3]
+    assert [r.payload for r in reopened.records(2)] == [b"\x02" * 40]
+    assert [r.payload for r in reopened.records(3)] == [b"next"]
+    assert (tmp_path / "segment-000002.log").exists()
+    assert not (tmp_path / "segment-000001.log").exists()
+    reopened.close()
+
+
+def test_parity_with_memory_store(store):
+    """Test: Segment and in-memory backends answer queries identically"""
+    memory = MemoryEvidenceStore()
+    for record in sample_records(4):
+        store.append(record)
+        memory.append(record)
+
+    for round in range(4):
+        assert list(store.records(round)) == list(memory.records(round))
+        for kind in EvidenceKind:
+            assert list(store.records(round, kind)) == list(memory.records(round, kind))
+
+
+def test_phase_and_sender_preserved(store):
+    """Test: Optional phase and sender fields survive the segment format"""
+    store.append(EvidenceRecord(1, "k", b"p", phase="ECHO", sender_id=0))
+    store.append(EvidenceRecord(1, "k", b"q"))
+
+    first, second = store.records(1)
+    assert (first.phase, first.sender_id) == ("ECHO", 0)
+    assert (second.phase, second.sender_id) == (None, None)
+
+
+def test_release_through_compacts_like_memory_store(store, tmp_path):
+    """Test: Compaction shrinks the index only and matches the in-memory backend"""
+    memory = MemoryEvidenceStore()
+    for record in sample_records(3):
+        store.append(record)
+        memory.append(record)
+    sizes = [path.stat().st_size for path in sorted((tmp_path / "evidence").iterdir())]
+
+    assert store.release_through(1) == memory.release_through(1) == 2 * 2
+    store.append(EvidenceRecord(0, EvidenceKind.LATE_ARRIVAL, b"late"))
+    memory.append(EvidenceRecord(0, EvidenceKind.LATE_ARRIVAL, b"late"))
+
+    for round in range(3):
+        assert list(store.records(round)) == list(memory.records(round))
+        assert store.summaries(round) == memory.summaries(round)
+    assert [r.kind for r in store.records(1)] == ["barrier_certificate", "decision"]
+    assert len(store) == len(memory)
+    files = sorted((tmp_path / "evidence").iterdir())
+    assert [path.stat().st_size for path in files][: len(sizes) - 1] == sizes[:-1]
+
+    store.close()
+    reopened = SegmentEvidenceStore(tmp_path / "evidence", segment_bytes=256)
+    assert len(list(reopened.records(0))) == len(EvidenceKind) + 1
+    reopened.close()
@@ -0,0 +1,153 @@
+"""
+Unit tests for the SQLite evidence store
+
+Tests cover:
+- WAL mode and schema indexes
+- One commit per round with buffered writes, unaffected by late arrivals
+- Queries by round, kind, phase and sender
+- Raw BLOB payloads and message-derived records
+- Durability across reopen and parity with the in-memory backend
+"""
+
+import sqlite3
+
+import pytest
+
+from ba_simulator.transport.message import Message
+from ba_simulator.transport.serialization import JSONMessageSerializer
+from ba_simulator.validation.evidence_store import (
+    EvidenceKind,
+    EvidenceRecord,
+    MemoryEvidenceStore,
+)
+from ba_simulator.validation.sqlite_store import SQLiteEvidenceStore
+
+
+def make_message(round, sender_id, phase="READY"):
+    """Build a signed-looking message."""
+    return Message(
+        ssid="sqlite-test",
+        round=round,
+        protocol_id="CoD",
+        phase=phase,
+        sender_id=sender_id,
+        value="v",
+        digest=None,
+        aux={},
+        signature=bytes([sender_id]) * 64,
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteEvidenceStore(tmp_path / "evidence.db")
+    yield store
+    store.close()
+
+
+# ============================================================================
+# Write Path
+# ============================================================================
+
+
+def test_wal_mode_and_indexes(store):
+    """Test: The database runs in WAL mode with round/phase/sender indexes"""
+    connection = sqlite3.connect(str(store.path))
+    assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    indexes = {row[1] for row in connection.execute("PRAGMA index_list(evidence)")}
+    connection.close()
+    assert {"evidence_round_kind", "evidence_phase", "evidence_sender"} <= indexes
+
+
+def test_one_commit_per_round(store):
+    """Test: Records of one round are committed together when the next round begins"""
+    for round in range(3):
+        for sender in range(10):
+            store.append(EvidenceRecord(round, EvidenceKind.TRANSITION, b"t", "ECHO", sender))
+
+    assert store.commits == 2
+    store.commit()
+    assert store.commits == 3
+    assert len(store) == 30
+
+
+def test_late_arrivals_do_not_force_commits(store):
+    """Test: Records of older rounds interleaved within a round share its commit"""
+    for i in range(100):
+        round = 5 if i % 2 == 0 else i % 5
+        store.append(EvidenceRecord(round, EvidenceKind.LATE_ARRIVAL, b"l", "ECHO", i % 7))
+
+    assert store.commits == 0
+    store.append(EvidenceRecord(6, EvidenceKind.TRANSITION, b"t"))
+    assert store.commits == 1
+    assert len(store) == 101
+
+
+def test_buffered_records_visible_to_queries(store):
+    """Test: Uncommitted records of the current round are returned by queries"""
+    store.append(EvidenceRecord(0, "k", b"pending"))
+
+    assert [r.payload for r in store.records(0)] == [b"pending"]
+    assert store.commits == 0
+
+
+def test_reopen_sees_committed_records(tmp_path):
+    """Test: close() commits the buffer; a reopened store sees everything"""
+    path = tmp_path / "evidence.db"
+    store = SQLiteEvidenceStore(path)
+    store.append(EvidenceRecord(0, "k", b"a"))
+    store.append(EvidenceRecord(1, "k", b"b"))
+    store.close()
+
+    reopened = SQLiteEvidenceStore(path)
+    assert reopened.rounds() == [0, 1]
+    assert len(reopened) == 2
+    reopened.close()
+
+
+# ============================================================================
+# Queries
+# ============================================================================
+
+
+def test_query_filters(store):
+    """Test: Phase, sender, kind and round filters combine"""
+    for round in range(2):
+        for sender in range(3):
+            for phase in ("ECHO", "READY"):
+                message = make_message(round, sender, phase)
+                store.append(EvidenceRecord.from_message(EvidenceKind.LATE_ARRIVAL, message))
+
+    assert len(list(store.query(phase="READY"))) == 6
+    assert len(list(store.query(sender_id=2, round=1))) == 2
+    assert list(store.query(kind=EvidenceKind.DECISION)) == []
+    [record] = store.query(round=0, phase="ECHO", sender_id=1)
+    assert (record.round, record.phase, record.sender_id) == (0, "ECHO", 1)
+
+
+def test_payload_stored_as_raw_blob(store):
+    """Test: Serializer bytes are stored and returned unchanged as a BLOB"""
+    message = make_message(4, 2)
+    store.append(EvidenceRecord.from_message(EvidenceKind.DECISION, message))
+    store.commit()
+
+    connection = sqlite3.connect(str(store.path))
+    blob, kind = connection.execute("SELECT typeof(payload), kind FROM evidence").fetchone()
+    connection.close()
+    assert (blob, kind) == ("blob", "decision")
+    [record] = store.records(4, EvidenceKind.DECISION)
+    assert JSONMessageSerializer().decode(record.payload) == message
+
+
+def test_parity_with_memory_store(store):
+    """Test: SQLite and in-memory backends answer records() identically"""
+    memory = MemoryEvidenceStore()
+    for round in range(3):
+        for kind in EvidenceKind:
+            record = EvidenceRecord(round, kind, f"{round}{kind.value}".encode(), "SEND", round)
+            store.append(record)
+            memory.append(record)
+
+    for round in range(3):
+        assert list(store.records(round)) == list(memory.records(round))
+        assert list(store.records(round, "decision")) == list(memory.records(round, "decision"))